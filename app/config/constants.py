@@ -73,6 +73,50 @@ class WorkOrderStatus:
             return Zones.STERILE
         return None
 
+    LIFECYCLE = {
+        RECEIVED: 0,
+        REPROCESSING: 0,
+        WASHING: 1,
+        WASHED: 2,
+        INSPECTING: 3,
+        INSPECTION_FAILED: 4,
+        PACKAGING: 4,
+        PACKAGED: 5,
+        STERILIZING: 6,
+        STERILIZED: 7,
+        PENDING_RELEASE: 8,
+        REJECTED: 9,
+        RELEASED: 10,
+        STORED: 11,
+        DISTRIBUTED: 12,
+        COMPLETED: 13,
+        RECALLED: 14,
+    }
+
+    STICKY = {
+        RELEASED: 1,
+        STORED: 1,
+        DISTRIBUTED: 1,
+        COMPLETED: 1,
+        RECALLED: 2,
+    }
+
+    @classmethod
+    def rank(cls, status: str) -> int:
+        return cls.LIFECYCLE.get(status, -1)
+
+    @classmethod
+    def sticky_rank(cls, status: str) -> int:
+        return cls.STICKY.get(status, 0)
+
+    @classmethod
+    def is_released(cls, status: str) -> bool:
+        return cls.STICKY.get(status) == 1
+
+    @classmethod
+    def reprocess_step(cls, status: str) -> int:
+        return 1 + (cls.sticky_rank(status) > 0)
+
 
 class SterilizationStatus:
     PENDING_CI = "PENDING_CI"
@@ -84,6 +128,32 @@ class SterilizationStatus:
     EXPIRED = "EXPIRED"
     USED = "USED"
 
+    LIFECYCLE = {
+        PENDING_CI: 0,
+        PENDING_BI: 1,
+        PENDING_RELEASE: 2,
+        REJECTED: 3,
+        RELEASED: 4,
+        EXPIRED: 5,
+        USED: 5,
+        RECALLED: 6,
+    }
+
+    STICKY = {
+        RELEASED: 1,
+        EXPIRED: 1,
+        USED: 1,
+        RECALLED: 2,
+    }
+
+    @classmethod
+    def rank(cls, status: str) -> int:
+        return cls.LIFECYCLE.get(status, -1)
+
+    @classmethod
+    def sticky_rank(cls, status: str) -> int:
+        return cls.STICKY.get(status, 0)
+
 
 class MachineTypes:
     WASHER_DISINFECTOR = "WASHER_DISINFECTOR"
@@ -107,12 +177,188 @@ class MachineTypes:
 
 class MachineStatus:
     IDLE = "IDLE"
+    LOADING = "LOADING"
     RUNNING = "RUNNING"
+    UNLOADING = "UNLOADING"
     COMPLETED = "COMPLETED"
     ERROR = "ERROR"
+    FAULT = "FAULT"
     MAINTENANCE = "MAINTENANCE"
     OFFLINE = "OFFLINE"
 
+    TRANSITIONS = {
+        IDLE: {LOADING, RUNNING, MAINTENANCE, FAULT, OFFLINE},
+        LOADING: {IDLE, RUNNING, FAULT},
+        RUNNING: {UNLOADING, IDLE, FAULT},
+        UNLOADING: {IDLE, FAULT},
+        MAINTENANCE: {IDLE, OFFLINE},
+        FAULT: {IDLE, MAINTENANCE, OFFLINE},
+        OFFLINE: {IDLE, MAINTENANCE},
+    }
+
+    LEGACY = {
+        COMPLETED: IDLE,
+        ERROR: FAULT,
+    }
+
+    @classmethod
+    def normalize(cls, status: str) -> str:
+        return cls.LEGACY.get(status, status or cls.IDLE)
+
+    @classmethod
+    def aliases(cls, status: str) -> list:
+        return [status] + [k for k, v in cls.LEGACY.items() if v == status]
+
+    @classmethod
+    def can_transition(cls, current: str, target: str) -> bool:
+        return target in cls.TRANSITIONS.get(cls.normalize(current), set())
+
+
+class MachineEvents:
+    LOAD = "LOAD"
+    CANCEL_LOAD = "CANCEL_LOAD"
+    START = "START"
+    COMPLETE = "COMPLETE"
+    UNLOAD = "UNLOAD"
+    ABORT = "ABORT"
+    FAULT = "FAULT"
+    RESET = "RESET"
+    MAINTENANCE_START = "MAINTENANCE_START"
+    MAINTENANCE_END = "MAINTENANCE_END"
+    SET_OFFLINE = "SET_OFFLINE"
+    STATUS_CHANGE = "STATUS_CHANGE"
+
+
+class CyclePhases:
+    UNKNOWN = "UNKNOWN"
+    CONDITIONING = "CONDITIONING"
+    HEATING = "HEATING"
+    STERILIZING = "STERILIZING"
+    EXHAUST = "EXHAUST"
+    DRYING = "DRYING"
+    COMPLETE = "COMPLETE"
+    FAULT = "FAULT"
+
+    CODES = {
+        UNKNOWN: 0,
+        CONDITIONING: 1,
+        HEATING: 2,
+        STERILIZING: 3,
+        EXHAUST: 4,
+        DRYING: 5,
+        COMPLETE: 6,
+        FAULT: 7,
+    }
+
+    ALIASES = {
+        "PREVAC": CONDITIONING,
+        "PRE-VAC": CONDITIONING,
+        "VACUUM": CONDITIONING,
+        "VAKUM": CONDITIONING,
+        "PULSE": CONDITIONING,
+        "HEAT": HEATING,
+        "HEATUP": HEATING,
+        "ISITMA": HEATING,
+        "STERILIZE": STERILIZING,
+        "STERILIZATION": STERILIZING,
+        "STERILIZASYON": STERILIZING,
+        "EXPOSURE": STERILIZING,
+        "HOLD": STERILIZING,
+        "PLATEAU": STERILIZING,
+        "EXHAUST": EXHAUST,
+        "TAHLIYE": EXHAUST,
+        "DRY": DRYING,
+        "KURUTMA": DRYING,
+        "END": COMPLETE,
+        "DONE": COMPLETE,
+        "BITTI": COMPLETE,
+        "ALARM": FAULT,
+        "ERROR": FAULT,
+        "HATA": FAULT,
+    }
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        key = (name or "").strip().upper().replace(" ", "")
+        if key in cls.CODES:
+            return key
+        return cls.ALIASES.get(key, cls.UNKNOWN)
+
+    @classmethod
+    def code(cls, phase: str) -> int:
+        return cls.CODES.get(phase, 0)
+
+    @classmethod
+    def from_code(cls, code: int) -> str:
+        for phase, value in cls.CODES.items():
+            if value == code:
+                return phase
+        return cls.UNKNOWN
+
+
+class MaintenanceTypes:
+    PREVENTIVE = "PREVENTIVE"
+    CALIBRATION = "CALIBRATION"
+    VALIDATION = "VALIDATION"
+    REPAIR = "REPAIR"
+
+    NAMES = {
+        PREVENTIVE: "Periyodik Bakım",
+        CALIBRATION: "Kalibrasyon",
+        VALIDATION: "Validasyon",
+        REPAIR: "Arıza Onarımı",
+    }
+
+
+class SyncTables:
+    TABLES = {
+        "work_orders": {},
+        "machine_cycles": {},
+        "process_records": {
+            "work_order_id": "work_orders",
+            "cycle_id": "machine_cycles",
+        },
+        "sterilization_records": {
+            "work_order_id": "work_orders",
+            "cycle_id": "machine_cycles",
+        },
+        "audit_log": {},
+    }
+
+    OPERATIONS = ("INSERT", "UPDATE", "DELETE")
+
+    @classmethod
+    def names(cls):
+        return list(cls.TABLES)
+
+
+class SearchKinds:
+    INSTRUMENT = 0
+    SET = 1
+    WORK_ORDER = 2
+    SHIFT = 40
+
+    TABLES = {
+        "instruments": (INSTRUMENT, ("name",), ("barcode", "serial_number", "model_number"),
+                        ("description", "category", "manufacturer")),
+        "instrument_sets": (SET, ("name",), ("barcode",),
+                            ("description", "category", "container_type")),
+        "work_orders": (WORK_ORDER, ("item_name",), ("order_number", "barcode", "item_barcode"),
+                        ("notes", "source_department", "destination_department")),
+    }
+
+    CODES = {
+        INSTRUMENT: ("barcode",),
+        SET: ("barcode",),
+        WORK_ORDER: ("order_number", "barcode"),
+    }
+
+    NAMES = {
+        INSTRUMENT: "Alet",
+        SET: "Set",
+        WORK_ORDER: "İş Emri",
+    }
+
 
 class PackagingTypes:
     WRAP_SINGLE = "WRAP_SINGLE"
@@ -160,3 +406,26 @@ class AuditActions:
     RECALL = "RECALL"
     PRINT = "PRINT"
     SCAN = "SCAN"
+    EXPORT = "EXPORT"
+
+
+class SessionEndReasons:
+    LOGOUT = "LOGOUT"
+    SWITCH = "SWITCH"
+    TIMEOUT = "TIMEOUT"
+    SHUTDOWN = "SHUTDOWN"
+
+
+class PrintJobStatus:
+    QUEUED = "QUEUED"
+    RENDERING = "RENDERING"
+    PRINTED = "PRINTED"
+    FAILED = "FAILED"
+
+
+class ExportJobStatus:
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    CANCELLED = "CANCELLED"
+    FAILED = "FAILED"
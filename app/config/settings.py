@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 @dataclass
@@ -9,6 +9,17 @@ class DatabaseSettings:
     backup_path: str = os.path.expanduser("~/data/backups")
     auto_backup: bool = True
     backup_interval_hours: int = 24
+    backup_keep_count: int = 14
+    backup_step_pages: int = 256
+    backup_step_sleep: float = 0.005
+    archive_enabled: bool = False
+    archive_path: str = os.path.expanduser("~/data/archive")
+    archive_interval_seconds: float = 1.0
+    archive_segment_bytes: int = 16 * 1024 * 1024
+    archive_base_hours: int = 24
+    archive_keep_bases: int = 7
+    mode: str = "local"
+    server_address: str = os.path.expanduser("~/data/sterilizasyon.sock")
 
 
 @dataclass
@@ -20,6 +31,9 @@ class UISettings:
     font_size_base: int = 12
     hide_cursor_timeout: int = 0
     screen_timeout_minutes: int = 15
+    boot_budget_ms: int = 1000
+    import_budget_ms: int = 300
+    boot_report: bool = False
 
 
 @dataclass
@@ -31,6 +45,93 @@ class SterilizationSettings:
     bi_incubation_hours: int = 24
     bi_required_for_implants: bool = True
     ci_check_required: bool = True
+    parametric_release_required: bool = False
+
+
+@dataclass
+class TelemetrySettings:
+    drop_path: str = os.path.expanduser("~/data/telemetry")
+    chunk_size: int = 4096
+    f0_reference_temperature: float = 121.1
+    f0_z_value: float = 10.0
+    f0_min_temperature: float = 100.0
+    hold_temperature_band: float = 3.0
+    hold_pressure_tolerance: float = 0.1
+    max_sample_gap_seconds: float = 5.0
+    min_f0_value: float = 0.0
+
+
+@dataclass
+class MaintenanceSettings:
+    block_overdue_machines: bool = True
+    warning_days: int = 7
+    warning_cycles: int = 50
+
+
+@dataclass
+class SyncSettings:
+    enabled: bool = False
+    device_id: str = ""
+    server_url: str = ""
+    batch_size: int = 500
+    interval_seconds: int = 60
+    timeout_seconds: int = 15
+    compression_level: int = 6
+
+
+@dataclass
+class ScannerSettings:
+    devices: List[str] = field(default_factory=list)
+    grab: bool = True
+    max_gap_ms: float = 35.0
+    min_length: int = 4
+    idle_flush_ms: float = 80.0
+    queue_size: int = 1000
+    reconnect_seconds: float = 2.0
+    dedupe_window_ms: float = 1500.0
+    latency_budget_ms: float = 100.0
+
+
+@dataclass
+class PrintingSettings:
+    format: str = "zpl"
+    dpi: int = 203
+    backend: str = "file"
+    spool_path: str = os.path.expanduser("~/data/print")
+    printer: str = ""
+    lp_command: str = "lp"
+    timeout_seconds: float = 30.0
+    print_on_release: bool = False
+
+
+@dataclass
+class ExportSettings:
+    export_path: str = os.path.expanduser("~/data/exports")
+    batch_size: int = 500
+    progress_every: int = 1000
+    pdf_rows_per_page: int = 40
+
+
+@dataclass
+class SearchSettings:
+    limit: int = 20
+    min_length: int = 2
+    debounce_ms: float = 40.0
+    rank_limit: int = 1000
+
+
+@dataclass
+class DiagnosticsSettings:
+    tracing: bool = True
+    trace_path: str = os.path.expanduser("~/data/traces")
+    action_history: int = 256
+    dump_shortcut: str = "Ctrl+Shift+F12"
+    slow_query_ms: float = 50.0
+    slow_query_log: str = os.path.expanduser("~/data/logs/slow_queries.log")
+    slow_query_log_bytes: int = 1024 * 1024
+    slow_query_log_backups: int = 5
+    slow_query_repeat_seconds: float = 300.0
+    large_table_rows: int = 10000
 
 
 @dataclass
@@ -40,6 +141,12 @@ class SecuritySettings:
     lockout_duration_minutes: int = 30
     require_pin_for_release: bool = True
     require_supervisor_for_reject: bool = True
+    pin_hash_n: int = 16384
+    pin_hash_r: int = 8
+    pin_hash_p: int = 1
+    pin_hash_budget_ms: int = 100
+    session_history_batch: int = 20
+    switch_budget_ms: int = 200
 
 
 @dataclass
@@ -48,6 +155,14 @@ class Settings:
     ui: UISettings = field(default_factory=UISettings)
     sterilization: SterilizationSettings = field(default_factory=SterilizationSettings)
     security: SecuritySettings = field(default_factory=SecuritySettings)
+    telemetry: TelemetrySettings = field(default_factory=TelemetrySettings)
+    maintenance: MaintenanceSettings = field(default_factory=MaintenanceSettings)
+    sync: SyncSettings = field(default_factory=SyncSettings)
+    scanner: ScannerSettings = field(default_factory=ScannerSettings)
+    printing: PrintingSettings = field(default_factory=PrintingSettings)
+    export: ExportSettings = field(default_factory=ExportSettings)
+    search: SearchSettings = field(default_factory=SearchSettings)
+    diagnostics: DiagnosticsSettings = field(default_factory=DiagnosticsSettings)
 
     @classmethod
     def load(cls) -> 'Settings':
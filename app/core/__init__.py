@@ -1,4 +1,6 @@
+from .clock import HybridLogicalClock, hlc
 from .database import Database, get_db
 from .session import SessionManager, current_session
+from .schema import init_database
 
-__all__ = ['Database', 'get_db', 'SessionManager', 'current_session']
+__all__ = ['HybridLogicalClock', 'hlc', 'Database', 'get_db', 'SessionManager', 'current_session', 'init_database']
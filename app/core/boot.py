@@ -0,0 +1,114 @@
+import sys
+import time
+import argparse
+import subprocess
+from typing import List, Tuple, Dict
+from contextlib import contextmanager
+
+from app.config.settings import settings
+
+
+class BootProfiler:
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._started = time.perf_counter()
+        self._modules_at_start = len(sys.modules)
+        self.spans: List[Tuple[str, float, float]] = []
+        self.marks: Dict[str, float] = {}
+        self._initialized = True
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000
+
+    @contextmanager
+    def span(self, name: str):
+        start = self.elapsed_ms()
+        try:
+            yield
+        finally:
+            self.spans.append((name, start, self.elapsed_ms() - start))
+
+    def mark(self, name: str) -> float:
+        if name not in self.marks:
+            self.marks[name] = self.elapsed_ms()
+        return self.marks[name]
+
+    @property
+    def interactive_ms(self) -> float:
+        return self.marks.get("interactive", self.elapsed_ms())
+
+    def over_budget(self) -> bool:
+        return self.interactive_ms > settings.ui.boot_budget_ms
+
+    def report(self) -> str:
+        lines = [f"Açılış: {self.interactive_ms:.0f} ms (bütçe {settings.ui.boot_budget_ms} ms), "
+                 f"{len(sys.modules) - self._modules_at_start} modül yüklendi"]
+        for name, start, duration in self.spans:
+            lines.append(f"  {start:8.1f} ms  {duration:8.1f} ms  {name}")
+        for name, at in sorted(self.marks.items(), key=lambda m: m[1]):
+            lines.append(f"  {at:8.1f} ms  {'':>11}  [{name}]")
+        return "\n".join(lines)
+
+
+def _run_importtime(code: str) -> List[Tuple[str, int, int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr else code)
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            own, cumulative = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), own, cumulative, depth))
+    return rows
+
+
+def import_times(module: str) -> List[Tuple[str, int, int, int]]:
+    baseline = {row[0] for row in _run_importtime("pass")}
+    return [row for row in _run_importtime(f"import {module}") if row[0] not in baseline]
+
+
+boot_profiler = BootProfiler()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış import süresi raporu")
+    parser.add_argument("module", nargs="?", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=int, default=None)
+    args = parser.parse_args()
+
+    budget = args.budget_ms if args.budget_ms is not None else settings.ui.import_budget_ms
+    rows = import_times(args.module)
+    total = sum(row[2] for row in rows if row[3] == 0) / 1000
+
+    print(f"{'self ms':>9} {'toplam ms':>10}  modül")
+    for name, own, cumulative, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{own / 1000:9.1f} {cumulative / 1000:10.1f}  {name}")
+    print(f"{args.module}: {total:.1f} ms / bütçe {budget} ms")
+    return 0 if total <= budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import time
+import threading
+from typing import Optional, Tuple
+
+
+class HybridLogicalClock:
+    _instance: Optional['HybridLogicalClock'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.Lock()
+        self._wall = 0
+        self._counter = 0
+        self.device_id = ""
+        self._initialized = True
+
+    def now(self) -> str:
+        with self._lock:
+            physical = self._physical()
+            if physical > self._wall:
+                self._wall = physical
+                self._counter = 0
+            else:
+                self._counter += 1
+            return self.format(self._wall, self._counter, self.device_id)
+
+    def update(self, stamp: str) -> str:
+        remote_wall, remote_counter, _ = self.parse(stamp)
+        with self._lock:
+            physical = self._physical()
+            wall = max(self._wall, remote_wall, physical)
+            if wall == self._wall and wall == remote_wall:
+                self._counter = max(self._counter, remote_counter) + 1
+            elif wall == self._wall:
+                self._counter += 1
+            elif wall == remote_wall:
+                self._counter = remote_counter + 1
+            else:
+                self._counter = 0
+            self._wall = wall
+            return self.format(self._wall, self._counter, self.device_id)
+
+    def set_device_id(self, device_id: str):
+        self.device_id = device_id or ""
+
+    def install(self, connection):
+        connection.create_function("hlc_now", 0, self.now)
+
+    @staticmethod
+    def format(wall: int, counter: int, device_id: str) -> str:
+        return f"{wall:013d}.{counter:05d}.{device_id}"
+
+    @staticmethod
+    def parse(stamp: str) -> Tuple[int, int, str]:
+        wall, counter, device_id = stamp.split(".", 2)
+        return int(wall), int(counter), device_id
+
+    @staticmethod
+    def _physical() -> int:
+        return int(time.time() * 1000)
+
+
+hlc = HybridLogicalClock()
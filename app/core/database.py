@@ -1,10 +1,15 @@
 import sqlite3
 import os
-from typing import Optional, Any, List, Dict
+import time
+from typing import Optional, Any, List, Dict, Callable
 from contextlib import contextmanager
 from datetime import datetime
 
 from app.config.settings import settings
+from app.core.clock import hlc
+from app.core.tracing import traced
+from app.core.slow_query import slow_queries, TimedConnection
+from app.core.rows import RowView, row_views
 
 
 class Database:
@@ -22,6 +27,7 @@ class Database:
 
         self._connection: Optional[sqlite3.Connection] = None
         self._db_path = settings.database.path
+        self._listeners: List[Callable[[List[str]], None]] = []
         self._ensure_directory()
         self._initialized = True
 
@@ -30,31 +36,71 @@ class Database:
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
 
+    @property
+    def is_remote(self) -> bool:
+        return settings.database.mode == "remote"
+
     @property
     def connection(self) -> sqlite3.Connection:
-        if self._connection is None:
+        if self._connection is None and self.is_remote:
+            from app.core.remote import RemoteConnection
+            self._connection = RemoteConnection(settings.database.server_address)
+            for callback in self._listeners:
+                self._connection.add_listener(callback)
+        elif self._connection is None:
             self._connection = sqlite3.connect(
                 self._db_path,
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
             )
             self._connection.row_factory = sqlite3.Row
             self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            hlc.install(self._connection)
         return self._connection
 
+    @traced("db.execute", query=True)
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
-        return self.connection.execute(query, params)
+        started = time.perf_counter()
+        cursor = self.connection.execute(query, params)
+        self._observe(query, params, started)
+        return cursor
 
+    @traced("db.executemany", query=True)
     def executemany(self, query: str, params_list: List[tuple]) -> sqlite3.Cursor:
-        return self.connection.executemany(query, params_list)
+        started = time.perf_counter()
+        cursor = self.connection.executemany(query, params_list)
+        self._observe(query, params_list, started, many=True)
+        return cursor
 
+    @traced("db.fetchone", query=True)
     def fetchone(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
-        cursor = self.execute(query, params)
-        return cursor.fetchone()
+        started = time.perf_counter()
+        row = self.connection.execute(query, params).fetchone()
+        self._observe(query, params, started)
+        return row
 
+    @traced("db.fetchall", query=True)
     def fetchall(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
-        cursor = self.execute(query, params)
-        return cursor.fetchall()
-
+        started = time.perf_counter()
+        rows = self.connection.execute(query, params).fetchall()
+        self._observe(query, params, started)
+        return rows
+
+    @traced("db.fetchall", query=True)
+    def fetchviews(self, query: str, params: tuple = ()) -> List[RowView]:
+        started = time.perf_counter()
+        cursor = self.connection.execute(query, params)
+        cursor.row_factory = None
+        rows = cursor.fetchall()
+        self._observe(query, params, started)
+        return row_views(cursor.description, rows)
+
+    def _observe(self, query: str, params: Any, started: float, many: bool = False):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms >= settings.diagnostics.slow_query_ms:
+            slow_queries.record(self.connection, query, params, elapsed_ms, many)
+
+    @traced("db.commit")
     def commit(self):
         if self._connection:
             self._connection.commit()
@@ -68,6 +114,17 @@ class Database:
             self._connection.close()
             self._connection = None
 
+    def add_change_listener(self, callback: Callable[[List[str]], None]):
+        self._listeners.append(callback)
+        if self._connection is not None and self.is_remote:
+            self._connection.add_listener(callback)
+
+    def remove_change_listener(self, callback: Callable[[List[str]], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+        if self._connection is not None and self.is_remote:
+            self._connection.remove_listener(callback)
+
     @contextmanager
     def transaction(self):
         try:
@@ -89,6 +146,24 @@ class Database:
         return result[0] if result else 0
 
 
+def open_connection(timeout: float = 30.0):
+    if settings.database.mode == "remote":
+        from app.core.remote import RemoteConnection
+        return RemoteConnection(settings.database.server_address)
+
+    connection = sqlite3.connect(
+        settings.database.path,
+        timeout=timeout,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        factory=TimedConnection
+    )
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("PRAGMA journal_mode = WAL")
+    hlc.install(connection)
+    return connection
+
+
 _db: Optional[Database] = None
 
 
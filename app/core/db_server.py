@@ -0,0 +1,322 @@
+import os
+import re
+import socket
+import sqlite3
+import argparse
+import itertools
+import threading
+import socketserver
+from typing import Optional, Dict, Any, Set
+
+from app.config.settings import settings
+from app.core.clock import hlc
+from app.core.remote import send_frame, recv_frame, parse_address, PAGE_SIZE
+
+WRITE_TABLE = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+[\"`\[]?(\w+)",
+    re.IGNORECASE
+)
+READ_PREFIXES = ("SELECT", "EXPLAIN", "WITH")
+
+
+def is_read(sql: str) -> bool:
+    head = sql.lstrip()[:10].upper()
+    if head.startswith(READ_PREFIXES):
+        return True
+    return head.startswith("PRAGMA") and "=" not in sql
+
+
+class _ClientSession:
+
+    def __init__(self, server: 'DatabaseServer', sock: socket.socket, client_id: int):
+        self.server = server
+        self.sock = sock
+        self.client_id = client_id
+        self.subscribed = False
+        self.holds_write = False
+        self.changed: Set[str] = set()
+        self.cursors: Dict[int, sqlite3.Cursor] = {}
+        self._cursor_ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self.connection = server.open_connection()
+
+    def send(self, message: Dict[str, Any]):
+        with self._send_lock:
+            send_frame(self.sock, message)
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "hello":
+            return {"client_id": self.client_id}
+        if op == "execute":
+            return self._execute(request["sql"], request.get("params") or [])
+        if op == "executemany":
+            return self._executemany(request["sql"], request.get("params") or [])
+        if op == "fetch":
+            return self._fetch(request["cursor"], request.get("size", PAGE_SIZE))
+        if op == "close_cursor":
+            cursor = self.cursors.pop(request["cursor"], None)
+            if cursor:
+                cursor.close()
+            return {}
+        if op == "commit":
+            self.connection.commit()
+            self._finish_write()
+            return {}
+        if op == "rollback":
+            self.connection.rollback()
+            self.changed.clear()
+            self._finish_write()
+            return {}
+        if op == "subscribe":
+            self.subscribed = True
+            return {}
+        raise sqlite3.ProgrammingError(f"Bilinmeyen işlem: {op}")
+
+    def _execute(self, sql: str, params) -> Dict[str, Any]:
+        write = not is_read(sql)
+        if write:
+            self._begin_write(sql)
+        try:
+            cursor = self.connection.execute(sql, params)
+        finally:
+            if write and not self.connection.in_transaction:
+                self._finish_write()
+        return self._cursor_reply(cursor)
+
+    def _executemany(self, sql: str, params) -> Dict[str, Any]:
+        self._begin_write(sql)
+        try:
+            cursor = self.connection.executemany(sql, params)
+        finally:
+            if not self.connection.in_transaction:
+                self._finish_write()
+        return self._cursor_reply(cursor)
+
+    def _cursor_reply(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+        reply = {"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}
+        if cursor.description is None:
+            return reply
+
+        reply["columns"] = [d[0] for d in cursor.description]
+        rows = cursor.fetchmany(PAGE_SIZE)
+        reply["rows"] = [tuple(r) for r in rows]
+        if len(rows) == PAGE_SIZE:
+            cursor_id = next(self._cursor_ids)
+            self.cursors[cursor_id] = cursor
+            reply["cursor"] = cursor_id
+        return reply
+
+    def _fetch(self, cursor_id: int, size: int) -> Dict[str, Any]:
+        cursor = self.cursors.get(cursor_id)
+        if cursor is None:
+            return {"rows": [], "more": False}
+        rows = cursor.fetchmany(size)
+        more = len(rows) == size
+        if not more:
+            self.cursors.pop(cursor_id, None)
+        return {"rows": [tuple(r) for r in rows], "more": more}
+
+    def _begin_write(self, sql: str):
+        if not self.holds_write:
+            if not self.server.write_lock.acquire(timeout=self.server.lock_timeout):
+                raise sqlite3.OperationalError("database is locked")
+            self.holds_write = True
+        match = WRITE_TABLE.match(sql)
+        if match:
+            self.changed.add(match.group(1).lower())
+
+    def _finish_write(self):
+        changed, self.changed = self.changed, set()
+        if self.holds_write:
+            self.holds_write = False
+            self.server.write_lock.release()
+        if changed:
+            if "sync_state" in changed and not hlc.device_id:
+                self.server.load_device_id()
+            self.server.broadcast(self, sorted(changed))
+
+    def close(self):
+        for cursor in self.cursors.values():
+            cursor.close()
+        self.cursors.clear()
+        if self.connection.in_transaction:
+            self.connection.rollback()
+        self.changed.clear()
+        self._finish_write()
+        self.connection.close()
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        owner: DatabaseServer = self.server.owner
+        session = owner.register(self.request)
+        try:
+            while True:
+                request = recv_frame(self.request)
+                if request is None:
+                    break
+                try:
+                    reply = session.handle(request)
+                except sqlite3.Error as e:
+                    reply = {"error": type(e).__name__, "message": str(e)}
+                except (KeyError, TypeError, ValueError) as e:
+                    reply = {"error": "ProgrammingError", "message": str(e)}
+                reply["id"] = request.get("id")
+                reply["in_transaction"] = session.connection.in_transaction
+                session.send(reply)
+        except OSError:
+            pass
+        finally:
+            owner.unregister(session)
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class DatabaseServer:
+
+    def __init__(self, db_path: str = None, address: str = None, lock_timeout: float = 30.0):
+        self.db_path = db_path or settings.database.path
+        self.address = address or settings.database.server_address
+        self.lock_timeout = lock_timeout
+        self.write_lock = threading.Lock()
+        self._sessions: Set[_ClientSession] = set()
+        self._sessions_lock = threading.Lock()
+        self._client_ids = itertools.count(1)
+        self._server: Optional[socketserver.BaseServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.close()
+        self.load_device_id()
+
+    def load_device_id(self):
+        connection = sqlite3.connect(self.db_path)
+        try:
+            row = connection.execute("SELECT value FROM sync_state WHERE key = 'device_id'").fetchone()
+            if row:
+                hlc.set_device_id(row[0])
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            connection.close()
+
+    def open_connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.db_path,
+            timeout=self.lock_timeout,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False
+        )
+        connection.execute("PRAGMA foreign_keys = ON")
+        hlc.install(connection)
+        return connection
+
+    def register(self, sock: socket.socket) -> _ClientSession:
+        session = _ClientSession(self, sock, next(self._client_ids))
+        with self._sessions_lock:
+            self._sessions.add(session)
+        return session
+
+    def unregister(self, session: _ClientSession):
+        with self._sessions_lock:
+            self._sessions.discard(session)
+        session.close()
+
+    def broadcast(self, origin: _ClientSession, tables):
+        message = {"event": "changes", "tables": tables, "origin": origin.client_id}
+        with self._sessions_lock:
+            targets = [s for s in self._sessions if s.subscribed and s is not origin]
+        for session in targets:
+            try:
+                session.send(message)
+            except OSError:
+                pass
+
+    @property
+    def client_count(self) -> int:
+        with self._sessions_lock:
+            return len(self._sessions)
+
+    def bind(self):
+        family, target = parse_address(self.address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(target):
+                os.unlink(target)
+            self._server = _UnixServer(target, _RequestHandler)
+        else:
+            self._server = _TCPServer(target, _RequestHandler)
+            self.address = f"{target[0]}:{self._server.server_address[1]}"
+        self._server.owner = self
+        return self
+
+    def serve_forever(self):
+        if self._server is None:
+            self.bind()
+        self._server.serve_forever()
+
+    def start(self) -> 'DatabaseServer':
+        if self._server is None:
+            self.bind()
+        self._thread = threading.Thread(target=self._server.serve_forever, name="db-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            family, target = parse_address(self.address)
+            if family == socket.AF_UNIX and os.path.exists(target):
+                os.unlink(target)
+            self._server = None
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            try:
+                session.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paylaşımlı veritabanı sunucusu")
+    parser.add_argument("--db", default=settings.database.path)
+    parser.add_argument("--address", default=settings.database.server_address)
+    parser.add_argument("--init", action="store_true", help="Şemayı oluştur")
+    args = parser.parse_args()
+
+    if args.init:
+        settings.database.path = args.db
+        from app.core.schema import init_database
+        init_database()
+
+    from app.services.archive_service import ArchiveService
+    archive = ArchiveService(args.db)
+    archive.start()
+
+    server = DatabaseServer(args.db, args.address).bind()
+    print(f"Veritabanı sunucusu: {server.address} ({args.db})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        archive.stop()
+
+
+if __name__ == "__main__":
+    main()
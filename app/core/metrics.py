@@ -0,0 +1,68 @@
+import math
+import threading
+from typing import Dict, List
+
+
+class LatencyHistogram:
+
+    MIN_MS = 0.01
+    GROWTH = 1.1
+    BUCKETS = 200
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._counts: List[int] = [0] * (self.BUCKETS + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float):
+        if ms <= self.MIN_MS:
+            index = 0
+        else:
+            index = min(self.BUCKETS, int(math.log(ms / self.MIN_MS, self.GROWTH)) + 1)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total_ms += ms
+            if ms > self.max_ms:
+                self.max_ms = ms
+
+    def percentile(self, pct: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(self.count * pct / 100))
+            seen = 0
+            for index, bucket in enumerate(self._counts):
+                seen += bucket
+                if seen >= rank:
+                    return min(self.max_ms, self.MIN_MS * self.GROWTH ** index)
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (self.BUCKETS + 1)
+            self.count = 0
+            self.total_ms = 0.0
+            self.max_ms = 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': round(self.mean_ms, 3),
+            'p50': round(self.percentile(50), 3),
+            'p95': round(self.percentile(95), 3),
+            'p99': round(self.percentile(99), 3),
+            'max': round(self.max_ms, 3)
+        }
+
+    def __str__(self) -> str:
+        s = self.summary()
+        return (f"{self.name:<10} n={s['count']:<6} ort {s['mean']:8.2f} ms  p50 {s['p50']:8.2f} ms  "
+                f"p95 {s['p95']:8.2f} ms  p99 {s['p99']:8.2f} ms  maks {s['max']:8.2f} ms")
@@ -0,0 +1,260 @@
+import os
+import json
+import queue
+import base64
+import socket
+import sqlite3
+import struct
+import threading
+from typing import Optional, List, Dict, Any, Callable, Tuple, Set
+from datetime import datetime, date
+
+FRAME_HEADER = struct.Struct("!I")
+PAGE_SIZE = 500
+
+_local_clients: Set[Tuple[str, int]] = set()
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$b": base64.b64encode(bytes(value)).decode("ascii")}
+    raise TypeError(f"Desteklenmeyen tip: {type(value).__name__}")
+
+
+def _decode_value(obj):
+    if len(obj) == 1:
+        if "$dt" in obj:
+            return datetime.fromisoformat(obj["$dt"])
+        if "$d" in obj:
+            return date.fromisoformat(obj["$d"])
+        if "$b" in obj:
+            return base64.b64decode(obj["$b"])
+    return obj
+
+
+def send_frame(sock: socket.socket, message: Dict[str, Any]):
+    payload = json.dumps(message, default=_encode_value, separators=(",", ":")).encode("utf-8")
+    sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        return None
+    return json.loads(payload.decode("utf-8"), object_hook=_decode_value)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def parse_address(address: str) -> Tuple[int, Any]:
+    if ":" in address and not address.startswith(("/", ".", "~")):
+        host, port = address.rsplit(":", 1)
+        return socket.AF_INET, (host, int(port))
+    return socket.AF_UNIX, os.path.expanduser(address)
+
+
+def raise_remote_error(error: str, message: str):
+    exc_type = getattr(sqlite3, error, None)
+    if not (isinstance(exc_type, type) and issubclass(exc_type, sqlite3.Error)):
+        exc_type = sqlite3.OperationalError
+    raise exc_type(message)
+
+
+class RemoteRow(tuple):
+
+    def __new__(cls, values, index: Dict[str, int]):
+        row = super().__new__(cls, values)
+        row._index = index
+        return row
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return tuple.__getitem__(self, self._index[key])
+            except KeyError:
+                raise IndexError(f"No item with that key: {key}")
+        return tuple.__getitem__(self, key)
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+
+class RemoteCursor:
+
+    def __init__(self, connection: 'RemoteConnection', reply: Dict[str, Any]):
+        self._connection = connection
+        self._cursor_id = reply.get("cursor")
+        self.rowcount = reply.get("rowcount", -1)
+        self.lastrowid = reply.get("lastrowid")
+        columns = reply.get("columns")
+        self.description = tuple((c, None, None, None, None, None, None) for c in columns) if columns else None
+        self._index = {c: i for i, c in enumerate(columns or [])}
+        self._rows = [RemoteRow(r, self._index) for r in reply.get("rows", [])]
+
+    def _fill(self) -> bool:
+        if self._cursor_id is None:
+            return False
+        reply = self._connection._call("fetch", cursor=self._cursor_id, size=PAGE_SIZE)
+        if not reply.get("more"):
+            self._cursor_id = None
+        rows = reply.get("rows", [])
+        self._rows.extend(RemoteRow(r, self._index) for r in rows)
+        return bool(rows)
+
+    def fetchone(self):
+        if not self._rows and not self._fill():
+            return None
+        return self._rows.pop(0)
+
+    def fetchmany(self, size: int = PAGE_SIZE) -> List[RemoteRow]:
+        while len(self._rows) < size and self._fill():
+            pass
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self) -> List[RemoteRow]:
+        while self._fill():
+            pass
+        rows, self._rows = self._rows, []
+        return rows
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def close(self):
+        if self._cursor_id is not None:
+            self._connection._call("close_cursor", cursor=self._cursor_id)
+            self._cursor_id = None
+        self._rows = []
+
+
+class RemoteConnection:
+
+    def __init__(self, address: str, timeout: float = 30.0):
+        family, target = parse_address(address)
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(target)
+        self._sock.settimeout(None)
+        self._timeout = timeout
+        self._address = address
+        self.client_id = None
+        self._request_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._replies: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._next_id = 0
+        self._closed = False
+        self.in_transaction = False
+        self.row_factory = None
+        self._reader = threading.Thread(target=self._read_loop, name="db-remote", daemon=True)
+        self._reader.start()
+        hello = self._call("hello")
+        self.client_id = hello.get("client_id")
+        _local_clients.add((address, self.client_id))
+
+    def execute(self, query: str, params=()) -> RemoteCursor:
+        reply = self._call("execute", sql=query, params=list(params))
+        return RemoteCursor(self, reply)
+
+    def executemany(self, query: str, params_list) -> RemoteCursor:
+        reply = self._call("executemany", sql=query, params=[list(p) for p in params_list])
+        return RemoteCursor(self, reply)
+
+    def commit(self):
+        self._call("commit")
+
+    def rollback(self):
+        self._call("rollback")
+
+    def create_function(self, *args, **kwargs):
+        pass
+
+    def add_listener(self, callback: Callable[[List[str]], None]):
+        if not self._listeners:
+            self._call("subscribe")
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[List[str]], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        _local_clients.discard((self._address, self.client_id))
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def _call(self, op: str, **kwargs) -> Dict[str, Any]:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Veritabanı bağlantısı kapalı")
+
+        with self._request_lock:
+            self._next_id += 1
+            request_id = self._next_id
+            with self._send_lock:
+                try:
+                    send_frame(self._sock, dict(kwargs, id=request_id, op=op))
+                except OSError as e:
+                    raise sqlite3.OperationalError(f"Veritabanı sunucusuna ulaşılamıyor: {e}")
+
+            while True:
+                try:
+                    reply = self._replies.get(timeout=self._timeout * 2)
+                except queue.Empty:
+                    raise sqlite3.OperationalError("Veritabanı sunucusu yanıt vermiyor")
+                if reply is None:
+                    raise sqlite3.OperationalError("Veritabanı sunucusuna bağlantı koptu")
+                if reply.get("id") == request_id:
+                    break
+
+        self.in_transaction = reply.get("in_transaction", False)
+        if "error" in reply:
+            raise_remote_error(reply["error"], reply.get("message", ""))
+        return reply
+
+    def _read_loop(self):
+        try:
+            while True:
+                message = recv_frame(self._sock)
+                if message is None:
+                    break
+                if "event" in message:
+                    if (self._address, message.get("origin")) in _local_clients:
+                        continue
+                    for callback in list(self._listeners):
+                        try:
+                            callback(message.get("tables", []))
+                        except Exception:
+                            pass
+                else:
+                    self._replies.put(message)
+        except OSError:
+            pass
+        self._replies.put(None)
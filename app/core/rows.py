@@ -0,0 +1,68 @@
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+_item = tuple.__getitem__
+
+
+class RowView(tuple):
+    __slots__ = ()
+    _index: Dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return _item(self, self._index[key])
+        return _item(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return _item(self, index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def values(self) -> List[Any]:
+        return [_item(self, index) for index in self._index.values()]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, _item(self, index)) for key, index in self._index.items()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: _item(self, index) for key, index in self._index.items()}
+
+    def __repr__(self) -> str:
+        return f"RowView({self.to_dict()!r})"
+
+
+_row_types: Dict[Tuple[str, ...], type] = {}
+
+
+def row_type(columns: Iterable[str]) -> type:
+    columns = tuple(columns)
+    cls = _row_types.get(columns)
+    if cls is None:
+        index = {name: position for position, name in enumerate(columns)}
+        cls = _row_types[columns] = type("RowView", (RowView,), {'__slots__': (), '_index': index})
+    return cls
+
+
+def row_views(description: Sequence[tuple], rows: Iterable[tuple]) -> List[RowView]:
+    if not description:
+        return []
+    cls = row_type(column[0] for column in description)
+    shared = {}.setdefault
+    return [cls([shared(value, value) if value.__class__ is str else value for value in row]) for row in rows]
+
+
+def as_dict(row) -> Dict[str, Any]:
+    if isinstance(row, dict):
+        return row
+    if isinstance(row, RowView):
+        return row.to_dict()
+    return dict(row)
@@ -0,0 +1,701 @@
+import uuid
+import sqlite3
+
+from app.core.database import get_db
+from app.core.clock import hlc
+from app.config.settings import settings
+from app.config.constants import SyncTables, SearchKinds
+
+SCHEMA_VERSION = 5
+
+
+def init_database():
+    db = get_db()
+    if _schema_current(db):
+        return
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS roles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            code TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            level INTEGER DEFAULT 0,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS operators (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            badge_number TEXT UNIQUE NOT NULL,
+            full_name TEXT NOT NULL,
+            pin_hash TEXT,
+            role_id INTEGER REFERENCES roles(id),
+            default_zone TEXT DEFAULT 'DIRTY',
+            workstation_id INTEGER,
+            is_active INTEGER DEFAULT 1,
+            can_approve_sterilization INTEGER DEFAULT 0,
+            can_release_load INTEGER DEFAULT 0,
+            last_login TIMESTAMP,
+            failed_attempts INTEGER DEFAULT 0,
+            locked_until TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS departments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            code TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS machines (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            machine_type TEXT NOT NULL,
+            manufacturer TEXT,
+            model TEXT,
+            serial_number TEXT,
+            zone TEXT,
+            status TEXT DEFAULT 'IDLE',
+            current_cycle_id INTEGER,
+            last_maintenance TIMESTAMP,
+            next_maintenance TIMESTAMP,
+            total_cycles INTEGER DEFAULT 0,
+            is_active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS machine_programs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            machine_id INTEGER REFERENCES machines(id),
+            name TEXT NOT NULL,
+            code TEXT,
+            temperature REAL,
+            pressure REAL,
+            duration_minutes INTEGER,
+            description TEXT,
+            is_active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS machine_cycles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_number TEXT UNIQUE NOT NULL,
+            machine_id INTEGER REFERENCES machines(id),
+            program_id INTEGER REFERENCES machine_programs(id),
+            operator_id INTEGER REFERENCES operators(id),
+            start_time TIMESTAMP,
+            end_time TIMESTAMP,
+            status TEXT DEFAULT 'IDLE',
+            temperature_achieved REAL,
+            pressure_achieved REAL,
+            ci_result TEXT DEFAULT 'PENDING',
+            bi_lot_number TEXT,
+            bi_result TEXT DEFAULT 'PENDING',
+            bi_read_time TIMESTAMP,
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS maintenance_plans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            machine_id INTEGER NOT NULL REFERENCES machines(id),
+            maintenance_type TEXT NOT NULL,
+            interval_days INTEGER DEFAULT 0,
+            interval_cycles INTEGER DEFAULT 0,
+            last_performed_at TIMESTAMP,
+            last_performed_cycles INTEGER DEFAULT 0,
+            is_active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS maintenance_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            machine_id INTEGER NOT NULL REFERENCES machines(id),
+            plan_id INTEGER REFERENCES maintenance_plans(id),
+            maintenance_type TEXT NOT NULL,
+            performed_by INTEGER REFERENCES operators(id),
+            maintenance_date TIMESTAMP NOT NULL,
+            cycle_count INTEGER DEFAULT 0,
+            next_maintenance_date TIMESTAMP,
+            description TEXT,
+            result TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS machine_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            machine_id INTEGER NOT NULL REFERENCES machines(id),
+            event TEXT NOT NULL,
+            from_status TEXT,
+            to_status TEXT NOT NULL,
+            cycle_id INTEGER REFERENCES machine_cycles(id),
+            operator_id INTEGER REFERENCES operators(id),
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_machine_events_machine
+        ON machine_events(machine_id, id)
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS cycle_telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id INTEGER UNIQUE NOT NULL REFERENCES machine_cycles(id),
+            sample_count INTEGER DEFAULT 0,
+            duration_seconds REAL DEFAULT 0,
+            elapsed_data BLOB,
+            temperature_data BLOB,
+            pressure_data BLOB,
+            phase_data BLOB,
+            max_temperature REAL,
+            max_pressure REAL,
+            hold_temperature REAL,
+            hold_seconds REAL,
+            f0_value REAL,
+            source TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS cycle_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id INTEGER UNIQUE NOT NULL REFERENCES machine_cycles(id),
+            result TEXT NOT NULL,
+            hold_start REAL,
+            hold_seconds REAL,
+            hold_min_temperature REAL,
+            hold_max_temperature REAL,
+            hold_min_pressure REAL,
+            max_gap_seconds REAL,
+            f0_value REAL,
+            failures TEXT,
+            analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS instruments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            barcode TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            category TEXT,
+            manufacturer TEXT,
+            model_number TEXT,
+            serial_number TEXT,
+            max_cycles INTEGER DEFAULT 0,
+            current_cycles INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'ACTIVE',
+            location TEXT,
+            last_sterilization TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS instrument_sets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            barcode TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            category TEXT,
+            department_id INTEGER REFERENCES departments(id),
+            container_type TEXT,
+            sterilization_method TEXT DEFAULT 'STEAM',
+            validity_days INTEGER DEFAULT 30,
+            status TEXT DEFAULT 'ACTIVE',
+            total_instruments INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS set_contents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            set_id INTEGER REFERENCES instrument_sets(id),
+            instrument_id INTEGER REFERENCES instruments(id),
+            quantity INTEGER DEFAULT 1,
+            is_mandatory INTEGER DEFAULT 1,
+            position TEXT
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS work_orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_number TEXT UNIQUE NOT NULL,
+            barcode TEXT,
+            item_type TEXT NOT NULL,
+            item_id INTEGER NOT NULL,
+            item_name TEXT,
+            item_barcode TEXT,
+            department_id INTEGER REFERENCES departments(id),
+            priority INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'RECEIVED',
+            current_zone TEXT DEFAULT 'DIRTY',
+            source_department TEXT,
+            destination_department TEXT,
+            received_by INTEGER REFERENCES operators(id),
+            received_at TIMESTAMP,
+            notes TEXT,
+            is_urgent INTEGER DEFAULT 0,
+            due_date TIMESTAMP,
+            completed_at TIMESTAMP,
+            status_epoch INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    _add_column(db, "work_orders", "status_epoch", "INTEGER DEFAULT 0")
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS process_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            work_order_id INTEGER REFERENCES work_orders(id),
+            process_type TEXT NOT NULL,
+            zone TEXT,
+            workstation_id INTEGER,
+            operator_id INTEGER REFERENCES operators(id),
+            machine_id INTEGER REFERENCES machines(id),
+            cycle_id INTEGER REFERENCES machine_cycles(id),
+            start_time TIMESTAMP,
+            end_time TIMESTAMP,
+            status TEXT,
+            result TEXT,
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS cycle_contents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cycle_id INTEGER REFERENCES machine_cycles(id),
+            work_order_id INTEGER REFERENCES work_orders(id),
+            loaded_at TIMESTAMP,
+            unloaded_at TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_machine_cycles_machine
+        ON machine_cycles(machine_id, start_time)
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_cycle_contents_cycle
+        ON cycle_contents(cycle_id)
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_process_records_order
+        ON process_records(work_order_id, created_at)
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_work_orders_barcode
+        ON work_orders(barcode)
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_work_orders_item
+        ON work_orders(item_type, item_id, status)
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sterilization_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            record_number TEXT UNIQUE NOT NULL,
+            work_order_id INTEGER REFERENCES work_orders(id),
+            item_type TEXT,
+            item_id INTEGER,
+            item_name TEXT,
+            item_barcode TEXT,
+            cycle_id INTEGER REFERENCES machine_cycles(id),
+            machine_id INTEGER REFERENCES machines(id),
+            sterilization_method TEXT,
+            operator_id INTEGER REFERENCES operators(id),
+            load_time TIMESTAMP,
+            unload_time TIMESTAMP,
+            status TEXT DEFAULT 'PENDING_CI',
+            ci_result TEXT DEFAULT 'PENDING',
+            ci_checked_by INTEGER REFERENCES operators(id),
+            ci_checked_at TIMESTAMP,
+            bi_lot_number TEXT,
+            bi_result TEXT DEFAULT 'PENDING',
+            bi_incubation_start TIMESTAMP,
+            bi_read_by INTEGER REFERENCES operators(id),
+            bi_read_at TIMESTAMP,
+            released_by INTEGER REFERENCES operators(id),
+            released_at TIMESTAMP,
+            rejected_by INTEGER REFERENCES operators(id),
+            rejected_at TIMESTAMP,
+            rejection_reason TEXT,
+            expiry_date TIMESTAMP,
+            storage_location TEXT,
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sterilization_release_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sterilization_id INTEGER REFERENCES sterilization_records(id),
+            action TEXT NOT NULL,
+            performed_by INTEGER REFERENCES operators(id),
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sterilization_records_load
+        ON sterilization_records(load_time)
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sterilization_release_log_record
+        ON sterilization_release_log(sterilization_id, created_at)
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS reprocessing_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            work_order_id INTEGER REFERENCES work_orders(id),
+            reason TEXT,
+            initiated_by INTEGER REFERENCES operators(id),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS audit_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            operator_id INTEGER REFERENCES operators(id),
+            action TEXT NOT NULL,
+            entity_type TEXT,
+            entity_id INTEGER,
+            old_value TEXT,
+            new_value TEXT,
+            ip_address TEXT,
+            details TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS login_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            operator_id INTEGER REFERENCES operators(id),
+            badge_number TEXT,
+            workstation_id INTEGER,
+            zone TEXT,
+            login_time TIMESTAMP NOT NULL,
+            logout_time TIMESTAMP,
+            end_reason TEXT
+        )
+    """)
+
+    db.execute("""
+        CREATE INDEX IF NOT EXISTS idx_login_sessions_operator
+        ON login_sessions(operator_id, login_time)
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS permissions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            code TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            module TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS role_permissions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            role_id INTEGER REFERENCES roles(id),
+            permission_id INTEGER REFERENCES permissions(id),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(role_id, permission_id)
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sync_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            operation TEXT NOT NULL,
+            hlc TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    _add_column(db, "sync_outbox", "hlc", "TEXT")
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sync_row_clock (
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            hlc TEXT NOT NULL,
+            PRIMARY KEY (table_name, row_id)
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sync_row_map (
+            table_name TEXT NOT NULL,
+            origin_device TEXT NOT NULL,
+            origin_id INTEGER NOT NULL,
+            local_id INTEGER NOT NULL,
+            PRIMARY KEY (table_name, origin_device, origin_id)
+        )
+    """)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS sync_conflicts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_key TEXT NOT NULL,
+            local_hlc TEXT,
+            remote_hlc TEXT,
+            resolution TEXT,
+            reason TEXT,
+            payload TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    db.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_sync_row_map_local
+        ON sync_row_map(table_name, local_id)
+    """)
+
+    device_id = db.fetchone("SELECT value FROM sync_state WHERE key = 'device_id'")
+    if device_id:
+        device_id = device_id[0]
+    else:
+        device_id = settings.sync.device_id or uuid.uuid4().hex
+        db.execute("INSERT INTO sync_state (key, value) VALUES ('device_id', ?)", (device_id,))
+    hlc.set_device_id(device_id)
+
+    for table in SyncTables.names():
+        for operation in SyncTables.OPERATIONS:
+            row = "OLD" if operation == "DELETE" else "NEW"
+            if operation == "DELETE":
+                clock = f"DELETE FROM sync_row_clock WHERE table_name = '{table}' AND row_id = OLD.id;"
+            else:
+                clock = """INSERT OR REPLACE INTO sync_row_clock (table_name, row_id, hlc)
+                    SELECT table_name, row_id, hlc FROM sync_outbox WHERE id = last_insert_rowid();"""
+            db.execute(f"DROP TRIGGER IF EXISTS sync_{table}_{operation.lower()}")
+            db.execute(f"""
+                CREATE TRIGGER sync_{table}_{operation.lower()}
+                AFTER {operation} ON {table}
+                WHEN NOT EXISTS (SELECT 1 FROM sync_state WHERE key = 'applying')
+                BEGIN
+                    INSERT INTO sync_outbox (table_name, row_id, operation, hlc)
+                    VALUES ('{table}', {row}.id, '{operation}', hlc_now());
+                    {clock}
+                END
+            """)
+
+    _install_search_index(db)
+
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS archive_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            operation TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            hlc TEXT,
+            data TEXT
+        )
+    """)
+
+    _install_archive_triggers(db, settings.database.archive_enabled)
+
+    db.commit()
+
+    existing = db.fetchone("SELECT id FROM roles WHERE code = 'ADMIN'")
+    if not existing:
+        db.execute("INSERT INTO roles (code, name, level) VALUES ('ADMIN', 'Yönetici', 100)")
+        db.execute("INSERT INTO roles (code, name, level) VALUES ('SUPERVISOR', 'Süpervizör', 80)")
+        db.execute("INSERT INTO roles (code, name, level) VALUES ('OPERATOR', 'Operatör', 50)")
+        db.execute("INSERT INTO roles (code, name, level) VALUES ('NURSE', 'Hemşire', 40)")
+        db.execute("INSERT INTO roles (code, name, level) VALUES ('VIEWER', 'İzleyici', 10)")
+
+        from app.core.security import hash_pin
+        pin_hash = hash_pin("1234")
+
+        db.execute("""
+            INSERT INTO operators (badge_number, full_name, pin_hash, role_id, can_release_load)
+            VALUES ('ADMIN001', 'Sistem Yöneticisi', ?, 1, 1)
+        """, (pin_hash,))
+
+        db.execute("""
+            INSERT INTO departments (name, code) VALUES
+            ('Ameliyathane', 'AME'),
+            ('Endoskopi', 'END'),
+            ('Yoğun Bakım', 'YBU'),
+            ('Acil', 'ACL')
+        """)
+
+        db.execute("""
+            INSERT INTO machines (name, machine_type, zone, status) VALUES
+            ('Yıkama-1', 'WASHER_DISINFECTOR', 'DIRTY', 'IDLE'),
+            ('Yıkama-2', 'WASHER_DISINFECTOR', 'DIRTY', 'IDLE'),
+            ('Otoklav-1', 'STEAM', 'STERILE', 'IDLE'),
+            ('Otoklav-2', 'STEAM', 'STERILE', 'IDLE'),
+            ('Plazma-1', 'PLASMA', 'STERILE', 'IDLE')
+        """)
+
+        db.commit()
+
+    db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    db.commit()
+
+
+def _schema_current(db) -> bool:
+    try:
+        row = db.fetchone("""
+            SELECT (SELECT user_version FROM pragma_user_version),
+                   (SELECT value FROM sync_state WHERE key = 'device_id'),
+                   (SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name GLOB 'archive_*')
+        """)
+    except sqlite3.OperationalError:
+        return False
+
+    version, device_id, archive_triggers = row
+    if version != SCHEMA_VERSION or not device_id:
+        return False
+    if bool(archive_triggers) != settings.database.archive_enabled:
+        return False
+    hlc.set_device_id(device_id)
+    return True
+
+
+def _add_column(db, table: str, column: str, definition: str):
+    columns = {row[1] for row in db.fetchall(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def _search_text(row: str, columns) -> str:
+    text = " || ' ' || ".join(f"COALESCE({row}.{column}, '')" for column in columns)
+    return f"replace({text}, 'ı', 'i')"
+
+
+def _install_search_index(db):
+    try:
+        created = not db.table_exists("search_index")
+        db.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+                title, code, body,
+                tokenize = "unicode61 remove_diacritics 2",
+                prefix = '2 3 4',
+                detail = column
+            )
+        """)
+    except sqlite3.OperationalError:
+        return
+
+    if created:
+        db.execute("INSERT INTO search_index (search_index, rank) VALUES ('rank', 'bm25(8.0, 4.0, 1.0)')")
+
+    for table, (kind, *groups) in SearchKinds.TABLES.items():
+        key = f"({kind} << {SearchKinds.SHIFT}) | {{row}}.id"
+        insert = (f"INSERT INTO search_index (rowid, title, code, body) VALUES ({key}, "
+                  + ", ".join(_search_text("{row}", columns) for columns in groups) + ");")
+        remove = f"DELETE FROM search_index WHERE rowid = {key};"
+        watched = ", ".join(dict.fromkeys(column for columns in groups for column in columns))
+        statements = {
+            "insert": (f"AFTER INSERT ON {table}", remove.format(row="NEW") + insert.format(row="NEW")),
+            "update": (f"AFTER UPDATE OF {watched} ON {table}",
+                       remove.format(row="OLD") + remove.format(row="NEW") + insert.format(row="NEW")),
+            "delete": (f"AFTER DELETE ON {table}", remove.format(row="OLD")),
+        }
+        for operation, (event, body) in statements.items():
+            db.execute(f"DROP TRIGGER IF EXISTS search_{table}_{operation}")
+            db.execute(f"CREATE TRIGGER search_{table}_{operation} {event} BEGIN {body} END")
+
+    if created:
+        rebuild_search_index(db)
+
+
+def rebuild_search_index(connection):
+    connection.execute("DELETE FROM search_index")
+    for table, (kind, *groups) in SearchKinds.TABLES.items():
+        connection.execute(f"INSERT INTO search_index (rowid, title, code, body) "
+                           f"SELECT ({kind} << {SearchKinds.SHIFT}) | {table}.id, "
+                           + ", ".join(_search_text(table, columns) for columns in groups) + f" FROM {table}")
+
+
+def _install_archive_triggers(db, enabled: bool):
+    for row in db.fetchall("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name GLOB 'archive_*'"):
+        db.execute(f"DROP TRIGGER IF EXISTS {row[0]}")
+    if not enabled:
+        return
+
+    tables = db.fetchall("""
+        SELECT name FROM sqlite_master
+        WHERE type = 'table' AND name NOT GLOB 'sqlite_*' AND name != 'archive_log'
+          AND name NOT GLOB 'search_index*'
+    """)
+    for (table,) in tables:
+        for operation in SyncTables.OPERATIONS:
+            row = "OLD" if operation == "DELETE" else "NEW"
+            if operation == "DELETE":
+                data = "NULL"
+            else:
+                pairs = []
+                for column in db.fetchall(f"PRAGMA table_info({table})"):
+                    name, declared = column[1], (column[2] or "").upper()
+                    if declared == "BLOB":
+                        value = f"CASE WHEN NEW.{name} IS NULL THEN NULL ELSE hex(NEW.{name}) END"
+                    else:
+                        value = f"NEW.{name}"
+                    pairs.append(f"'{name}', {value}")
+                data = f"json_object({', '.join(pairs)})"
+            db.execute(f"""
+                CREATE TRIGGER archive_{table}_{operation.lower()}
+                AFTER {operation} ON {table}
+                BEGIN
+                    INSERT INTO archive_log (table_name, operation, row_id, hlc, data)
+                    VALUES ('{table}', '{operation}', {row}.rowid, hlc_now(), {data});
+                END
+            """)
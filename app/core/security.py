@@ -0,0 +1,97 @@
+import os
+import sys
+import hmac
+import time
+import hashlib
+import argparse
+from typing import Tuple, Optional
+
+from app.config.settings import settings
+
+SCHEME = "scrypt"
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+def _cost(n: int = None) -> Tuple[int, int, int]:
+    security = settings.security
+    return n or security.pin_hash_n, security.pin_hash_r, security.pin_hash_p
+
+
+def _derive(pin: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        pin.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=2 * 128 * r * (n + p + 2), dklen=KEY_BYTES
+    )
+
+
+def hash_pin(pin: str, n: int = None) -> str:
+    n, r, p = _cost(n)
+    salt = os.urandom(SALT_BYTES)
+    key = _derive(pin, salt, n, r, p)
+    return f"{SCHEME}${n}${r}${p}${salt.hex()}${key.hex()}"
+
+
+def verify_pin(pin: str, stored: Optional[str]) -> bool:
+    if not stored:
+        return False
+
+    if not stored.startswith(SCHEME + "$"):
+        legacy = hashlib.sha256(pin.encode()).hexdigest()
+        return hmac.compare_digest(legacy, stored)
+
+    try:
+        _, n, r, p, salt, key = stored.split("$")
+        expected = bytes.fromhex(key)
+        derived = _derive(pin, bytes.fromhex(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(derived, expected)
+
+
+def needs_rehash(stored: Optional[str]) -> bool:
+    if not stored or not stored.startswith(SCHEME + "$"):
+        return True
+    parts = stored.split("$")
+    return len(parts) != 6 or tuple(int(v) for v in parts[1:4]) != _cost()
+
+
+def measure_ms(n: int = None, rounds: int = 5) -> float:
+    n, r, p = _cost(n)
+    salt = os.urandom(SALT_BYTES)
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _derive("0000", salt, n, r, p)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def calibrate(budget_ms: int = None) -> Tuple[int, float]:
+    budget_ms = budget_ms or settings.security.pin_hash_budget_ms
+    n, elapsed = 1 << 12, measure_ms(1 << 12)
+    while True:
+        candidate = measure_ms(n * 2)
+        if candidate > budget_ms:
+            return n, elapsed
+        n, elapsed = n * 2, candidate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PIN özet maliyeti ölçümü")
+    parser.add_argument("--budget-ms", type=int, default=None)
+    parser.add_argument("--calibrate", action="store_true")
+    args = parser.parse_args()
+
+    budget = args.budget_ms or settings.security.pin_hash_budget_ms
+    n, r, p = _cost()
+    elapsed = measure_ms()
+    print(f"scrypt n={n} r={r} p={p}: {elapsed:.1f} ms (bütçe {budget} ms)")
+    if args.calibrate:
+        best, best_ms = calibrate(budget)
+        print(f"Önerilen n={best}: {best_ms:.1f} ms")
+    return 0 if elapsed <= budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,9 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
 from app.config.settings import settings
-from app.config.constants import Roles, Zones
+from app.config.constants import Roles, Zones, SessionEndReasons
 
 
 @dataclass
@@ -15,6 +15,9 @@ class UserSession:
     zone: str
     workstation_id: Optional[int] = None
     permissions: Dict[str, bool] = field(default_factory=dict)
+    can_release_load: bool = False
+    can_approve_sterilization: bool = False
+    permission_version: int = 0
     login_time: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
 
@@ -27,6 +30,10 @@ class UserSession:
             return True
         return self.permissions.get(permission, False)
 
+    @property
+    def can_release(self) -> bool:
+        return self.can_release_load or self.has_permission('sterilization.release')
+
     def can_access_zone(self, zone: str) -> bool:
         if self.role in [Roles.ADMIN, Roles.SUPERVISOR]:
             return True
@@ -40,6 +47,11 @@ class UserSession:
         self.last_activity = datetime.now()
 
 
+PERMISSION_TABLES = {'operators', 'roles', 'permissions', 'role_permissions'}
+
+PermissionLoader = Callable[[int], Optional[Tuple[Dict[str, Any], Dict[str, bool]]]]
+
+
 class SessionManager:
     _instance: Optional['SessionManager'] = None
 
@@ -54,23 +66,57 @@ class SessionManager:
             return
 
         self._current_session: Optional[UserSession] = None
-        self._session_history: list = []
+        self._session_history: List[tuple] = []
+        self._permission_version = 0
+        self._permission_loader: Optional[PermissionLoader] = None
         self._initialized = True
 
     @property
     def current_user(self) -> Optional[UserSession]:
         if self._current_session and self._current_session.is_expired():
-            self.logout()
+            self.logout(SessionEndReasons.TIMEOUT)
             return None
+        if self._current_session and self._current_session.permission_version != self._permission_version:
+            self._reload_permissions()
         return self._current_session
 
+    @property
+    def permission_version(self) -> int:
+        return self._permission_version
+
+    def set_permission_loader(self, loader: PermissionLoader):
+        self._permission_loader = loader
+
+    def invalidate_permissions(self):
+        self._permission_version += 1
+
+    def on_tables_changed(self, tables: list):
+        if PERMISSION_TABLES.intersection(tables):
+            self.invalidate_permissions()
+
+    def _reload_permissions(self):
+        session = self._current_session
+        version = self._permission_version
+        loaded = self._permission_loader(session.user_id) if self._permission_loader else None
+        if loaded is None:
+            self.logout()
+            return
+
+        user_data, permissions = loaded
+        session.role = user_data['role']
+        session.full_name = user_data['full_name']
+        session.can_release_load = user_data.get('can_release_load', False)
+        session.can_approve_sterilization = user_data.get('can_approve_sterilization', False)
+        session.permissions = permissions
+        session.permission_version = version
+
     @property
     def is_authenticated(self) -> bool:
         return self.current_user is not None
 
     def login(self, user_data: Dict[str, Any], permissions: Dict[str, bool]) -> UserSession:
         if self._current_session:
-            self.logout()
+            self.logout(SessionEndReasons.SWITCH)
 
         self._current_session = UserSession(
             user_id=user_data['id'],
@@ -79,23 +125,40 @@ class SessionManager:
             role=user_data['role'],
             zone=user_data.get('default_zone', Zones.DIRTY),
             workstation_id=user_data.get('workstation_id'),
-            permissions=permissions
+            permissions=permissions,
+            can_release_load=user_data.get('can_release_load', False),
+            can_approve_sterilization=user_data.get('can_approve_sterilization', False),
+            permission_version=self._permission_version
         )
 
         return self._current_session
 
-    def logout(self) -> bool:
+    def logout(self, reason: str = SessionEndReasons.LOGOUT) -> bool:
         if self._current_session:
-            self._session_history.append({
-                'user_id': self._current_session.user_id,
-                'badge_number': self._current_session.badge_number,
-                'login_time': self._current_session.login_time,
-                'logout_time': datetime.now()
-            })
+            session = self._current_session
+            self._session_history.append((
+                session.user_id, session.badge_number, session.workstation_id, session.zone,
+                session.login_time, datetime.now(), reason
+            ))
             self._current_session = None
+            if len(self._session_history) >= settings.security.session_history_batch:
+                self.flush_history()
             return True
         return False
 
+    def flush_history(self):
+        if not self._session_history:
+            return
+        from app.core.writer import background_writer
+
+        history, self._session_history = self._session_history, []
+        background_writer.submit_many([("""
+            INSERT INTO login_sessions (
+                operator_id, badge_number, workstation_id, zone,
+                login_time, logout_time, end_reason
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, record) for record in history])
+
     def switch_zone(self, zone: str) -> bool:
         if not self._current_session:
             return False
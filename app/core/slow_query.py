@@ -0,0 +1,308 @@
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple, Any
+
+from app.config.settings import settings
+
+WHITESPACE = re.compile(r"\s+")
+PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+PLAN_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS (\w+))?(.*)$")
+TABLE_REF = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+KEYWORDS = {"WHERE", "ON", "LEFT", "RIGHT", "INNER", "OUTER", "CROSS", "NATURAL", "JOIN", "GROUP", "ORDER",
+            "LIMIT", "USING", "SET", "VALUES", "SELECT", "UNION", "HAVING", "WINDOW", "AS", "DEFAULT"}
+INTERNAL = tuple(os.path.join("app", "core", name) for name in ("database.py", "slow_query.py", "tracing.py"))
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TABLE_SIZE_TTL = 600.0
+
+
+def normalize(query: str) -> str:
+    return PLACEHOLDER_LIST.sub("(?, ...)", WHITESPACE.sub(" ", query).strip())
+
+
+def param_shape(value: Any) -> str:
+    if value is None:
+        return "None"
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def params_shape(params: Any, many: bool = False) -> str:
+    if many:
+        if isinstance(params, (list, tuple)):
+            first = params_shape(params[0]) if params else "()"
+            return f"{len(params)} x {first}"
+        return "çoklu (akış)"
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{key}: {param_shape(value)}" for key, value in params.items()) + "}"
+    return "(" + ", ".join(param_shape(value) for value in params) + ")"
+
+
+def caller_stack(depth: int = 6) -> List[str]:
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < depth:
+        filename = frame.f_code.co_filename
+        if not filename.endswith(INTERNAL):
+            frames.append(f"{os.path.relpath(filename, ROOT)}:{frame.f_lineno} {frame.f_code.co_name}")
+        frame = frame.f_back
+    return frames
+
+
+def _execute(connection, query: str, params: Any = ()):
+    if isinstance(connection, TimedConnection):
+        return sqlite3.Connection.execute(connection, query, params)
+    return connection.execute(query, params)
+
+
+def table_aliases(query: str) -> Dict[str, str]:
+    aliases = {}
+    for table, alias in TABLE_REF.findall(query):
+        aliases[table] = table
+        if alias and alias.upper() not in KEYWORDS:
+            aliases[alias] = table
+    return aliases
+
+
+class SlowQueryLog:
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.Lock()
+        self._logger = None
+        self._last_logged: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._table_sizes: Dict[str, Tuple[int, float]] = {}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._initialized = True
+
+    def record(self, connection, query: str, params: Any, elapsed_ms: float, many: bool = False):
+        statement = normalize(query)
+        now = time.monotonic()
+        with self._lock:
+            entry = self.stats.setdefault(statement, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                                      'plan': [], 'full_scans': []})
+            entry['count'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            last = self._last_logged.get(statement)
+            if last is not None and now - last < settings.diagnostics.slow_query_repeat_seconds:
+                self._suppressed[statement] = self._suppressed.get(statement, 0) + 1
+                return
+            self._last_logged[statement] = now
+            repeats = self._suppressed.pop(statement, 0)
+
+        sample = params
+        if many:
+            sample = params[0] if isinstance(params, (list, tuple)) and params else None
+        plan = self.explain(connection, query, sample) if not many or sample is not None else []
+        full_scans = self.full_scans(connection, query, plan)
+        entry['plan'], entry['full_scans'] = plan, full_scans
+
+        record = {
+            'time': datetime.now().isoformat(timespec="milliseconds"),
+            'ms': round(elapsed_ms, 2),
+            'query': statement,
+            'params': params_shape(params, many),
+            'plan': plan,
+            'full_scans': full_scans,
+            'stack': caller_stack(),
+            'thread': threading.current_thread().name,
+            'repeats': repeats,
+        }
+        self._write(record)
+        if full_scans:
+            tables = ", ".join(f"{scan['table']} ({scan['rows']} satır)" for scan in full_scans)
+            print(f"Yavaş sorgu {elapsed_ms:.0f} ms, tam tarama: {tables} @ "
+                  f"{record['stack'][0] if record['stack'] else '?'}", file=sys.stderr)
+
+    def explain(self, connection, query: str, params: Any) -> List[str]:
+        if not query.lstrip().upper().startswith(EXPLAINABLE):
+            return []
+        try:
+            rows = _execute(connection, f"EXPLAIN QUERY PLAN {query}",
+                            params if params is not None else ()).fetchall()
+        except Exception as e:
+            return [f"EXPLAIN başarısız: {e}"]
+
+        depth = {0: -1}
+        plan = []
+        for row in rows:
+            node, parent, detail = row[0], row[1], row[3]
+            depth[node] = depth.get(parent, -1) + 1
+            plan.append(f"{'  ' * depth[node]}{detail}")
+        return plan
+
+    def full_scans(self, connection, query: str, plan: List[str]) -> List[Dict[str, Any]]:
+        aliases = None
+        scans = []
+        for line in plan:
+            match = PLAN_SCAN.match(line.strip())
+            if match is None or "USING" in match.group(3) or "VIRTUAL TABLE" in match.group(3):
+                continue
+            if aliases is None:
+                aliases = table_aliases(query)
+            name = match.group(1)
+            table = aliases.get(name, name)
+            rows = self.table_size(connection, table)
+            if rows >= settings.diagnostics.large_table_rows:
+                scans.append({'table': table, 'rows': rows})
+        return scans
+
+    def table_size(self, connection, table: str) -> int:
+        cached = self._table_sizes.get(table)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < TABLE_SIZE_TTL:
+            return cached[0]
+        try:
+            row = _execute(connection, f"SELECT MAX(rowid) FROM {table}").fetchone()
+            rows = (row[0] or 0) if row else 0
+        except Exception:
+            rows = 0
+        self._table_sizes[table] = (rows, now)
+        return rows
+
+    def _write(self, record: Dict[str, Any]):
+        with self._lock:
+            if self._logger is None:
+                import logging
+                from logging.handlers import RotatingFileHandler
+                path = settings.diagnostics.slow_query_log
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                handler = RotatingFileHandler(path, maxBytes=settings.diagnostics.slow_query_log_bytes,
+                                              backupCount=settings.diagnostics.slow_query_log_backups,
+                                              encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self._logger = logging.getLogger("stys.slow_query")
+                self._logger.propagate = False
+                self._logger.setLevel(logging.INFO)
+                for old in list(self._logger.handlers):
+                    self._logger.removeHandler(old)
+                    old.close()
+                self._logger.addHandler(handler)
+        try:
+            self._logger.info(json.dumps(record, ensure_ascii=False))
+        except Exception as e:
+            print(f"Yavaş sorgu günlüğü yazılamadı: {e}", file=sys.stderr)
+
+    def close(self):
+        with self._lock:
+            if self._logger is not None:
+                for handler in list(self._logger.handlers):
+                    self._logger.removeHandler(handler)
+                    handler.close()
+                self._logger = None
+
+    def reset(self):
+        with self._lock:
+            self._last_logged.clear()
+            self._suppressed.clear()
+            self._table_sizes.clear()
+            self.stats.clear()
+
+
+slow_queries = SlowQueryLog()
+
+
+def _timed(connection, execute, query: str, params: Any, many: bool = False):
+    started = time.perf_counter()
+    result = execute(query, params)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if elapsed_ms >= settings.diagnostics.slow_query_ms:
+        slow_queries.record(connection, query, params, elapsed_ms, many)
+    return result
+
+
+class TimedCursor(sqlite3.Cursor):
+
+    def execute(self, query: str, params: Any = ()) -> sqlite3.Cursor:
+        return _timed(self.connection, super().execute, query, params)
+
+    def executemany(self, query: str, params: Any) -> sqlite3.Cursor:
+        return _timed(self.connection, super().executemany, query, params, many=True)
+
+
+class TimedConnection(sqlite3.Connection):
+
+    def cursor(self, factory=TimedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, query: str, params: Any = ()) -> sqlite3.Cursor:
+        return _timed(self, super().execute, query, params)
+
+    def executemany(self, query: str, params: Any) -> sqlite3.Cursor:
+        return _timed(self, super().executemany, query, params, many=True)
+
+
+def read_log(path: str) -> List[Dict[str, Any]]:
+    directory, base = os.path.split(path)
+    files = []
+    for name in os.listdir(directory or "."):
+        suffix = name[len(base) + 1:]
+        if name == base or (name.startswith(base + ".") and suffix.isdigit()):
+            files.append((int(suffix) if suffix else 0, name))
+
+    records = []
+    for _, name in sorted(files, reverse=True):
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yavaş sorgu günlüğü özeti")
+    parser.add_argument("path", nargs="?", default=settings.diagnostics.slow_query_log)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--scans", action="store_true", help="yalnızca büyük tablo taramaları")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"Günlük yok: {args.path}")
+        return 0
+
+    grouped: Dict[str, Dict[str, Any]] = {}
+    for record in read_log(args.path):
+        entry = grouped.setdefault(record['query'], {'count': 0, 'max_ms': 0.0, 'first': record['time']})
+        entry['count'] += 1 + record.get('repeats', 0)
+        entry['max_ms'] = max(entry['max_ms'], record['ms'])
+        entry['last'] = record
+
+    rows = [item for item in grouped.items() if not args.scans or item[1]['last']['full_scans']]
+    rows.sort(key=lambda item: (bool(item[1]['last']['full_scans']), item[1]['max_ms']), reverse=True)
+    for statement, entry in rows[:args.top]:
+        last = entry['last']
+        flag = " TAM TARAMA" if last['full_scans'] else ""
+        print(f"{entry['count']:5}x  maks {entry['max_ms']:8.1f} ms  ilk {entry['first'][:19]}{flag}")
+        print(f"       {statement[:160]}")
+        print(f"       parametreler {last['params']}")
+        for line in last['plan']:
+            print(f"         {line}")
+        for frame in last['stack'][:3]:
+            print(f"       @ {frame}")
+    return 1 if any(entry['last']['full_scans'] for _, entry in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+import os
+import sys
+import time
+import signal
+import inspect
+import argparse
+import threading
+import functools
+from collections import deque
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, NamedTuple
+
+from app.config.settings import settings
+from app.core.metrics import LatencyHistogram
+
+SPAN, QUERY, ACTION = 0, 1, 2
+
+_clock = time.perf_counter
+
+
+class ActionRecord(NamedTuple):
+    name: str
+    thread: str
+    started_at: datetime
+    duration_ms: float
+    queries: int
+    query_ms: float
+    spans: int
+
+
+class _ThreadState:
+    __slots__ = ("root", "stack", "stacks", "action", "queries", "query_time", "spans")
+
+    def __init__(self, root: str):
+        self.root = root
+        self.stack: List[list] = []
+        self.stacks: Dict[str, float] = {}
+        self.action: Optional[list] = None
+        self.queries = 0
+        self.query_time = 0.0
+        self.spans = 0
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_kind", "_frame")
+
+    def __init__(self, tracer: 'Tracer', name: str, kind: int):
+        self._tracer = tracer
+        self._name = name
+        self._kind = kind
+        self._frame = None
+
+    def __enter__(self):
+        if self._tracer.enabled:
+            self._frame = self._tracer._enter(self._name, self._kind)
+        return self
+
+    def __exit__(self, *exc):
+        if self._frame is not None:
+            self._tracer._exit(self._frame)
+            self._frame = None
+        return False
+
+
+class Tracer:
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.enabled = settings.diagnostics.tracing
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads: List[_ThreadState] = []
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.actions: deque = deque(maxlen=settings.diagnostics.action_history)
+        self._started = datetime.now()
+        self._initialized = True
+
+    def _state(self) -> _ThreadState:
+        try:
+            return self._local.state
+        except AttributeError:
+            state = self._local.state = _ThreadState(threading.current_thread().name.replace(";", "_"))
+            with self._lock:
+                self._threads.append(state)
+            return state
+
+    def _enter(self, name: str, kind: int) -> list:
+        state = self._state()
+        stack = state.stack
+        frame = [name, f"{stack[-1][1] if stack else state.root};{name}", kind, state, 0.0, 0.0]
+        if kind == ACTION and state.action is None:
+            state.action = frame
+            state.queries = 0
+            state.query_time = 0.0
+            state.spans = 0
+        state.spans += 1
+        stack.append(frame)
+        frame[4] = _clock()
+        return frame
+
+    def _exit(self, frame: list):
+        elapsed = _clock() - frame[4]
+        state = frame[3]
+        stack = state.stack
+        if stack and stack[-1] is frame:
+            stack.pop()
+        elif frame in stack:
+            del stack[stack.index(frame):]
+
+        stacks = state.stacks
+        path = frame[1]
+        stacks[path] = stacks.get(path, 0.0) + elapsed - frame[5]
+        if stack:
+            stack[-1][5] += elapsed
+
+        if frame[2] == QUERY:
+            state.queries += 1
+            state.query_time += elapsed
+        elif frame is state.action:
+            state.action = None
+            self.actions.append(ActionRecord(
+                frame[0], state.root, datetime.now(), elapsed * 1000,
+                state.queries, state.query_time * 1000, state.spans
+            ))
+
+        histogram = self._histograms.get(frame[0])
+        if histogram is None:
+            histogram = self._histograms.setdefault(frame[0], LatencyHistogram(frame[0]))
+        histogram.record(elapsed * 1000)
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name, SPAN)
+
+    def query(self, name: str) -> _Span:
+        return _Span(self, name, QUERY)
+
+    def action(self, name: str) -> _Span:
+        return _Span(self, name, ACTION)
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        return dict(self._histograms)
+
+    def stacks(self) -> Dict[str, float]:
+        with self._lock:
+            threads = list(self._threads)
+        merged: Dict[str, float] = {}
+        for state in threads:
+            for path, seconds in dict(state.stacks).items():
+                merged[path] = merged.get(path, 0.0) + seconds
+        return merged
+
+    def recent_actions(self, limit: int = None) -> List[ActionRecord]:
+        actions = list(self.actions)
+        return actions[-limit:] if limit else actions
+
+    def reset(self):
+        with self._lock:
+            for state in self._threads:
+                state.stacks = {}
+            self._histograms = {}
+            self.actions.clear()
+            self._started = datetime.now()
+
+    def folded(self) -> List[str]:
+        return [f"{path} {round(seconds * 1e6)}"
+                for path, seconds in sorted(self.stacks().items()) if seconds > 0]
+
+    def report(self, actions: int = 50) -> str:
+        histograms = sorted(self.histograms().values(), key=lambda h: h.total_ms, reverse=True)
+        width = max([len(h.name) for h in histograms] + [10])
+        lines = [f"İz: {self._started:%Y-%m-%d %H:%M:%S} - {datetime.now():%H:%M:%S}, "
+                 f"{len(histograms)} aralık, {len(self.actions)} kullanıcı eylemi",
+                 f"{'aralık':<{width}} {'adet':>8} {'toplam ms':>11} {'ort':>8} {'p50':>8} "
+                 f"{'p95':>8} {'p99':>8} {'maks':>8}"]
+        for h in histograms:
+            s = h.summary()
+            lines.append(f"{h.name:<{width}} {s['count']:>8} {h.total_ms:>11.1f} {s['mean']:>8.2f} "
+                         f"{s['p50']:>8.2f} {s['p95']:>8.2f} {s['p99']:>8.2f} {s['max']:>8.2f}")
+
+        lines.append("")
+        lines.append(f"Son {min(actions, len(self.actions))} eylem:")
+        for record in self.recent_actions(actions):
+            lines.append(f"  {record.started_at:%H:%M:%S.%f}"[:-3] + f"  {record.duration_ms:8.1f} ms  "
+                         f"{record.queries:4} sorgu {record.query_ms:8.1f} ms  {record.spans:5} aralık  "
+                         f"{record.name} [{record.thread}]")
+        return "\n".join(lines)
+
+    def dump(self, directory: str = None) -> str:
+        directory = directory or settings.diagnostics.trace_path
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"trace_{datetime.now():%Y%m%d_%H%M%S_%f}")
+        with open(base + ".folded", "w", encoding="utf-8") as f:
+            f.write("\n".join(self.folded()) + "\n")
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(self.report(settings.diagnostics.action_history) + "\n")
+        return base + ".folded"
+
+    def install_signal(self, signum: int = None) -> bool:
+        signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+        if signum is None or threading.current_thread() is not threading.main_thread():
+            return False
+
+        def handler(received, frame):
+            threading.Thread(target=self._dump_logged, name="trace-dump", daemon=True).start()
+
+        signal.signal(signum, handler)
+        return True
+
+    def _dump_logged(self):
+        try:
+            print(f"İz kaydedildi: {self.dump()}", file=sys.stderr)
+        except OSError as e:
+            print(f"İz kaydedilemedi: {e}", file=sys.stderr)
+
+
+tracer = Tracer()
+
+
+def traced(name: str = None, action: bool = False, query: bool = False):
+    kind = ACTION if action else QUERY if query else SPAN
+
+    def decorate(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            frame = tracer._enter(label, kind)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tracer._exit(frame)
+        return wrapper
+    return decorate
+
+
+def traced_service(cls):
+    for attribute, value in list(vars(cls).items()):
+        if (attribute.startswith("_") or not inspect.isfunction(value)
+                or inspect.isgeneratorfunction(value)):
+            continue
+        setattr(cls, attribute, traced(f"{cls.__name__}.{attribute}")(value))
+    return cls
+
+
+def load_folded(path: str) -> Dict[str, int]:
+    stacks: Dict[str, int] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            stack, _, value = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] = stacks.get(stack, 0) + int(value)
+    return stacks
+
+
+def top_frames(stacks: Dict[str, int], limit: int = 20) -> List[Tuple[str, int, int]]:
+    own: Dict[str, int] = {}
+    total: Dict[str, int] = {}
+    for stack, value in stacks.items():
+        frames = stack.split(";")[1:]
+        for frame in set(frames):
+            total[frame] = total.get(frame, 0) + value
+        if frames:
+            own[frames[-1]] = own.get(frames[-1], 0) + value
+    return sorted(((frame, own.get(frame, 0), value) for frame, value in total.items()),
+                  key=lambda row: row[1], reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alınan iz dosyasının özeti (flamegraph.pl ile de açılabilir)")
+    parser.add_argument("path")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    stacks = load_folded(args.path)
+    print(f"{'self ms':>10} {'toplam ms':>10}  aralık")
+    for frame, own, total in top_frames(stacks, args.top):
+        print(f"{own / 1000:10.1f} {total / 1000:10.1f}  {frame}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import queue
+import threading
+from typing import Optional, List, Tuple, Callable
+
+from app.core.database import open_connection
+
+Statement = Tuple[str, tuple]
+Callback = Callable[[bool, Optional[str], int], None]
+
+
+class BackgroundWriter:
+    _instance: Optional['BackgroundWriter'] = None
+
+    BATCH_SIZE = 200
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._queue: "queue.Queue[Optional[Tuple[List[Statement], Optional[Callback]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._initialized = True
+
+    def submit(self, query: str, params: tuple = (), callback: Callback = None):
+        self.submit_many([(query, params)], callback)
+
+    def submit_many(self, statements: List[Statement], callback: Callback = None):
+        self._ensure_thread()
+        self._queue.put((list(statements), callback))
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.join()
+
+    def stop(self, timeout: float = 10.0):
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        connection = open_connection()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = None in batch
+                self._write(connection, [item for item in batch if item is not None])
+                for _ in batch:
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    def _write(self, connection, batch: List[Tuple[List[Statement], Optional[Callback]]]):
+        if not batch:
+            return
+        try:
+            results = [(callback, True, None, self._execute(connection, statements))
+                       for statements, callback in batch]
+            connection.commit()
+            self.written += len(batch)
+        except Exception:
+            connection.rollback()
+            results = []
+            for statements, callback in batch:
+                try:
+                    changed = self._execute(connection, statements)
+                    connection.commit()
+                    self.written += 1
+                    results.append((callback, True, None, changed))
+                except Exception as e:
+                    connection.rollback()
+                    self.errors += 1
+                    self.last_error = str(e)
+                    results.append((callback, False, str(e), 0))
+
+        for callback, ok, error, changed in results:
+            if callback is None:
+                continue
+            try:
+                callback(ok, error, changed)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+
+    @staticmethod
+    def _execute(connection, statements: List[Statement]) -> int:
+        changed = 0
+        for index, (query, params) in enumerate(statements):
+            cursor = connection.execute(query, params)
+            if index == 0:
+                changed = cursor.rowcount
+        return changed
+
+
+background_writer = BackgroundWriter()
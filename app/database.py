@@ -10,6 +10,8 @@ from contextlib import contextmanager
 from typing import Optional, List, Dict
 import hashlib
 
+from app.core.slow_query import TimedConnection
+
 DATABASE_PATH = os.path.expanduser("~/data/sterilizasyon.db")
 
 
@@ -760,7 +762,7 @@ def init_database():
 @contextmanager
 def get_connection():
     """Veritabanı bağlantısı context manager"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = sqlite3.connect(DATABASE_PATH, factory=TimedConnection)
     conn.row_factory = sqlite3.Row
     try:
         yield conn
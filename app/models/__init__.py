@@ -3,11 +3,15 @@ from .instrument import Instrument, InstrumentSet, SetContent
 from .machine import Machine, MachineProgram, MachineCycle
 from .work_order import WorkOrder, ProcessRecord
 from .sterilization import SterilizationRecord, SterilizationRelease
+from .telemetry import CycleTelemetry
+from .maintenance import MaintenancePlan, MaintenanceRecord
 
 __all__ = [
     'User', 'Role', 'Permission',
     'Instrument', 'InstrumentSet', 'SetContent',
     'Machine', 'MachineProgram', 'MachineCycle',
     'WorkOrder', 'ProcessRecord',
-    'SterilizationRecord', 'SterilizationRelease'
+    'SterilizationRecord', 'SterilizationRelease',
+    'CycleTelemetry',
+    'MaintenancePlan', 'MaintenanceRecord'
 ]
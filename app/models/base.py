@@ -1,20 +1,16 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseModel:
     id: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
-        return data
+        return {name: _plain(getattr(self, name)) for name in self.__dataclass_fields__}
 
     @classmethod
     def from_row(cls, row) -> Optional['BaseModel']:
@@ -25,3 +21,13 @@ class BaseModel:
     @classmethod
     def from_rows(cls, rows) -> List['BaseModel']:
         return [cls.from_row(row) for row in rows if row]
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
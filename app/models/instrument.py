@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from .base import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class Instrument(BaseModel):
     barcode: str = ""
     name: str = ""
@@ -44,7 +44,7 @@ class Instrument(BaseModel):
         return self.current_cycles >= self.max_cycles
 
 
-@dataclass
+@dataclass(slots=True)
 class SetContent(BaseModel):
     set_id: int = 0
     instrument_id: int = 0
@@ -54,7 +54,7 @@ class SetContent(BaseModel):
     instrument: Optional[Instrument] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InstrumentSet(BaseModel):
     barcode: str = ""
     name: str = ""
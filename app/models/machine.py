@@ -6,7 +6,7 @@ from .base import BaseModel
 from app.config.constants import MachineTypes, MachineStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineProgram(BaseModel):
     machine_id: int = 0
     name: str = ""
@@ -18,7 +18,7 @@ class MachineProgram(BaseModel):
     is_active: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineCycle(BaseModel):
     cycle_number: str = ""
     machine_id: int = 0
@@ -55,7 +55,7 @@ class MachineCycle(BaseModel):
         return self.ci_result == "PASS" and self.bi_result == "PASS"
 
 
-@dataclass
+@dataclass(slots=True)
 class Machine(BaseModel):
     name: str = ""
     machine_type: str = ""
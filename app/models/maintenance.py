@@ -0,0 +1,45 @@
+from typing import Optional
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+
+from .base import BaseModel
+
+
+@dataclass(slots=True)
+class MaintenancePlan(BaseModel):
+    machine_id: int = 0
+    machine_name: str = ""
+    maintenance_type: str = ""
+    interval_days: int = 0
+    interval_cycles: int = 0
+    last_performed_at: Optional[datetime] = None
+    last_performed_cycles: int = 0
+    is_active: bool = True
+
+    @property
+    def due_date(self) -> Optional[datetime]:
+        if self.interval_days <= 0:
+            return None
+        base = self.last_performed_at or self.created_at or datetime.now()
+        return base + timedelta(days=self.interval_days)
+
+    @property
+    def due_cycles(self) -> Optional[int]:
+        if self.interval_cycles <= 0:
+            return None
+        return self.last_performed_cycles + self.interval_cycles
+
+
+@dataclass(slots=True)
+class MaintenanceRecord(BaseModel):
+    machine_id: int = 0
+    machine_name: str = ""
+    plan_id: Optional[int] = None
+    maintenance_type: str = ""
+    performed_by: Optional[int] = None
+    performed_by_name: str = ""
+    maintenance_date: Optional[datetime] = None
+    cycle_count: int = 0
+    next_maintenance_date: Optional[datetime] = None
+    description: str = ""
+    result: str = ""
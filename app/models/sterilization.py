@@ -6,7 +6,7 @@ from .base import BaseModel
 from app.config.constants import SterilizationStatus, IndicatorResults
 
 
-@dataclass
+@dataclass(slots=True)
 class SterilizationRelease(BaseModel):
     sterilization_id: int = 0
     action: str = ""
@@ -25,7 +25,7 @@ class SterilizationRelease(BaseModel):
         return self.action == "REJECT"
 
 
-@dataclass
+@dataclass(slots=True)
 class SterilizationRecord(BaseModel):
     record_number: str = ""
     work_order_id: int = 0
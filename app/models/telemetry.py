@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from .base import BaseModel
+
+
+@dataclass(slots=True)
+class CycleTelemetry(BaseModel):
+    cycle_id: int = 0
+    sample_count: int = 0
+    duration_seconds: float = 0.0
+    max_temperature: float = 0.0
+    max_pressure: float = 0.0
+    hold_temperature: float = 0.0
+    hold_seconds: float = 0.0
+    f0_value: float = 0.0
+    source: str = ""
+
+    @property
+    def hold_minutes(self) -> float:
+        return self.hold_seconds / 60
+
+    @property
+    def has_samples(self) -> bool:
+        return self.sample_count > 0
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from .base import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission(BaseModel):
     code: str = ""
     name: str = ""
@@ -13,7 +13,7 @@ class Permission(BaseModel):
     module: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Role(BaseModel):
     code: str = ""
     name: str = ""
@@ -25,7 +25,7 @@ class Role(BaseModel):
         return any(p.code == permission_code for p in self.permissions)
 
 
-@dataclass
+@dataclass(slots=True)
 class User(BaseModel):
     badge_number: str = ""
     full_name: str = ""
@@ -6,7 +6,7 @@ from .base import BaseModel
 from app.config.constants import WorkOrderStatus, Zones
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessRecord(BaseModel):
     work_order_id: int = 0
     process_type: str = ""
@@ -25,7 +25,7 @@ class ProcessRecord(BaseModel):
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkOrder(BaseModel):
     order_number: str = ""
     barcode: str = ""
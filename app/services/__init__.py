@@ -1,22 +1,31 @@
-from .auth_service import AuthService
-from .user_service import UserService
-from .machine_service import MachineService
-from .instrument_service import InstrumentService
-from .audit_service import AuditService
+from app.utils.lazy import lazy_exports
 
-from .zones import DirtyZoneService, CleanZoneService, SterileZoneService
-from .sterilization import SterilizationRecordService, IndicatorService, ReleaseService
+_EXPORTS = {
+    'AuthService': '.auth_service',
+    'UserService': '.user_service',
+    'MachineService': '.machine_service',
+    'InstrumentService': '.instrument_service',
+    'AuditService': '.audit_service',
+    'MachineAnalyticsService': '.machine_analytics_service',
+    'MaintenanceService': '.maintenance_service',
+    'BackupService': '.backup_service',
+    'ArchiveService': '.archive_service',
+    'DirtyZoneService': '.zones',
+    'CleanZoneService': '.zones',
+    'SterileZoneService': '.zones',
+    'SterilizationRecordService': '.sterilization',
+    'IndicatorService': '.sterilization',
+    'ReleaseService': '.sterilization',
+    'TelemetryService': '.telemetry',
+    'ScannerService': '.scanner',
+    'ScanPipeline': '.scanner',
+    'LabelService': '.labels',
+    'ComplianceExportService': '.export',
+    'SearchService': '.search_service',
+    'LiveSearch': '.search_service',
+    'SyncService': '.sync'
+}
 
-__all__ = [
-    'AuthService',
-    'UserService',
-    'MachineService',
-    'InstrumentService',
-    'AuditService',
-    'DirtyZoneService',
-    'CleanZoneService',
-    'SterileZoneService',
-    'SterilizationRecordService',
-    'IndicatorService',
-    'ReleaseService'
-]
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,394 @@
+import os
+import sys
+import json
+import gzip
+import time
+import shutil
+import sqlite3
+import argparse
+import threading
+from typing import Optional, List, Dict, Tuple, Iterator, Any
+from datetime import datetime, timedelta
+
+from app.config.settings import settings
+from app.core.clock import HybridLogicalClock
+from app.core.schema import rebuild_search_index
+from app.core.tracing import traced_service
+from app.services.backup_service import BackupService
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+BASE_PREFIX = "base-"
+BASE_SUFFIX = ".db.gz"
+SHIP_BATCH = 5000
+
+
+@traced_service
+class ArchiveService:
+
+    def __init__(self, db_path: str = None, archive_path: str = None):
+        self.db_path = db_path or settings.database.path
+        self.archive_path = archive_path or settings.database.archive_path
+        self.segment_dir = os.path.join(self.archive_path, "segments")
+        self.base_dir = os.path.join(self.archive_path, "base")
+        self.backups = BackupService(self.db_path, self.base_dir)
+        self.last_error = ""
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._repaired = False
+
+    def ship(self) -> int:
+        with self._lock:
+            os.makedirs(self.segment_dir, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            shipped = 0
+            try:
+                while True:
+                    rows = connection.execute("""
+                        SELECT id, table_name, operation, row_id, hlc, data
+                        FROM archive_log ORDER BY id LIMIT ?
+                    """, (SHIP_BATCH,)).fetchall()
+                    if not rows:
+                        break
+
+                    lines = []
+                    for seq, table, operation, row_id, stamp, data in rows:
+                        lines.append(json.dumps({
+                            "seq": seq,
+                            "table": table,
+                            "op": operation,
+                            "row": row_id,
+                            "hlc": stamp,
+                            "data": json.loads(data) if data else None
+                        }, separators=(",", ":")))
+                    self._append(rows[0][0], "\n".join(lines) + "\n")
+
+                    connection.execute("DELETE FROM archive_log WHERE id <= ?", (rows[-1][0],))
+                    connection.commit()
+                    shipped += len(rows)
+                    if len(rows) < SHIP_BATCH:
+                        break
+            finally:
+                connection.close()
+            return shipped
+
+    def create_base(self) -> Tuple[bool, str, Optional[str]]:
+        os.makedirs(self.base_dir, exist_ok=True)
+        created_ms = int(time.time() * 1000)
+        raw_path = os.path.join(self.base_dir, f".base-{created_ms}.db")
+        try:
+            stats = self.backups.copy_online(
+                self.db_path, raw_path,
+                snapshot_query="SELECT seq FROM sqlite_sequence WHERE name = 'archive_log'"
+            )
+            seq = stats['snapshot'][0] if stats['snapshot'] else 0
+
+            ok, message = self.backups.verify_file(raw_path)
+            if not ok:
+                return False, f"Temel yedek doğrulanamadı: {message}", None
+
+            name = f"{BASE_PREFIX}{seq:012d}-{created_ms}"
+            final_path = os.path.join(self.base_dir, name + BASE_SUFFIX)
+            partial = final_path + ".tmp"
+            with open(raw_path, "rb") as src, gzip.open(partial, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(partial, final_path)
+            self._sync_dir(self.base_dir)
+            self.prune()
+            return True, "Temel yedek alındı", final_path
+        except (sqlite3.Error, OSError) as e:
+            return False, str(e), None
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
+
+    def list_bases(self) -> List[Dict]:
+        if not os.path.isdir(self.base_dir):
+            return []
+
+        bases = []
+        for name in os.listdir(self.base_dir):
+            if not (name.startswith(BASE_PREFIX) and name.endswith(BASE_SUFFIX)):
+                continue
+            seq, created_ms = name[len(BASE_PREFIX):-len(BASE_SUFFIX)].split("-")
+            bases.append({
+                'path': os.path.join(self.base_dir, name),
+                'seq': int(seq),
+                'created_ms': int(created_ms),
+                'created_at': datetime.fromtimestamp(int(created_ms) / 1000),
+            })
+        bases.sort(key=lambda b: b['created_ms'])
+        return bases
+
+    def list_segments(self) -> List[Dict]:
+        if not os.path.isdir(self.segment_dir):
+            return []
+
+        segments = []
+        for name in sorted(os.listdir(self.segment_dir)):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                path = os.path.join(self.segment_dir, name)
+                segments.append({
+                    'path': path,
+                    'first_seq': int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]),
+                    'size': os.path.getsize(path),
+                })
+        return segments
+
+    def prune(self, keep: int = None) -> int:
+        keep = settings.database.archive_keep_bases if keep is None else keep
+        bases = self.list_bases()
+        if len(bases) <= keep:
+            return 0
+
+        for base in bases[:-keep]:
+            os.remove(base['path'])
+        oldest_seq = bases[-keep]['seq']
+
+        removed = 0
+        segments = self.list_segments()
+        for segment, following in zip(segments, segments[1:]):
+            if following['first_seq'] <= oldest_seq + 1:
+                os.remove(segment['path'])
+                removed += 1
+        return removed
+
+    def iter_records(self, after_seq: int = 0) -> Iterator[Dict[str, Any]]:
+        segments = self.list_segments()
+        last_seq = after_seq
+        for index, segment in enumerate(segments):
+            following = segments[index + 1] if index + 1 < len(segments) else None
+            if following and following['first_seq'] <= after_seq + 1:
+                continue
+            with open(segment['path'], "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    if record["seq"] <= last_seq:
+                        continue
+                    last_seq = record["seq"]
+                    yield record
+
+    def restore_to(self, target_path: str, until: datetime = None) -> Tuple[bool, str, Dict]:
+        until_ms = int(until.timestamp() * 1000) if until else None
+        bases = [b for b in self.list_bases() if until_ms is None or b['created_ms'] <= until_ms]
+        if not bases:
+            return False, "Uygun temel yedek bulunamadı", {}
+        base = bases[-1]
+
+        if os.path.exists(target_path):
+            return False, "Hedef dosya zaten var", {}
+
+        partial = target_path + ".partial"
+        stats = {'base': base['path'], 'applied': 0, 'skipped': 0, 'last_hlc': None}
+        try:
+            with gzip.open(base['path'], "rb") as src, open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+            connection = sqlite3.connect(partial)
+            try:
+                connection.execute("PRAGMA journal_mode = DELETE")
+                triggers = connection.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"
+                ).fetchall()
+                for name, _ in triggers:
+                    connection.execute(f"DROP TRIGGER {name}")
+                connection.execute("PRAGMA foreign_keys = OFF")
+                connection.execute("DELETE FROM archive_log")
+
+                columns: Dict[str, Dict[str, bool]] = {}
+                for record in self.iter_records(base['seq']):
+                    if until_ms is not None and record["hlc"]:
+                        if HybridLogicalClock.parse(record["hlc"])[0] > until_ms:
+                            stats['skipped'] += 1
+                            continue
+                    self._replay(connection, record, columns)
+                    stats['applied'] += 1
+                    stats['last_hlc'] = record["hlc"]
+
+                if connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'search_index'").fetchone():
+                    rebuild_search_index(connection)
+                for _, sql in triggers:
+                    connection.execute(sql)
+                connection.commit()
+                violations = connection.execute("PRAGMA foreign_key_check").fetchall()
+                stats['fk_violations'] = len(violations)
+            finally:
+                connection.close()
+
+            ok, message = self.backups.verify_file(partial)
+            if not ok:
+                return False, f"Geri yüklenen veritabanı bozuk: {message}", stats
+            os.replace(partial, target_path)
+            return True, "Zamana göre geri yükleme tamamlandı", stats
+        except (sqlite3.Error, OSError, ValueError) as e:
+            return False, str(e), stats
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    def is_base_due(self) -> bool:
+        bases = self.list_bases()
+        if not bases:
+            return True
+        age = datetime.now() - bases[-1]['created_at']
+        return age >= timedelta(hours=settings.database.archive_base_hours)
+
+    def start(self):
+        if not settings.database.archive_enabled:
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="archive", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.ship()
+                if self.is_base_due():
+                    self.create_base()
+                self.last_error = ""
+            except (sqlite3.Error, OSError) as e:
+                self.last_error = str(e)
+            self._stop.wait(settings.database.archive_interval_seconds)
+        try:
+            self.ship()
+        except (sqlite3.Error, OSError) as e:
+            self.last_error = str(e)
+
+    def _replay(self, connection: sqlite3.Connection, record: Dict[str, Any],
+                columns: Dict[str, Dict[str, bool]]):
+        table = record["table"]
+        if table not in columns:
+            columns[table] = {
+                row[1]: (row[2] or "").upper() == "BLOB"
+                for row in connection.execute(f"PRAGMA table_info({table})").fetchall()
+            }
+        if not columns[table]:
+            return
+
+        if record["op"] == "DELETE":
+            connection.execute(f"DELETE FROM {table} WHERE rowid = ?", (record["row"],))
+            return
+
+        data = record["data"] or {}
+        names = [c for c in data if c in columns[table]]
+        values = [
+            bytes.fromhex(data[c]) if columns[table][c] and data[c] is not None else data[c]
+            for c in names
+        ]
+        placeholders = ", ".join("?" for _ in range(len(names) + 1))
+        connection.execute(
+            f"INSERT OR REPLACE INTO {table} (rowid, {', '.join(names)}) VALUES ({placeholders})",
+            (record["row"], *values)
+        )
+
+    def _append(self, first_seq: int, text: str):
+        segments = self.list_segments()
+        current = segments[-1] if segments else None
+        if current and not self._repaired:
+            self._repair(current['path'])
+            self._repaired = True
+            current['size'] = os.path.getsize(current['path'])
+
+        if current is None or current['size'] >= settings.database.archive_segment_bytes:
+            path = os.path.join(self.segment_dir, f"{SEGMENT_PREFIX}{first_seq:012d}{SEGMENT_SUFFIX}")
+            created = True
+        else:
+            path = current['path']
+            created = False
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if created:
+            self._sync_dir(self.segment_dir)
+
+    def _repair(self, path: str):
+        with open(path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return
+            f.seek(max(0, size - 65536))
+            tail = f.read()
+            if tail.endswith(b"\n"):
+                return
+            cut = tail.rfind(b"\n")
+            f.truncate(size - len(tail) + cut + 1 if cut >= 0 else 0)
+
+    def _sync_dir(self, path: str):
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sürekli arşiv ve zamana göre geri yükleme")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ship")
+    sub.add_parser("base")
+    sub.add_parser("list")
+    sub.add_parser("run")
+    restore = sub.add_parser("restore")
+    restore.add_argument("--until", default=None, help="YYYY-MM-DD HH:MM:SS (yerel saat)")
+    restore.add_argument("--target", default=None)
+    restore.add_argument("--apply", action="store_true", help="Sonucu canlı veritabanına yükle")
+    args = parser.parse_args()
+
+    service = ArchiveService()
+    if args.command == "ship":
+        print(f"Gönderilen kayıt: {service.ship()}")
+        return 0
+    if args.command == "base":
+        service.ship()
+        ok, message, path = service.create_base()
+        print(message, path or "")
+        return 0 if ok else 1
+    if args.command == "list":
+        for base in service.list_bases():
+            print(f"temel  {base['created_at']:%Y-%m-%d %H:%M:%S}  seq {base['seq']:>10}  {base['path']}")
+        for segment in service.list_segments():
+            print(f"parça  seq {segment['first_seq']:>10}  {segment['size']:>12}  {segment['path']}")
+        return 0
+    if args.command == "run":
+        settings.database.archive_enabled = True
+        service.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            service.stop()
+        return 0
+
+    until = datetime.strptime(args.until, "%Y-%m-%d %H:%M:%S") if args.until else None
+    target = args.target or f"{settings.database.path}.pitr-{datetime.now():%Y%m%d-%H%M%S}"
+    service.ship()
+    ok, message, stats = service.restore_to(target, until)
+    print(f"{message}: {target}")
+    print(stats)
+    if ok and args.apply:
+        ok, message = BackupService().restore(target)
+        print(message)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
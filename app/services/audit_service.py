@@ -4,10 +4,11 @@ from dataclasses import dataclass
 
 from app.core.database import get_db
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import AuditActions
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEntry:
     id: int
     operator_id: Optional[int]
@@ -22,6 +23,7 @@ class AuditEntry:
     created_at: datetime
 
 
+@traced_service
 class AuditService:
     def __init__(self):
         self.db = get_db()
@@ -1,50 +1,47 @@
-import hashlib
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Any
 from datetime import datetime, timedelta
 
 from app.core.database import get_db
 from app.core.session import current_session, UserSession
+from app.core.security import hash_pin, verify_pin, needs_rehash
+from app.core.writer import background_writer
+from app.core.tracing import traced_service
 from app.config.settings import settings
-from app.config.constants import AuditActions
+from app.config.constants import AuditActions, SessionEndReasons
 
+OPERATOR_QUERY = """
+    SELECT o.*, r.code as role_code, r.name as role_name, r.level as role_level
+    FROM operators o
+    LEFT JOIN roles r ON o.role_id = r.id
+"""
 
+
+@traced_service
 class AuthService:
+
+    _role_permissions: Dict[int, Tuple[int, Dict[str, bool]]] = {}
+    _badge_index: Dict[str, Dict[str, Any]] = {}
+    _badge_index_version = -1
+    _listening = False
+
     def __init__(self):
         self.db = get_db()
-
-    def _hash_pin(self, pin: str) -> str:
-        return hashlib.sha256(pin.encode()).hexdigest()
+        current_session.set_permission_loader(self._load_session_user)
+        if not AuthService._listening:
+            self.db.add_change_listener(current_session.on_tables_changed)
+            AuthService._listening = True
 
     def authenticate_by_badge(self, badge_number: str) -> Tuple[bool, str, Optional[Dict]]:
-        user = self.db.fetchone("""
-            SELECT o.*, r.code as role_code, r.name as role_name, r.level as role_level
-            FROM operators o
-            LEFT JOIN roles r ON o.role_id = r.id
-            WHERE o.badge_number = ? AND o.is_active = 1
-        """, (badge_number,))
-
+        user = self._lookup_badge(badge_number)
         if not user:
             return False, "Kullanici bulunamadi", None
 
-        if user['locked_until']:
-            locked_until = datetime.fromisoformat(user['locked_until'])
-            if datetime.now() < locked_until:
-                remaining = int((locked_until - datetime.now()).total_seconds() / 60)
-                return False, f"Hesap kilitli. {remaining} dakika sonra tekrar deneyin.", None
+        locked = self._locked_message(user)
+        if locked:
+            return False, locked, None
 
         permissions = self._get_user_permissions(user['role_id'])
-
-        user_data = {
-            'id': user['id'],
-            'badge_number': user['badge_number'],
-            'full_name': user['full_name'],
-            'role': user['role_code'],
-            'role_name': user['role_name'],
-            'default_zone': user['default_zone'],
-            'workstation_id': user['workstation_id'],
-            'can_approve_sterilization': bool(user['can_approve_sterilization']),
-            'can_release_load': bool(user['can_release_load'])
-        }
+        user_data = self._user_data(user)
 
         session = current_session.login(user_data, permissions)
         self._update_login_info(user['id'])
@@ -53,53 +50,35 @@ class AuthService:
         return True, "Giris basarili", user_data
 
     def authenticate_with_pin(self, badge_number: str, pin: str) -> Tuple[bool, str, Optional[Dict]]:
-        user = self.db.fetchone("""
-            SELECT o.*, r.code as role_code, r.name as role_name
-            FROM operators o
-            LEFT JOIN roles r ON o.role_id = r.id
-            WHERE o.badge_number = ? AND o.is_active = 1
-        """, (badge_number,))
-
+        user = self._lookup_badge(badge_number)
         if not user:
             return False, "Kullanici bulunamadi", None
 
-        if user['locked_until']:
-            locked_until = datetime.fromisoformat(user['locked_until'])
-            if datetime.now() < locked_until:
-                remaining = int((locked_until - datetime.now()).total_seconds() / 60)
-                return False, f"Hesap kilitli. {remaining} dakika sonra tekrar deneyin.", None
+        locked = self._locked_message(user)
+        if locked:
+            return False, locked, None
 
-        pin_hash = self._hash_pin(pin)
-        if user['pin_hash'] != pin_hash:
-            self._handle_failed_attempt(user['id'], user['failed_attempts'])
+        if not verify_pin(pin, user['pin_hash']):
+            self._handle_failed_attempt(user)
             return False, "Hatali PIN", None
 
         permissions = self._get_user_permissions(user['role_id'])
-
-        user_data = {
-            'id': user['id'],
-            'badge_number': user['badge_number'],
-            'full_name': user['full_name'],
-            'role': user['role_code'],
-            'role_name': user['role_name'],
-            'default_zone': user['default_zone'],
-            'workstation_id': user['workstation_id'],
-            'can_approve_sterilization': bool(user['can_approve_sterilization']),
-            'can_release_load': bool(user['can_release_load'])
-        }
+        user_data = self._user_data(user)
 
         session = current_session.login(user_data, permissions)
-        self._reset_failed_attempts(user['id'])
+        if needs_rehash(user['pin_hash']):
+            self._store_pin_hash(user, hash_pin(pin))
+        self._reset_failed_attempts(user)
         self._update_login_info(user['id'])
         self._log_action(user['id'], AuditActions.LOGIN, "PIN ile giris")
 
         return True, "Giris basarili", user_data
 
-    def logout(self) -> bool:
+    def logout(self, reason: str = SessionEndReasons.LOGOUT) -> bool:
         if current_session.current_user:
             user_id = current_session.current_user.user_id
             self._log_action(user_id, AuditActions.LOGOUT, "Oturum kapatildi")
-        return current_session.logout()
+        return current_session.logout(reason)
 
     def verify_pin_for_action(self, pin: str) -> bool:
         if not current_session.current_user:
@@ -113,7 +92,7 @@ class AuthService:
         if not user or not user['pin_hash']:
             return False
 
-        return user['pin_hash'] == self._hash_pin(pin)
+        return verify_pin(pin, user['pin_hash'])
 
     def change_pin(self, old_pin: str, new_pin: str) -> Tuple[bool, str]:
         if not current_session.current_user:
@@ -122,24 +101,82 @@ class AuthService:
         user_id = current_session.current_user.user_id
         user = self.db.fetchone("SELECT pin_hash FROM operators WHERE id = ?", (user_id,))
 
-        if user['pin_hash'] and user['pin_hash'] != self._hash_pin(old_pin):
+        if user['pin_hash'] and not verify_pin(old_pin, user['pin_hash']):
             return False, "Mevcut PIN hatali"
 
         if len(new_pin) < 4 or len(new_pin) > 6:
             return False, "PIN 4-6 karakter olmali"
 
+        pin_hash = hash_pin(new_pin)
         self.db.execute(
             "UPDATE operators SET pin_hash = ?, updated_at = ? WHERE id = ?",
-            (self._hash_pin(new_pin), datetime.now(), user_id)
+            (pin_hash, datetime.now(), user_id)
         )
         self.db.commit()
 
+        cached = self._badge_index.get(current_session.current_user.badge_number)
+        if cached:
+            cached['pin_hash'] = pin_hash
+
         return True, "PIN degistirildi"
 
+    def _lookup_badge(self, badge_number: str) -> Optional[Dict[str, Any]]:
+        version = current_session.permission_version
+        if AuthService._badge_index_version != version:
+            rows = self.db.fetchall(OPERATOR_QUERY + " WHERE o.is_active = 1")
+            AuthService._badge_index = {row['badge_number']: dict(row) for row in rows}
+            AuthService._badge_index_version = version
+
+        user = self._badge_index.get(badge_number)
+        if user is None:
+            row = self.db.fetchone(
+                OPERATOR_QUERY + " WHERE o.badge_number = ? AND o.is_active = 1",
+                (badge_number,)
+            )
+            if row:
+                user = self._badge_index[badge_number] = dict(row)
+        return user
+
+    def _locked_message(self, user: Dict[str, Any]) -> Optional[str]:
+        locked_until = user['locked_until']
+        if not locked_until:
+            return None
+        if isinstance(locked_until, str):
+            locked_until = datetime.fromisoformat(locked_until)
+        if datetime.now() >= locked_until:
+            return None
+        remaining = int((locked_until - datetime.now()).total_seconds() / 60)
+        return f"Hesap kilitli. {remaining} dakika sonra tekrar deneyin."
+
+    def _user_data(self, user) -> Dict[str, Any]:
+        return {
+            'id': user['id'],
+            'badge_number': user['badge_number'],
+            'full_name': user['full_name'],
+            'role': user['role_code'],
+            'role_name': user['role_name'],
+            'default_zone': user['default_zone'],
+            'workstation_id': user['workstation_id'],
+            'can_approve_sterilization': bool(user['can_approve_sterilization']),
+            'can_release_load': bool(user['can_release_load'])
+        }
+
+    def _load_session_user(self, user_id: int) -> Optional[Tuple[Dict[str, Any], Dict[str, bool]]]:
+        user = self.db.fetchone(OPERATOR_QUERY + " WHERE o.id = ? AND o.is_active = 1", (user_id,))
+
+        if not user:
+            return None
+        return self._user_data(user), self._get_user_permissions(user['role_id'])
+
     def _get_user_permissions(self, role_id: int) -> Dict[str, bool]:
         if not role_id:
             return {}
 
+        version = current_session.permission_version
+        cached = self._role_permissions.get(role_id)
+        if cached and cached[0] == version:
+            return dict(cached[1])
+
         permissions = self.db.fetchall("""
             SELECT p.code
             FROM role_permissions rp
@@ -147,10 +184,12 @@ class AuthService:
             WHERE rp.role_id = ?
         """, (role_id,))
 
-        return {p['code']: True for p in permissions}
+        result = {p['code']: True for p in permissions}
+        self._role_permissions[role_id] = (version, result)
+        return dict(result)
 
-    def _handle_failed_attempt(self, user_id: int, current_attempts: int):
-        attempts = current_attempts + 1
+    def _handle_failed_attempt(self, user: Dict[str, Any]):
+        attempts = (user['failed_attempts'] or 0) + 1
         locked_until = None
 
         if attempts >= settings.security.max_failed_attempts:
@@ -158,32 +197,42 @@ class AuthService:
                 minutes=settings.security.lockout_duration_minutes
             )
 
-        self.db.execute("""
+        user['failed_attempts'] = attempts
+        user['locked_until'] = locked_until
+        background_writer.submit("""
             UPDATE operators
             SET failed_attempts = ?, locked_until = ?, updated_at = ?
             WHERE id = ?
-        """, (attempts, locked_until, datetime.now(), user_id))
-        self.db.commit()
+        """, (attempts, locked_until, datetime.now(), user['id']))
+
+    def _reset_failed_attempts(self, user: Dict[str, Any]):
+        if not user['failed_attempts'] and not user['locked_until']:
+            return
 
-    def _reset_failed_attempts(self, user_id: int):
-        self.db.execute("""
+        user['failed_attempts'] = 0
+        user['locked_until'] = None
+        background_writer.submit("""
             UPDATE operators
             SET failed_attempts = 0, locked_until = NULL, updated_at = ?
             WHERE id = ?
-        """, (datetime.now(), user_id))
-        self.db.commit()
+        """, (datetime.now(), user['id']))
+
+    def _store_pin_hash(self, user: Dict[str, Any], pin_hash: str):
+        user['pin_hash'] = pin_hash
+        background_writer.submit(
+            "UPDATE operators SET pin_hash = ?, updated_at = ? WHERE id = ?",
+            (pin_hash, datetime.now(), user['id'])
+        )
 
     def _update_login_info(self, user_id: int):
-        self.db.execute("""
+        background_writer.submit("""
             UPDATE operators
             SET last_login = ?, updated_at = ?
             WHERE id = ?
         """, (datetime.now(), datetime.now(), user_id))
-        self.db.commit()
 
     def _log_action(self, user_id: int, action: str, details: str):
-        self.db.execute("""
+        background_writer.submit("""
             INSERT INTO audit_log (operator_id, action, entity_type, details, created_at)
             VALUES (?, ?, 'SESSION', ?, ?)
         """, (user_id, action, details, datetime.now()))
-        self.db.commit()
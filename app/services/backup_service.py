@@ -0,0 +1,284 @@
+import os
+import sys
+import gzip
+import time
+import shutil
+import sqlite3
+import argparse
+import threading
+from typing import Optional, List, Dict, Tuple, Callable
+from datetime import datetime, timedelta
+
+from app.config.settings import settings
+from app.core.tracing import traced_service
+
+BACKUP_PREFIX = "sterilizasyon-"
+BACKUP_SUFFIX = ".db.gz"
+
+
+@traced_service
+class BackupService:
+
+    def __init__(self, db_path: str = None, backup_path: str = None):
+        self.db_path = db_path or settings.database.path
+        self.backup_path = backup_path or settings.database.backup_path
+        self.last_result: Optional[Dict] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def create_backup(self, label: str = "",
+                      progress: Callable[[int, int], None] = None) -> Tuple[bool, str, Optional[str]]:
+        if not self._lock.acquire(blocking=False):
+            return False, "Yedekleme zaten çalışıyor", None
+
+        try:
+            os.makedirs(self.backup_path, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            name = f"{BACKUP_PREFIX}{stamp}{'-' + label if label else ''}"
+            raw_path = os.path.join(self.backup_path, name + ".db.partial")
+            final_path = os.path.join(self.backup_path, name + BACKUP_SUFFIX)
+
+            started = time.perf_counter()
+            stats = self.copy_online(self.db_path, raw_path, progress)
+
+            ok, message = self.verify_file(raw_path)
+            if not ok:
+                os.remove(raw_path)
+                return False, f"Yedek doğrulanamadı: {message}", None
+
+            self._compress(raw_path, final_path)
+            os.remove(raw_path)
+            self.rotate()
+
+            self.last_result = {
+                'path': final_path,
+                'created_at': datetime.now(),
+                'size': os.path.getsize(final_path),
+                'pages': stats['pages'],
+                'steps': stats['steps'],
+                'restarts': stats['restarts'],
+                'max_step_ms': round(stats['max_step'] * 1000, 2),
+                'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+            }
+            return True, "Yedekleme tamamlandı", final_path
+        except (sqlite3.Error, OSError) as e:
+            return False, str(e), None
+        finally:
+            self._lock.release()
+
+    def restore(self, backup_file: str, target_path: str = None) -> Tuple[bool, str]:
+        target_path = target_path or self.db_path
+        if not os.path.exists(backup_file):
+            return False, "Yedek dosyası bulunamadı"
+
+        raw_path = target_path + ".restore"
+        try:
+            if backup_file.endswith(".gz"):
+                with gzip.open(backup_file, "rb") as src, open(raw_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            else:
+                shutil.copyfile(backup_file, raw_path)
+
+            ok, message = self.verify_file(raw_path)
+            if not ok:
+                return False, f"Yedek bozuk: {message}"
+
+            if os.path.exists(target_path):
+                self.create_backup("pre-restore")
+
+            from app.core.database import get_db
+            db = get_db()
+            if os.path.abspath(db._db_path) == os.path.abspath(target_path):
+                db.close()
+
+            source = sqlite3.connect(raw_path)
+            target = sqlite3.connect(target_path, timeout=30)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+            return True, "Geri yükleme tamamlandı"
+        except (sqlite3.Error, OSError) as e:
+            return False, str(e)
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
+
+    def verify_file(self, path: str) -> Tuple[bool, str]:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = connection.execute("PRAGMA integrity_check").fetchall()
+        finally:
+            connection.close()
+        messages = [row[0] for row in rows]
+        if messages == ["ok"]:
+            return True, "ok"
+        return False, "; ".join(messages[:5])
+
+    def verify_backup(self, backup_file: str) -> Tuple[bool, str]:
+        raw_path = os.path.join(self.backup_path, ".verify.db")
+        try:
+            with gzip.open(backup_file, "rb") as src, open(raw_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            return self.verify_file(raw_path)
+        except (OSError, sqlite3.Error) as e:
+            return False, str(e)
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
+
+    def list_backups(self) -> List[Dict]:
+        if not os.path.isdir(self.backup_path):
+            return []
+
+        backups = []
+        for name in os.listdir(self.backup_path):
+            if not (name.startswith(BACKUP_PREFIX) and name.endswith(BACKUP_SUFFIX)):
+                continue
+            path = os.path.join(self.backup_path, name)
+            stat = os.stat(path)
+            backups.append({
+                'name': name,
+                'path': path,
+                'size': stat.st_size,
+                'created_at': datetime.fromtimestamp(stat.st_mtime),
+            })
+        backups.sort(key=lambda b: b['created_at'], reverse=True)
+        return backups
+
+    def latest_backup(self) -> Optional[Dict]:
+        backups = self.list_backups()
+        return backups[0] if backups else None
+
+    def rotate(self, keep: int = None) -> int:
+        keep = settings.database.backup_keep_count if keep is None else keep
+        removed = 0
+        for backup in self.list_backups()[keep:]:
+            os.remove(backup['path'])
+            removed += 1
+        return removed
+
+    def is_due(self, now: datetime = None) -> bool:
+        latest = self.latest_backup()
+        if not latest:
+            return True
+        now = now or datetime.now()
+        return now - latest['created_at'] >= timedelta(hours=settings.database.backup_interval_hours)
+
+    def start_scheduler(self, check_seconds: int = 300):
+        if not settings.database.auto_backup:
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(check_seconds,), name="backup", daemon=True
+        )
+        self._thread.start()
+
+    def stop_scheduler(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, check_seconds: int):
+        while not self._stop.is_set():
+            if self.is_due():
+                self.create_backup()
+            self._stop.wait(check_seconds)
+
+    def copy_online(self, source_path: str, target_path: str,
+                    progress: Callable[[int, int], None] = None,
+                    snapshot_query: str = None) -> Dict:
+        stats = {'pages': 0, 'steps': 0, 'restarts': 0, 'max_step': 0.0, 'snapshot': None}
+        step_pages = settings.database.backup_step_pages
+        last = {'remaining': None, 'time': time.perf_counter()}
+
+        def on_progress(status, remaining, total):
+            now = time.perf_counter()
+            stats['max_step'] = max(stats['max_step'], now - last['time'] - settings.database.backup_step_sleep)
+            if last['remaining'] is not None and remaining > last['remaining']:
+                stats['restarts'] += 1
+            last['remaining'] = remaining
+            last['time'] = now
+            stats['steps'] += 1
+            stats['pages'] = total
+            if progress:
+                progress(total - remaining, total)
+
+        if os.path.exists(target_path):
+            os.remove(target_path)
+
+        source = sqlite3.connect(source_path, timeout=30, isolation_level=None)
+        target = sqlite3.connect(target_path)
+        try:
+            source.execute("PRAGMA journal_mode = WAL")
+            source.execute("BEGIN")
+            source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            if snapshot_query:
+                stats['snapshot'] = source.execute(snapshot_query).fetchone()
+            source.backup(
+                target,
+                pages=step_pages,
+                progress=on_progress,
+                sleep=settings.database.backup_step_sleep
+            )
+            source.execute("COMMIT")
+            target.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            target.close()
+            source.close()
+        return stats
+
+    def _compress(self, source_path: str, target_path: str):
+        partial = target_path + ".tmp"
+        with open(source_path, "rb") as src, gzip.open(partial, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(partial, target_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veritabanı yedekleme")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("backup")
+    sub.add_parser("list")
+    verify = sub.add_parser("verify")
+    verify.add_argument("file")
+    restore = sub.add_parser("restore")
+    restore.add_argument("file", nargs="?", help="Boş bırakılırsa en son yedek")
+    restore.add_argument("--target", default=None)
+    args = parser.parse_args()
+
+    service = BackupService()
+    if args.command == "backup":
+        ok, message, path = service.create_backup()
+        print(message, path or "")
+        if ok:
+            print(service.last_result)
+        return 0 if ok else 1
+    if args.command == "list":
+        for backup in service.list_backups():
+            print(f"{backup['created_at']:%Y-%m-%d %H:%M:%S}  {backup['size']:>12}  {backup['path']}")
+        return 0
+    if args.command == "verify":
+        ok, message = service.verify_backup(args.file)
+        print(message)
+        return 0 if ok else 1
+
+    backup_file = args.file
+    if not backup_file:
+        latest = service.latest_backup()
+        if not latest:
+            print("Yedek bulunamadı")
+            return 1
+        backup_file = latest['path']
+    ok, message = service.restore(backup_file, args.target)
+    print(f"{message}: {backup_file}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+from .query import COLUMNS, compliance_rows, count_rows, date_range
+from .writers import ExportWriter, CsvWriter, XlsxWriter, PdfWriter, WRITERS
+from .export_service import ExportJob, ComplianceExportService
+
+__all__ = [
+    'COLUMNS', 'compliance_rows', 'count_rows', 'date_range',
+    'ExportWriter', 'CsvWriter', 'XlsxWriter', 'PdfWriter', 'WRITERS',
+    'ExportJob', 'ComplianceExportService'
+]
@@ -0,0 +1,129 @@
+import os
+import time
+import itertools
+import threading
+from datetime import datetime, date, timedelta
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, Callable, Iterator, Any
+
+from app.config.settings import settings
+from app.config.constants import ExportJobStatus, AuditActions
+from app.core.database import open_connection
+from app.core.session import current_session
+from app.core.writer import background_writer
+from app.core.tracing import traced_service
+from app.utils.date_utils import DateUtils
+from .query import COLUMNS, date_range, count_rows, compliance_rows
+from .writers import WRITERS, PdfWriter
+
+_ids = itertools.count(1)
+LAST_DAY = timedelta(seconds=1)
+
+
+@dataclass
+class ExportJob:
+    id: int
+    format: str
+    start: datetime
+    end: datetime
+    path: str
+    operator_id: Optional[int] = None
+    status: str = ExportJobStatus.QUEUED
+    rows: int = 0
+    total: int = 0
+    error: str = ""
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+    cancelled: threading.Event = field(default_factory=threading.Event, repr=False)
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def progress(self) -> float:
+        if self.status == ExportJobStatus.COMPLETED:
+            return 1.0
+        return min(1.0, self.rows / self.total) if self.total else 0.0
+
+    @property
+    def elapsed_ms(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+@traced_service
+class ComplianceExportService:
+
+    def export(self, start: date, end: date, fmt: str = "csv", path: str = None,
+               progress: Callable[[ExportJob], None] = None) -> Tuple[bool, str, Optional[ExportJob]]:
+        if fmt not in WRITERS:
+            return False, f"Desteklenmeyen dışa aktarma biçimi: {fmt}", None
+
+        start, end = date_range(start, end)
+        if end <= start:
+            return False, "Bitiş tarihi başlangıçtan önce olamaz", None
+
+        if path is None:
+            os.makedirs(settings.export.export_path, exist_ok=True)
+            path = os.path.join(settings.export.export_path,
+                                f"uyumluluk_{start:%Y%m%d}_{end - LAST_DAY:%Y%m%d}_{datetime.now():%H%M%S}.{fmt}")
+
+        user = current_session.current_user
+        job = ExportJob(id=next(_ids), format=fmt, start=start, end=end, path=path,
+                        operator_id=user.user_id if user else None)
+        threading.Thread(target=self.run, args=(job, progress),
+                         name=f"compliance-export-{job.id}", daemon=True).start()
+        return True, "Dışa aktarma başlatıldı", job
+
+    def iter_rows(self, start: date, end: date) -> Iterator[Tuple[Any, ...]]:
+        start, end = date_range(start, end)
+        connection = open_connection()
+        try:
+            yield from compliance_rows(connection, start, end, settings.export.batch_size)
+        finally:
+            connection.close()
+
+    def run(self, job: ExportJob, progress: Callable[[ExportJob], None] = None):
+        job.status = ExportJobStatus.RUNNING
+        every = max(1, settings.export.progress_every)
+        connection = None
+        try:
+            connection = open_connection()
+            job.total = count_rows(connection, job.start, job.end)
+            title = (f"Sterilizasyon Uyumluluk Raporu {DateUtils.format_date(job.start)} - "
+                     f"{DateUtils.format_date(job.end - LAST_DAY)}")
+            if job.format == "pdf":
+                writer = PdfWriter(job.path, COLUMNS, title, settings.export.pdf_rows_per_page)
+            else:
+                writer = WRITERS[job.format](job.path, COLUMNS, title)
+
+            with writer:
+                for row in compliance_rows(connection, job.start, job.end, settings.export.batch_size):
+                    writer.write(row)
+                    job.rows += 1
+                    if job.rows % every == 0:
+                        if job.cancelled.is_set():
+                            raise InterruptedError
+                        if progress is not None:
+                            progress(job)
+
+            job.status = ExportJobStatus.COMPLETED
+            background_writer.submit("""
+                INSERT INTO audit_log (operator_id, action, entity_type, details, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (job.operator_id, AuditActions.EXPORT, "STERILIZATION_RECORD",
+                  f"{job.rows} kayıt, {job.format.upper()}, {title}", datetime.now()))
+        except InterruptedError:
+            job.status = ExportJobStatus.CANCELLED
+        except Exception as e:
+            job.status = ExportJobStatus.FAILED
+            job.error = str(e)
+        finally:
+            if connection is not None:
+                connection.close()
+
+        job.finished_at = time.perf_counter()
+        job.done.set()
+        if progress is not None:
+            progress(job)
@@ -0,0 +1,92 @@
+from datetime import datetime, time, timedelta
+from typing import Iterator, Tuple, Any
+
+from app.utils.date_utils import DateUtils
+
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('record_number', "Kayıt No"),
+    ('item_name', "Malzeme"),
+    ('item_barcode', "Malzeme Barkodu"),
+    ('sterilization_method', "Yöntem"),
+    ('cycle_number', "Çevrim No"),
+    ('machine_name', "Makine"),
+    ('program_name', "Program"),
+    ('cycle_start', "Çevrim Başlangıç"),
+    ('cycle_end', "Çevrim Bitiş"),
+    ('temperature_achieved', "Sıcaklık"),
+    ('pressure_achieved', "Basınç"),
+    ('load_time', "Yükleme"),
+    ('unload_time', "Boşaltma"),
+    ('ci_result', "KI Sonucu"),
+    ('ci_checked_by', "KI Kontrol Eden"),
+    ('ci_checked_at', "KI Kontrol Zamanı"),
+    ('bi_lot_number', "BI Lot"),
+    ('bi_result', "BI Sonucu"),
+    ('bi_read_by', "BI Okuyan"),
+    ('bi_read_at', "BI Okuma Zamanı"),
+    ('status', "Durum"),
+    ('released_by', "Serbest Bırakan"),
+    ('released_at', "Serbest Bırakma"),
+    ('rejected_by', "Reddeden"),
+    ('rejection_reason', "Red Nedeni"),
+    ('expiry_date', "SKT"),
+    ('release_log', "Serbest Bırakma Geçmişi"),
+)
+
+COMPLIANCE_QUERY = """
+    SELECT sr.record_number, sr.item_name, sr.item_barcode, sr.sterilization_method,
+           mc.cycle_number, m.name, mp.name,
+           strftime(?3, mc.start_time), strftime(?3, mc.end_time),
+           mc.temperature_achieved, mc.pressure_achieved,
+           strftime(?3, sr.load_time), strftime(?3, sr.unload_time),
+           sr.ci_result, ci.full_name, strftime(?3, sr.ci_checked_at),
+           COALESCE(sr.bi_lot_number, mc.bi_lot_number), sr.bi_result, bi.full_name,
+           strftime(?3, sr.bi_read_at),
+           sr.status, rel.full_name, strftime(?3, sr.released_at), rej.full_name, sr.rejection_reason,
+           strftime(?4, sr.expiry_date),
+           (SELECT group_concat(action || ' ' || COALESCE(strftime(?3, created_at), ''), ' | ')
+            FROM sterilization_release_log WHERE sterilization_id = sr.id)
+    FROM sterilization_records sr
+    LEFT JOIN machine_cycles mc ON sr.cycle_id = mc.id
+    LEFT JOIN machines m ON COALESCE(sr.machine_id, mc.machine_id) = m.id
+    LEFT JOIN machine_programs mp ON mc.program_id = mp.id
+    LEFT JOIN operators ci ON sr.ci_checked_by = ci.id
+    LEFT JOIN operators bi ON sr.bi_read_by = bi.id
+    LEFT JOIN operators rel ON sr.released_by = rel.id
+    LEFT JOIN operators rej ON sr.rejected_by = rej.id
+    WHERE sr.load_time >= ?1 AND sr.load_time < ?2
+    ORDER BY sr.load_time, sr.id
+"""
+
+COUNT_QUERY = """
+    SELECT COUNT(*) FROM sterilization_records
+    WHERE load_time >= ? AND load_time < ?
+"""
+
+
+def date_range(start, end) -> Tuple[datetime, datetime]:
+    if not isinstance(start, datetime):
+        start = datetime.combine(start, time.min)
+    if not isinstance(end, datetime):
+        end = datetime.combine(end + timedelta(days=1), time.min)
+    return start, end
+
+
+def count_rows(connection, start: datetime, end: datetime) -> int:
+    return connection.execute(COUNT_QUERY, (start, end)).fetchone()[0]
+
+
+def compliance_rows(connection, start: datetime, end: datetime,
+                    batch_size: int = 500) -> Iterator[Tuple[Any, ...]]:
+    cursor = connection.execute(COMPLIANCE_QUERY, (
+        start, end, DateUtils.DATETIME_FULL_FORMAT, DateUtils.DATE_FORMAT
+    ))
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield tuple("" if value is None else value for value in row)
+    finally:
+        cursor.close()
@@ -0,0 +1,301 @@
+import io
+import os
+import re
+import csv
+import zlib
+import zipfile
+from datetime import datetime
+from typing import List, Tuple, Sequence, Any
+from xml.sax.saxutils import escape
+
+from app.services.labels.renderers import TRANSLITERATE
+
+
+class ExportWriter:
+    extension = ""
+
+    def __init__(self, path: str, columns: Sequence[Tuple[str, str]], title: str = ""):
+        self.path = path
+        self.columns = columns
+        self.title = title
+        self.rows = 0
+        self._temp = path + ".tmp"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        if kind is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, row: Sequence[Any]):
+        raise NotImplementedError
+
+    def _finish(self):
+        raise NotImplementedError
+
+    def close(self):
+        self._finish()
+        os.replace(self._temp, self.path)
+
+    def abort(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+        if os.path.exists(self._temp):
+            os.remove(self._temp)
+
+
+class CsvWriter(ExportWriter):
+    extension = "csv"
+
+    def __init__(self, path: str, columns: Sequence[Tuple[str, str]], title: str = ""):
+        super().__init__(path, columns, title)
+        self._file = open(self._temp, "w", encoding="utf-8-sig", newline="")
+        self._csv = csv.writer(self._file, delimiter=";")
+        self._csv.writerow([header for _, header in columns])
+
+    def write(self, row: Sequence[Any]):
+        self._csv.writerow(row)
+        self.rows += 1
+
+    def _finish(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border/></borders>'
+        '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+        '<cellXfs count="2"><xf/><xf fontId="1" applyFont="1"/></cellXfs>'
+        '</styleSheet>'
+    ),
+}
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class XlsxWriter(ExportWriter):
+    extension = "xlsx"
+    sheet_name = "Uyumluluk"
+
+    def __init__(self, path: str, columns: Sequence[Tuple[str, str]], title: str = ""):
+        super().__init__(path, columns, title)
+        self._letters = [_column_letter(n) for n in range(len(columns))]
+        self._zip = zipfile.ZipFile(self._temp, "w", zipfile.ZIP_DEFLATED, compresslevel=6)
+        self._raw = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet = io.BufferedWriter(self._raw, buffer_size=256 * 1024)
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b'<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" '
+            b'activePane="bottomLeft" state="frozen"/></sheetView></sheetViews><sheetData>'
+        )
+        self._line = 0
+        self._row([header for _, header in columns], ' s="1"')
+
+    def _row(self, values: Sequence[Any], style: str = ""):
+        self._line += 1
+        line = self._line
+        cells = []
+        for letter, value in zip(self._letters, values):
+            if value == "":
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c r="{letter}{line}"{style}><v>{value}</v></c>')
+            else:
+                text = escape(INVALID_XML.sub("", str(value)))
+                cells.append(f'<c r="{letter}{line}"{style} t="inlineStr"><is><t xml:space="preserve">'
+                             f'{text}</t></is></c>')
+        self._sheet.write(f'<row r="{line}">{"".join(cells)}</row>'.encode("utf-8"))
+
+    def write(self, row: Sequence[Any]):
+        self._row(row)
+        self.rows += 1
+
+    def _finish(self):
+        if self._zip.fp is None:
+            return
+        if not self._sheet.closed:
+            self._sheet.write(b'</sheetData>')
+            if self._line > 1:
+                self._sheet.write(f'<autoFilter ref="A1:{self._letters[-1]}{self._line}"/>'.encode())
+            self._sheet.write(b'</worksheet>')
+            self._sheet.close()
+        for name, body in XLSX_PARTS.items():
+            self._zip.writestr(name, body)
+        self._zip.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{self.sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+            + (f'<definedNames><definedName name="_xlnm._FilterDatabase" localSheetId="0" hidden="1">'
+               f'{self.sheet_name}!$A$1:${self._letters[-1]}${self._line}</definedName></definedNames>'
+               if self._line > 1 else '')
+            + '</workbook>'
+        ))
+        self._zip.close()
+
+
+PDF_COLUMNS = (
+    ('record_number', 70), ('item_name', 120), ('cycle_number', 80), ('machine_name', 70),
+    ('load_time', 72), ('ci_result', 40), ('bi_result', 40), ('status', 74),
+    ('released_by', 80), ('released_at', 72), ('expiry_date', 50),
+)
+
+
+PDF_TEXT = str.maketrans({**{chr(k): v for k, v in TRANSLITERATE.items()},
+                          '\\': '\\\\', '(': '\\(', ')': '\\)'})
+
+
+def _pdf_text(text: Any) -> bytes:
+    return str(text).translate(PDF_TEXT).encode("cp1252", "replace")
+
+
+class PdfWriter(ExportWriter):
+    extension = "pdf"
+    width, height = 842, 595
+    margin = 24
+    font_size = 7
+    line_height = 12
+
+    def __init__(self, path: str, columns: Sequence[Tuple[str, str]], title: str = "",
+                 rows_per_page: int = 40):
+        super().__init__(path, columns, title)
+        keys = [key for key, _ in columns]
+        headers = dict(columns)
+        self._fields = [(keys.index(key), width, headers[key]) for key, width in PDF_COLUMNS if key in keys]
+        self.rows_per_page = rows_per_page
+        self._file = open(self._temp, "wb")
+        self._offsets: List[int] = [0, 0, 0]
+        self._kids: List[int] = []
+        self._page: List[bytes] = []
+        self._page_rows = 0
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+        self._object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold "
+                        b"/Encoding /WinAnsiEncoding >>")
+        self._created = datetime.now().strftime("%d.%m.%Y %H:%M")
+
+    def _object(self, number: int, body: bytes):
+        while len(self._offsets) < number:
+            self._offsets.append(0)
+        self._offsets[number - 1] = self._file.tell()
+        self._file.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    def _line(self, y: float, cells: Sequence[Any], font: str):
+        parts = [f"BT {font} {self.font_size} Tf {self.margin} {y:.1f} Td"]
+        offset = 0
+        for (_, width, _), value in zip(self._fields, cells):
+            limit = int(width / (self.font_size * 0.5))
+            text = str(value)
+            if len(text) > limit:
+                text = text[:limit - 1] + "."
+            parts.append(f"{offset} 0 Td ({text.translate(PDF_TEXT)}) Tj")
+            offset = width
+        parts.append("ET")
+        self._page.append(" ".join(parts).encode("cp1252", "replace"))
+
+    def _start_page(self):
+        top = self.height - self.margin
+        self._page = [b"0 g",
+                      b"BT /F2 11 Tf %d %d Td (%s) Tj ET" % (self.margin, top - 11, _pdf_text(self.title)),
+                      b"BT /F1 7 Tf %d %d Td (%s) Tj ET" % (
+                          self.width - self.margin - 120, top - 11,
+                          _pdf_text(f"{self._created}  Sayfa {len(self._kids) + 1}"))]
+        self._line(top - 32, [header for _, _, header in self._fields], "/F2")
+        self._page.append(b"%d %d m %d %d l 0.5 w S" % (
+            self.margin, top - 36, self.width - self.margin, top - 36))
+        self._page_rows = 0
+
+    def _end_page(self):
+        content = zlib.compress(b"\n".join(self._page), 6)
+        number = len(self._offsets) + 1
+        self._object(number, b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (
+            len(content), content))
+        self._object(number + 1, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                                 b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % (
+                                     self.width, self.height, number))
+        self._kids.append(number + 1)
+        self._page = []
+
+    def write(self, row: Sequence[Any]):
+        if not self._page:
+            self._start_page()
+        y = self.height - self.margin - 48 - self._page_rows * self.line_height
+        self._line(y, [row[index] for index, _, _ in self._fields], "/F1")
+        self._page_rows += 1
+        self.rows += 1
+        if self._page_rows >= self.rows_per_page:
+            self._end_page()
+
+    def _finish(self):
+        if self._file.closed:
+            return
+        if self._page or not self._kids:
+            if not self._page:
+                self._start_page()
+            self._end_page()
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % kid for kid in self._kids), len(self._kids)))
+        xref = self._file.tell()
+        self._file.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(self._offsets) + 1))
+        self._file.write(b"".join(b"%010d 00000 n \n" % offset for offset in self._offsets))
+        self._file.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(self._offsets) + 1, xref))
+        self._file.close()
+
+
+WRITERS = {'csv': CsvWriter, 'xlsx': XlsxWriter, 'pdf': PdfWriter}
@@ -3,9 +3,13 @@ from datetime import datetime
 import uuid
 
 from app.core.database import get_db
+from app.core.tracing import traced_service
+from app.config.constants import SearchKinds
 from app.models.instrument import Instrument, InstrumentSet, SetContent
+from app.services.search_service import SearchService
 
 
+@traced_service
 class InstrumentService:
 
     def __init__(self):
@@ -30,22 +34,7 @@ class InstrumentService:
         query += " ORDER BY name"
         rows = self.db.fetchall(query, tuple(params))
 
-        return [Instrument(
-            id=row['id'],
-            barcode=row['barcode'],
-            name=row['name'],
-            description=row['description'] or "",
-            category=row['category'] or "",
-            manufacturer=row['manufacturer'] or "",
-            model_number=row['model_number'] or "",
-            serial_number=row['serial_number'] or "",
-            max_cycles=row['max_cycles'] or 0,
-            current_cycles=row['current_cycles'] or 0,
-            status=row['status'],
-            location=row['location'] or "",
-            last_sterilization=row['last_sterilization'],
-            created_at=row['created_at']
-        ) for row in rows]
+        return [self._row_to_instrument(row) for row in rows]
 
     def get_instrument(self, instrument_id: int) -> Optional[Instrument]:
         row = self.db.fetchone(
@@ -55,22 +44,7 @@ class InstrumentService:
         if not row:
             return None
 
-        return Instrument(
-            id=row['id'],
-            barcode=row['barcode'],
-            name=row['name'],
-            description=row['description'] or "",
-            category=row['category'] or "",
-            manufacturer=row['manufacturer'] or "",
-            model_number=row['model_number'] or "",
-            serial_number=row['serial_number'] or "",
-            max_cycles=row['max_cycles'] or 0,
-            current_cycles=row['current_cycles'] or 0,
-            status=row['status'],
-            location=row['location'] or "",
-            last_sterilization=row['last_sterilization'],
-            created_at=row['created_at']
-        )
+        return self._row_to_instrument(row)
 
     def get_instrument_by_barcode(self, barcode: str) -> Optional[Instrument]:
         row = self.db.fetchone(
@@ -186,21 +160,7 @@ class InstrumentService:
         query += " ORDER BY s.name"
         rows = self.db.fetchall(query, tuple(params))
 
-        return [InstrumentSet(
-            id=row['id'],
-            barcode=row['barcode'],
-            name=row['name'],
-            description=row['description'] or "",
-            category=row['category'] or "",
-            department_id=row['department_id'],
-            department_name=row['department_name'] or "",
-            container_type=row['container_type'] or "",
-            sterilization_method=row['sterilization_method'] or "STEAM",
-            validity_days=row['validity_days'] or 30,
-            status=row['status'],
-            total_instruments=row['total_instruments'] or 0,
-            created_at=row['created_at']
-        ) for row in rows]
+        return [self._row_to_set(row) for row in rows]
 
     def get_set(self, set_id: int) -> Optional[InstrumentSet]:
         row = self.db.fetchone("""
@@ -213,21 +173,7 @@ class InstrumentService:
         if not row:
             return None
 
-        instrument_set = InstrumentSet(
-            id=row['id'],
-            barcode=row['barcode'],
-            name=row['name'],
-            description=row['description'] or "",
-            category=row['category'] or "",
-            department_id=row['department_id'],
-            department_name=row['department_name'] or "",
-            container_type=row['container_type'] or "",
-            sterilization_method=row['sterilization_method'] or "STEAM",
-            validity_days=row['validity_days'] or 30,
-            status=row['status'],
-            total_instruments=row['total_instruments'] or 0,
-            created_at=row['created_at']
-        )
+        instrument_set = self._row_to_set(row)
 
         instrument_set.contents = self._get_set_contents(set_id)
         return instrument_set
@@ -391,22 +337,45 @@ class InstrumentService:
         """)
         return [row['category'] for row in rows]
 
-    def search_instruments(self, query: str) -> List[Instrument]:
-        search = f"%{query}%"
-        rows = self.db.fetchall("""
-            SELECT id FROM instruments
-            WHERE name LIKE ? OR barcode LIKE ? OR description LIKE ?
-            ORDER BY name
-            LIMIT 50
-        """, (search, search, search))
-        return [self.get_instrument(row['id']) for row in rows]
-
-    def search_sets(self, query: str) -> List[InstrumentSet]:
-        search = f"%{query}%"
-        rows = self.db.fetchall("""
-            SELECT id FROM instrument_sets
-            WHERE name LIKE ? OR barcode LIKE ? OR description LIKE ?
-            ORDER BY name
-            LIMIT 50
-        """, (search, search, search))
-        return [self.get_set(row['id']) for row in rows]
+    def search_instruments(self, query: str, limit: int = 50) -> List[Instrument]:
+        rows = SearchService(self.db).rows(SearchKinds.INSTRUMENT, query, limit)
+        return [self._row_to_instrument(row) for row in rows]
+
+    def search_sets(self, query: str, limit: int = 50) -> List[InstrumentSet]:
+        rows = SearchService(self.db).rows(SearchKinds.SET, query, limit)
+        return [self._row_to_set(row) for row in rows]
+
+    def _row_to_instrument(self, row) -> Instrument:
+        return Instrument(
+            id=row['id'],
+            barcode=row['barcode'],
+            name=row['name'],
+            description=row['description'] or "",
+            category=row['category'] or "",
+            manufacturer=row['manufacturer'] or "",
+            model_number=row['model_number'] or "",
+            serial_number=row['serial_number'] or "",
+            max_cycles=row['max_cycles'] or 0,
+            current_cycles=row['current_cycles'] or 0,
+            status=row['status'],
+            location=row['location'] or "",
+            last_sterilization=row['last_sterilization'],
+            created_at=row['created_at']
+        )
+
+    def _row_to_set(self, row) -> InstrumentSet:
+        return InstrumentSet(
+            id=row['id'],
+            barcode=row['barcode'],
+            name=row['name'],
+            description=row['description'] or "",
+            category=row['category'] or "",
+            department_id=row['department_id'],
+            department_name=row['department_name'] or "",
+            container_type=row['container_type'] or "",
+            sterilization_method=row['sterilization_method'] or "STEAM",
+            validity_days=row['validity_days'] or 30,
+            status=row['status'],
+            total_instruments=row['total_instruments'] or 0,
+            created_at=row['created_at']
+        )
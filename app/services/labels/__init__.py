@@ -0,0 +1,13 @@
+from .symbology import code128, datamatrix
+from .templates import TEMPLATES, CompiledTemplate, compile_template
+from .renderers import render, render_png, render_zpl, render_pdf
+from .print_queue import PrintJob, PrintQueue, print_queue
+from .label_service import LabelService
+
+__all__ = [
+    'code128', 'datamatrix',
+    'TEMPLATES', 'CompiledTemplate', 'compile_template',
+    'render', 'render_png', 'render_zpl', 'render_pdf',
+    'PrintJob', 'PrintQueue', 'print_queue',
+    'LabelService'
+]
@@ -0,0 +1,110 @@
+from datetime import datetime
+from typing import Optional, List, Dict, Tuple, Any
+
+from app.core.database import get_db
+from app.core.session import current_session
+from app.core.tracing import traced_service
+from app.utils.date_utils import DateUtils
+from .print_queue import print_queue, PrintJob
+
+
+def _when(value, date_only: bool = False) -> str:
+    if isinstance(value, datetime):
+        return DateUtils.format_date(value) if date_only else DateUtils.format_datetime(value)
+    return str(value or "")
+
+
+RECORD_QUERY = """
+    SELECT sr.*, mc.cycle_number
+    FROM sterilization_records sr
+    LEFT JOIN machine_cycles mc ON sr.cycle_id = mc.id
+"""
+
+
+@traced_service
+class LabelService:
+
+    def __init__(self):
+        self.db = get_db()
+
+    def work_order_label(self, order_id: int) -> Optional[Dict[str, Any]]:
+        row = self.db.fetchone("""
+            SELECT wo.*, d.name as department_name
+            FROM work_orders wo
+            LEFT JOIN departments d ON wo.department_id = d.id
+            WHERE wo.id = ?
+        """, (order_id,))
+        if not row:
+            return None
+
+        data = dict(row)
+        data['barcode'] = data['barcode'] or data['order_number']
+        data['received_at'] = _when(data['received_at'])
+        return data
+
+    def record_label(self, record_id: int) -> Optional[Dict[str, Any]]:
+        row = self.db.fetchone(RECORD_QUERY + " WHERE sr.id = ?", (record_id,))
+        return self._record_data(row) if row else None
+
+    def load_labels(self, cycle_id: int) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        row = self.db.fetchone("""
+            SELECT mc.*, m.name as machine_name, mp.name as program_name,
+                   o.full_name as operator_name
+            FROM machine_cycles mc
+            LEFT JOIN machines m ON mc.machine_id = m.id
+            LEFT JOIN machine_programs mp ON mc.program_id = mp.id
+            LEFT JOIN operators o ON mc.operator_id = o.id
+            WHERE mc.id = ?
+        """, (cycle_id,))
+        if not row:
+            return None, []
+
+        records = [self._record_data(r) for r in self.db.fetchall(
+            RECORD_QUERY + " WHERE sr.cycle_id = ? ORDER BY sr.id", (cycle_id,)
+        )]
+        load = dict(row)
+        load['start_time'] = _when(load['start_time'])
+        load['item_count'] = len(records)
+        return load, records
+
+    def print_work_order(self, order_id: int, fmt: str = None) -> Tuple[bool, str, Optional[PrintJob]]:
+        data = self.work_order_label(order_id)
+        if not data:
+            return False, "İş emri bulunamadı", None
+        job = self._submit([('work_order', data)], fmt, "WORK_ORDER", order_id)
+        return True, "Etiket yazdırma kuyruğunda", job
+
+    def print_record(self, record_id: int, fmt: str = None) -> Tuple[bool, str, Optional[PrintJob]]:
+        data = self.record_label(record_id)
+        if not data:
+            return False, "Sterilizasyon kaydı bulunamadı", None
+        job = self._submit([('sterilization_record', data)], fmt, "STERILIZATION_RECORD", record_id)
+        return True, "Etiket yazdırma kuyruğunda", job
+
+    def print_order_record(self, order_id: int, fmt: str = None) -> Tuple[bool, str, Optional[PrintJob]]:
+        row = self.db.fetchone(
+            "SELECT id FROM sterilization_records WHERE work_order_id = ? ORDER BY id DESC LIMIT 1",
+            (order_id,)
+        )
+        if not row:
+            return self.print_work_order(order_id, fmt)
+        return self.print_record(row['id'], fmt)
+
+    def print_load(self, cycle_id: int, fmt: str = None) -> Tuple[bool, str, Optional[PrintJob]]:
+        load, records = self.load_labels(cycle_id)
+        if not load:
+            return False, "Çevrim bulunamadı", None
+
+        labels = [('load', load)] + [('sterilization_record', data) for data in records]
+        job = self._submit(labels, fmt, "MACHINE_CYCLE", cycle_id)
+        return True, f"{len(labels)} etiket yazdırma kuyruğunda", job
+
+    def _record_data(self, row) -> Dict[str, Any]:
+        data = dict(row)
+        data['load_time'] = _when(data['load_time'])
+        data['expiry_date'] = _when(data['expiry_date'], date_only=True)
+        return data
+
+    def _submit(self, labels, fmt: Optional[str], entity_type: str, entity_id: int) -> PrintJob:
+        user = current_session.current_user
+        return print_queue.submit(labels, fmt, entity_type, entity_id, user.user_id if user else None)
@@ -0,0 +1,168 @@
+import os
+import time
+import shlex
+import queue
+import itertools
+import threading
+import subprocess
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Tuple, Callable, Any
+
+from app.config.settings import settings
+from app.config.constants import PrintJobStatus, AuditActions
+from app.core.writer import background_writer
+from .templates import compile_template
+from .renderers import render
+
+
+@dataclass
+class PrintJob:
+    id: int
+    labels: List[Tuple[str, Dict[str, Any]]]
+    format: str
+    entity_type: str = ""
+    entity_id: Optional[int] = None
+    operator_id: Optional[int] = None
+    status: str = PrintJobStatus.QUEUED
+    path: str = ""
+    size: int = 0
+    error: str = ""
+    submitted_at: float = field(default_factory=time.perf_counter)
+    render_ms: float = 0.0
+    finished_at: Optional[float] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def label_count(self) -> int:
+        return len(self.labels)
+
+    @property
+    def elapsed_ms(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.submitted_at) * 1000
+
+
+class PrintQueue:
+    _instance: Optional['PrintQueue'] = None
+
+    EXTENSIONS = {'png': 'png', 'zpl': 'zpl', 'pdf': 'pdf'}
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._queue: "queue.Queue[Optional[PrintJob]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._listener: Optional[Callable[[PrintJob], None]] = None
+        self.history: List[PrintJob] = []
+        self._initialized = True
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def set_listener(self, listener: Optional[Callable[[PrintJob], None]]):
+        self._listener = listener
+
+    def submit(self, labels: List[Tuple[str, Dict[str, Any]]], fmt: str = None,
+               entity_type: str = "", entity_id: int = None, operator_id: int = None) -> PrintJob:
+        job = PrintJob(
+            id=next(self._ids),
+            labels=list(labels),
+            format=fmt or settings.printing.format,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            operator_id=operator_id
+        )
+        self._ensure_thread()
+        self._queue.put(job)
+        return job
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.join()
+
+    def stop(self, timeout: float = 10.0):
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="print-queue", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._print(job)
+            finally:
+                self._queue.task_done()
+
+    def _print(self, job: PrintJob):
+        job.status = PrintJobStatus.RENDERING
+        try:
+            started = time.perf_counter()
+            pages = []
+            for name, data in job.labels:
+                template = compile_template(name, settings.printing.dpi)
+                pages.append((template, template.fill(data)))
+            document = render(pages, job.format)
+            job.render_ms = (time.perf_counter() - started) * 1000
+            job.size = len(document)
+            job.path = self._spool(job, document)
+            job.status = PrintJobStatus.PRINTED
+            background_writer.submit("""
+                INSERT INTO audit_log (operator_id, action, entity_type, entity_id, details, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (job.operator_id, AuditActions.PRINT, job.entity_type, job.entity_id,
+                  f"{job.label_count} etiket, {job.format.upper()}", datetime.now()))
+        except Exception as e:
+            job.status = PrintJobStatus.FAILED
+            job.error = str(e)
+
+        job.finished_at = time.perf_counter()
+        self.history = self.history[-99:] + [job]
+        job.done.set()
+        if self._listener is not None:
+            self._listener(job)
+
+    def _spool(self, job: PrintJob, document: bytes) -> str:
+        if settings.printing.backend == "lp":
+            command = shlex.split(settings.printing.lp_command)
+            if settings.printing.printer:
+                command += ["-d", settings.printing.printer]
+            command += ["-t", f"{job.entity_type or 'etiket'}-{job.id}"]
+            result = subprocess.run(command, input=document, capture_output=True,
+                                    timeout=settings.printing.timeout_seconds)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.decode(errors="replace").strip() or "Yazdırma başarısız")
+            return result.stdout.decode(errors="replace").strip()
+
+        os.makedirs(settings.printing.spool_path, exist_ok=True)
+        name = f"{datetime.now():%Y%m%d_%H%M%S}_{job.id:05d}_{job.entity_type or 'etiket'}"
+        path = os.path.join(settings.printing.spool_path, f"{name}.{self.EXTENSIONS[job.format]}")
+        temp = path + ".tmp"
+        with open(temp, "wb") as f:
+            f.write(document)
+        os.replace(temp, path)
+        return path
+
+
+print_queue = PrintQueue()
@@ -0,0 +1,229 @@
+import zlib
+import struct
+from functools import lru_cache
+from typing import List, Tuple
+
+from .templates import CompiledTemplate
+
+Page = Tuple[CompiledTemplate, List[Tuple]]
+
+TRANSLITERATE = str.maketrans("ğĞşŞıİçÇöÖüÜ", "gGsSiIcCoOuU")
+
+FONT = {
+    '0': (0x3E, 0x51, 0x49, 0x45, 0x3E), '1': (0x00, 0x42, 0x7F, 0x40, 0x00),
+    '2': (0x42, 0x61, 0x51, 0x49, 0x46), '3': (0x21, 0x41, 0x45, 0x4B, 0x31),
+    '4': (0x18, 0x14, 0x12, 0x7F, 0x10), '5': (0x27, 0x45, 0x45, 0x45, 0x39),
+    '6': (0x3C, 0x4A, 0x49, 0x49, 0x30), '7': (0x01, 0x71, 0x09, 0x05, 0x03),
+    '8': (0x36, 0x49, 0x49, 0x49, 0x36), '9': (0x06, 0x49, 0x49, 0x29, 0x1E),
+    'A': (0x7E, 0x11, 0x11, 0x11, 0x7E), 'B': (0x7F, 0x49, 0x49, 0x49, 0x36),
+    'C': (0x3E, 0x41, 0x41, 0x41, 0x22), 'D': (0x7F, 0x41, 0x41, 0x22, 0x1C),
+    'E': (0x7F, 0x49, 0x49, 0x49, 0x41), 'F': (0x7F, 0x09, 0x09, 0x09, 0x01),
+    'G': (0x3E, 0x41, 0x49, 0x49, 0x7A), 'H': (0x7F, 0x08, 0x08, 0x08, 0x7F),
+    'I': (0x00, 0x41, 0x7F, 0x41, 0x00), 'J': (0x20, 0x40, 0x41, 0x3F, 0x01),
+    'K': (0x7F, 0x08, 0x14, 0x22, 0x41), 'L': (0x7F, 0x40, 0x40, 0x40, 0x40),
+    'M': (0x7F, 0x02, 0x0C, 0x02, 0x7F), 'N': (0x7F, 0x04, 0x08, 0x10, 0x7F),
+    'O': (0x3E, 0x41, 0x41, 0x41, 0x3E), 'P': (0x7F, 0x09, 0x09, 0x09, 0x06),
+    'Q': (0x3E, 0x41, 0x51, 0x21, 0x5E), 'R': (0x7F, 0x09, 0x19, 0x29, 0x46),
+    'S': (0x46, 0x49, 0x49, 0x49, 0x31), 'T': (0x01, 0x01, 0x7F, 0x01, 0x01),
+    'U': (0x3F, 0x40, 0x40, 0x40, 0x3F), 'V': (0x1F, 0x20, 0x40, 0x20, 0x1F),
+    'W': (0x3F, 0x40, 0x38, 0x40, 0x3F), 'X': (0x63, 0x14, 0x08, 0x14, 0x63),
+    'Y': (0x07, 0x08, 0x70, 0x08, 0x07), 'Z': (0x61, 0x51, 0x49, 0x45, 0x43),
+    ' ': (0x00, 0x00, 0x00, 0x00, 0x00), '-': (0x08, 0x08, 0x08, 0x08, 0x08),
+    '.': (0x00, 0x60, 0x60, 0x00, 0x00), ':': (0x00, 0x36, 0x36, 0x00, 0x00),
+    '/': (0x20, 0x10, 0x08, 0x04, 0x02), '#': (0x14, 0x7F, 0x14, 0x7F, 0x14),
+    '(': (0x00, 0x1C, 0x22, 0x41, 0x00), ')': (0x00, 0x41, 0x22, 0x1C, 0x00),
+    '+': (0x08, 0x08, 0x3E, 0x08, 0x08), ',': (0x00, 0x50, 0x30, 0x00, 0x00),
+    '%': (0x23, 0x13, 0x08, 0x64, 0x62), '_': (0x40, 0x40, 0x40, 0x40, 0x40),
+    '?': (0x02, 0x01, 0x51, 0x09, 0x06),
+}
+
+
+class Canvas:
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(b"\xff" * (width * height))
+
+    def fill(self, x: int, y: int, w: int, h: int):
+        x0, x1 = max(0, x), min(self.width, x + w)
+        if x1 <= x0:
+            return
+        dark = bytes(x1 - x0)
+        for row in range(max(0, y), min(self.height, y + h)):
+            start = row * self.width
+            self.pixels[start + x0:start + x1] = dark
+
+    def blit(self, x: int, y: int, rows: Tuple[bytes, ...], repeat: int = 1):
+        x0 = max(0, x)
+        for n, pixels in enumerate(rows):
+            pixels = pixels[x0 - x:self.width - x]
+            for line in range(max(0, y + n * repeat), min(self.height, y + (n + 1) * repeat)):
+                start = line * self.width + x0
+                self.pixels[start:start + len(pixels)] = pixels
+
+
+def _row(bits, width: int) -> bytes:
+    white, dark = b"\xff" * width, b"\x00" * width
+    return b"".join(dark if bit else white for bit in bits)
+
+
+@lru_cache(maxsize=4096)
+def _text_rows(text: str, scale: int) -> Tuple[bytes, ...]:
+    columns = []
+    for char in text.translate(TRANSLITERATE).upper():
+        columns.extend(FONT.get(char, FONT['?']))
+        columns.append(0)
+    return tuple(_row((bits >> row & 1 for bits in columns), scale) for row in range(7))
+
+
+@lru_cache(maxsize=1024)
+def _bar_rows(widths: Tuple[int, ...], module: int) -> Tuple[bytes, ...]:
+    return (b"".join((b"\x00" if n % 2 == 0 else b"\xff") * width * module
+                     for n, width in enumerate(widths)),)
+
+
+@lru_cache(maxsize=1024)
+def _matrix_rows(matrix: Tuple[Tuple[bool, ...], ...], module: int) -> Tuple[bytes, ...]:
+    return tuple(_row(row, module) for row in matrix)
+
+
+def draw_page(canvas: Canvas, ops: List[Tuple], top: int = 0):
+    for kind, (x, y, *size), payload, _ in ops:
+        y += top
+        if kind == 'rule':
+            canvas.fill(x, y, size[0], max(1, size[1]))
+        elif kind == 'text':
+            scale = max(1, size[0] // 7)
+            canvas.blit(x, y, _text_rows(payload, scale), scale)
+        elif kind == 'code128':
+            canvas.blit(x, y, _bar_rows(payload, max(1, size[0] // sum(payload))), size[1])
+        elif kind == 'datamatrix':
+            module = max(1, size[0] // len(payload))
+            canvas.blit(x, y, _matrix_rows(payload, module), module)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+
+def render_png(pages: List[Page]) -> bytes:
+    width = max(template.width for template, _ in pages)
+    height = sum(template.height for template, _ in pages)
+    canvas = Canvas(width, height)
+    top = 0
+    for template, ops in pages:
+        draw_page(canvas, ops, top)
+        top += template.height
+
+    raw = bytearray()
+    for row in range(height):
+        raw.append(0)
+        raw += canvas.pixels[row * width:(row + 1) * width]
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)),
+        _png_chunk(b"IDAT", zlib.compress(bytes(raw), 3)),
+        _png_chunk(b"IEND", b""),
+    ))
+
+
+def _zpl_field(text: str) -> str:
+    return "^FH_^FD" + text.replace("_", "_5F").replace("^", "_5E").replace("~", "_7E") + "^FS"
+
+
+def render_zpl(pages: List[Page]) -> bytes:
+    out = []
+    for template, ops in pages:
+        out.append(f"^XA^CI28^PW{template.width}^LL{template.height}")
+        for kind, (x, y, *size), payload, text in ops:
+            if kind == 'rule':
+                out.append(f"^FO{x},{y}^GB{size[0]},{max(1, size[1])},{max(1, size[1])}^FS")
+            elif kind == 'text':
+                out.append(f"^FO{x},{y}^A0N,{size[0]},{size[0]}" + _zpl_field(text))
+            elif kind == 'code128':
+                module = max(1, size[0] // sum(payload))
+                out.append(f"^FO{x},{y}^BY{module}^BCN,{size[1]},N,N,N,A" + _zpl_field(text))
+            elif kind == 'datamatrix':
+                module = max(1, size[0] // len(payload))
+                out.append(f"^FO{x},{y}^BXN,{module},200" + _zpl_field(text))
+        out.append("^XZ")
+    return "\n".join(out).encode("utf-8")
+
+
+def _pdf_text(text: str) -> bytes:
+    encoded = text.translate(TRANSLITERATE).encode("cp1252", "replace")
+    return encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _pdf_content(template: CompiledTemplate, ops: List[Tuple]) -> bytes:
+    scale = 72 / template.dpi
+    height = template.height
+    out = [b"0 g"]
+
+    def rect(x, y, w, h):
+        out.append(b"%.2f %.2f %.2f %.2f re f" % (x * scale, (height - y - h) * scale, w * scale, h * scale))
+
+    for kind, (x, y, *size), payload, text in ops:
+        if kind == 'rule':
+            rect(x, y, size[0], max(1, size[1]))
+        elif kind == 'text':
+            points = size[0] * scale
+            out.append(b"BT /F1 %.2f Tf %.2f %.2f Td (%s) Tj ET" % (
+                points, x * scale, (height - y) * scale - points * 0.8, _pdf_text(text)))
+        elif kind == 'code128':
+            module = size[0] / sum(payload)
+            dark = True
+            for width in payload:
+                if dark:
+                    rect(x, y, width * module, size[1])
+                x += width * module
+                dark = not dark
+        elif kind == 'datamatrix':
+            module = size[0] / len(payload)
+            for r, row in enumerate(payload):
+                for c, on in enumerate(row):
+                    if on:
+                        rect(x + c * module, y + r * module, module, module)
+    return b"\n".join(out)
+
+
+def render_pdf(pages: List[Page]) -> bytes:
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for template, ops in pages:
+        content = zlib.compress(_pdf_content(template, ops), 6)
+        objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(content), content))
+        kids.append(len(objects) + 1)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (
+                           template.width * 72 / template.dpi, template.height * 72 / template.dpi,
+                           len(objects)))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+RENDERERS = {'png': render_png, 'zpl': render_zpl, 'pdf': render_pdf}
+
+
+def render(pages: List[Page], fmt: str) -> bytes:
+    if fmt not in RENDERERS:
+        raise ValueError(f"Desteklenmeyen etiket biçimi: {fmt}")
+    return RENDERERS[fmt](pages)
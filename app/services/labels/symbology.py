@@ -0,0 +1,234 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+CODE128_PATTERNS = (
+    "212222", "222122", "222221", "121223", "121322", "131222", "122213", "122312", "132212", "221213",
+    "221312", "231212", "112232", "122132", "122231", "113222", "123122", "123221", "223211", "221132",
+    "221231", "213212", "223112", "312131", "311222", "321122", "321221", "312212", "322112", "322211",
+    "212123", "212321", "232121", "111323", "131123", "131321", "112313", "132113", "132311", "211313",
+    "231113", "231311", "112133", "112331", "132131", "113123", "113321", "133121", "313121", "211331",
+    "231131", "213113", "213311", "213131", "311123", "311321", "331121", "312113", "312311", "332111",
+    "314111", "221411", "431111", "111224", "111422", "121124", "121421", "141122", "141221", "112214",
+    "112412", "122114", "122411", "142112", "142211", "241211", "221114", "413111", "241112", "134111",
+    "111242", "121142", "121241", "114212", "124112", "124211", "411212", "421112", "421211", "212141",
+    "214121", "412121", "111143", "111341", "131141", "114113", "114311", "411113", "411311", "113141",
+    "114131", "311141", "411131", "211412", "211214", "211232", "2331112"
+)
+
+CODE_B, CODE_C = 100, 99
+START_B, START_C, STOP = 104, 105, 106
+
+
+def _digit_run(data: str, start: int) -> int:
+    end = start
+    while end < len(data) and data[end].isdigit():
+        end += 1
+    return end - start
+
+
+@lru_cache(maxsize=1024)
+def code128_values(data: str) -> Tuple[int, ...]:
+    if not data or any(not 32 <= ord(ch) < 127 for ch in data):
+        raise ValueError(f"Code128 ile kodlanamaz: {data!r}")
+
+    values = []
+    mode = None
+    i = 0
+    while i < len(data):
+        run = _digit_run(data, i)
+        use_c = run >= 4 or (run >= 2 and run == len(data) - i and mode == CODE_C)
+        if use_c:
+            if mode != CODE_C:
+                values.append(START_C if mode is None else CODE_C)
+                mode = CODE_C
+            pairs = run // 2
+            for n in range(pairs):
+                values.append(int(data[i + 2 * n:i + 2 * n + 2]))
+            i += pairs * 2
+            continue
+        if mode != CODE_B:
+            values.append(START_B if mode is None else CODE_B)
+            mode = CODE_B
+        values.append(ord(data[i]) - 32)
+        i += 1
+
+    checksum = values[0] + sum(n * value for n, value in enumerate(values[1:], 1))
+    values.append(checksum % 103)
+    values.append(STOP)
+    return tuple(values)
+
+
+@lru_cache(maxsize=1024)
+def code128(data: str) -> Tuple[int, ...]:
+    widths = []
+    for value in code128_values(data):
+        widths.extend(int(w) for w in CODE128_PATTERNS[value])
+    return tuple(widths)
+
+
+DATAMATRIX_SIZES = (
+    (10, 3, 5), (12, 5, 7), (14, 8, 10), (16, 12, 12), (18, 18, 14),
+    (20, 22, 18), (22, 30, 20), (24, 36, 24), (26, 44, 28)
+)
+
+
+def _gf_tables() -> Tuple[List[int], List[int]]:
+    exp, log = [0] * 255, [0] * 256
+    value = 1
+    for power in range(255):
+        exp[power] = value
+        log[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= 0x12D
+    return exp, log
+
+
+GF_EXP, GF_LOG = _gf_tables()
+
+
+def _gf_mul(a: int, b: int) -> int:
+    if a == 0 or b == 0:
+        return 0
+    return GF_EXP[(GF_LOG[a] + GF_LOG[b]) % 255]
+
+
+@lru_cache(maxsize=None)
+def _rs_generator(count: int) -> Tuple[int, ...]:
+    poly = [1]
+    for root in range(1, count + 1):
+        poly = [a ^ _gf_mul(b, GF_EXP[root]) for a, b in zip(poly + [0], [0] + poly)]
+    return tuple(poly)
+
+
+def reed_solomon(data: List[int], count: int) -> List[int]:
+    generator = _rs_generator(count)
+    remainder = [0] * count
+    for value in data:
+        factor = value ^ remainder[0]
+        remainder = remainder[1:] + [0]
+        for n in range(count):
+            remainder[n] ^= _gf_mul(generator[n + 1], factor)
+    return remainder
+
+
+def datamatrix_codewords(data: str) -> List[int]:
+    raw = data.encode("latin-1")
+    codewords = []
+    i = 0
+    while i < len(raw):
+        byte = raw[i]
+        if 48 <= byte <= 57 and i + 1 < len(raw) and 48 <= raw[i + 1] <= 57:
+            codewords.append(130 + (byte - 48) * 10 + raw[i + 1] - 48)
+            i += 2
+            continue
+        if byte > 127:
+            codewords.extend((235, byte - 127))
+        else:
+            codewords.append(byte + 1)
+        i += 1
+    return codewords
+
+
+@lru_cache(maxsize=None)
+def _place(rows: int, cols: int) -> List[List[Tuple[int, int]]]:
+    grid: List[List[Tuple[int, int]]] = [[None] * cols for _ in range(rows)]
+
+    def module(r, c, index, bit):
+        if r < 0:
+            r += rows
+            c += 4 - ((rows + 4) % 8)
+        if c < 0:
+            c += cols
+            r += 4 - ((cols + 4) % 8)
+        grid[r][c] = (index, bit)
+
+    def utah(r, c, index):
+        for bit, (dr, dc) in enumerate(((-2, -2), (-2, -1), (-1, -2), (-1, -1),
+                                        (-1, 0), (0, -2), (0, -1), (0, 0)), 1):
+            module(r + dr, c + dc, index, bit)
+
+    def corner(index, positions):
+        for bit, (r, c) in enumerate(positions, 1):
+            module(r, c, index, bit)
+
+    index, r, c = 0, 4, 0
+    while True:
+        if r == rows and c == 0:
+            corner(index, ((rows - 1, 0), (rows - 1, 1), (rows - 1, 2), (0, cols - 2),
+                           (0, cols - 1), (1, cols - 1), (2, cols - 1), (3, cols - 1)))
+            index += 1
+        if r == rows - 2 and c == 0 and cols % 4:
+            corner(index, ((rows - 3, 0), (rows - 2, 0), (rows - 1, 0), (0, cols - 4),
+                           (0, cols - 3), (0, cols - 2), (0, cols - 1), (1, cols - 1)))
+            index += 1
+        if r == rows - 2 and c == 0 and cols % 8 == 4:
+            corner(index, ((rows - 3, 0), (rows - 2, 0), (rows - 1, 0), (0, cols - 2),
+                           (0, cols - 1), (1, cols - 1), (2, cols - 1), (3, cols - 1)))
+            index += 1
+        if r == rows + 4 and c == 2 and not cols % 8:
+            corner(index, ((rows - 1, 0), (rows - 1, cols - 1), (0, cols - 3), (0, cols - 2),
+                           (0, cols - 1), (1, cols - 3), (1, cols - 2), (1, cols - 1)))
+            index += 1
+
+        while True:
+            if r < rows and c >= 0 and grid[r][c] is None:
+                utah(r, c, index)
+                index += 1
+            r -= 2
+            c += 2
+            if not (r >= 0 and c < cols):
+                break
+        r += 1
+        c += 3
+
+        while True:
+            if r >= 0 and c < cols and grid[r][c] is None:
+                utah(r, c, index)
+                index += 1
+            r += 2
+            c -= 2
+            if not (r < rows and c >= 0):
+                break
+        r += 3
+        c += 1
+
+        if not (r < rows or c < cols):
+            break
+
+    if grid[rows - 1][cols - 1] is None:
+        grid[rows - 1][cols - 1] = grid[rows - 2][cols - 2] = (-1, 1)
+        grid[rows - 1][cols - 2] = grid[rows - 2][cols - 1] = (-1, 0)
+    return grid
+
+
+@lru_cache(maxsize=1024)
+def datamatrix(data: str) -> Tuple[Tuple[bool, ...], ...]:
+    codewords = datamatrix_codewords(data)
+    for size, capacity, ecc in DATAMATRIX_SIZES:
+        if len(codewords) <= capacity:
+            break
+    else:
+        raise ValueError(f"DataMatrix için veri çok uzun: {len(codewords)} kod sözcüğü")
+
+    if len(codewords) < capacity:
+        codewords.append(129)
+        while len(codewords) < capacity:
+            pad = 129 + ((149 * (len(codewords) + 1)) % 253) + 1
+            codewords.append(pad - 254 if pad > 254 else pad)
+    codewords += reed_solomon(codewords, ecc)
+
+    region = size - 2
+    placement = _place(region, region)
+    matrix = [[False] * size for _ in range(size)]
+    for r in range(size):
+        matrix[r][0] = True
+        matrix[size - 1][r] = True
+        matrix[0][r] = r % 2 == 0
+        matrix[r][size - 1] = r % 2 == 1
+    for r in range(region):
+        for c in range(region):
+            index, bit = placement[r][c]
+            dark = bit == 1 if index < 0 else bool(codewords[index] >> (8 - bit) & 1)
+            matrix[r + 1][c + 1] = dark
+    return tuple(tuple(row) for row in matrix)
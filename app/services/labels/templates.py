@@ -0,0 +1,94 @@
+from string import Formatter
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any
+
+from .symbology import code128, datamatrix
+
+TEMPLATES: Dict[str, Dict[str, Any]] = {
+    'work_order': {
+        'size': (60, 40),
+        'elements': [
+            ('text', 3, 2.5, 3.2, "{item_name}"),
+            ('text', 3, 7.5, 2.4, "{order_number}  {department_name}"),
+            ('code128', 3, 12, 54, 13, "{barcode}"),
+            ('text', 3, 27, 2.4, "{barcode}"),
+            ('text', 3, 32, 2.4, "Kabul: {received_at}  Oncelik: {priority}"),
+        ],
+    },
+    'sterilization_record': {
+        'size': (60, 40),
+        'elements': [
+            ('text', 3, 2.5, 3.2, "{item_name}"),
+            ('text', 3, 8, 2.4, "{record_number}"),
+            ('text', 3, 13, 2.4, "Yontem: {sterilization_method}"),
+            ('text', 3, 18, 2.4, "Cevrim: {cycle_number}"),
+            ('text', 3, 23, 2.4, "Uretim: {load_time}"),
+            ('text', 3, 28, 2.8, "SKT: {expiry_date}"),
+            ('datamatrix', 41, 13, 16, "{record_number}"),
+            ('rule', 3, 34, 54, 0.4),
+            ('text', 3, 35.5, 2.0, "{storage_location}"),
+        ],
+    },
+    'load': {
+        'size': (100, 60),
+        'elements': [
+            ('text', 4, 3, 4.5, "Yuk {cycle_number}"),
+            ('text', 4, 10, 3.0, "{machine_name}  {program_name}"),
+            ('text', 4, 15, 3.0, "Baslangic: {start_time}"),
+            ('text', 4, 20, 3.0, "Icerik: {item_count} paket"),
+            ('text', 4, 25, 3.0, "Operator: {operator_name}"),
+            ('datamatrix', 72, 10, 22, "{cycle_number}"),
+            ('code128', 4, 34, 92, 16, "{cycle_number}"),
+            ('text', 4, 52, 3.0, "{cycle_number}"),
+        ],
+    },
+}
+
+
+class _Blank(dict):
+
+    def __missing__(self, key):
+        return ""
+
+
+class CompiledTemplate:
+
+    def __init__(self, name: str, dpi: int):
+        spec = TEMPLATES[name]
+        self.name = name
+        self.dpi = dpi
+        self.width = self.dots(spec['size'][0])
+        self.height = self.dots(spec['size'][1])
+        self.fields = set()
+        self._ops: List[Tuple] = []
+        formatter = Formatter()
+        for kind, *geometry in spec['elements']:
+            if kind == 'rule':
+                self._ops.append((kind, tuple(self.dots(v) for v in geometry), None))
+                continue
+            *box, pattern = geometry
+            self.fields.update(field for _, field, _, _ in formatter.parse(pattern) if field)
+            self._ops.append((kind, tuple(self.dots(v) for v in box), pattern))
+
+    def dots(self, mm: float) -> int:
+        return round(mm * self.dpi / 25.4)
+
+    def fill(self, data: Dict[str, Any]) -> List[Tuple]:
+        values = _Blank((key, "" if value is None else value) for key, value in data.items())
+        ops = []
+        for kind, box, pattern in self._ops:
+            text = pattern.format_map(values).strip() if pattern else ""
+            if kind == 'code128' and text:
+                ops.append((kind, box, code128(text), text))
+            elif kind == 'datamatrix' and text:
+                ops.append((kind, box, datamatrix(text), text))
+            elif kind in ('text', 'rule'):
+                ops.append((kind, box, text, text))
+        return ops
+
+
+@lru_cache(maxsize=64)
+def compile_template(name: str, dpi: int) -> CompiledTemplate:
+    if name not in TEMPLATES:
+        raise KeyError(f"Etiket şablonu bulunamadı: {name}")
+    return CompiledTemplate(name, dpi)
@@ -0,0 +1,302 @@
+import math
+import operator
+from array import array
+from typing import Optional, List, Dict
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+
+from app.core.database import get_db
+from app.core.tracing import traced_service
+from app.config.constants import MachineTypes
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch(dt: datetime) -> float:
+    return (dt - EPOCH).total_seconds()
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+@dataclass
+class DurationDistribution:
+    count: int = 0
+    mean_minutes: float = 0.0
+    min_minutes: float = 0.0
+    max_minutes: float = 0.0
+    p50_minutes: float = 0.0
+    p90_minutes: float = 0.0
+    p99_minutes: float = 0.0
+    buckets: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class MachineUtilization:
+    machine_id: int = 0
+    machine_name: str = ""
+    machine_type: str = ""
+    zone: str = ""
+    cycle_count: int = 0
+    failed_cycles: int = 0
+    busy_hours: float = 0.0
+    utilization: float = 0.0
+    idle_gap_count: int = 0
+    idle_gap_mean_minutes: float = 0.0
+    idle_gap_max_minutes: float = 0.0
+    idle_gap_p90_minutes: float = 0.0
+    items_processed: int = 0
+    average_load: float = 0.0
+    queue_wait_mean_minutes: float = 0.0
+    queue_wait_p90_minutes: float = 0.0
+    cycles_per_day: float = 0.0
+    durations: DurationDistribution = field(default_factory=DurationDistribution)
+
+    @property
+    def category(self) -> str:
+        return MachineTypes.CATEGORIES.get(self.machine_type, "UNKNOWN")
+
+
+@dataclass
+class Bottleneck:
+    zone: str = ""
+    category: str = ""
+    machine_count: int = 0
+    utilization: float = 0.0
+    queue_wait_p90_minutes: float = 0.0
+    recommended_machines: int = 0
+    reason: str = ""
+
+
+@dataclass
+class MachineParkReport:
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    machines: List[MachineUtilization] = field(default_factory=list)
+    bottlenecks: List[Bottleneck] = field(default_factory=list)
+
+    @property
+    def total_cycles(self) -> int:
+        return sum(m.cycle_count for m in self.machines)
+
+    @property
+    def total_items(self) -> int:
+        return sum(m.items_processed for m in self.machines)
+
+
+@traced_service
+class MachineAnalyticsService:
+
+    DURATION_BUCKETS = (15, 30, 45, 60, 90, 120)
+    BOTTLENECK_UTILIZATION = 0.8
+    BOTTLENECK_QUEUE_MINUTES = 60
+    TARGET_UTILIZATION = 0.75
+
+    def __init__(self):
+        self.db = get_db()
+
+    def analyze(self, start: datetime = None, end: datetime = None,
+                zone: str = None, category: str = None) -> MachineParkReport:
+        end = end or datetime.now()
+        start = start or end - timedelta(days=30)
+        window_start = _to_epoch(start)
+        window_end = _to_epoch(end)
+        window = max(window_end - window_start, 1.0)
+
+        machines = self._get_machines(zone, category)
+        cycles = self._get_cycle_intervals(start, end, list(machines))
+        waits = self._get_queue_waits(start, end, list(machines))
+
+        report = MachineParkReport(start=start, end=end)
+        for machine_id, row in machines.items():
+            stats = MachineUtilization(
+                machine_id=machine_id,
+                machine_name=row['name'],
+                machine_type=row['machine_type'],
+                zone=row['zone'] or ""
+            )
+            data = cycles.get(machine_id)
+            if data:
+                self._fill_cycle_stats(stats, data, window_start, window_end, window)
+            wait = waits.get(machine_id)
+            if wait:
+                wait.sort()
+                stats.queue_wait_mean_minutes = round(sum(wait) / len(wait) / 60, 1)
+                stats.queue_wait_p90_minutes = round(_percentile(wait, 90) / 60, 1)
+            report.machines.append(stats)
+
+        report.bottlenecks = self._find_bottlenecks(report.machines, window)
+        return report
+
+    def get_utilization(self, machine_id: int, start: datetime = None,
+                        end: datetime = None) -> Optional[MachineUtilization]:
+        report = self.analyze(start, end)
+        for stats in report.machines:
+            if stats.machine_id == machine_id:
+                return stats
+        return None
+
+    def get_bottlenecks(self, start: datetime = None, end: datetime = None) -> List[Bottleneck]:
+        return self.analyze(start, end).bottlenecks
+
+    def _get_machines(self, zone: str = None, category: str = None) -> Dict[int, dict]:
+        query = "SELECT id, name, machine_type, zone FROM machines WHERE is_active = 1"
+        params = []
+        if zone:
+            query += " AND zone = ?"
+            params.append(zone)
+        if category:
+            types = [k for k, v in MachineTypes.CATEGORIES.items() if v == category]
+            placeholders = ','.join(['?' for _ in types])
+            query += f" AND machine_type IN ({placeholders})"
+            params.extend(types)
+        query += " ORDER BY name"
+        return {row['id']: dict(row) for row in self.db.fetchall(query, tuple(params))}
+
+    def _get_cycle_intervals(self, start: datetime, end: datetime,
+                             machine_ids: List[int]) -> Dict[int, dict]:
+        if not machine_ids:
+            return {}
+
+        placeholders = ','.join(['?' for _ in machine_ids])
+        rows = self.db.execute(f"""
+            SELECT mc.machine_id,
+                   (julianday(mc.start_time) - 2440587.5) * 86400.0 AS start_ts,
+                   (julianday(COALESCE(mc.end_time, mc.start_time)) - 2440587.5) * 86400.0 AS end_ts,
+                   mc.status = 'ERROR' AS failed,
+                   (SELECT COUNT(*) FROM cycle_contents cc WHERE cc.cycle_id = mc.id) AS items
+            FROM machine_cycles mc
+            WHERE mc.machine_id IN ({placeholders})
+              AND mc.start_time < ?
+              AND COALESCE(mc.end_time, mc.start_time) >= ?
+            ORDER BY mc.machine_id, mc.start_time
+        """, (*machine_ids, end, start))
+
+        data: Dict[int, dict] = {}
+        for machine_id, start_ts, end_ts, failed, items in rows:
+            entry = data.get(machine_id)
+            if entry is None:
+                entry = data[machine_id] = {
+                    'starts': array('d'), 'ends': array('d'),
+                    'items': array('l'), 'failed': 0
+                }
+            entry['starts'].append(start_ts)
+            entry['ends'].append(end_ts)
+            entry['items'].append(items)
+            entry['failed'] += failed
+        return data
+
+    def _get_queue_waits(self, start: datetime, end: datetime,
+                         machine_ids: List[int]) -> Dict[int, List[float]]:
+        if not machine_ids:
+            return {}
+
+        placeholders = ','.join(['?' for _ in machine_ids])
+        rows = self.db.execute(f"""
+            SELECT mc.machine_id,
+                   (julianday(cc.loaded_at) - julianday(MAX(pr.created_at))) * 86400.0 AS wait
+            FROM cycle_contents cc
+            JOIN machine_cycles mc ON cc.cycle_id = mc.id
+            JOIN process_records pr ON pr.work_order_id = cc.work_order_id
+                 AND pr.created_at < cc.loaded_at
+                 AND (pr.cycle_id IS NULL OR pr.cycle_id <> cc.cycle_id)
+            WHERE mc.machine_id IN ({placeholders})
+              AND mc.start_time >= ? AND mc.start_time < ?
+            GROUP BY cc.id
+        """, (*machine_ids, start, end))
+
+        waits: Dict[int, List[float]] = {}
+        for machine_id, wait in rows:
+            if wait is not None and wait >= 0:
+                waits.setdefault(machine_id, []).append(wait)
+        return waits
+
+    def _fill_cycle_stats(self, stats: MachineUtilization, data: dict,
+                          window_start: float, window_end: float, window: float):
+        starts = data['starts']
+        ends = data['ends']
+        count = len(starts)
+
+        clipped_starts = array('d', map(max, starts, [window_start] * count))
+        clipped_ends = array('d', map(min, ends, [window_end] * count))
+        durations = sorted(map(operator.sub, ends, starts))
+        busy = sum(d for d in map(operator.sub, clipped_ends, clipped_starts) if d > 0)
+
+        gaps = sorted(g for g in map(operator.sub, clipped_starts[1:], clipped_ends[:-1]) if g > 0)
+
+        stats.cycle_count = count
+        stats.failed_cycles = data['failed']
+        stats.busy_hours = round(busy / 3600, 1)
+        stats.utilization = round(min(busy / window, 1.0), 3)
+        stats.cycles_per_day = round(count / (window / 86400), 2)
+        stats.items_processed = sum(data['items'])
+        stats.average_load = round(stats.items_processed / count, 1)
+
+        if gaps:
+            stats.idle_gap_count = len(gaps)
+            stats.idle_gap_mean_minutes = round(sum(gaps) / len(gaps) / 60, 1)
+            stats.idle_gap_max_minutes = round(gaps[-1] / 60, 1)
+            stats.idle_gap_p90_minutes = round(_percentile(gaps, 90) / 60, 1)
+
+        stats.durations = self._distribution(durations)
+
+    def _distribution(self, durations: List[float]) -> DurationDistribution:
+        dist = DurationDistribution(count=len(durations))
+        if not durations:
+            return dist
+
+        minutes = [d / 60 for d in durations]
+        dist.mean_minutes = round(sum(minutes) / len(minutes), 1)
+        dist.min_minutes = round(minutes[0], 1)
+        dist.max_minutes = round(minutes[-1], 1)
+        dist.p50_minutes = round(_percentile(minutes, 50), 1)
+        dist.p90_minutes = round(_percentile(minutes, 90), 1)
+        dist.p99_minutes = round(_percentile(minutes, 99), 1)
+
+        lower = 0
+        for upper in self.DURATION_BUCKETS:
+            dist.buckets[f"{lower}-{upper}"] = sum(1 for m in minutes if lower <= m < upper)
+            lower = upper
+        dist.buckets[f"{lower}+"] = sum(1 for m in minutes if m >= lower)
+        return dist
+
+    def _find_bottlenecks(self, machines: List[MachineUtilization],
+                          window: float) -> List[Bottleneck]:
+        groups: Dict[tuple, List[MachineUtilization]] = {}
+        for stats in machines:
+            groups.setdefault((stats.zone, stats.category), []).append(stats)
+
+        bottlenecks = []
+        for (zone, category), members in groups.items():
+            busy_seconds = sum(m.busy_hours for m in members) * 3600
+            utilization = busy_seconds / (window * len(members))
+            waits = sorted(m.queue_wait_p90_minutes for m in members)
+            queue_p90 = waits[-1] if waits else 0.0
+
+            reasons = []
+            if utilization >= self.BOTTLENECK_UTILIZATION:
+                reasons.append(f"Kullanım oranı yüksek (%{utilization * 100:.0f})")
+            if queue_p90 >= self.BOTTLENECK_QUEUE_MINUTES:
+                reasons.append(f"Bekleme süresi uzun ({queue_p90:.0f} dk)")
+            if not reasons:
+                continue
+
+            bottlenecks.append(Bottleneck(
+                zone=zone,
+                category=category,
+                machine_count=len(members),
+                utilization=round(utilization, 3),
+                queue_wait_p90_minutes=queue_p90,
+                recommended_machines=max(
+                    len(members),
+                    math.ceil(busy_seconds / (window * self.TARGET_UTILIZATION))
+                ),
+                reason=", ".join(reasons)
+            ))
+
+        bottlenecks.sort(key=lambda b: b.utilization, reverse=True)
+        return bottlenecks
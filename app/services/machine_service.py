@@ -4,10 +4,15 @@ import uuid
 
 from app.core.database import get_db
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.models.machine import Machine, MachineProgram, MachineCycle
-from app.config.constants import MachineStatus, MachineTypes, Zones
+from app.config.constants import MachineStatus, MachineEvents, MachineTypes, Zones
+from app.config.settings import settings
+from .machine_state import machine_states
+from .maintenance_scheduler import maintenance_scheduler
 
 
+@traced_service
 class MachineService:
 
     def __init__(self):
@@ -76,8 +81,13 @@ class MachineService:
         return machine
 
     def get_available_machines(self, zone: str, category: str) -> List[Machine]:
-        machines = self.get_all_machines(zone, category)
-        return [m for m in machines if m.is_available]
+        return machine_states.available(zone, category)
+
+    def get_utilization(self, zone: str = None, category: str = None) -> Dict:
+        return machine_states.utilization(zone, category)
+
+    def get_machine_history(self, machine_id: int, limit: int = 50) -> List[Dict]:
+        return machine_states.get_history(machine_id, limit)
 
     def create_machine(self, data: Dict) -> Tuple[bool, str, Optional[int]]:
         try:
@@ -100,6 +110,7 @@ class MachineService:
             ))
             self.db.commit()
             machine_id = self.db.get_last_insert_id()
+            machine_states.reload(machine_id)
             return True, "Makine oluşturuldu", machine_id
         except Exception as e:
             self.db.rollback()
@@ -130,22 +141,60 @@ class MachineService:
                 machine_id
             ))
             self.db.commit()
+            machine_states.reload(machine_id)
             return True, "Makine güncellendi"
         except Exception as e:
             self.db.rollback()
             return False, str(e)
 
-    def set_status(self, machine_id: int, status: str) -> Tuple[bool, str]:
+    def set_status(self, machine_id: int, status: str, notes: str = "") -> Tuple[bool, str]:
+        current = machine_states.get_status(machine_id)
+        if current is None:
+            return False, "Makine bulunamadı"
+
         try:
-            self.db.execute("""
-                UPDATE machines SET status = ?, updated_at = ? WHERE id = ?
-            """, (status, datetime.now(), machine_id))
-            self.db.commit()
-            return True, "Durum güncellendi"
+            return machine_states.transition(
+                machine_id, status, self._status_event(current, status), notes=notes
+            )
+        except Exception as e:
+            self.db.rollback()
+            machine_states.reload(machine_id)
+            return False, str(e)
+
+    def start_loading(self, machine_id: int) -> Tuple[bool, str]:
+        return self._transition(machine_id, MachineStatus.LOADING, MachineEvents.LOAD,
+                                MachineStatus.IDLE)
+
+    def cancel_loading(self, machine_id: int) -> Tuple[bool, str]:
+        return self._transition(machine_id, MachineStatus.IDLE, MachineEvents.CANCEL_LOAD,
+                                MachineStatus.LOADING)
+
+    def finish_unloading(self, machine_id: int) -> Tuple[bool, str]:
+        return self._transition(machine_id, MachineStatus.IDLE, MachineEvents.UNLOAD,
+                                MachineStatus.UNLOADING)
+
+    def _transition(self, machine_id: int, status: str, event: str,
+                    expected: str) -> Tuple[bool, str]:
+        try:
+            return machine_states.transition(machine_id, status, event, expected=expected)
         except Exception as e:
             self.db.rollback()
+            machine_states.reload(machine_id)
             return False, str(e)
 
+    def _status_event(self, current: str, status: str) -> str:
+        if status == MachineStatus.MAINTENANCE:
+            return MachineEvents.MAINTENANCE_START
+        if status == MachineStatus.OFFLINE:
+            return MachineEvents.SET_OFFLINE
+        if status == MachineStatus.FAULT:
+            return MachineEvents.FAULT
+        if status == MachineStatus.IDLE and current == MachineStatus.MAINTENANCE:
+            return MachineEvents.MAINTENANCE_END
+        if status == MachineStatus.IDLE and current == MachineStatus.FAULT:
+            return MachineEvents.RESET
+        return MachineEvents.STATUS_CHANGE
+
     def _generate_cycle_number(self, machine_id: int) -> str:
         date_part = datetime.now().strftime("%Y%m%d")
         count = self.db.fetchone("""
@@ -159,13 +208,18 @@ class MachineService:
         if not current_session.current_user:
             return False, "Oturum açık değil", None
 
-        machine = self.get_machine(machine_id)
-        if not machine:
+        status = machine_states.get_status(machine_id)
+        if status is None:
             return False, "Makine bulunamadı", None
 
-        if not machine.is_available:
+        if status not in (MachineStatus.IDLE, MachineStatus.LOADING):
             return False, "Makine kullanılabilir değil", None
 
+        if settings.maintenance.block_overdue_machines:
+            reason = maintenance_scheduler.get_overdue_reason(machine_id)
+            if reason:
+                return False, f"Bakım gerekli: {reason}", None
+
         cycle_number = self._generate_cycle_number(machine_id)
 
         try:
@@ -186,22 +240,24 @@ class MachineService:
 
             cycle_id = self.db.get_last_insert_id()
 
-            self.db.execute("""
-                UPDATE machines SET
-                    status = ?,
-                    current_cycle_id = ?,
-                    updated_at = ?
-                WHERE id = ?
-            """, (MachineStatus.RUNNING, cycle_id, datetime.now(), machine_id))
+            success, msg = machine_states.transition(
+                machine_id, MachineStatus.RUNNING, MachineEvents.START,
+                expected=status, cycle_id=cycle_id, commit=False
+            )
+            if not success:
+                self.db.rollback()
+                return False, msg, None
 
             self.db.commit()
             return True, "Çevrim başlatıldı", cycle_id
         except Exception as e:
             self.db.rollback()
+            machine_states.reload(machine_id)
             return False, str(e), None
 
     def complete_cycle(self, cycle_id: int, temperature: float = 0,
-                      pressure: float = 0, ci_result: str = "PENDING") -> Tuple[bool, str]:
+                      pressure: float = 0, ci_result: str = "PENDING",
+                      unload: bool = True) -> Tuple[bool, str]:
         cycle = self.get_cycle(cycle_id)
         if not cycle:
             return False, "Çevrim bulunamadı"
@@ -211,8 +267,8 @@ class MachineService:
                 UPDATE machine_cycles SET
                     end_time = ?,
                     status = ?,
-                    temperature_achieved = ?,
-                    pressure_achieved = ?,
+                    temperature_achieved = COALESCE(NULLIF(?, 0), temperature_achieved),
+                    pressure_achieved = COALESCE(NULLIF(?, 0), pressure_achieved),
                     ci_result = ?
                 WHERE id = ?
             """, (
@@ -224,19 +280,37 @@ class MachineService:
                 cycle_id
             ))
 
+            success, msg = machine_states.transition(
+                cycle.machine_id, MachineStatus.UNLOADING, MachineEvents.COMPLETE,
+                expected=MachineStatus.RUNNING, cycle_id=cycle_id, commit=False
+            )
+            if success and unload:
+                success, msg = machine_states.transition(
+                    cycle.machine_id, MachineStatus.IDLE, MachineEvents.UNLOAD,
+                    expected=MachineStatus.UNLOADING, commit=False
+                )
+            if not success:
+                self.db.rollback()
+                machine_states.reload(cycle.machine_id)
+                return False, msg
+
             self.db.execute("""
                 UPDATE machines SET
-                    status = ?,
-                    current_cycle_id = NULL,
                     total_cycles = total_cycles + 1,
                     updated_at = ?
                 WHERE id = ?
-            """, (MachineStatus.IDLE, datetime.now(), cycle.machine_id))
+            """, (datetime.now(), cycle.machine_id))
 
             self.db.commit()
+            machine_states.reload(cycle.machine_id)
+            machine = machine_states.get(cycle.machine_id)
+            maintenance_scheduler.record_cycle(
+                cycle.machine_id, machine.total_cycles if machine else None
+            )
             return True, "Çevrim tamamlandı"
         except Exception as e:
             self.db.rollback()
+            machine_states.reload(cycle.machine_id)
             return False, str(e)
 
     def abort_cycle(self, cycle_id: int, reason: str) -> Tuple[bool, str]:
@@ -253,18 +327,19 @@ class MachineService:
                 WHERE id = ?
             """, (datetime.now(), MachineStatus.ERROR, reason, cycle_id))
 
-            self.db.execute("""
-                UPDATE machines SET
-                    status = ?,
-                    current_cycle_id = NULL,
-                    updated_at = ?
-                WHERE id = ?
-            """, (MachineStatus.ERROR, datetime.now(), cycle.machine_id))
+            success, msg = machine_states.transition(
+                cycle.machine_id, MachineStatus.FAULT, MachineEvents.ABORT,
+                cycle_id=cycle_id, notes=reason, commit=False
+            )
+            if not success:
+                self.db.rollback()
+                return False, msg
 
             self.db.commit()
             return True, "Çevrim iptal edildi"
         except Exception as e:
             self.db.rollback()
+            machine_states.reload(cycle.machine_id)
             return False, str(e)
 
     def get_cycle(self, cycle_id: int) -> Optional[MachineCycle]:
@@ -402,6 +477,7 @@ class MachineService:
             ))
             self.db.commit()
             program_id = self.db.get_last_insert_id()
+            machine_states.reload(machine_id)
             return True, "Program eklendi", program_id
         except Exception as e:
             self.db.rollback()
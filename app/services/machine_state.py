@@ -0,0 +1,271 @@
+import threading
+from dataclasses import replace
+from typing import Optional, List, Dict, Tuple, Set
+from datetime import datetime
+
+from app.core.database import get_db
+from app.core.session import current_session
+from app.models.machine import Machine, MachineProgram
+from app.config.constants import MachineStatus, MachineTypes
+
+
+class MachineStateRegistry:
+    _instance: Optional['MachineStateRegistry'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._listening = False
+        self._machines: Dict[int, Machine] = {}
+        self._available: Dict[Tuple[str, str], Set[int]] = {}
+        self._counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._initialized = True
+
+    @property
+    def db(self):
+        return get_db()
+
+    def load(self):
+        with self._lock:
+            if not self._listening:
+                self.db.add_change_listener(self._on_changes)
+                self._listening = True
+            self._machines = {}
+            self._available = {}
+            self._counts = {}
+
+            programs: Dict[int, List[MachineProgram]] = {}
+            for row in self.db.fetchall("""
+                SELECT * FROM machine_programs WHERE is_active = 1 ORDER BY name
+            """):
+                programs.setdefault(row['machine_id'], []).append(self._row_to_program(row))
+
+            for row in self.db.fetchall("SELECT * FROM machines WHERE is_active = 1"):
+                machine = self._row_to_machine(row)
+                machine.programs = programs.get(machine.id, [])
+                self._add(machine)
+
+            self._loaded = True
+
+    def reload(self, machine_id: int):
+        with self._lock:
+            if not self._loaded:
+                return
+
+            old = self._machines.get(machine_id)
+            if old:
+                self._remove(old)
+
+            row = self.db.fetchone(
+                "SELECT * FROM machines WHERE id = ? AND is_active = 1",
+                (machine_id,)
+            )
+            if not row:
+                return
+
+            machine = self._row_to_machine(row)
+            machine.programs = [self._row_to_program(r) for r in self.db.fetchall("""
+                SELECT * FROM machine_programs
+                WHERE machine_id = ? AND is_active = 1
+                ORDER BY name
+            """, (machine_id,))]
+            self._add(machine)
+
+    def get(self, machine_id: int) -> Optional[Machine]:
+        with self._lock:
+            self._ensure_loaded()
+            machine = self._machines.get(machine_id)
+            return self._copy(machine) if machine else None
+
+    def get_status(self, machine_id: int) -> Optional[str]:
+        machine = self.get(machine_id)
+        return machine.status if machine else None
+
+    def is_available(self, machine_id: int) -> bool:
+        machine = self.get(machine_id)
+        return machine is not None and machine.is_available
+
+    def available(self, zone: str = None, category: str = None) -> List[Machine]:
+        with self._lock:
+            self._ensure_loaded()
+            ids = set()
+            for key, members in self._available.items():
+                if (zone is None or key[0] == zone) and (category is None or key[1] == category):
+                    ids |= members
+            return sorted((self._copy(self._machines[i]) for i in ids), key=lambda m: m.name)
+
+    def utilization(self, zone: str = None, category: str = None) -> Dict[str, int]:
+        with self._lock:
+            self._ensure_loaded()
+            totals: Dict[str, int] = {}
+            for key, counts in self._counts.items():
+                if (zone is None or key[0] == zone) and (category is None or key[1] == category):
+                    for status, count in counts.items():
+                        totals[status] = totals.get(status, 0) + count
+
+            total = sum(totals.values())
+            busy = (totals.get(MachineStatus.LOADING, 0) +
+                    totals.get(MachineStatus.RUNNING, 0) +
+                    totals.get(MachineStatus.UNLOADING, 0))
+            return {
+                'total': total,
+                'busy': busy,
+                'available': totals.get(MachineStatus.IDLE, 0),
+                'by_status': totals,
+                'busy_percent': round(busy * 100 / total) if total else 0,
+            }
+
+    def transition(self, machine_id: int, to_status: str, event: str,
+                   expected: str = None, cycle_id: int = None, notes: str = "",
+                   commit: bool = True) -> Tuple[bool, str]:
+        with self._lock:
+            self._ensure_loaded()
+            machine = self._machines.get(machine_id)
+            if not machine:
+                return False, "Makine bulunamadı"
+
+            from_status = machine.status
+            if from_status == to_status:
+                return False, f"Makine zaten {from_status}"
+            if expected and MachineStatus.normalize(expected) != from_status:
+                return False, f"Geçersiz durum geçişi: makine {from_status}, beklenen {expected}"
+            if not MachineStatus.can_transition(from_status, to_status):
+                return False, f"Geçersiz durum geçişi: {from_status} → {to_status}"
+
+            if to_status in (MachineStatus.RUNNING, MachineStatus.UNLOADING):
+                cycle_id = cycle_id or machine.current_cycle_id
+            else:
+                cycle_id = None
+
+            aliases = MachineStatus.aliases(from_status)
+            placeholders = ','.join(['?' for _ in aliases])
+            cursor = self.db.execute(f"""
+                UPDATE machines SET
+                    status = ?,
+                    current_cycle_id = ?,
+                    updated_at = ?
+                WHERE id = ? AND status IN ({placeholders})
+            """, (to_status, cycle_id, datetime.now(), machine_id, *aliases))
+
+            if cursor.rowcount == 0:
+                self.reload(machine_id)
+                return False, "Makine durumu başka bir istasyonda değişti"
+
+            self.db.execute("""
+                INSERT INTO machine_events (
+                    machine_id, event, from_status, to_status, cycle_id,
+                    operator_id, notes, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                machine_id,
+                event,
+                from_status,
+                to_status,
+                cycle_id or machine.current_cycle_id,
+                current_session.current_user.user_id if current_session.current_user else None,
+                notes,
+                datetime.now()
+            ))
+
+            if commit:
+                self.db.commit()
+
+            self._remove(machine)
+            machine.status = to_status
+            machine.current_cycle_id = cycle_id
+            self._add(machine)
+            return True, "Durum güncellendi"
+
+    def get_history(self, machine_id: int, limit: int = 50) -> List[dict]:
+        rows = self.db.fetchall("""
+            SELECT me.*, o.full_name as operator_name
+            FROM machine_events me
+            LEFT JOIN operators o ON me.operator_id = o.id
+            WHERE me.machine_id = ?
+            ORDER BY me.id DESC
+            LIMIT ?
+        """, (machine_id, limit))
+        return [dict(row) for row in rows]
+
+    def replay(self, machine_id: int) -> str:
+        status = MachineStatus.IDLE
+        for row in self.db.fetchall("""
+            SELECT from_status, to_status FROM machine_events
+            WHERE machine_id = ?
+            ORDER BY id
+        """, (machine_id,)):
+            if MachineStatus.can_transition(status, row['to_status']):
+                status = row['to_status']
+        return status
+
+    def _on_changes(self, tables: List[str]):
+        if any(t in tables for t in ('machines', 'machine_programs')):
+            self._loaded = False
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def _copy(self, machine: Machine) -> Machine:
+        return replace(machine, programs=list(machine.programs))
+
+    def _key(self, machine: Machine) -> Tuple[str, str]:
+        return machine.zone or "", MachineTypes.CATEGORIES.get(machine.machine_type, "UNKNOWN")
+
+    def _add(self, machine: Machine):
+        key = self._key(machine)
+        self._machines[machine.id] = machine
+        counts = self._counts.setdefault(key, {})
+        counts[machine.status] = counts.get(machine.status, 0) + 1
+        if machine.is_available:
+            self._available.setdefault(key, set()).add(machine.id)
+
+    def _remove(self, machine: Machine):
+        key = self._key(machine)
+        self._machines.pop(machine.id, None)
+        counts = self._counts.get(key, {})
+        if counts.get(machine.status):
+            counts[machine.status] -= 1
+        self._available.get(key, set()).discard(machine.id)
+
+    def _row_to_machine(self, row) -> Machine:
+        return Machine(
+            id=row['id'],
+            name=row['name'],
+            machine_type=row['machine_type'],
+            manufacturer=row['manufacturer'],
+            model=row['model'],
+            serial_number=row['serial_number'],
+            zone=row['zone'],
+            status=MachineStatus.normalize(row['status']),
+            current_cycle_id=row['current_cycle_id'],
+            last_maintenance=row['last_maintenance'],
+            next_maintenance=row['next_maintenance'],
+            total_cycles=row['total_cycles'],
+            is_active=bool(row['is_active'])
+        )
+
+    def _row_to_program(self, row) -> MachineProgram:
+        return MachineProgram(
+            id=row['id'],
+            machine_id=row['machine_id'],
+            name=row['name'],
+            code=row['code'] or "",
+            temperature=row['temperature'] or 0,
+            pressure=row['pressure'] or 0,
+            duration_minutes=row['duration_minutes'] or 0,
+            description=row['description'] or "",
+            is_active=bool(row['is_active'])
+        )
+
+
+machine_states = MachineStateRegistry()
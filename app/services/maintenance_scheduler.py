@@ -0,0 +1,193 @@
+import heapq
+import threading
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime
+
+from app.core.database import get_db
+from app.models.maintenance import MaintenancePlan
+from app.config.constants import MaintenanceTypes
+from app.config.settings import settings
+
+
+class MaintenanceScheduler:
+    _instance: Optional['MaintenanceScheduler'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._listening = False
+        self._plans: Dict[int, MaintenancePlan] = {}
+        self._counters: Dict[int, int] = {}
+        self._date_queues: Dict[int, List[Tuple[datetime, int]]] = {}
+        self._cycle_queues: Dict[int, List[Tuple[int, int]]] = {}
+        self._initialized = True
+
+    @property
+    def db(self):
+        return get_db()
+
+    def load(self):
+        with self._lock:
+            if not self._listening:
+                self.db.add_change_listener(self._on_changes)
+                self._listening = True
+            self._plans = {}
+            self._date_queues = {}
+            self._cycle_queues = {}
+            self._counters = {
+                row['id']: row['total_cycles'] or 0
+                for row in self.db.fetchall("SELECT id, total_cycles FROM machines")
+            }
+
+            for row in self.db.fetchall("""
+                SELECT mp.*, m.name as machine_name
+                FROM maintenance_plans mp
+                JOIN machines m ON mp.machine_id = m.id
+                WHERE mp.is_active = 1
+            """):
+                self._schedule(self._row_to_plan(row))
+
+            self._loaded = True
+
+    def reschedule(self, plan_id: int):
+        with self._lock:
+            if not self._loaded:
+                return
+
+            self._plans.pop(plan_id, None)
+            row = self.db.fetchone("""
+                SELECT mp.*, m.name as machine_name
+                FROM maintenance_plans mp
+                JOIN machines m ON mp.machine_id = m.id
+                WHERE mp.id = ? AND mp.is_active = 1
+            """, (plan_id,))
+            if row:
+                self._schedule(self._row_to_plan(row))
+
+    def record_cycle(self, machine_id: int, total_cycles: int = None) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            if total_cycles is None:
+                total_cycles = self._counters.get(machine_id, 0) + 1
+            self._counters[machine_id] = total_cycles
+            return self.is_overdue(machine_id)
+
+    def is_overdue(self, machine_id: int, now: datetime = None) -> bool:
+        return self.get_overdue_reason(machine_id, now) is not None
+
+    def get_overdue_reason(self, machine_id: int, now: datetime = None) -> Optional[str]:
+        with self._lock:
+            self._ensure_loaded()
+            now = now or datetime.now()
+
+            top = self._peek(self._cycle_queues.get(machine_id))
+            if top and self._counters.get(machine_id, 0) >= top[0]:
+                plan = self._plans[top[1]]
+                return f"{MaintenanceTypes.NAMES.get(plan.maintenance_type, plan.maintenance_type)} çevrim sınırı aşıldı"
+
+            top = self._peek(self._date_queues.get(machine_id))
+            if top and now >= top[0]:
+                plan = self._plans[top[1]]
+                return f"{MaintenanceTypes.NAMES.get(plan.maintenance_type, plan.maintenance_type)} tarihi geçti"
+
+            return None
+
+    def next_due_date(self, machine_id: int) -> Optional[datetime]:
+        with self._lock:
+            self._ensure_loaded()
+            top = self._peek(self._date_queues.get(machine_id))
+            return top[0] if top else None
+
+    def get_upcoming(self, days: int = None, cycles: int = None,
+                     now: datetime = None) -> List[dict]:
+        days = settings.maintenance.warning_days if days is None else days
+        cycles = settings.maintenance.warning_cycles if cycles is None else cycles
+        now = now or datetime.now()
+
+        with self._lock:
+            self._ensure_loaded()
+            upcoming = []
+            for plan in self._plans.values():
+                counter = self._counters.get(plan.machine_id, 0)
+                due_date = plan.due_date
+                due_cycles = plan.due_cycles
+                days_remaining = (due_date - now).days if due_date else None
+                cycles_remaining = due_cycles - counter if due_cycles is not None else None
+
+                date_near = days_remaining is not None and days_remaining <= days
+                cycles_near = cycles_remaining is not None and cycles_remaining <= cycles
+                if not (date_near or cycles_near):
+                    continue
+
+                upcoming.append({
+                    'plan_id': plan.id,
+                    'machine_id': plan.machine_id,
+                    'machine_name': plan.machine_name,
+                    'maintenance_type': plan.maintenance_type,
+                    'maintenance_type_name': MaintenanceTypes.NAMES.get(plan.maintenance_type, plan.maintenance_type),
+                    'due_date': due_date,
+                    'days_remaining': days_remaining,
+                    'due_cycles': due_cycles,
+                    'cycles_remaining': cycles_remaining,
+                    'overdue': ((days_remaining is not None and due_date <= now) or
+                                (cycles_remaining is not None and cycles_remaining <= 0)),
+                })
+
+            upcoming.sort(key=lambda u: (
+                not u['overdue'],
+                u['days_remaining'] if u['days_remaining'] is not None else days + 1,
+                u['cycles_remaining'] if u['cycles_remaining'] is not None else cycles + 1
+            ))
+            return upcoming
+
+    def _on_changes(self, tables: List[str]):
+        if any(t in tables for t in ('machines', 'maintenance_plans')):
+            self._loaded = False
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def _schedule(self, plan: MaintenancePlan):
+        self._plans[plan.id] = plan
+        if plan.due_date is not None:
+            heapq.heappush(self._date_queues.setdefault(plan.machine_id, []),
+                           (plan.due_date, plan.id))
+        if plan.due_cycles is not None:
+            heapq.heappush(self._cycle_queues.setdefault(plan.machine_id, []),
+                           (plan.due_cycles, plan.id))
+
+    def _peek(self, queue: Optional[list]):
+        while queue:
+            due, plan_id = queue[0]
+            plan = self._plans.get(plan_id)
+            if plan is not None and due in (plan.due_date, plan.due_cycles):
+                return queue[0]
+            heapq.heappop(queue)
+        return None
+
+    def _row_to_plan(self, row) -> MaintenancePlan:
+        return MaintenancePlan(
+            id=row['id'],
+            machine_id=row['machine_id'],
+            machine_name=row['machine_name'] or "",
+            maintenance_type=row['maintenance_type'],
+            interval_days=row['interval_days'] or 0,
+            interval_cycles=row['interval_cycles'] or 0,
+            last_performed_at=row['last_performed_at'],
+            last_performed_cycles=row['last_performed_cycles'] or 0,
+            is_active=bool(row['is_active']),
+            created_at=row['created_at']
+        )
+
+
+maintenance_scheduler = MaintenanceScheduler()
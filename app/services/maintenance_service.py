@@ -0,0 +1,231 @@
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime
+
+from app.core.database import get_db
+from app.core.session import current_session
+from app.core.tracing import traced_service
+from app.models.maintenance import MaintenancePlan, MaintenanceRecord
+from app.config.constants import MaintenanceTypes
+from .maintenance_scheduler import maintenance_scheduler
+
+
+@traced_service
+class MaintenanceService:
+
+    def __init__(self):
+        self.db = get_db()
+
+    def create_plan(self, machine_id: int, maintenance_type: str,
+                    interval_days: int = 0, interval_cycles: int = 0) -> Tuple[bool, str, Optional[int]]:
+        if maintenance_type not in MaintenanceTypes.NAMES:
+            return False, "Geçersiz bakım tipi", None
+
+        if interval_days <= 0 and interval_cycles <= 0:
+            return False, "Gün veya çevrim aralığı belirtilmeli", None
+
+        machine = self.db.fetchone(
+            "SELECT id, total_cycles FROM machines WHERE id = ?",
+            (machine_id,)
+        )
+        if not machine:
+            return False, "Makine bulunamadı", None
+
+        try:
+            self.db.execute("""
+                INSERT INTO maintenance_plans (
+                    machine_id, maintenance_type, interval_days, interval_cycles,
+                    last_performed_at, last_performed_cycles, is_active, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                machine_id,
+                maintenance_type,
+                interval_days,
+                interval_cycles,
+                datetime.now(),
+                machine['total_cycles'] or 0,
+                True,
+                datetime.now()
+            ))
+            plan_id = self.db.get_last_insert_id()
+            self._sync_next_maintenance(machine_id)
+            self.db.commit()
+            maintenance_scheduler.reschedule(plan_id)
+            return True, "Bakım planı oluşturuldu", plan_id
+        except Exception as e:
+            self.db.rollback()
+            return False, str(e), None
+
+    def deactivate_plan(self, plan_id: int) -> Tuple[bool, str]:
+        plan = self.db.fetchone("SELECT machine_id FROM maintenance_plans WHERE id = ?", (plan_id,))
+        if not plan:
+            return False, "Bakım planı bulunamadı"
+
+        try:
+            self.db.execute(
+                "UPDATE maintenance_plans SET is_active = 0 WHERE id = ?",
+                (plan_id,)
+            )
+            self._sync_next_maintenance(plan['machine_id'])
+            self.db.commit()
+            maintenance_scheduler.reschedule(plan_id)
+            return True, "Bakım planı kapatıldı"
+        except Exception as e:
+            self.db.rollback()
+            return False, str(e)
+
+    def record_maintenance(self, machine_id: int, maintenance_type: str,
+                           description: str = "", result: str = "OK",
+                           plan_id: int = None) -> Tuple[bool, str, Optional[int]]:
+        if not current_session.current_user:
+            return False, "Oturum açık değil", None
+
+        machine = self.db.fetchone(
+            "SELECT id, total_cycles FROM machines WHERE id = ?",
+            (machine_id,)
+        )
+        if not machine:
+            return False, "Makine bulunamadı", None
+
+        now = datetime.now()
+        cycle_count = machine['total_cycles'] or 0
+
+        try:
+            if plan_id:
+                plan_ids = [plan_id]
+            else:
+                plan_ids = [row['id'] for row in self.db.fetchall("""
+                    SELECT id FROM maintenance_plans
+                    WHERE machine_id = ? AND maintenance_type = ? AND is_active = 1
+                """, (machine_id, maintenance_type))]
+
+            for pid in plan_ids:
+                self.db.execute("""
+                    UPDATE maintenance_plans SET
+                        last_performed_at = ?,
+                        last_performed_cycles = ?
+                    WHERE id = ?
+                """, (now, cycle_count, pid))
+
+            next_date = self._sync_next_maintenance(machine_id, now)
+
+            self.db.execute("""
+                INSERT INTO maintenance_records (
+                    machine_id, plan_id, maintenance_type, performed_by,
+                    maintenance_date, cycle_count, next_maintenance_date,
+                    description, result, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                machine_id,
+                plan_ids[0] if len(plan_ids) == 1 else None,
+                maintenance_type,
+                current_session.current_user.user_id,
+                now,
+                cycle_count,
+                next_date,
+                description,
+                result,
+                now
+            ))
+            record_id = self.db.get_last_insert_id()
+            self.db.commit()
+
+            for pid in plan_ids:
+                maintenance_scheduler.reschedule(pid)
+            return True, "Bakım kaydedildi", record_id
+        except Exception as e:
+            self.db.rollback()
+            return False, str(e), None
+
+    def get_plans(self, machine_id: int = None) -> List[MaintenancePlan]:
+        query = """
+            SELECT mp.*, m.name as machine_name
+            FROM maintenance_plans mp
+            JOIN machines m ON mp.machine_id = m.id
+            WHERE mp.is_active = 1
+        """
+        params = []
+        if machine_id:
+            query += " AND mp.machine_id = ?"
+            params.append(machine_id)
+        query += " ORDER BY m.name, mp.maintenance_type"
+
+        return [MaintenancePlan(
+            id=row['id'],
+            machine_id=row['machine_id'],
+            machine_name=row['machine_name'] or "",
+            maintenance_type=row['maintenance_type'],
+            interval_days=row['interval_days'] or 0,
+            interval_cycles=row['interval_cycles'] or 0,
+            last_performed_at=row['last_performed_at'],
+            last_performed_cycles=row['last_performed_cycles'] or 0,
+            is_active=bool(row['is_active']),
+            created_at=row['created_at']
+        ) for row in self.db.fetchall(query, tuple(params))]
+
+    def get_records(self, machine_id: int = None, limit: int = 50) -> List[MaintenanceRecord]:
+        query = """
+            SELECT mr.*, m.name as machine_name, o.full_name as performed_by_name
+            FROM maintenance_records mr
+            JOIN machines m ON mr.machine_id = m.id
+            LEFT JOIN operators o ON mr.performed_by = o.id
+        """
+        params = []
+        if machine_id:
+            query += " WHERE mr.machine_id = ?"
+            params.append(machine_id)
+        query += " ORDER BY mr.maintenance_date DESC LIMIT ?"
+        params.append(limit)
+
+        return [MaintenanceRecord(
+            id=row['id'],
+            machine_id=row['machine_id'],
+            machine_name=row['machine_name'] or "",
+            plan_id=row['plan_id'],
+            maintenance_type=row['maintenance_type'],
+            performed_by=row['performed_by'],
+            performed_by_name=row['performed_by_name'] or "",
+            maintenance_date=row['maintenance_date'],
+            cycle_count=row['cycle_count'] or 0,
+            next_maintenance_date=row['next_maintenance_date'],
+            description=row['description'] or "",
+            result=row['result'] or "",
+            created_at=row['created_at']
+        ) for row in self.db.fetchall(query, tuple(params))]
+
+    def get_upcoming(self, days: int = None, cycles: int = None) -> List[Dict]:
+        return maintenance_scheduler.get_upcoming(days, cycles)
+
+    def check_machine(self, machine_id: int) -> Tuple[bool, str]:
+        reason = maintenance_scheduler.get_overdue_reason(machine_id)
+        if reason:
+            return False, f"Bakım gerekli: {reason}"
+        return True, "Bakım güncel"
+
+    def _sync_next_maintenance(self, machine_id: int, performed_at: datetime = None) -> Optional[datetime]:
+        plans = self.db.fetchall("""
+            SELECT interval_days, last_performed_at, created_at
+            FROM maintenance_plans
+            WHERE machine_id = ? AND is_active = 1 AND interval_days > 0
+        """, (machine_id,))
+
+        next_date = None
+        for row in plans:
+            due = MaintenancePlan(
+                interval_days=row['interval_days'],
+                last_performed_at=row['last_performed_at'],
+                created_at=row['created_at']
+            ).due_date
+            if next_date is None or due < next_date:
+                next_date = due
+
+        if performed_at:
+            self.db.execute("""
+                UPDATE machines SET last_maintenance = ?, next_maintenance = ?, updated_at = ?
+                WHERE id = ?
+            """, (performed_at, next_date, datetime.now(), machine_id))
+        else:
+            self.db.execute("""
+                UPDATE machines SET next_maintenance = ?, updated_at = ?
+                WHERE id = ?
+            """, (next_date, datetime.now(), machine_id))
+        return next_date
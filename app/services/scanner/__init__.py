@@ -0,0 +1,15 @@
+from .keymap import KeyDecoder
+from .burst import BurstDetector, ScanEvent
+from .devices import EvdevScanner, SerialScanner, open_device
+from .simulator import SimulatedScanner
+from .scanner_service import ScannerService
+from .pipeline import ScanPipeline, ScanResult, ScanActions
+
+__all__ = [
+    'KeyDecoder',
+    'BurstDetector', 'ScanEvent',
+    'EvdevScanner', 'SerialScanner', 'open_device',
+    'SimulatedScanner',
+    'ScannerService',
+    'ScanPipeline', 'ScanResult', 'ScanActions'
+]
@@ -0,0 +1,55 @@
+from typing import List, NamedTuple
+
+from app.config.settings import settings
+from .keymap import TERMINATORS
+
+
+class ScanEvent(NamedTuple):
+    code: str
+    timestamp: float
+    source: str
+    duration_ms: float
+    sequence: int = 0
+
+
+class BurstDetector:
+
+    def __init__(self, source: str, max_gap_ms: float = None, min_length: int = None,
+                 idle_flush_ms: float = None, burst: bool = True):
+        self.source = source
+        self.max_gap = (max_gap_ms or settings.scanner.max_gap_ms) / 1000 if burst else None
+        self.min_length = min_length or settings.scanner.min_length
+        self.idle_flush = (idle_flush_ms or settings.scanner.idle_flush_ms) / 1000
+        self.typing = 0
+        self._chars: List[str] = []
+        self._first = 0.0
+        self._last = 0.0
+
+    def feed(self, char: str, timestamp: float) -> List[ScanEvent]:
+        events = []
+        if self._chars and self.max_gap is not None and timestamp - self._last > self.max_gap:
+            events.extend(self._finish())
+
+        if char in TERMINATORS:
+            events.extend(self._finish())
+            return events
+
+        if not self._chars:
+            self._first = timestamp
+        self._chars.append(char)
+        self._last = timestamp
+        return events
+
+    def flush(self, now: float) -> List[ScanEvent]:
+        if self._chars and now - self._last > self.idle_flush:
+            return self._finish()
+        return []
+
+    def _finish(self) -> List[ScanEvent]:
+        chars, self._chars = self._chars, []
+        code = "".join(chars).strip()
+        if len(code) < self.min_length:
+            if chars:
+                self.typing += 1
+            return []
+        return [ScanEvent(code, self._first, self.source, (self._last - self._first) * 1000)]
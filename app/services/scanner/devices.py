@@ -0,0 +1,118 @@
+import os
+import stat
+import time
+import select
+import struct
+from typing import List, Tuple, Optional
+
+from app.config.settings import settings
+from .keymap import EV_KEY, KeyDecoder
+
+Keystroke = Tuple[str, float]
+
+
+class EvdevScanner:
+
+    EVENT = struct.Struct("llHHi")
+    EVIOCGRAB = 0x40044590
+    burst = True
+
+    def __init__(self, path: str, grab: bool = None, fd: int = None):
+        self.path = path
+        self.name = f"evdev:{path}"
+        self.grab = settings.scanner.grab if grab is None else grab
+        self.fd: Optional[int] = fd
+        self._decoder = KeyDecoder()
+        self._pending = b""
+
+    def open(self):
+        if self.fd is not None:
+            return
+        fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        if self.grab and stat.S_ISCHR(os.fstat(fd).st_mode):
+            import fcntl
+            fcntl.ioctl(fd, self.EVIOCGRAB, 1)
+        self.fd = fd
+
+    def read(self, timeout: float) -> List[Keystroke]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        data = os.read(self.fd, self.EVENT.size * 256)
+        if not data:
+            raise EOFError(self.name)
+
+        data = self._pending + data
+        usable = len(data) - len(data) % self.EVENT.size
+        self._pending = data[usable:]
+
+        keys = []
+        for seconds, micros, kind, code, value in self.EVENT.iter_unpack(data[:usable]):
+            if kind != EV_KEY:
+                continue
+            char = self._decoder.feed(code, value)
+            if char is not None:
+                keys.append((char, seconds + micros / 1_000_000))
+        return keys
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class SerialScanner:
+
+    BAUDRATES = {
+        1200: "B1200", 2400: "B2400", 4800: "B4800", 9600: "B9600",
+        19200: "B19200", 38400: "B38400", 57600: "B57600", 115200: "B115200"
+    }
+    burst = False
+
+    def __init__(self, path: str, baudrate: int = 9600, fd: int = None):
+        self.path = path
+        self.name = f"serial:{path}"
+        self.baudrate = baudrate
+        self.fd: Optional[int] = fd
+
+    def open(self):
+        if self.fd is not None:
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        if os.isatty(fd):
+            import tty
+            import termios
+            tty.setraw(fd)
+            attributes = termios.tcgetattr(fd)
+            speed = getattr(termios, self.BAUDRATES.get(self.baudrate, "B9600"))
+            attributes[4] = attributes[5] = speed
+            termios.tcsetattr(fd, termios.TCSANOW, attributes)
+        self.fd = fd
+
+    def read(self, timeout: float) -> List[Keystroke]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        data = os.read(self.fd, 4096)
+        if not data:
+            raise EOFError(self.name)
+
+        now = time.time()
+        return [(char, now) for char in data.decode("latin-1")]
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def open_device(spec: str):
+    kind, _, target = spec.partition(":")
+    if kind == "evdev":
+        return EvdevScanner(target)
+    if kind == "serial":
+        path, _, baudrate = target.partition("@")
+        return SerialScanner(path, int(baudrate or 9600))
+    raise ValueError(f"Bilinmeyen tarayıcı tanımı: {spec}")
@@ -0,0 +1,69 @@
+from typing import Optional, Dict, Tuple
+
+EV_KEY = 1
+
+KEY_TAB = 15
+KEY_ENTER = 28
+KEY_LEFTSHIFT = 42
+KEY_RIGHTSHIFT = 54
+KEY_KPENTER = 96
+
+KEYS: Dict[int, str] = {
+    2: '1', 3: '2', 4: '3', 5: '4', 6: '5', 7: '6', 8: '7', 9: '8', 10: '9', 11: '0',
+    12: '-', 13: '=',
+    16: 'q', 17: 'w', 18: 'e', 19: 'r', 20: 't', 21: 'y', 22: 'u', 23: 'i', 24: 'o', 25: 'p',
+    26: '[', 27: ']',
+    30: 'a', 31: 's', 32: 'd', 33: 'f', 34: 'g', 35: 'h', 36: 'j', 37: 'k', 38: 'l',
+    39: ';', 40: "'", 41: '`', 43: '\\',
+    44: 'z', 45: 'x', 46: 'c', 47: 'v', 48: 'b', 49: 'n', 50: 'm',
+    51: ',', 52: '.', 53: '/', 57: ' ',
+    71: '7', 72: '8', 73: '9', 74: '-', 75: '4', 76: '5', 77: '6', 78: '+',
+    79: '1', 80: '2', 81: '3', 82: '0', 83: '.', 98: '/', 55: '*'
+}
+
+SHIFTED: Dict[str, str] = {
+    '1': '!', '2': '@', '3': '#', '4': '$', '5': '%', '6': '^', '7': '&', '8': '*',
+    '9': '(', '0': ')', '-': '_', '=': '+', '[': '{', ']': '}', ';': ':', "'": '"',
+    '`': '~', '\\': '|', ',': '<', '.': '>', '/': '?'
+}
+
+TERMINATORS = "\r\n\t"
+
+
+def key_for(char: str) -> Tuple[int, bool]:
+    if char == "\n":
+        return KEY_ENTER, False
+    if char == "\t":
+        return KEY_TAB, False
+    for code, plain in KEYS.items():
+        if code >= 71 and code != 57:
+            continue
+        if plain == char:
+            return code, False
+        if SHIFTED.get(plain, plain.upper()) == char and plain != char:
+            return code, True
+    raise ValueError(f"Klavye karşılığı yok: {char!r}")
+
+
+class KeyDecoder:
+
+    def __init__(self):
+        self.shift = False
+
+    def feed(self, code: int, value: int) -> Optional[str]:
+        if code in (KEY_LEFTSHIFT, KEY_RIGHTSHIFT):
+            self.shift = value != 0
+            return None
+        if value != 1:
+            return None
+        if code in (KEY_ENTER, KEY_KPENTER):
+            return "\n"
+        if code == KEY_TAB:
+            return "\t"
+
+        char = KEYS.get(code)
+        if char is None:
+            return None
+        if self.shift:
+            return SHIFTED.get(char, char.upper())
+        return char
@@ -0,0 +1,405 @@
+import re
+import time
+import queue
+import threading
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, Callable, NamedTuple
+
+from app.config.settings import settings
+from app.config.constants import WorkOrderStatus, Zones
+from app.core.database import get_db, open_connection
+from app.core.metrics import LatencyHistogram
+from app.core.session import current_session
+from app.core.writer import background_writer
+from app.utils.barcode import BarcodeGenerator, BarcodeValidator
+
+
+class ScanActions:
+    RECEIVE = "RECEIVE"
+    TRANSFER_CLEAN = "TRANSFER_CLEAN"
+    TRANSFER_STERILE = "TRANSFER_STERILE"
+    INFO = "INFO"
+    DUPLICATE = "DUPLICATE"
+    REJECTED = "REJECTED"
+
+
+class ScanResult(NamedTuple):
+    code: str
+    zone: Optional[str]
+    action: str
+    ok: bool
+    message: str
+    order_id: Optional[int] = None
+    latency_ms: float = 0.0
+
+
+STAGES = ('queue', 'normalize', 'dedupe', 'resolve', 'dispatch', 'persist', 'total')
+
+CLOSED_STATUSES = (WorkOrderStatus.DISTRIBUTED, WorkOrderStatus.COMPLETED, WorkOrderStatus.RECALLED)
+
+TRANSFERS = {
+    Zones.CLEAN: (WorkOrderStatus.WASHED, WorkOrderStatus.INSPECTING,
+                  ScanActions.TRANSFER_CLEAN, "Temiz alana transfer edildi"),
+    Zones.STERILE: (WorkOrderStatus.PACKAGED, WorkOrderStatus.STERILIZING,
+                    ScanActions.TRANSFER_STERILE, "Steril alana transfer edildi"),
+}
+
+NOT_APPLIED = {
+    ScanActions.RECEIVE: "Ürün için açık iş emri zaten var",
+    ScanActions.TRANSFER_CLEAN: "İş emri durumu başka bir istasyonda değişti",
+    ScanActions.TRANSFER_STERILE: "İş emri durumu başka bir istasyonda değişti",
+}
+
+AIM_PREFIX = re.compile(r'^\][A-Za-z][0-9A-Za-z]')
+
+Item = Tuple[str, int, str, str]
+
+
+class ScanPipeline:
+
+    CATALOG_TABLES = {'instruments', 'instrument_sets'}
+
+    def __init__(self):
+        self.metrics: Dict[str, LatencyHistogram] = {stage: LatencyHistogram(stage) for stage in STAGES}
+        self.stats: Dict[str, int] = {'scans': 0, 'duplicates': 0, 'rejected': 0, 'persisted': 0, 'errors': 0}
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._handler: Optional[Callable[[ScanResult], None]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._connection = None
+        self._recent: Dict[Tuple[str, Optional[str]], float] = {}
+        self._items: Dict[str, Item] = {}
+        self._orders: Dict[str, int] = {}
+        self._active: Dict[Tuple[str, int], int] = {}
+        self._last_order_id = 0
+        self._catalog_loaded = False
+        self._inflight: Dict[int, Tuple[str, str]] = {}
+        self._receiving: set = set()
+        get_db().add_change_listener(self._on_tables_changed)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def set_handler(self, handler: Optional[Callable[[ScanResult], None]]):
+        self._handler = handler
+
+    def submit(self, code: str, zone: str = None, captured_at: float = None):
+        user = current_session.current_user
+        allowed = user is not None and (zone is None or user.can_access_zone(zone))
+        scan = (code, zone, user.user_id if user else None, allowed,
+                captured_at if captured_at is not None else time.perf_counter())
+        self._ensure_thread()
+        self._queue.put(scan)
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.join()
+        background_writer.flush()
+
+    def stop(self, timeout: float = 5.0):
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def over_budget(self) -> bool:
+        return self.metrics['total'].percentile(99) > settings.scanner.latency_budget_ms
+
+    def report(self) -> str:
+        return "\n".join(str(self.metrics[stage]) for stage in STAGES)
+
+    @staticmethod
+    def normalize(raw: str) -> Tuple[str, Optional[str]]:
+        code = AIM_PREFIX.sub('', ''.join(ch for ch in raw if ch.isprintable()).strip())
+        code = code.upper()
+        valid, message = BarcodeValidator.validate(code)
+        return code, None if valid else message
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="scan-pipeline", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        self._connection = open_connection()
+        try:
+            while True:
+                scan = self._queue.get()
+                try:
+                    if scan is None:
+                        return
+                    self._process(scan)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self._complete(ScanResult(scan[0], scan[1], ScanActions.REJECTED, False, str(e)), scan[4])
+                finally:
+                    self._queue.task_done()
+        finally:
+            self._connection.close()
+            self._connection = None
+            self._catalog_loaded = False
+
+    def _process(self, scan: tuple):
+        raw, zone, operator_id, allowed, captured_at = scan
+        started = time.perf_counter()
+        self.metrics['queue'].record((started - captured_at) * 1000)
+        self.stats['scans'] += 1
+
+        code, error = self.normalize(raw)
+        mark = self._mark('normalize', started)
+        if error is None and operator_id is None:
+            error = "Oturum açık değil"
+        elif error is None and not allowed:
+            error = f"{Zones.NAMES.get(zone, zone)} alanına erişim yetkiniz yok"
+        if error:
+            self.stats['rejected'] += 1
+            self._complete(ScanResult(code, zone, ScanActions.REJECTED, False, error), captured_at)
+            return
+
+        duplicate = self._is_duplicate(code, zone, captured_at)
+        mark = self._mark('dedupe', mark)
+        if duplicate:
+            self.stats['duplicates'] += 1
+            self._complete(ScanResult(code, zone, ScanActions.DUPLICATE, True,
+                                      "Tekrar okuma yok sayıldı"), captured_at)
+            return
+
+        item, order = self._resolve(code)
+        mark = self._mark('resolve', mark)
+
+        result, statements, release = self._dispatch(code, zone, operator_id, item, order)
+        self._mark('dispatch', mark)
+        if not result.ok:
+            self.stats['rejected'] += 1
+        self._complete(result, captured_at, statements, release)
+
+    def _mark(self, stage: str, since: float) -> float:
+        now = time.perf_counter()
+        self.metrics[stage].record((now - since) * 1000)
+        return now
+
+    def _is_duplicate(self, code: str, zone: Optional[str], captured_at: float) -> bool:
+        window = settings.scanner.dedupe_window_ms / 1000
+        key = (code, zone)
+        last = self._recent.get(key)
+        self._recent[key] = captured_at
+        if len(self._recent) > 512:
+            self._recent = {k: at for k, at in self._recent.items() if captured_at - at < window}
+        return last is not None and captured_at - last < window
+
+    def _on_tables_changed(self, tables: List[str]):
+        if self.CATALOG_TABLES.intersection(tables):
+            self._catalog_loaded = False
+
+    def _resolve(self, code: str) -> Tuple[Optional[Item], Optional[dict]]:
+        if not self._catalog_loaded:
+            self._load_index()
+        self._refresh_orders()
+
+        order_id = self._orders.get(code)
+        item = self._items.get(code)
+        if order_id is None and item is None:
+            item, order_id = self._lookup(code)
+        if order_id is None and item is not None:
+            order_id = self._active.get(item[:2])
+
+        order = self._order_state(order_id) if order_id else None
+        if order is not None and item is not None and order['status'] in CLOSED_STATUSES:
+            self._active.pop(item[:2], None)
+            order = None
+        return item, order
+
+    def _load_index(self):
+        self._items = {}
+        for item_type, table in (("SET", "instrument_sets"), ("INSTRUMENT", "instruments")):
+            for row in self._connection.execute(f"SELECT id, name, barcode FROM {table}").fetchall():
+                self._items[row['barcode'].upper()] = (item_type, row['id'], row['name'], row['barcode'])
+
+        self._orders = {}
+        self._active = {}
+        row = self._connection.execute("SELECT MAX(id) as last_id FROM work_orders").fetchone()
+        rows = self._connection.execute(f"""
+            SELECT id, order_number, barcode, item_type, item_id, status FROM work_orders
+            WHERE status NOT IN ({', '.join('?' * len(CLOSED_STATUSES))})
+        """, CLOSED_STATUSES).fetchall()
+        self._index_orders(rows)
+        self._last_order_id = row['last_id'] or 0
+        self._catalog_loaded = True
+
+    def _refresh_orders(self):
+        rows = self._connection.execute("""
+            SELECT id, order_number, barcode, item_type, item_id, status FROM work_orders
+            WHERE id > ? ORDER BY id
+        """, (self._last_order_id,)).fetchall()
+        if rows:
+            self._index_orders(rows)
+            self._last_order_id = rows[-1]['id']
+
+    def _index_orders(self, rows):
+        for row in rows:
+            self._orders[row['order_number'].upper()] = row['id']
+            if row['barcode']:
+                self._orders[row['barcode'].upper()] = row['id']
+            if row['status'] not in CLOSED_STATUSES:
+                self._active[(row['item_type'], row['item_id'])] = row['id']
+
+    def _lookup(self, code: str) -> Tuple[Optional[Item], Optional[int]]:
+        for item_type, table in (("SET", "instrument_sets"), ("INSTRUMENT", "instruments")):
+            row = self._connection.execute(
+                f"SELECT id, name, barcode FROM {table} WHERE barcode = ?", (code,)
+            ).fetchone()
+            if row:
+                self._items[code] = (item_type, row['id'], row['name'], row['barcode'])
+                return self._items[code], None
+
+        row = self._connection.execute(
+            "SELECT id FROM work_orders WHERE barcode = ? OR order_number = ?", (code, code)
+        ).fetchone()
+        if row:
+            self._orders[code] = row['id']
+            return None, row['id']
+        return None, None
+
+    def _order_state(self, order_id: int) -> Optional[dict]:
+        row = self._connection.execute("""
+            SELECT id, order_number, item_name, status, current_zone FROM work_orders WHERE id = ?
+        """, (order_id,)).fetchone()
+        if not row:
+            return None
+
+        order = dict(row)
+        with self._lock:
+            inflight = self._inflight.get(order_id)
+        if inflight:
+            order['status'], order['current_zone'] = inflight
+        return order
+
+    def _dispatch(self, code: str, zone: Optional[str], operator_id: int,
+                  item: Optional[Item], order: Optional[dict]):
+        if item is None and order is None:
+            return ScanResult(code, zone, ScanActions.REJECTED, False, "Barkod tanımsız"), [], None
+
+        active = order is not None and order['status'] not in CLOSED_STATUSES
+        if zone == Zones.DIRTY and not active:
+            if item is None:
+                return ScanResult(code, zone, ScanActions.REJECTED, False,
+                                  "İş emri kapalı", order['id']), [], None
+            return self._receive(code, operator_id, item)
+
+        if not active:
+            message = "Aktif iş emri yok" if zone is None else "Aktif iş emri bulunamadı"
+            return ScanResult(code, zone, ScanActions.INFO, zone is None, message), [], None
+
+        transfer = TRANSFERS.get(zone)
+        if transfer and order['status'] == transfer[0]:
+            return self._transfer(code, zone, operator_id, order, *transfer)
+
+        message = f"{order['order_number']}: {order['item_name']} ({order['status']})"
+        if zone is None or order['current_zone'] == zone:
+            return ScanResult(code, zone, ScanActions.INFO, True, message, order['id']), [], None
+        return ScanResult(code, zone, ScanActions.REJECTED, False,
+                          f"İş emri başka aşamada - {message}", order['id']), [], None
+
+    def _receive(self, code: str, operator_id: int, item: Item):
+        key = item[:2]
+        with self._lock:
+            if key in self._receiving:
+                return ScanResult(code, Zones.DIRTY, ScanActions.DUPLICATE, True,
+                                  "Kabul işlemi sürüyor"), [], None
+            self._receiving.add(key)
+
+        item_type, item_id, name, item_barcode = item
+        now = datetime.now()
+        prefix = BarcodeGenerator.work_order_prefix(now)
+        statements = [
+            (f"""
+                INSERT INTO work_orders (
+                    order_number, barcode, item_type, item_id, item_name, item_barcode,
+                    status, current_zone, received_by, received_at, created_at, updated_at
+                )
+                SELECT ? || printf('%04d', (SELECT COUNT(*) + 1 FROM work_orders WHERE order_number LIKE ?)),
+                       ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM work_orders WHERE item_type = ? AND item_id = ?
+                    AND status NOT IN ({', '.join('?' * len(CLOSED_STATUSES))})
+                )
+            """, (prefix, f"{prefix}%", BarcodeGenerator.generate("WO"), item_type, item_id, name,
+                  item_barcode, WorkOrderStatus.RECEIVED, Zones.DIRTY, operator_id, now, now, now,
+                  item_type, item_id, *CLOSED_STATUSES)),
+            ("""
+                INSERT INTO process_records (
+                    work_order_id, process_type, zone, operator_id, start_time, created_at
+                )
+                SELECT last_insert_rowid(), 'RECEIVE', ?, ?, ?, ? WHERE changes() > 0
+            """, (Zones.DIRTY, operator_id, now, now)),
+        ]
+
+        def release():
+            with self._lock:
+                self._receiving.discard(key)
+
+        result = ScanResult(code, Zones.DIRTY, ScanActions.RECEIVE, True, f"{name} kabul edildi")
+        return result, statements, release
+
+    def _transfer(self, code: str, zone: str, operator_id: int, order: dict,
+                  expected: str, status: str, action: str, message: str):
+        order_id = order['id']
+        with self._lock:
+            self._inflight[order_id] = (status, zone)
+
+        now = datetime.now()
+        statements = [
+            ("""
+                UPDATE work_orders SET current_zone = ?, status = ?, updated_at = ?
+                WHERE id = ? AND status = ?
+            """, (zone, status, now, order_id, expected)),
+            ("""
+                INSERT INTO process_records (
+                    work_order_id, process_type, zone, operator_id, start_time, notes, created_at
+                )
+                SELECT ?, ?, ?, ?, ?, '', ? WHERE changes() > 0
+            """, (order_id, action, zone, operator_id, now, now)),
+        ]
+
+        def release():
+            with self._lock:
+                self._inflight.pop(order_id, None)
+
+        result = ScanResult(code, zone, action, True, f"{order['order_number']}: {message}", order_id)
+        return result, statements, release
+
+    def _complete(self, result: ScanResult, captured_at: float,
+                  statements: list = None, release: Callable[[], None] = None):
+        submitted = time.perf_counter()
+
+        def done(ok: bool, error: Optional[str], changed: int):
+            now = time.perf_counter()
+            applied = True
+            if statements:
+                self.metrics['persist'].record((now - submitted) * 1000)
+                applied = changed > 0
+                if not ok:
+                    self.stats['errors'] += 1
+                elif applied:
+                    self.stats['persisted'] += 1
+                else:
+                    self.stats['rejected'] += 1
+            if release is not None:
+                release()
+
+            latency = (now - captured_at) * 1000
+            self.metrics['total'].record(latency)
+            final = result._replace(latency_ms=latency)
+            if not ok:
+                final = final._replace(ok=False, message=error or "Kayıt başarısız")
+            elif not applied:
+                final = final._replace(action=ScanActions.REJECTED, ok=False,
+                                       message=NOT_APPLIED.get(result.action, "Kayıt uygulanmadı"))
+            if self._handler is not None:
+                self._handler(final)
+
+        background_writer.submit_many(statements or [], done)
@@ -0,0 +1,105 @@
+import time
+import queue
+import threading
+import itertools
+from typing import Optional, List, Dict, Callable
+
+from app.config.settings import settings
+from app.core.tracing import traced_service
+from .burst import BurstDetector, ScanEvent
+from .devices import open_device
+
+
+@traced_service
+class ScannerService:
+
+    def __init__(self, devices: list = None):
+        if devices is None:
+            devices = [open_device(spec) for spec in settings.scanner.devices]
+        self.devices = devices
+        self.stats: Dict[str, int] = {'scans': 0, 'typing': 0, 'dropped': 0, 'errors': 0}
+        self._queue: "queue.Queue[ScanEvent]" = queue.Queue(maxsize=settings.scanner.queue_size)
+        self._handler: Optional[Callable[[ScanEvent], None]] = None
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def set_handler(self, handler: Optional[Callable[[ScanEvent], None]]):
+        self._handler = handler
+
+    def start(self):
+        if self.is_running or not self.devices:
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._read_loop, args=(device,), name=f"scanner-{n}", daemon=True)
+            for n, device in enumerate(self.devices)
+        ]
+        self._threads.append(threading.Thread(target=self._dispatch_loop, name="scanner-dispatch", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        for device in self.devices:
+            device.close()
+
+    def get(self, timeout: float = None) -> Optional[ScanEvent]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _read_loop(self, device):
+        detector = BurstDetector(device.name, burst=device.burst)
+        while not self._stop.is_set():
+            try:
+                device.open()
+                while not self._stop.is_set():
+                    for char, timestamp in device.read(0.05):
+                        for event in detector.feed(char, timestamp):
+                            self._put(event)
+                    for event in detector.flush(time.time()):
+                        self._put(event)
+                    if detector.typing:
+                        self.stats['typing'] += detector.typing
+                        detector.typing = 0
+            except (OSError, EOFError):
+                self.stats['errors'] += 1
+                device.close()
+                self._stop.wait(settings.scanner.reconnect_seconds)
+
+    def _put(self, event: ScanEvent):
+        with self._lock:
+            event = event._replace(sequence=next(self._sequence))
+            try:
+                self._queue.put_nowait(event)
+                self.stats['scans'] += 1
+            except queue.Full:
+                self.stats['dropped'] += 1
+
+    def _dispatch_loop(self):
+        while not self._stop.is_set():
+            if self._handler is None:
+                self._stop.wait(0.05)
+                continue
+            try:
+                event = self._queue.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            try:
+                self._handler(event)
+            except Exception:
+                self.stats['errors'] += 1
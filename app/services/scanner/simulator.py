@@ -0,0 +1,50 @@
+import os
+import time
+import random
+from typing import List
+
+from .keymap import EV_KEY, KEY_LEFTSHIFT, key_for
+from .devices import EvdevScanner
+
+
+class SimulatedScanner:
+
+    def __init__(self, key_ms: float = 1.5, gap_ms: float = 20.0, seed: int = None):
+        self.key_ms = key_ms
+        self.gap_ms = gap_ms
+        self._random = random.Random(seed)
+        self._read_fd, self._write_fd = os.pipe()
+        self._clock = time.time()
+        self.sent: List[str] = []
+
+    def device(self) -> EvdevScanner:
+        return EvdevScanner("simulated", grab=False, fd=self._read_fd)
+
+    def scan(self, code: str, terminator: str = "\n"):
+        self._emit(code + terminator, self.key_ms, jitter=0.3)
+        self._clock += self.gap_ms / 1000
+        self.sent.append(code)
+
+    def type_text(self, text: str, key_ms: float = 150.0):
+        self._emit(text, key_ms, jitter=0.4)
+
+    def close(self):
+        os.close(self._write_fd)
+
+    def _emit(self, text: str, key_ms: float, jitter: float):
+        events = []
+        for char in text:
+            code, shifted = key_for(char)
+            self._clock += key_ms * (1 + self._random.uniform(-jitter, jitter)) / 1000
+            if shifted:
+                events.append(self._event(KEY_LEFTSHIFT, 1))
+            events.append(self._event(code, 1))
+            events.append(self._event(code, 0))
+            if shifted:
+                events.append(self._event(KEY_LEFTSHIFT, 0))
+        os.write(self._write_fd, b"".join(events))
+
+    def _event(self, code: int, value: int) -> bytes:
+        seconds = int(self._clock)
+        micros = int((self._clock - seconds) * 1_000_000)
+        return EvdevScanner.EVENT.pack(seconds, micros, EV_KEY, code, value)
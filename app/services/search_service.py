@@ -0,0 +1,288 @@
+import re
+import time
+import sqlite3
+import threading
+import unicodedata
+from typing import Optional, List, Dict, Tuple, Callable, Iterable, NamedTuple, Any
+
+from app.config.settings import settings
+from app.config.constants import SearchKinds
+from app.core.database import get_db, open_connection
+from app.core.tracing import traced_service
+
+TOKEN = re.compile(r"[^\W_]+")
+TURKISH_FOLD = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+MASK = (1 << SearchKinds.SHIFT) - 1
+
+ROW_QUERIES = {
+    SearchKinds.INSTRUMENT: ("SELECT i.* FROM instruments i", "i"),
+    SearchKinds.SET: ("""
+        SELECT s.*, d.name as department_name
+        FROM instrument_sets s
+        LEFT JOIN departments d ON s.department_id = d.id
+    """, "s"),
+    SearchKinds.WORK_ORDER: ("""
+        SELECT wo.*, d.name as department_name
+        FROM work_orders wo
+        LEFT JOIN departments d ON wo.department_id = d.id
+    """, "wo"),
+}
+
+SOURCES = {kind: (table, title[0], code[0], (*title, *code, *body))
+           for table, (kind, title, code, body) in SearchKinds.TABLES.items()}
+
+
+class SearchHit(NamedTuple):
+    kind: int
+    id: int
+    title: str
+    code: str
+    status: str
+
+
+class SearchResult(NamedTuple):
+    generation: int
+    query: str
+    hits: List[SearchHit]
+    elapsed_ms: float
+
+
+def fold(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text.translate(TURKISH_FOLD).lower())
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+def split_query(query: str) -> Tuple[List[str], List[str]]:
+    words, codes = [], []
+    for token in TOKEN.findall(fold(query)):
+        is_code = len(token) >= 4 and any(c.isdigit() for c in token) and any(c.isalpha() for c in token)
+        (codes if is_code else words).append(token)
+    return words, codes
+
+
+def match_expression(words: Iterable[str]) -> str:
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _rowid_range(kind: Optional[int]) -> str:
+    if kind is None:
+        return ""
+    return f" AND rowid BETWEEN {kind << SearchKinds.SHIFT} AND {(kind << SearchKinds.SHIFT) | MASK}"
+
+
+@traced_service
+class SearchService:
+
+    def __init__(self, db=None):
+        self.db = db or get_db()
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        if self._available is None:
+            self._available = self.db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+            ).fetchone() is not None
+        return self._available
+
+    def matches(self, query: str, kind: int = None, limit: int = None) -> List[Tuple[int, int]]:
+        limit = limit or settings.search.limit
+        if len(query.strip()) < settings.search.min_length:
+            return []
+
+        words, codes = split_query(query)
+        kinds = (kind,) if kind is not None else tuple(SOURCES)
+        if not self.available:
+            return self._like(query.strip(), kinds, limit)
+        if codes:
+            code = max(codes, key=len)
+            terms = words + [token for token in codes if token is not code]
+            found = self._codes(code.upper(), terms, kinds, limit)
+            if found:
+                return found
+
+        expression = match_expression(words + codes)
+        bounds = _rowid_range(kind)
+        probe = [row[0] for row in self.db.execute(
+            f"SELECT rowid FROM search_index WHERE search_index MATCH ?{bounds} ORDER BY rowid DESC LIMIT ?",
+            (expression, settings.search.rank_limit + 1)
+        ).fetchall()]
+
+        if len(probe) <= settings.search.rank_limit:
+            rowids = [row[0] for row in self.db.execute(
+                f"SELECT rowid FROM search_index WHERE search_index MATCH ?{bounds} ORDER BY rank LIMIT ?",
+                (expression, limit)
+            ).fetchall()]
+        else:
+            rowids = [row[0] for row in self.db.execute(
+                f"SELECT rowid FROM search_index WHERE search_index MATCH ?{bounds} ORDER BY rowid DESC LIMIT ?",
+                (f"title : ({expression})", limit)
+            ).fetchall()]
+            seen = set(rowids)
+            rowids.extend(rowid for rowid in probe if rowid not in seen)
+        return [(rowid >> SearchKinds.SHIFT, rowid & MASK) for rowid in rowids[:limit]]
+
+    def rows(self, kind: int, query: str, limit: int = 50) -> List[Any]:
+        ids = [ref for _, ref in self.matches(query, kind, limit)]
+        if not ids:
+            return []
+        select, alias = ROW_QUERIES[kind]
+        rows = {row['id']: row for row in self.db.execute(
+            f"{select} WHERE {alias}.id IN ({', '.join('?' * len(ids))})", tuple(ids)
+        ).fetchall()}
+        return [rows[ref] for ref in ids if ref in rows]
+
+    def search(self, query: str, kinds: Iterable[int] = None, limit: int = None) -> List[SearchHit]:
+        limit = limit or settings.search.limit
+        kinds = tuple(kinds) if kinds is not None else None
+        if kinds is not None and len(kinds) == 1:
+            found = self.matches(query, kinds[0], limit)
+        else:
+            found = [(kind, ref) for kind, ref in self.matches(query, None, limit * 2 if kinds else limit)
+                     if kinds is None or kind in kinds][:limit]
+
+        grouped: Dict[int, List[int]] = {}
+        for kind, ref in found:
+            grouped.setdefault(kind, []).append(ref)
+
+        details = {}
+        for kind, refs in grouped.items():
+            table, title, code, _ = SOURCES[kind]
+            for row in self.db.execute(
+                f"SELECT id, {title}, {code}, status FROM {table} WHERE id IN ({', '.join('?' * len(refs))})",
+                tuple(refs)
+            ).fetchall():
+                details[kind, row[0]] = SearchHit(kind, row[0], row[1] or "", row[2] or "", row[3] or "")
+        return [details[key] for key in found if key in details]
+
+    def _codes(self, code: str, words: List[str], kinds: Tuple[int, ...], limit: int) -> List[Tuple[int, int]]:
+        upper = code[:-1] + chr(ord(code[-1]) + 1)
+        found: List[Tuple[int, int]] = []
+        for kind in kinds:
+            table = SOURCES[kind][0]
+            for column in SearchKinds.CODES[kind]:
+                found.extend((kind, row[0]) for row in self.db.execute(
+                    f"SELECT id FROM {table} WHERE {column} >= ? AND {column} < ? ORDER BY {column} LIMIT ?",
+                    (code, upper, limit)
+                ).fetchall() if (kind, row[0]) not in found)
+
+        if words and found:
+            rowids = [(kind << SearchKinds.SHIFT) | ref for kind, ref in found]
+            keep = {row[0] for row in self.db.execute(
+                f"SELECT rowid FROM search_index WHERE search_index MATCH ? "
+                f"AND rowid IN ({', '.join('?' * len(rowids))})", (match_expression(words), *rowids)
+            ).fetchall()}
+            found = [key for key, rowid in zip(found, rowids) if rowid in keep]
+        return found[:limit]
+
+    def _like(self, query: str, kinds: Tuple[int, ...], limit: int) -> List[Tuple[int, int]]:
+        search = f"%{query}%"
+        found = []
+        for kind in kinds:
+            table, title, _, columns = SOURCES[kind]
+            condition = " OR ".join(f"{column} LIKE ?" for column in columns)
+            found.extend((kind, row[0]) for row in self.db.execute(
+                f"SELECT id FROM {table} WHERE {condition} ORDER BY {title} LIMIT ?",
+                (*[search] * len(columns), limit)
+            ).fetchall())
+        return found[:limit]
+
+
+class LiveSearch:
+
+    def __init__(self, callback: Callable[[SearchResult], None], kinds: Iterable[int] = None,
+                 limit: int = None):
+        self._callback = callback
+        self._kinds = tuple(kinds) if kinds is not None else None
+        self._limit = limit
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[int, str, float]] = None
+        self._generation = 0
+        self._running = 0
+        self._connection = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.completed = 0
+        self.cancelled = 0
+
+    def submit(self, query: str) -> int:
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, query, time.perf_counter())
+            self._interrupt()
+            self._ensure_thread()
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self):
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._interrupt()
+
+    def stop(self, timeout: float = 2.0):
+        with self._condition:
+            self._stopping = True
+            self._pending = None
+            self._interrupt()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _interrupt(self):
+        if self._running and self._connection is not None and hasattr(self._connection, "interrupt"):
+            self._connection.interrupt()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="live-search", daemon=True)
+            self._thread.start()
+
+    def _next(self) -> Optional[Tuple[int, str, float]]:
+        debounce = settings.search.debounce_ms / 1000
+        with self._condition:
+            while True:
+                if self._stopping:
+                    return None
+                if self._pending is None:
+                    self._condition.wait()
+                    continue
+                generation, query, submitted = self._pending
+                remaining = submitted + debounce - time.perf_counter()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._pending = None
+                self._running = generation
+                return generation, query, submitted
+
+    def _run(self):
+        self._connection = open_connection()
+        service = SearchService(self._connection)
+        try:
+            while True:
+                request = self._next()
+                if request is None:
+                    return
+                generation, query, submitted = request
+                try:
+                    hits = service.search(query, self._kinds, self._limit)
+                except sqlite3.OperationalError as e:
+                    if "interrupt" not in str(e):
+                        raise
+                    hits = None
+                finally:
+                    with self._condition:
+                        self._running = 0
+                        current = generation == self._generation
+
+                if hits is None or not current:
+                    self.cancelled += 1
+                    continue
+                self.completed += 1
+                self._callback(SearchResult(generation, query, hits, (time.perf_counter() - submitted) * 1000))
+        finally:
+            self._connection.close()
+            self._connection = None
@@ -3,9 +3,11 @@ from datetime import datetime
 
 from app.core.database import get_db
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import SterilizationStatus, IndicatorResults
 
 
+@traced_service
 class IndicatorService:
 
     def __init__(self):
@@ -3,10 +3,12 @@ from datetime import datetime, timedelta
 
 from app.core.database import get_db
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import SterilizationStatus, IndicatorResults
 from app.config.settings import settings
 
 
+@traced_service
 class SterilizationRecordService:
 
     def __init__(self):
@@ -2,14 +2,19 @@ from typing import Optional, List, Tuple
 from datetime import datetime
 
 from app.core.database import get_db
+from app.core.rows import RowView
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import SterilizationStatus, WorkOrderStatus, IndicatorResults
+from app.services.telemetry import CycleAnalysisService
 
 
+@traced_service
 class ReleaseService:
 
     def __init__(self):
         self.db = get_db()
+        self.analysis_service = CycleAnalysisService()
 
     def can_release(self, record_id: int) -> Tuple[bool, str]:
         record = self.db.fetchone(
@@ -28,17 +33,17 @@ class ReleaseService:
         if record['bi_result'] != IndicatorResults.PASS:
             return False, "BI sonucu başarısız"
 
+        passed, msg = self.analysis_service.check_release(record['cycle_id'])
+        if not passed:
+            return False, msg
+
         return True, "Onaylanabilir"
 
     def release(self, record_id: int, notes: str = "") -> Tuple[bool, str]:
         if not current_session.current_user:
             return False, "Oturum açık değil"
 
-        user = self.db.fetchone(
-            "SELECT can_release_load FROM operators WHERE id = ?",
-            (current_session.current_user.user_id,)
-        )
-        if not user or not user['can_release_load']:
+        if not current_session.current_user.can_release_load:
             return False, "Onay yetkiniz yok"
 
         can_release, msg = self.can_release(record_id)
@@ -168,8 +173,8 @@ class ReleaseService:
             self.db.rollback()
             return False, str(e)
 
-    def get_pending_release(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_pending_release(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT sr.id, sr.record_number, sr.item_name, sr.item_barcode,
                    sr.ci_result, sr.bi_result, sr.load_time, sr.unload_time,
                    m.name as machine_name, o.full_name as operator_name
@@ -179,10 +184,9 @@ class ReleaseService:
             WHERE sr.status = ?
             ORDER BY sr.unload_time
         """, (SterilizationStatus.PENDING_RELEASE,))
-        return [dict(row) for row in rows]
 
-    def get_released(self, limit: int = 50) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_released(self, limit: int = 50) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT sr.id, sr.record_number, sr.item_name, sr.item_barcode,
                    sr.released_at, sr.expiry_date, sr.storage_location,
                    rel.full_name as released_by_name
@@ -192,10 +196,9 @@ class ReleaseService:
             ORDER BY sr.released_at DESC
             LIMIT ?
         """, (SterilizationStatus.RELEASED, limit))
-        return [dict(row) for row in rows]
 
-    def get_rejected(self, limit: int = 50) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_rejected(self, limit: int = 50) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT sr.id, sr.record_number, sr.item_name, sr.item_barcode,
                    sr.rejected_at, sr.rejection_reason,
                    rej.full_name as rejected_by_name
@@ -205,17 +208,15 @@ class ReleaseService:
             ORDER BY sr.rejected_at DESC
             LIMIT ?
         """, (SterilizationStatus.REJECTED, limit))
-        return [dict(row) for row in rows]
 
-    def get_history(self, record_id: int) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_history(self, record_id: int) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT srl.*, o.full_name as performed_by_name
             FROM sterilization_release_log srl
             LEFT JOIN operators o ON srl.performed_by = o.id
             WHERE srl.sterilization_id = ?
             ORDER BY srl.created_at
         """, (record_id,))
-        return [dict(row) for row in rows]
 
     def _log_action(self, record_id: int, action: str, notes: str):
         self.db.execute("""
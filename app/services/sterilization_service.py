@@ -4,6 +4,7 @@ import uuid
 
 from app.core.database import get_db
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.models.sterilization import SterilizationRecord, SterilizationRelease
 from app.config.constants import (
     SterilizationStatus, WorkOrderStatus, IndicatorResults, AuditActions
@@ -11,6 +12,7 @@ from app.config.constants import (
 from app.config.settings import settings
 
 
+@traced_service
 class SterilizationService:
 
     def __init__(self):
@@ -245,13 +247,8 @@ class SterilizationService:
         if not current_session.current_user:
             return False, "Oturum açık değil"
 
-        if not current_session.current_user.has_permission('sterilization.release'):
-            user = self.db.fetchone(
-                "SELECT can_release_load FROM operators WHERE id = ?",
-                (current_session.current_user.user_id,)
-            )
-            if not user or not user['can_release_load']:
-                return False, "Onay yetkiniz yok"
+        if not current_session.current_user.can_release:
+            return False, "Onay yetkiniz yok"
 
         record = self.get_record(record_id)
         if not record:
@@ -0,0 +1,18 @@
+from app.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'encode_batch': '.protocol',
+    'decode_batch': '.protocol',
+    'MergePolicy': '.merge',
+    'SyncEngine': '.engine',
+    'SyncResult': '.engine',
+    'SyncServer': '.server',
+    'serve_http': '.server',
+    'LocalTransport': '.transport',
+    'HttpTransport': '.transport',
+    'SyncService': '.sync_service'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,346 @@
+import json
+import uuid
+import sqlite3
+from typing import Optional, List, Dict, Tuple, Any
+from datetime import datetime
+from dataclasses import dataclass
+
+from app.config.constants import SyncTables
+from app.config.settings import settings
+from app.core.clock import hlc
+from .merge import MergePolicy
+from .protocol import encode_batch, decode_batch, make_key, split_key
+
+
+@dataclass
+class SyncResult:
+    pushed: int = 0
+    pulled: int = 0
+    batches_sent: int = 0
+    batches_received: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: str = ""
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def success(self) -> bool:
+        return not self.error
+
+
+class SyncEngine:
+
+    MAX_ROUNDS = 100
+
+    def __init__(self, db, transport, device_id: str = None, batch_size: int = None,
+                 clock=None, policy: MergePolicy = None):
+        self.db = db
+        self.transport = transport
+        self.clock = clock or hlc
+        self.policy = policy or MergePolicy()
+        self.batch_size = batch_size or settings.sync.batch_size
+        self._device_id = device_id
+        self._columns: Dict[str, set] = {}
+
+    @property
+    def device_id(self) -> str:
+        if not self._device_id:
+            stored = self._get_state("device_id")
+            if not stored:
+                stored = self.clock.device_id or uuid.uuid4().hex
+                self._set_state("device_id", stored)
+                self.db.commit()
+            self._device_id = stored
+        return self._device_id
+
+    def sync(self) -> SyncResult:
+        result = SyncResult(started_at=datetime.now())
+        try:
+            self.push(result)
+            self.pull(result)
+        except Exception as e:
+            self.db.rollback()
+            result.error = str(e)
+        result.finished_at = datetime.now()
+        return result
+
+    def push(self, result: SyncResult = None) -> SyncResult:
+        result = result or SyncResult(started_at=datetime.now())
+        for _ in range(self.MAX_ROUNDS):
+            changes, upper = self.collect(self.batch_size)
+            if not changes:
+                break
+
+            blob = encode_batch({
+                "device_id": self.device_id,
+                "upper": upper,
+                "changes": changes
+            })
+            response = self.transport.push(self.device_id, blob)
+            ack = int(response.get("ack", 0))
+            if ack < upper:
+                raise RuntimeError("Sunucu gönderimi onaylamadı")
+
+            self.db.execute("DELETE FROM sync_outbox WHERE id <= ?", (ack,))
+            self._set_state("push_watermark", ack)
+            self.db.commit()
+
+            result.pushed += len(changes)
+            result.batches_sent += 1
+            result.bytes_sent += len(blob)
+        return result
+
+    def pull(self, result: SyncResult = None) -> SyncResult:
+        result = result or SyncResult(started_at=datetime.now())
+        for _ in range(self.MAX_ROUNDS):
+            since = int(self._get_state("pull_watermark") or 0)
+            blob = self.transport.pull(self.device_id, since, self.batch_size)
+            payload = decode_batch(blob)
+            result.bytes_received += len(blob)
+
+            changes = payload.get("changes", [])
+            watermark = int(payload.get("watermark", since))
+            if watermark <= since and not changes:
+                break
+
+            try:
+                self.apply(changes)
+                self._set_state("pull_watermark", watermark)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+
+            result.pulled += len(changes)
+            result.batches_received += 1
+            if not changes:
+                break
+        return result
+
+    def pending_count(self) -> int:
+        row = self.db.execute("SELECT COUNT(*) FROM sync_outbox").fetchone()
+        return row[0] if row else 0
+
+    def collect(self, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        bound = self.db.execute("""
+            SELECT MAX(id) FROM (SELECT id FROM sync_outbox ORDER BY id LIMIT ?)
+        """, (limit,)).fetchone()
+        upper = bound[0] if bound and bound[0] is not None else 0
+        if not upper:
+            return [], 0
+
+        groups = self.db.execute("""
+            SELECT g.table_name, g.row_id, g.first_id, g.last_id, o.operation, o.hlc
+            FROM (
+                SELECT table_name, row_id, MIN(id) AS first_id, MAX(id) AS last_id
+                FROM sync_outbox
+                WHERE id <= ?
+                GROUP BY table_name, row_id
+            ) g
+            JOIN sync_outbox o ON o.id = g.last_id
+            ORDER BY g.first_id
+        """, (upper,)).fetchall()
+
+        changes = []
+        for table, row_id, _, last_id, operation, stamp in groups:
+            refs = SyncTables.TABLES.get(table)
+            if refs is None:
+                continue
+
+            change = {
+                "seq": last_id,
+                "table": table,
+                "key": self._global_key(table, row_id),
+                "hlc": stamp or "",
+                "op": "DELETE",
+                "data": None
+            }
+            if operation != "DELETE":
+                row = self.db.execute(f"SELECT * FROM {table} WHERE id = ?", (row_id,)).fetchone()
+                if row is not None:
+                    data = dict(zip(row.keys(), row))
+                    data.pop("id", None)
+                    for column, ref_table in refs.items():
+                        if data.get(column) is not None:
+                            data[column] = self._global_key(ref_table, data[column])
+                    change["op"] = "UPSERT"
+                    change["data"] = data
+            changes.append(change)
+        return changes, upper
+
+    def apply(self, changes: List[Dict[str, Any]]):
+        self.db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('applying', '1')")
+        try:
+            for change in changes:
+                self._apply_change(change)
+        finally:
+            self.db.execute("DELETE FROM sync_state WHERE key = 'applying'")
+
+    def _apply_change(self, change: Dict[str, Any]):
+        table = change["table"]
+        refs = SyncTables.TABLES.get(table)
+        if refs is None:
+            return
+
+        remote_stamp = change.get("hlc") or ""
+        if remote_stamp:
+            self.clock.update(remote_stamp)
+
+        origin, origin_id = split_key(change["key"])
+        local_id = self._local_id(table, origin, origin_id)
+        local_stamp = self._row_stamp(table, local_id) if local_id is not None else None
+
+        if local_stamp and local_stamp == remote_stamp:
+            return
+
+        if change["op"] == "DELETE":
+            if local_id is None:
+                return
+            if local_stamp and local_stamp > remote_stamp:
+                self._record_conflict(change, "LOCAL", local_stamp,
+                                      "Silme, yerel değişiklikten daha eski")
+                return
+            self.db.execute(f"DELETE FROM {table} WHERE id = ?", (local_id,))
+            self.db.execute(
+                "DELETE FROM sync_row_map WHERE table_name = ? AND local_id = ?",
+                (table, local_id)
+            )
+            self.db.execute(
+                "DELETE FROM sync_row_clock WHERE table_name = ? AND row_id = ?",
+                (table, local_id)
+            )
+            return
+
+        data = dict(change["data"] or {})
+        if local_id is not None and local_stamp:
+            row = self.db.execute(f"SELECT * FROM {table} WHERE id = ?", (local_id,)).fetchone()
+            local = dict(zip(row.keys(), row))
+            reason = self.policy.reason(table, local, local_stamp, data, remote_stamp)
+
+            if not self.policy.remote_wins(table, local, local_stamp, data, remote_stamp):
+                self._record_conflict(change, "LOCAL", local_stamp, reason)
+                self._requeue(table, local_id, local_stamp)
+                return
+
+            if self._has_pending(table, local_id):
+                self._record_conflict(change, "REMOTE", local_stamp, reason)
+                self.db.execute(
+                    "DELETE FROM sync_outbox WHERE table_name = ? AND row_id = ?",
+                    (table, local_id)
+                )
+            elif self.policy.overrides(table, local, data):
+                self._record_conflict(change, "REMOTE", local_stamp, reason)
+
+        for column, ref_table in refs.items():
+            if data.get(column) is not None:
+                ref_origin, ref_id = split_key(data[column])
+                data[column] = self._local_id(ref_table, ref_origin, ref_id)
+
+        columns = self._table_columns(table)
+        names = [c for c in data if c in columns and c != "id"]
+        values = [data[c] for c in names]
+
+        try:
+            if local_id is not None:
+                assignments = ", ".join(f"{c} = ?" for c in names)
+                self.db.execute(
+                    f"UPDATE {table} SET {assignments} WHERE id = ?",
+                    (*values, local_id)
+                )
+            else:
+                placeholders = ", ".join("?" for _ in names)
+                cursor = self.db.execute(
+                    f"INSERT INTO {table} ({', '.join(names)}) VALUES ({placeholders})",
+                    tuple(values)
+                )
+                local_id = cursor.lastrowid
+        except sqlite3.IntegrityError as e:
+            self._record_conflict(change, "REJECTED", local_stamp, f"Kayıt uygulanamadı: {e}")
+            return
+
+        if origin != self.device_id:
+            self.db.execute("""
+                INSERT OR REPLACE INTO sync_row_map (table_name, origin_device, origin_id, local_id)
+                VALUES (?, ?, ?, ?)
+            """, (table, origin, origin_id, local_id))
+
+        if remote_stamp:
+            self.db.execute("""
+                INSERT OR REPLACE INTO sync_row_clock (table_name, row_id, hlc)
+                VALUES (?, ?, ?)
+            """, (table, local_id, remote_stamp))
+
+    def _row_stamp(self, table: str, local_id: int) -> Optional[str]:
+        row = self.db.execute("""
+            SELECT hlc FROM sync_row_clock WHERE table_name = ? AND row_id = ?
+        """, (table, local_id)).fetchone()
+        return row[0] if row else None
+
+    def _has_pending(self, table: str, local_id: int) -> bool:
+        return self.db.execute("""
+            SELECT 1 FROM sync_outbox WHERE table_name = ? AND row_id = ? LIMIT 1
+        """, (table, local_id)).fetchone() is not None
+
+    def _requeue(self, table: str, local_id: int, stamp: str):
+        if self._has_pending(table, local_id):
+            return
+        self.db.execute("""
+            INSERT INTO sync_outbox (table_name, row_id, operation, hlc, created_at)
+            VALUES (?, ?, 'UPDATE', ?, ?)
+        """, (table, local_id, stamp, datetime.now()))
+
+    def _record_conflict(self, change: Dict[str, Any], resolution: str,
+                         local_stamp: Optional[str], reason: str):
+        self.db.execute("""
+            INSERT INTO sync_conflicts (
+                table_name, row_key, local_hlc, remote_hlc, resolution,
+                reason, payload, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            change["table"],
+            json.dumps(change["key"]),
+            local_stamp,
+            change.get("hlc"),
+            resolution,
+            reason,
+            json.dumps(change, default=str),
+            datetime.now()
+        ))
+
+    def _global_key(self, table: str, local_id: int) -> List:
+        row = self.db.execute("""
+            SELECT origin_device, origin_id FROM sync_row_map
+            WHERE table_name = ? AND local_id = ?
+        """, (table, local_id)).fetchone()
+        if row:
+            return make_key(row[0], row[1])
+        return make_key(self.device_id, local_id)
+
+    def _local_id(self, table: str, origin: str, origin_id: int) -> Optional[int]:
+        if origin == self.device_id:
+            row = self.db.execute(f"SELECT id FROM {table} WHERE id = ?", (origin_id,)).fetchone()
+            return row[0] if row else None
+
+        row = self.db.execute("""
+            SELECT local_id FROM sync_row_map
+            WHERE table_name = ? AND origin_device = ? AND origin_id = ?
+        """, (table, origin, origin_id)).fetchone()
+        return row[0] if row else None
+
+    def _table_columns(self, table: str) -> set:
+        if table not in self._columns:
+            self._columns[table] = {
+                row[1] for row in self.db.execute(f"PRAGMA table_info({table})").fetchall()
+            }
+        return self._columns[table]
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self.db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value):
+        self.db.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            (key, str(value))
+        )
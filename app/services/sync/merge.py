@@ -0,0 +1,47 @@
+from typing import Dict, Any, Optional
+
+from app.config.constants import WorkOrderStatus, SterilizationStatus
+
+
+class MergePolicy:
+
+    LIFECYCLES = {
+        "work_orders": WorkOrderStatus,
+        "sterilization_records": SterilizationStatus,
+    }
+
+    def order_key(self, table: str, row: Dict[str, Any], stamp: Optional[str]) -> tuple:
+        lifecycle = self.LIFECYCLES.get(table)
+        if lifecycle is None:
+            return (stamp or "",)
+
+        status = row.get("status")
+        sticky = lifecycle.sticky_rank(status)
+        return (
+            (row.get("status_epoch") or 0) + (sticky > 0),
+            sticky,
+            lifecycle.rank(status),
+            stamp or ""
+        )
+
+    def remote_wins(self, table: str, local: Dict[str, Any], local_stamp: Optional[str],
+                    remote: Dict[str, Any], remote_stamp: Optional[str]) -> bool:
+        return self.order_key(table, remote, remote_stamp) > self.order_key(table, local, local_stamp)
+
+    def overrides(self, table: str, local: Dict[str, Any], remote: Dict[str, Any]) -> bool:
+        lifecycle = self.LIFECYCLES.get(table)
+        if lifecycle is None:
+            return False
+
+        local_status, remote_status = local.get("status"), remote.get("status")
+        return ((lifecycle.sticky_rank(local_status), lifecycle.rank(local_status)) >
+                (lifecycle.sticky_rank(remote_status), lifecycle.rank(remote_status)))
+
+    def reason(self, table: str, local: Dict[str, Any], local_stamp: Optional[str],
+               remote: Dict[str, Any], remote_stamp: Optional[str]) -> str:
+        local_key = self.order_key(table, local, local_stamp)
+        remote_key = self.order_key(table, remote, remote_stamp)
+        if local_key[:-1] != remote_key[:-1]:
+            return (f"Durum yaşam döngüsü: {local.get('status')} / "
+                    f"{remote.get('status')}")
+        return "Son yazma kazanır"
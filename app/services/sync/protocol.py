@@ -0,0 +1,39 @@
+import json
+import zlib
+from typing import List, Dict, Any, Tuple
+from datetime import datetime, date
+
+from app.config.settings import settings
+
+PROTOCOL_VERSION = 1
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def encode_batch(payload: Dict[str, Any]) -> bytes:
+    payload = dict(payload, version=PROTOCOL_VERSION)
+    raw = json.dumps(payload, default=_default, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, settings.sync.compression_level)
+
+
+def decode_batch(blob: bytes) -> Dict[str, Any]:
+    payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+    if payload.get("version") != PROTOCOL_VERSION:
+        raise ValueError(f"Desteklenmeyen senkronizasyon sürümü: {payload.get('version')}")
+    return payload
+
+
+def make_key(device_id: str, row_id: int) -> List:
+    return [device_id, row_id]
+
+
+def split_key(key) -> Tuple[str, int]:
+    return key[0], int(key[1])
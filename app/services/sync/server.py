@@ -0,0 +1,183 @@
+import json
+import sqlite3
+import threading
+import argparse
+from typing import Optional
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .protocol import encode_batch, decode_batch
+
+
+class SyncServer:
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin_device TEXT NOT NULL,
+                origin_seq INTEGER NOT NULL,
+                table_name TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                received_at TIMESTAMP,
+                UNIQUE(origin_device, origin_seq)
+            )
+        """)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS devices (
+                device_id TEXT PRIMARY KEY,
+                push_ack INTEGER DEFAULT 0,
+                pull_watermark INTEGER DEFAULT 0,
+                last_seen TIMESTAMP
+            )
+        """)
+        self._connection.commit()
+
+    def push(self, device_id: str, blob: bytes) -> bytes:
+        payload = decode_batch(blob)
+        changes = payload.get("changes", [])
+        upper = int(payload.get("upper", 0))
+        now = datetime.now().isoformat(" ")
+
+        with self._lock:
+            accepted = 0
+            for change in changes:
+                cursor = self._connection.execute("""
+                    INSERT OR IGNORE INTO changes (
+                        origin_device, origin_seq, table_name, payload, received_at
+                    ) VALUES (?, ?, ?, ?, ?)
+                """, (
+                    device_id,
+                    change["seq"],
+                    change["table"],
+                    json.dumps(change, separators=(",", ":")),
+                    now
+                ))
+                accepted += cursor.rowcount
+
+            self._connection.execute("""
+                INSERT INTO devices (device_id, push_ack, last_seen) VALUES (?, ?, ?)
+                ON CONFLICT(device_id) DO UPDATE SET
+                    push_ack = MAX(push_ack, excluded.push_ack),
+                    last_seen = excluded.last_seen
+            """, (device_id, upper, now))
+            self._connection.commit()
+
+        return encode_batch({"ack": upper, "accepted": accepted})
+
+    def pull(self, device_id: str, since: int, limit: int = 500) -> bytes:
+        with self._lock:
+            rows = self._connection.execute("""
+                SELECT seq, payload FROM changes
+                WHERE seq > ? AND origin_device <> ?
+                ORDER BY seq
+                LIMIT ?
+            """, (since, device_id, limit)).fetchall()
+
+            if rows:
+                watermark = rows[-1][0]
+            else:
+                top = self._connection.execute("SELECT MAX(seq) FROM changes").fetchone()
+                watermark = max(since, top[0] or 0)
+
+            self._connection.execute("""
+                INSERT INTO devices (device_id, pull_watermark, last_seen) VALUES (?, ?, ?)
+                ON CONFLICT(device_id) DO UPDATE SET
+                    pull_watermark = excluded.pull_watermark,
+                    last_seen = excluded.last_seen
+            """, (device_id, since, datetime.now().isoformat(" ")))
+            self._connection.commit()
+
+        return encode_batch({
+            "watermark": watermark,
+            "changes": [json.loads(payload) for _, payload in rows]
+        })
+
+    def change_count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM changes").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class _SyncRequestHandler(BaseHTTPRequestHandler):
+    sync_server: Optional[SyncServer] = None
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/push":
+            self.send_error(404)
+            return
+        query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = self.sync_server.push(query["device"][0], self.rfile.read(length))
+        except (KeyError, ValueError) as e:
+            self.send_error(400, str(e))
+            return
+        self._reply(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/pull":
+            self.send_error(404)
+            return
+        query = parse_qs(url.query)
+        try:
+            body = self.sync_server.pull(
+                query["device"][0],
+                int(query.get("since", ["0"])[0]),
+                int(query.get("limit", ["500"])[0])
+            )
+        except (KeyError, ValueError) as e:
+            self.send_error(400, str(e))
+            return
+        self._reply(body)
+
+    def _reply(self, body: bytes):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_http(server: SyncServer, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    handler = type("SyncRequestHandler", (_SyncRequestHandler,), {"sync_server": server})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=httpd.serve_forever, name="sync-http", daemon=True)
+    thread.start()
+    return httpd
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merkezi senkronizasyon sunucusu (yerel)")
+    parser.add_argument("--db", default="sync_server.db")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = SyncServer(args.db)
+    handler = type("SyncRequestHandler", (_SyncRequestHandler,), {"sync_server": server})
+    httpd = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Senkronizasyon sunucusu: http://{args.host}:{args.port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
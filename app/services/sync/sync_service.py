@@ -0,0 +1,96 @@
+import sqlite3
+import threading
+from typing import Optional, List, Dict, Any
+
+from app.core.database import get_db
+from app.config.settings import settings
+from app.core.clock import hlc
+from app.core.tracing import traced_service
+from .engine import SyncEngine, SyncResult
+from .transport import HttpTransport
+
+
+@traced_service
+class SyncService:
+
+    def __init__(self, transport=None):
+        self.db = get_db()
+        self.transport = transport or HttpTransport()
+        self.engine = SyncEngine(self.db, self.transport)
+        self.last_result: Optional[SyncResult] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    @property
+    def device_id(self) -> str:
+        return self.engine.device_id
+
+    def sync_now(self) -> SyncResult:
+        self.last_result = self.engine.sync()
+        return self.last_result
+
+    def get_status(self) -> Dict[str, Any]:
+        state = {
+            row['key']: row['value']
+            for row in self.db.fetchall("SELECT key, value FROM sync_state")
+        }
+        return {
+            'device_id': self.device_id,
+            'pending': self.engine.pending_count(),
+            'push_watermark': int(state.get('push_watermark') or 0),
+            'pull_watermark': int(state.get('pull_watermark') or 0),
+            'running': self.is_running,
+            'last_result': self.last_result,
+        }
+
+    def get_conflicts(self, limit: int = 100) -> List[dict]:
+        rows = self.db.fetchall("""
+            SELECT id, table_name, row_key, local_hlc, remote_hlc, resolution, reason, created_at
+            FROM sync_conflicts
+            ORDER BY id DESC
+            LIMIT ?
+        """, (limit,))
+        return [dict(row) for row in rows]
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_seconds: int = None):
+        if self.is_running:
+            return
+        device_id = self.device_id
+        interval = interval_seconds or settings.sync.interval_seconds
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(device_id, interval), name="sync", daemon=True
+        )
+        self._thread.start()
+
+    def trigger(self):
+        self._wake.set()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, device_id: str, interval: int):
+        connection = sqlite3.connect(
+            settings.database.path,
+            timeout=30,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+        )
+        connection.row_factory = sqlite3.Row
+        hlc.install(connection)
+        engine = SyncEngine(connection, self.transport, device_id=device_id)
+        try:
+            while not self._stop.is_set():
+                self.last_result = engine.sync()
+                self._wake.wait(interval)
+                self._wake.clear()
+        finally:
+            connection.close()
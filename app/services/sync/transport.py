@@ -0,0 +1,40 @@
+from typing import Dict, Any
+from urllib.request import Request, urlopen
+from urllib.parse import urlencode
+
+from app.config.settings import settings
+from .protocol import decode_batch
+
+
+class LocalTransport:
+
+    def __init__(self, server):
+        self.server = server
+
+    def push(self, device_id: str, blob: bytes) -> Dict[str, Any]:
+        return decode_batch(self.server.push(device_id, blob))
+
+    def pull(self, device_id: str, since: int, limit: int) -> bytes:
+        return self.server.pull(device_id, since, limit)
+
+
+class HttpTransport:
+
+    def __init__(self, base_url: str = None, timeout: int = None):
+        self.base_url = (base_url or settings.sync.server_url).rstrip("/")
+        self.timeout = timeout or settings.sync.timeout_seconds
+
+    def push(self, device_id: str, blob: bytes) -> Dict[str, Any]:
+        request = Request(
+            f"{self.base_url}/push?{urlencode({'device': device_id})}",
+            data=blob,
+            headers={"Content-Type": "application/octet-stream"},
+            method="POST"
+        )
+        with urlopen(request, timeout=self.timeout) as response:
+            return decode_batch(response.read())
+
+    def pull(self, device_id: str, since: int, limit: int) -> bytes:
+        query = urlencode({"device": device_id, "since": since, "limit": limit})
+        with urlopen(f"{self.base_url}/pull?{query}", timeout=self.timeout) as response:
+            return response.read()
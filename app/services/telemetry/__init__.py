@@ -0,0 +1,14 @@
+from .parser import TelemetryParser, TelemetrySample
+from .series import TelemetrySeries, CycleParameters
+from .simulator import SimulatedSterilizer
+from .telemetry_service import TelemetryService, TelemetryIngest
+from .analysis import CycleAnalyzer, CycleVerdict
+from .analysis_service import CycleAnalysisService
+
+__all__ = [
+    'TelemetryParser', 'TelemetrySample',
+    'TelemetrySeries', 'CycleParameters',
+    'SimulatedSterilizer',
+    'TelemetryService', 'TelemetryIngest',
+    'CycleAnalyzer', 'CycleVerdict', 'CycleAnalysisService'
+]
@@ -0,0 +1,123 @@
+import operator
+from typing import List
+from dataclasses import dataclass, field
+
+from app.config.constants import CyclePhases, IndicatorResults
+from app.config.settings import settings
+from .series import TelemetrySeries
+
+
+@dataclass
+class CycleVerdict:
+    result: str = IndicatorResults.PENDING
+    hold_start: float = 0.0
+    hold_seconds: float = 0.0
+    hold_min_temperature: float = 0.0
+    hold_max_temperature: float = 0.0
+    hold_min_pressure: float = 0.0
+    max_gap_seconds: float = 0.0
+    f0_value: float = 0.0
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return self.result == IndicatorResults.PASS
+
+
+class CycleAnalyzer:
+
+    _STERILIZING_MASK = bytes(
+        1 if code == CyclePhases.code(CyclePhases.STERILIZING) else 0 for code in range(256)
+    )
+    _FAULT_CODE = bytes([CyclePhases.code(CyclePhases.FAULT)])
+
+    def __init__(self, temperature: float = 0.0, pressure: float = 0.0,
+                 duration_minutes: int = 0):
+        self.temperature = temperature
+        self.pressure = pressure
+        self.duration_minutes = duration_minutes
+
+    @classmethod
+    def for_program(cls, program) -> 'CycleAnalyzer':
+        return cls(
+            temperature=program['temperature'] or 0.0,
+            pressure=program['pressure'] or 0.0,
+            duration_minutes=program['duration_minutes'] or 0
+        )
+
+    def analyze(self, series: TelemetrySeries) -> CycleVerdict:
+        verdict = CycleVerdict()
+        if len(series) < 2:
+            verdict.failures.append("Çevrim eğrisi yok")
+            verdict.result = IndicatorResults.FAIL
+            return verdict
+
+        cfg = settings.telemetry
+        elapsed = series.elapsed
+        temperature = series.temperature
+
+        if self.temperature > 0:
+            target = float(self.temperature)
+            mask = bytes(map(target.__le__, temperature))
+        else:
+            mask = series.phase.tobytes().translate(self._STERILIZING_MASK)
+
+        start, end = self._longest_run(mask)
+        verdict.f0_value = series.f0()
+
+        if series.phase.tobytes().find(self._FAULT_CODE) >= 0:
+            verdict.failures.append("Çevrimde alarm fazı var")
+
+        if end <= start:
+            verdict.failures.append("Tutma fazı bulunamadı")
+            verdict.result = IndicatorResults.FAIL
+            return verdict
+
+        hold_temps = temperature[start:end + 1]
+        hold_pressures = series.pressure[start:end + 1]
+        verdict.hold_start = round(elapsed[start], 1)
+        verdict.hold_seconds = round(elapsed[end] - elapsed[start], 1)
+        verdict.hold_min_temperature = round(min(hold_temps), 2)
+        verdict.hold_max_temperature = round(max(hold_temps), 2)
+        verdict.hold_min_pressure = round(min(hold_pressures), 3)
+        verdict.max_gap_seconds = round(max(map(
+            operator.sub, elapsed[start + 1:end + 1], elapsed[start:end]
+        )), 1)
+
+        required = self.duration_minutes * 60
+        if required and verdict.hold_seconds < required:
+            verdict.failures.append(
+                f"Tutma süresi yetersiz ({verdict.hold_seconds / 60:.1f}/{self.duration_minutes} dk)"
+            )
+
+        if self.temperature > 0 and verdict.hold_max_temperature > self.temperature + cfg.hold_temperature_band:
+            verdict.failures.append(
+                f"Sıcaklık bandı aşıldı ({verdict.hold_max_temperature:.1f} °C)"
+            )
+
+        if self.pressure > 0 and verdict.hold_min_pressure < self.pressure - cfg.hold_pressure_tolerance:
+            verdict.failures.append(
+                f"Basınç hedefin altında ({verdict.hold_min_pressure:.2f}/{self.pressure:.2f} bar)"
+            )
+
+        if verdict.max_gap_seconds > cfg.max_sample_gap_seconds:
+            verdict.failures.append(f"Ölçüm boşluğu ({verdict.max_gap_seconds:.0f} sn)")
+
+        if cfg.min_f0_value and verdict.f0_value < cfg.min_f0_value:
+            verdict.failures.append(f"F0 değeri yetersiz ({verdict.f0_value:.1f})")
+
+        verdict.result = IndicatorResults.FAIL if verdict.failures else IndicatorResults.PASS
+        return verdict
+
+    @staticmethod
+    def _longest_run(mask: bytes):
+        best_start, best_end = 0, -1
+        pos = mask.find(1)
+        while pos >= 0:
+            stop = mask.find(0, pos)
+            if stop < 0:
+                stop = len(mask)
+            if stop - 1 - pos > best_end - best_start:
+                best_start, best_end = pos, stop - 1
+            pos = mask.find(1, stop)
+        return best_start, best_end
@@ -0,0 +1,79 @@
+import json
+from typing import Optional, Tuple
+
+from app.core.database import get_db
+from app.core.tracing import traced_service
+from app.config.constants import IndicatorResults
+from app.config.settings import settings
+from .analysis import CycleAnalyzer, CycleVerdict
+from .telemetry_service import TelemetryService
+
+
+@traced_service
+class CycleAnalysisService:
+
+    def __init__(self):
+        self.db = get_db()
+        self.telemetry_service = TelemetryService()
+
+    def evaluate(self, cycle_id: int) -> Tuple[bool, str, Optional[CycleVerdict]]:
+        program = self.telemetry_service.get_program(cycle_id)
+        if not program:
+            return False, "Çevrim bulunamadı", None
+
+        series = self.telemetry_service.get_series(cycle_id)
+        if series is None:
+            return False, "Çevrim eğrisi kaydı yok", None
+
+        verdict = CycleAnalyzer.for_program(program).analyze(series)
+        if verdict.passed:
+            return True, "Çevrim parametreleri uygun", verdict
+        return True, verdict.failures[0], verdict
+
+    def analyze(self, cycle_id: int) -> Tuple[bool, str, Optional[CycleVerdict]]:
+        success, msg, verdict = self.evaluate(cycle_id)
+        if not success:
+            return success, msg, verdict
+
+        try:
+            self.telemetry_service.save_analysis(cycle_id, verdict)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            return False, str(e), verdict
+        return success, msg, verdict
+
+    def get_verdict(self, cycle_id: int) -> Optional[CycleVerdict]:
+        row = self.db.fetchone(
+            "SELECT * FROM cycle_analysis WHERE cycle_id = ?",
+            (cycle_id,)
+        )
+        if row:
+            return CycleVerdict(
+                result=row['result'],
+                hold_start=row['hold_start'] or 0,
+                hold_seconds=row['hold_seconds'] or 0,
+                hold_min_temperature=row['hold_min_temperature'] or 0,
+                hold_max_temperature=row['hold_max_temperature'] or 0,
+                hold_min_pressure=row['hold_min_pressure'] or 0,
+                max_gap_seconds=row['max_gap_seconds'] or 0,
+                f0_value=row['f0_value'] or 0,
+                failures=json.loads(row['failures'] or "[]")
+            )
+
+        success, _, verdict = self.evaluate(cycle_id)
+        return verdict if success else None
+
+    def check_release(self, cycle_id: Optional[int]) -> Tuple[bool, str]:
+        verdict = self.get_verdict(cycle_id) if cycle_id else None
+
+        if verdict is None:
+            if settings.sterilization.parametric_release_required:
+                return False, "Çevrim eğrisi kaydı yok"
+            return True, "Parametrik kontrol yok"
+
+        if verdict.result != IndicatorResults.PASS:
+            reason = verdict.failures[0] if verdict.failures else "Çevrim parametreleri uygun değil"
+            return False, f"Parametrik kontrol başarısız: {reason}"
+
+        return True, "Parametrik kontrol başarılı"
@@ -0,0 +1,182 @@
+import re
+from typing import Optional, List, NamedTuple
+from datetime import datetime
+
+from app.config.constants import CyclePhases
+
+
+class TelemetrySample(NamedTuple):
+    elapsed: float
+    temperature: float
+    pressure: float
+    phase: str
+
+
+class TelemetryParser:
+
+    TIME_COLUMNS = ('time', 'zaman', 'elapsed', 'saniye', 'second', 'seconds', 'timestamp', 't')
+    TEMPERATURE_COLUMNS = ('temperature', 'temp', 'sicaklik', 'sıcaklık', 't_c', 'degc')
+    PRESSURE_COLUMNS = ('pressure', 'basinc', 'basınç', 'bar', 'kpa', 'p')
+    PHASE_COLUMNS = ('phase', 'faz', 'step', 'asama', 'aşama', 'state')
+
+    PRESSURE_UNITS = {'bar': 1.0, 'mbar': 0.001, 'kpa': 0.01}
+
+    PRINTER_LINE = re.compile(
+        r'^\s*(?P<time>\d{1,2}:\d{2}:\d{2})\s+'
+        r'(?P<temp>-?\d+(?:[.,]\d+)?)\s*(?:°\s*)?C?\s+'
+        r'(?P<pressure>-?\d+(?:[.,]\d+)?)\s*(?P<unit>mbar|bar|kpa)?\s*'
+        r'(?P<phase>[A-Za-zÇĞİÖŞÜçğıöşü_\-]+)?\s*$',
+        re.IGNORECASE
+    )
+    NUMBER = re.compile(r'-?\d+(?:[.,]\d+)?')
+
+    def __init__(self):
+        self._buffer = ""
+        self._columns: Optional[dict] = None
+        self._delimiter: Optional[str] = None
+        self._pressure_scale = 1.0
+        self._origin: Optional[float] = None
+        self._last_clock: Optional[float] = None
+        self._day_offset = 0.0
+        self.line_count = 0
+        self.skipped_count = 0
+
+    def feed(self, chunk: str) -> List[TelemetrySample]:
+        self._buffer += chunk
+        lines = self._buffer.split('\n')
+        self._buffer = lines.pop()
+        return self._parse_lines(lines)
+
+    def close(self) -> List[TelemetrySample]:
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = ""
+        return self._parse_lines(lines)
+
+    def _parse_lines(self, lines: List[str]) -> List[TelemetrySample]:
+        samples = []
+        for line in lines:
+            line = line.strip().lstrip('﻿')
+            if not line:
+                continue
+            self.line_count += 1
+            sample = self._parse_line(line)
+            if sample is None:
+                self.skipped_count += 1
+            else:
+                samples.append(sample)
+        return samples
+
+    def _parse_line(self, line: str) -> Optional[TelemetrySample]:
+        if self._columns is None and self._try_header(line):
+            return None
+
+        if self._columns is not None:
+            return self._parse_csv(line)
+
+        match = self.PRINTER_LINE.match(line)
+        if not match:
+            return None
+
+        clock = self._parse_time(match.group('time'))
+        if clock is None:
+            return None
+
+        scale = self.PRESSURE_UNITS.get((match.group('unit') or 'bar').lower(), 1.0)
+        return TelemetrySample(
+            self._elapsed(clock),
+            self._to_float(match.group('temp')),
+            self._to_float(match.group('pressure')) * scale,
+            CyclePhases.normalize(match.group('phase') or "")
+        )
+
+    def _try_header(self, line: str) -> bool:
+        for delimiter in (';', '\t', ','):
+            if delimiter not in line:
+                continue
+            names = [n.strip().strip('"').lower() for n in line.split(delimiter)]
+            if any(self.NUMBER.fullmatch(n) for n in names):
+                return False
+
+            columns = {}
+            for index, name in enumerate(names):
+                key = re.sub(r'\s*[\(\[].*$', '', name)
+                unit = re.search(r'[\(\[]\s*(\w+)\s*[\)\]]', name)
+                if 'time' not in columns and key in self.TIME_COLUMNS:
+                    columns['time'] = index
+                elif 'temperature' not in columns and key in self.TEMPERATURE_COLUMNS:
+                    columns['temperature'] = index
+                elif 'pressure' not in columns and key in self.PRESSURE_COLUMNS:
+                    columns['pressure'] = index
+                    unit_name = unit.group(1) if unit else key
+                    self._pressure_scale = self.PRESSURE_UNITS.get(unit_name, 1.0)
+                elif 'phase' not in columns and key in self.PHASE_COLUMNS:
+                    columns['phase'] = index
+
+            if 'time' in columns and 'temperature' in columns:
+                self._columns = columns
+                self._delimiter = delimiter
+                return True
+        return False
+
+    def _parse_csv(self, line: str) -> Optional[TelemetrySample]:
+        fields = [f.strip().strip('"') for f in line.split(self._delimiter)]
+        columns = self._columns
+        if len(fields) <= max(columns.values()):
+            return None
+
+        clock = self._parse_time(fields[columns['time']])
+        if clock is None:
+            return None
+
+        try:
+            temperature = self._to_float(fields[columns['temperature']])
+            pressure = 0.0
+            if 'pressure' in columns:
+                pressure = self._to_float(fields[columns['pressure']]) * self._pressure_scale
+        except ValueError:
+            return None
+
+        phase = CyclePhases.UNKNOWN
+        if 'phase' in columns:
+            phase = CyclePhases.normalize(fields[columns['phase']])
+
+        return TelemetrySample(self._elapsed(clock), temperature, pressure, phase)
+
+    def _parse_time(self, value: str) -> Optional[float]:
+        value = value.strip()
+        if not value:
+            return None
+
+        if ':' in value and '-' not in value:
+            parts = value.split(':')
+            try:
+                seconds = 0.0
+                for part in parts:
+                    seconds = seconds * 60 + float(part.replace(',', '.'))
+            except ValueError:
+                return None
+            if self._last_clock is not None and seconds + self._day_offset < self._last_clock - 43200:
+                self._day_offset += 86400
+            return seconds + self._day_offset
+
+        try:
+            return float(value.replace(',', '.'))
+        except ValueError:
+            pass
+
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+
+    def _elapsed(self, clock: float) -> float:
+        self._last_clock = clock
+        if self._origin is None:
+            self._origin = clock
+        return clock - self._origin
+
+    def _to_float(self, value: str) -> float:
+        match = self.NUMBER.search(value)
+        if not match:
+            raise ValueError(value)
+        return float(match.group(0).replace(',', '.'))
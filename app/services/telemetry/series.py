@@ -0,0 +1,135 @@
+import sys
+import zlib
+import operator
+from array import array
+from typing import Iterable, Dict
+from dataclasses import dataclass
+
+from app.config.constants import CyclePhases
+from app.config.settings import settings
+from .parser import TelemetrySample
+
+
+@dataclass
+class CycleParameters:
+    sample_count: int = 0
+    duration_seconds: float = 0.0
+    max_temperature: float = 0.0
+    max_pressure: float = 0.0
+    hold_temperature: float = 0.0
+    hold_seconds: float = 0.0
+    hold_pressure: float = 0.0
+    f0_value: float = 0.0
+
+
+class TelemetrySeries:
+
+    COLUMNS = {
+        'elapsed': 'f',
+        'temperature': 'f',
+        'pressure': 'f',
+        'phase': 'B',
+    }
+
+    def __init__(self):
+        self.elapsed = array('f')
+        self.temperature = array('f')
+        self.pressure = array('f')
+        self.phase = array('B')
+
+    def __len__(self) -> int:
+        return len(self.elapsed)
+
+    @property
+    def duration(self) -> float:
+        if not self.elapsed:
+            return 0.0
+        return float(self.elapsed[-1] - self.elapsed[0])
+
+    def append(self, sample: TelemetrySample):
+        self.elapsed.append(sample.elapsed)
+        self.temperature.append(sample.temperature)
+        self.pressure.append(sample.pressure)
+        self.phase.append(CyclePhases.code(sample.phase))
+
+    def extend(self, samples: Iterable[TelemetrySample]):
+        for sample in samples:
+            self.append(sample)
+
+    def to_blobs(self) -> Dict[str, bytes]:
+        blobs = {}
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            if sys.byteorder == 'big':
+                column = array(column.typecode, column)
+                column.byteswap()
+            blobs[name] = zlib.compress(column.tobytes(), 6)
+        return blobs
+
+    @classmethod
+    def from_blobs(cls, blobs: Dict[str, bytes]) -> 'TelemetrySeries':
+        series = cls()
+        for name, typecode in cls.COLUMNS.items():
+            column = array(typecode)
+            if blobs.get(name):
+                column.frombytes(zlib.decompress(blobs[name]))
+                if sys.byteorder == 'big':
+                    column.byteswap()
+            setattr(series, name, column)
+        return series
+
+    def f0(self) -> float:
+        cfg = settings.telemetry
+        dts = map(operator.sub, self.elapsed[1:], self.elapsed[:-1])
+        reference = cfg.f0_reference_temperature
+        z = cfg.f0_z_value
+        floor = cfg.f0_min_temperature
+        total = sum(
+            dt * 10 ** ((t - reference) / z)
+            for dt, t in zip(dts, self.temperature)
+            if t >= floor and dt > 0
+        )
+        return round(total / 60, 2)
+
+    def compute_parameters(self, hold_temperature: float = 0.0) -> CycleParameters:
+        params = CycleParameters(sample_count=len(self))
+        if not self.elapsed:
+            return params
+
+        sterilizing = CyclePhases.code(CyclePhases.STERILIZING)
+        if hold_temperature <= 0:
+            hold_temps = [t for t, p in zip(self.temperature, self.phase) if p == sterilizing]
+            hold_temperature = min(hold_temps) if hold_temps else 0.0
+
+        params.duration_seconds = self.duration
+        params.max_temperature = round(max(self.temperature), 2)
+        params.max_pressure = round(max(self.pressure), 3)
+        params.hold_temperature = hold_temperature
+
+        elapsed = self.elapsed
+        temperature = self.temperature
+        pressure = self.pressure
+        run = 0.0
+        run_pressure = float('inf')
+        best = 0.0
+        best_pressure = 0.0
+
+        for i in range(len(elapsed) - 1):
+            dt = elapsed[i + 1] - elapsed[i]
+            if dt <= 0:
+                continue
+            t = temperature[i]
+            if hold_temperature > 0 and t >= hold_temperature and temperature[i + 1] >= hold_temperature:
+                run += dt
+                run_pressure = min(run_pressure, pressure[i], pressure[i + 1])
+                if run > best:
+                    best = run
+                    best_pressure = run_pressure
+            else:
+                run = 0.0
+                run_pressure = float('inf')
+
+        params.f0_value = self.f0()
+        params.hold_seconds = best
+        params.hold_pressure = round(best_pressure, 3)
+        return params
@@ -0,0 +1,112 @@
+import random
+from typing import Iterator, Optional
+from datetime import datetime, timedelta
+
+from app.config.constants import CyclePhases
+from .parser import TelemetrySample
+
+
+class SimulatedSterilizer:
+
+    FORMAT_CSV = "csv"
+    FORMAT_PRINTER = "printer"
+
+    def __init__(self, target_temperature: float = 134.0, hold_minutes: float = 4,
+                 pulses: int = 3, start_time: datetime = None, noise: float = 0.2,
+                 fault_at: Optional[int] = None, fault_drop: float = 6.0,
+                 seed: int = None):
+        self.target_temperature = target_temperature
+        self.hold_minutes = hold_minutes
+        self.pulses = pulses
+        self.start_time = start_time or datetime.now().replace(microsecond=0)
+        self.noise = noise
+        self.fault_at = fault_at
+        self.fault_drop = fault_drop
+        self._random = random.Random(seed)
+
+    @staticmethod
+    def saturated_pressure(temperature: float) -> float:
+        mmhg = 10 ** (8.14019 - 1810.94 / (244.485 + temperature))
+        return mmhg * 0.00133322
+
+    def samples(self) -> Iterator[TelemetrySample]:
+        elapsed = 0
+        temperature = 25.0
+        target = self.target_temperature
+
+        for _ in range(self.pulses):
+            for i in range(60):
+                temperature = max(45.0, temperature - 0.5)
+                yield self._sample(elapsed, temperature, 1.0 - 0.9 * i / 59, CyclePhases.CONDITIONING)
+                elapsed += 1
+            for i in range(45):
+                temperature = min(110.0, temperature + 1.5)
+                yield self._sample(elapsed, temperature, 0.1 + 1.4 * i / 44, CyclePhases.CONDITIONING)
+                elapsed += 1
+
+        while temperature < target:
+            temperature = min(target, temperature + 0.4)
+            yield self._sample(elapsed, temperature, self.saturated_pressure(temperature),
+                               CyclePhases.HEATING)
+            elapsed += 1
+
+        for _ in range(int(self.hold_minutes * 60) + 1):
+            temperature = target + 0.6
+            if self.fault_at is not None and elapsed >= self.fault_at:
+                temperature -= self.fault_drop
+            yield self._sample(elapsed, temperature, self.saturated_pressure(temperature),
+                               CyclePhases.STERILIZING)
+            elapsed += 1
+
+        while temperature > 100.0:
+            temperature -= 0.8
+            yield self._sample(elapsed, temperature, self.saturated_pressure(temperature),
+                               CyclePhases.EXHAUST)
+            elapsed += 1
+
+        for i in range(300):
+            temperature = max(70.0, temperature - 0.1)
+            yield self._sample(elapsed, temperature, 0.1, CyclePhases.DRYING)
+            elapsed += 1
+
+        yield self._sample(elapsed, temperature, 1.0, CyclePhases.COMPLETE)
+
+    def lines(self, fmt: str = FORMAT_CSV) -> Iterator[str]:
+        if fmt == self.FORMAT_CSV:
+            yield "time;temperature;pressure(bar);phase\n"
+        else:
+            yield f"CYCLE START {self.start_time:%d.%m.%Y %H:%M:%S}\n"
+            yield f"PROGRAM {self.target_temperature:.0f}C {self.hold_minutes:g} MIN\n"
+
+        for sample in self.samples():
+            clock = self.start_time + timedelta(seconds=sample.elapsed)
+            if fmt == self.FORMAT_CSV:
+                yield (f"{clock:%H:%M:%S};{sample.temperature:.1f};"
+                       f"{sample.pressure:.3f};{sample.phase}\n").replace('.', ',')
+            else:
+                yield (f"{clock:%H:%M:%S}  {sample.temperature:6.1f}C  "
+                       f"{sample.pressure:5.3f}bar  {sample.phase}\n")
+
+        if fmt != self.FORMAT_CSV:
+            yield "CYCLE END\n"
+
+    def chunks(self, fmt: str = FORMAT_CSV, size: int = 256) -> Iterator[str]:
+        buffer = ""
+        for line in self.lines(fmt):
+            buffer += line
+            while len(buffer) >= size:
+                yield buffer[:size]
+                buffer = buffer[size:]
+        if buffer:
+            yield buffer
+
+    def write(self, path: str, fmt: str = FORMAT_CSV):
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.lines(fmt):
+                f.write(line)
+
+    def _sample(self, elapsed: int, temperature: float, pressure: float,
+                phase: str) -> TelemetrySample:
+        jitter = self._random.uniform(-self.noise, self.noise) if self.noise else 0.0
+        return TelemetrySample(float(elapsed), round(temperature + jitter, 2),
+                               round(max(0.0, pressure), 3), phase)
@@ -0,0 +1,224 @@
+import os
+import json
+import codecs
+import shutil
+from typing import Optional, List, Tuple, Union, BinaryIO, TextIO
+from datetime import datetime
+
+from app.core.database import get_db
+from app.core.tracing import traced_service
+from app.config.settings import settings
+from app.models.telemetry import CycleTelemetry
+from .parser import TelemetryParser
+from .series import TelemetrySeries, CycleParameters
+from .analysis import CycleAnalyzer, CycleVerdict
+
+
+class TelemetryIngest:
+
+    def __init__(self, cycle_id: int, source: str = ""):
+        self.cycle_id = cycle_id
+        self.source = source
+        self.parser = TelemetryParser()
+        self.series = TelemetrySeries()
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.finished = False
+
+    def feed(self, chunk: Union[str, bytes]) -> int:
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        samples = self.parser.feed(chunk)
+        self.series.extend(samples)
+        return len(samples)
+
+    def finish(self) -> TelemetrySeries:
+        if not self.finished:
+            tail = self._decoder.decode(b'', final=True)
+            if tail:
+                self.series.extend(self.parser.feed(tail))
+            self.series.extend(self.parser.close())
+            self.finished = True
+        return self.series
+
+
+@traced_service
+class TelemetryService:
+
+    EXTENSIONS = ('.csv', '.log', '.txt')
+
+    def __init__(self):
+        self.db = get_db()
+
+    def begin(self, cycle_id: int, source: str = "") -> TelemetryIngest:
+        return TelemetryIngest(cycle_id, source)
+
+    def ingest_stream(self, cycle_id: int, stream: Union[BinaryIO, TextIO],
+                      source: str = "STREAM") -> Tuple[bool, str, Optional[CycleParameters]]:
+        ingest = self.begin(cycle_id, source)
+        chunk_size = settings.telemetry.chunk_size
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            ingest.feed(chunk)
+        return self.save(ingest)
+
+    def ingest_file(self, cycle_id: int, path: str) -> Tuple[bool, str, Optional[CycleParameters]]:
+        if not os.path.exists(path):
+            return False, "Dosya bulunamadı", None
+        with open(path, 'rb') as f:
+            return self.ingest_stream(cycle_id, f, os.path.basename(path))
+
+    def ingest_drop_directory(self, directory: str = None) -> List[Tuple[str, bool, str]]:
+        directory = directory or settings.telemetry.drop_path
+        if not os.path.isdir(directory):
+            return []
+
+        processed_dir = os.path.join(directory, "processed")
+        failed_dir = os.path.join(directory, "failed")
+        results = []
+
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not os.path.isfile(path) or not name.lower().endswith(self.EXTENSIONS):
+                continue
+
+            cycle_number = os.path.splitext(name)[0].split('_')[0]
+            cycle = self.db.fetchone(
+                "SELECT id FROM machine_cycles WHERE cycle_number = ?",
+                (cycle_number,)
+            )
+            if not cycle:
+                success, msg = False, "Çevrim bulunamadı"
+            else:
+                success, msg, _ = self.ingest_file(cycle['id'], path)
+
+            target_dir = processed_dir if success else failed_dir
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.move(path, os.path.join(target_dir, name))
+            results.append((name, success, msg))
+
+        return results
+
+    def save(self, ingest: TelemetryIngest) -> Tuple[bool, str, Optional[CycleParameters]]:
+        series = ingest.finish()
+        if not len(series):
+            return False, "Geçerli ölçüm bulunamadı", None
+
+        program = self.get_program(ingest.cycle_id)
+        if program is None:
+            return False, "Çevrim bulunamadı", None
+
+        params = series.compute_parameters(program['temperature'] or 0.0)
+        verdict = CycleAnalyzer.for_program(program).analyze(series)
+        blobs = series.to_blobs()
+
+        try:
+            self.db.execute("""
+                INSERT OR REPLACE INTO cycle_telemetry (
+                    cycle_id, sample_count, duration_seconds,
+                    elapsed_data, temperature_data, pressure_data, phase_data,
+                    max_temperature, max_pressure, hold_temperature,
+                    hold_seconds, f0_value, source, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                ingest.cycle_id,
+                params.sample_count,
+                params.duration_seconds,
+                blobs['elapsed'],
+                blobs['temperature'],
+                blobs['pressure'],
+                blobs['phase'],
+                params.max_temperature,
+                params.max_pressure,
+                params.hold_temperature,
+                params.hold_seconds,
+                params.f0_value,
+                ingest.source,
+                datetime.now()
+            ))
+
+            self.save_analysis(ingest.cycle_id, verdict)
+
+            self.db.execute("""
+                UPDATE machine_cycles SET
+                    temperature_achieved = ?,
+                    pressure_achieved = ?
+                WHERE id = ?
+            """, (params.max_temperature, params.hold_pressure or params.max_pressure,
+                  ingest.cycle_id))
+
+            self.db.commit()
+            return True, f"{params.sample_count} ölçüm kaydedildi", params
+        except Exception as e:
+            self.db.rollback()
+            return False, str(e), None
+
+    def get_telemetry(self, cycle_id: int) -> Optional[CycleTelemetry]:
+        row = self.db.fetchone("""
+            SELECT id, cycle_id, sample_count, duration_seconds, max_temperature,
+                   max_pressure, hold_temperature, hold_seconds, f0_value,
+                   source, created_at
+            FROM cycle_telemetry WHERE cycle_id = ?
+        """, (cycle_id,))
+        if not row:
+            return None
+
+        return CycleTelemetry(
+            id=row['id'],
+            cycle_id=row['cycle_id'],
+            sample_count=row['sample_count'] or 0,
+            duration_seconds=row['duration_seconds'] or 0,
+            max_temperature=row['max_temperature'] or 0,
+            max_pressure=row['max_pressure'] or 0,
+            hold_temperature=row['hold_temperature'] or 0,
+            hold_seconds=row['hold_seconds'] or 0,
+            f0_value=row['f0_value'] or 0,
+            source=row['source'] or "",
+            created_at=row['created_at']
+        )
+
+    def get_series(self, cycle_id: int) -> Optional[TelemetrySeries]:
+        row = self.db.fetchone("""
+            SELECT elapsed_data, temperature_data, pressure_data, phase_data
+            FROM cycle_telemetry WHERE cycle_id = ?
+        """, (cycle_id,))
+        if not row:
+            return None
+
+        return TelemetrySeries.from_blobs({
+            'elapsed': row['elapsed_data'],
+            'temperature': row['temperature_data'],
+            'pressure': row['pressure_data'],
+            'phase': row['phase_data'],
+        })
+
+    def get_program(self, cycle_id: int):
+        return self.db.fetchone("""
+            SELECT mc.id, mp.temperature, mp.pressure, mp.duration_minutes
+            FROM machine_cycles mc
+            LEFT JOIN machine_programs mp ON mc.program_id = mp.id
+            WHERE mc.id = ?
+        """, (cycle_id,))
+
+    def save_analysis(self, cycle_id: int, verdict: CycleVerdict):
+        self.db.execute("""
+            INSERT OR REPLACE INTO cycle_analysis (
+                cycle_id, result, hold_start, hold_seconds,
+                hold_min_temperature, hold_max_temperature,
+                hold_min_pressure, max_gap_seconds, f0_value,
+                failures, analyzed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            cycle_id,
+            verdict.result,
+            verdict.hold_start,
+            verdict.hold_seconds,
+            verdict.hold_min_temperature,
+            verdict.hold_max_temperature,
+            verdict.hold_min_pressure,
+            verdict.max_gap_seconds,
+            verdict.f0_value,
+            json.dumps(verdict.failures, ensure_ascii=False),
+            datetime.now()
+        ))
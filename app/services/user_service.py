@@ -1,19 +1,19 @@
-import hashlib
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 
 from app.core.database import get_db
+from app.core.session import current_session
+from app.core.security import hash_pin
+from app.core.tracing import traced_service
 from app.models.user import User, Role, Permission
 
 
+@traced_service
 class UserService:
 
     def __init__(self):
         self.db = get_db()
 
-    def _hash_pin(self, pin: str) -> str:
-        return hashlib.sha256(pin.encode()).hexdigest()
-
     def get_all_users(self, include_inactive: bool = False) -> List[User]:
         query = """
             SELECT o.*, r.code as role_code, r.name as role_name
@@ -109,7 +109,7 @@ class UserService:
 
         pin_hash = None
         if data.get('pin'):
-            pin_hash = self._hash_pin(data['pin'])
+            pin_hash = hash_pin(data['pin'])
 
         try:
             self.db.execute("""
@@ -174,6 +174,7 @@ class UserService:
                 user_id
             ))
             self.db.commit()
+            current_session.invalidate_permissions()
             return True, "Kullanıcı güncellendi"
         except Exception as e:
             self.db.rollback()
@@ -185,6 +186,7 @@ class UserService:
                 UPDATE operators SET is_active = 0, updated_at = ? WHERE id = ?
             """, (datetime.now(), user_id))
             self.db.commit()
+            current_session.invalidate_permissions()
             return True, "Kullanıcı devre dışı bırakıldı"
         except Exception as e:
             self.db.rollback()
@@ -197,8 +199,9 @@ class UserService:
         try:
             self.db.execute("""
                 UPDATE operators SET pin_hash = ?, updated_at = ? WHERE id = ?
-            """, (self._hash_pin(new_pin), datetime.now(), user_id))
+            """, (hash_pin(new_pin), datetime.now(), user_id))
             self.db.commit()
+            current_session.invalidate_permissions()
             return True, "PIN sıfırlandı"
         except Exception as e:
             self.db.rollback()
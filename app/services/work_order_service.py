@@ -4,23 +4,26 @@ import uuid
 
 from app.core.database import get_db
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.models.work_order import WorkOrder, ProcessRecord
 from app.config.constants import WorkOrderStatus, Zones, AuditActions
+from app.utils.barcode import BarcodeGenerator
 
 
+@traced_service
 class WorkOrderService:
 
     def __init__(self):
         self.db = get_db()
 
     def _generate_order_number(self) -> str:
-        date_part = datetime.now().strftime("%Y%m%d")
+        prefix = BarcodeGenerator.work_order_prefix()
         count = self.db.fetchone(
             "SELECT COUNT(*) as cnt FROM work_orders WHERE order_number LIKE ?",
-            (f"WO{date_part}%",)
+            (f"{prefix}%",)
         )
         seq = (count['cnt'] or 0) + 1
-        return f"WO{date_part}{seq:04d}"
+        return f"{prefix}{seq:04d}"
 
     def create_work_order(self, item_type: str, item_id: int,
                          department_id: int = None, priority: int = 0,
@@ -212,15 +215,19 @@ class WorkOrderService:
         order = self.get_work_order(order_id)
         if not order:
             return False, "İş emri bulunamadı"
+        if WorkOrderStatus.is_released(order.status):
+            return False, "Serbest bırakılmış iş emri tekrar işlemeye gönderilemez"
 
         try:
             self.db.execute("""
                 UPDATE work_orders SET
                     status = ?,
                     current_zone = ?,
+                    status_epoch = COALESCE(status_epoch, 0) + ?,
                     updated_at = ?
                 WHERE id = ?
-            """, (WorkOrderStatus.REPROCESSING, Zones.DIRTY, datetime.now(), order_id))
+            """, (WorkOrderStatus.REPROCESSING, Zones.DIRTY,
+                  WorkOrderStatus.reprocess_step(order.status), datetime.now(), order_id))
 
             self.db.execute("""
                 INSERT INTO reprocessing_records (
@@ -2,10 +2,13 @@ from typing import Optional, List, Tuple
 from datetime import datetime
 
 from app.core.database import get_db
+from app.core.rows import RowView
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import WorkOrderStatus, Zones, PackagingTypes
 
 
+@traced_service
 class CleanZoneService:
 
     def __init__(self):
@@ -117,55 +120,59 @@ class CleanZoneService:
             self.db.rollback()
             return False, str(e)
 
-    def get_pending_inspection(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_pending_inspection(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.current_zone = ? AND wo.status IN (?, ?)
             ORDER BY wo.priority DESC, wo.created_at
         """, (Zones.CLEAN, WorkOrderStatus.WASHED, WorkOrderStatus.INSPECTING))
-        return [dict(row) for row in rows]
 
-    def get_pending_packaging(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_pending_packaging(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.priority DESC, wo.created_at
         """, (WorkOrderStatus.PACKAGING,))
-        return [dict(row) for row in rows]
 
-    def get_packaged_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_packaged_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at
         """, (WorkOrderStatus.PACKAGED,))
-        return [dict(row) for row in rows]
 
-    def get_failed_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_failed_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at
         """, (WorkOrderStatus.INSPECTION_FAILED,))
-        return [dict(row) for row in rows]
 
     def send_to_reprocess(self, order_id: int, reason: str) -> Tuple[bool, str]:
+        order = self.db.fetchone("SELECT status FROM work_orders WHERE id = ?", (order_id,))
+        if not order:
+            return False, "İş emri bulunamadı"
+        if WorkOrderStatus.is_released(order['status']):
+            return False, "Serbest bırakılmış iş emri tekrar işlemeye gönderilemez"
+
         try:
             self.db.execute("""
                 UPDATE work_orders SET
                     status = ?,
                     current_zone = ?,
+                    status_epoch = COALESCE(status_epoch, 0) + ?,
                     updated_at = ?
                 WHERE id = ?
-            """, (WorkOrderStatus.REPROCESSING, Zones.DIRTY, datetime.now(), order_id))
+            """, (WorkOrderStatus.REPROCESSING, Zones.DIRTY,
+                  WorkOrderStatus.reprocess_step(order['status']), datetime.now(), order_id))
 
             self.db.execute("""
                 INSERT INTO reprocessing_records (
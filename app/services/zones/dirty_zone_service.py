@@ -2,10 +2,14 @@ from typing import Optional, List, Tuple
 from datetime import datetime
 
 from app.core.database import get_db
+from app.core.rows import RowView
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import WorkOrderStatus, Zones
+from app.utils.barcode import BarcodeGenerator
 
 
+@traced_service
 class DirtyZoneService:
 
     def __init__(self):
@@ -90,44 +94,41 @@ class DirtyZoneService:
             self.db.rollback()
             return False, str(e)
 
-    def get_pending_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_pending_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.current_zone = ? AND wo.status = ?
             ORDER BY wo.priority DESC, wo.created_at
         """, (Zones.DIRTY, WorkOrderStatus.RECEIVED))
-        return [dict(row) for row in rows]
 
-    def get_washing_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_washing_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at
         """, (WorkOrderStatus.WASHING,))
-        return [dict(row) for row in rows]
 
-    def get_washed_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_washed_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at
         """, (WorkOrderStatus.WASHED,))
-        return [dict(row) for row in rows]
 
     def _generate_order_number(self) -> str:
-        date_part = datetime.now().strftime("%Y%m%d")
+        prefix = BarcodeGenerator.work_order_prefix()
         count = self.db.fetchone(
             "SELECT COUNT(*) as cnt FROM work_orders WHERE order_number LIKE ?",
-            (f"WO{date_part}%",)
+            (f"{prefix}%",)
         )
         seq = (count['cnt'] or 0) + 1
-        return f"WO{date_part}{seq:04d}"
+        return f"{prefix}{seq:04d}"
 
     def _get_item_info(self, item_type: str, item_id: int) -> Optional[dict]:
         if item_type == "SET":
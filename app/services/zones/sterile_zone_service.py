@@ -2,11 +2,14 @@ from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 
 from app.core.database import get_db
+from app.core.rows import RowView
 from app.core.session import current_session
+from app.core.tracing import traced_service
 from app.config.constants import WorkOrderStatus, SterilizationStatus, Zones
 from app.config.settings import settings
 
 
+@traced_service
 class SterileZoneService:
 
     def __init__(self):
@@ -90,11 +93,7 @@ class SterileZoneService:
         if not current_session.current_user:
             return False, "Oturum açık değil"
 
-        user = self.db.fetchone(
-            "SELECT can_release_load FROM operators WHERE id = ?",
-            (current_session.current_user.user_id,)
-        )
-        if not user or not user['can_release_load']:
+        if not current_session.current_user.can_release_load:
             return False, "Onay yetkiniz yok"
 
         try:
@@ -170,55 +169,50 @@ class SterileZoneService:
             self.db.rollback()
             return False, str(e)
 
-    def get_sterilizing_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_sterilizing_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at
         """, (WorkOrderStatus.STERILIZING,))
-        return [dict(row) for row in rows]
 
-    def get_pending_release_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_pending_release_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.priority DESC, wo.created_at
         """, (WorkOrderStatus.PENDING_RELEASE,))
-        return [dict(row) for row in rows]
 
-    def get_released_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_released_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at DESC
         """, (WorkOrderStatus.RELEASED,))
-        return [dict(row) for row in rows]
 
-    def get_stored_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_stored_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at DESC
         """, (WorkOrderStatus.STORED,))
-        return [dict(row) for row in rows]
 
-    def get_rejected_items(self) -> List[dict]:
-        rows = self.db.fetchall("""
+    def get_rejected_items(self) -> List[RowView]:
+        return self.db.fetchviews("""
             SELECT wo.*, d.name as department_name
             FROM work_orders wo
             LEFT JOIN departments d ON wo.department_id = d.id
             WHERE wo.status = ?
             ORDER BY wo.created_at DESC
         """, (WorkOrderStatus.REJECTED,))
-        return [dict(row) for row in rows]
 
     def _add_process_record(self, order_id: int, process_type: str,
                            notes: str = "", machine_id: int = None,
@@ -1,4 +1,11 @@
-from .styles import Styles, Colors
-from .main_window import MainWindow
+from app.utils.lazy import lazy_exports
 
-__all__ = ['Styles', 'Colors', 'MainWindow']
+_EXPORTS = {
+    'Styles': '.styles',
+    'Colors': '.styles',
+    'MainWindow': '.main_window'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
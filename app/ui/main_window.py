@@ -1,28 +1,126 @@
+import time
+from functools import cached_property
+
 from PySide6.QtWidgets import QMainWindow, QStackedWidget, QMessageBox, QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, Signal, QTimer
+from PySide6.QtGui import QShortcut, QKeySequence
 
 from app.ui.styles import Styles
-from app.ui.screens import LoginScreen, DashboardScreen, ZoneSelectorScreen
-from app.ui.zones import DirtyZoneScreen, CleanZoneScreen, SterileZoneScreen
-from app.services import AuthService
-from app.services.zones import DirtyZoneService, CleanZoneService, SterileZoneService
+from app.ui.screens.login_screen import LoginScreen
 from app.core.session import current_session
+from app.core.database import get_db
+from app.core.boot import boot_profiler
+from app.core.tracing import tracer, traced
+from app.config.settings import settings
+from app.config.constants import SessionEndReasons
+
+
+class DatabaseEvents(QObject):
+
+    changed = Signal(list)
+
+
+class ScannerEvents(QObject):
+
+    scanned = Signal(str)
+    resolved = Signal(object)
+
+
+class PrintEvents(QObject):
+
+    finished = Signal(object)
 
 
 class MainWindow(QMainWindow):
 
+    WATCHED_TABLES = {'work_orders', 'process_records', 'sterilization_records',
+                      'machine_cycles', 'machines', 'maintenance_plans'}
+
+    ZONE_SCREENS = {'dirty_zone': 'DIRTY', 'clean_zone': 'CLEAN', 'sterile_zone': 'STERILE'}
+
     def __init__(self):
         super().__init__()
-        self.auth_service = AuthService()
-        self.dirty_service = DirtyZoneService()
-        self.clean_service = CleanZoneService()
-        self.sterile_service = SterileZoneService()
+        self._screens = {}
+        self._resume_screen = None
+        self.last_switch_ms = 0.0
+        self._held_scans = []
         self._setup_ui()
         self._connect_signals()
+        self.database_events = DatabaseEvents()
+        self.database_events.changed.connect(self._on_database_changed)
+        get_db().add_change_listener(self.database_events.changed.emit)
+        self.scanner_events = ScannerEvents()
+        self.scanner_events.scanned.connect(self._dispatch_scan)
+        self.scanner_events.resolved.connect(self._on_scan_resolved)
+        QTimer.singleShot(0, self._warm_up)
+
+    @cached_property
+    def scanner_service(self):
+        from app.services.scanner import ScannerService
+        return ScannerService()
+
+    @cached_property
+    def scan_pipeline(self):
+        from app.services.scanner import ScanPipeline
+        pipeline = ScanPipeline()
+        pipeline.set_handler(self.scanner_events.resolved.emit)
+        return pipeline
+
+    @cached_property
+    def label_service(self):
+        from app.services.labels import LabelService, print_queue
+        self.print_events = PrintEvents()
+        self.print_events.finished.connect(self._on_print_finished)
+        print_queue.set_listener(self.print_events.finished.emit)
+        return LabelService()
+
+    @cached_property
+    def auth_service(self):
+        from app.services.auth_service import AuthService
+        return AuthService()
+
+    @cached_property
+    def dirty_service(self):
+        from app.services.zones import DirtyZoneService
+        return DirtyZoneService()
+
+    @cached_property
+    def clean_service(self):
+        from app.services.zones import CleanZoneService
+        return CleanZoneService()
+
+    @cached_property
+    def sterile_service(self):
+        from app.services.zones import SterileZoneService
+        return SterileZoneService()
+
+    @cached_property
+    def maintenance_service(self):
+        from app.services.maintenance_service import MaintenanceService
+        return MaintenanceService()
+
+    @property
+    def dashboard_screen(self):
+        return self._screen('dashboard')
+
+    @property
+    def zone_selector(self):
+        return self._screen('zone_selector')
+
+    @property
+    def dirty_zone(self):
+        return self._screen('dirty_zone')
+
+    @property
+    def clean_zone(self):
+        return self._screen('clean_zone')
+
+    @property
+    def sterile_zone(self):
+        return self._screen('sterile_zone')
 
     def _setup_ui(self):
         self.setWindowTitle("Sterilizasyon Takip Sistemi")
-        self.setStyleSheet(Styles.main_window())
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.showFullScreen()
         self.setCursor(Qt.BlankCursor)
@@ -31,55 +129,159 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.stack)
 
         self.login_screen = LoginScreen()
-        self.dashboard_screen = DashboardScreen()
-        self.zone_selector = ZoneSelectorScreen()
-        self.dirty_zone = DirtyZoneScreen()
-        self.clean_zone = CleanZoneScreen()
-        self.sterile_zone = SterileZoneScreen()
-
         self.stack.addWidget(self.login_screen)
-        self.stack.addWidget(self.dashboard_screen)
-        self.stack.addWidget(self.zone_selector)
-        self.stack.addWidget(self.dirty_zone)
-        self.stack.addWidget(self.clean_zone)
-        self.stack.addWidget(self.sterile_zone)
-
         self.stack.setCurrentWidget(self.login_screen)
 
+    def set_theme(self, name: str):
+        Styles.apply(name)
+        settings.ui.theme = Styles.current
+
     def _connect_signals(self):
         self.login_screen.login_requested.connect(self._on_login)
-
-        self.dashboard_screen.logout_requested.connect(self._on_logout)
-        self.dashboard_screen.zone_selected.connect(self._on_zone_selected)
-        self.dashboard_screen.barcode_scanned.connect(self._on_barcode_scanned)
-        self.dashboard_screen.exit_requested.connect(self._on_exit)
-
-        self.zone_selector.zone_selected.connect(self._on_zone_selected)
-        self.zone_selector.back_requested.connect(self._show_dashboard)
-
-        self.dirty_zone.back_requested.connect(self._show_dashboard)
-        self.dirty_zone.receive_item.connect(self._on_receive_item)
-        self.dirty_zone.barcode_scanned.connect(self._on_barcode_scanned)
-
-        self.clean_zone.back_requested.connect(self._show_dashboard)
-        self.clean_zone.pass_inspection.connect(self._on_pass_inspection)
-        self.clean_zone.fail_inspection.connect(self._on_fail_inspection)
-        self.clean_zone.complete_packaging.connect(self._on_complete_packaging)
-        self.clean_zone.barcode_scanned.connect(self._on_barcode_scanned)
-
-        self.sterile_zone.back_requested.connect(self._show_dashboard)
-        self.sterile_zone.release_item.connect(self._on_release_item)
-        self.sterile_zone.reject_item.connect(self._on_reject_item)
-        self.sterile_zone.barcode_scanned.connect(self._on_barcode_scanned)
-
+        self.login_screen.cancel_requested.connect(self._resume)
+        self.trace_shortcut = QShortcut(QKeySequence(settings.diagnostics.dump_shortcut), self)
+        self.trace_shortcut.setContext(Qt.ApplicationShortcut)
+        self.trace_shortcut.activated.connect(self._dump_trace)
+
+    def _screen(self, name: str):
+        screen = self._screens.get(name)
+        if screen is None:
+            with boot_profiler.span(f"screen.{name}"):
+                screen = getattr(self, f"_create_{name}")()
+            self._screens[name] = screen
+            self.stack.addWidget(screen)
+        return screen
+
+    def _create_dashboard(self):
+        from app.ui.screens.dashboard_screen import DashboardScreen
+        screen = DashboardScreen()
+        screen.logout_requested.connect(self._on_logout)
+        screen.switch_user_requested.connect(self._on_switch_user)
+        screen.zone_selected.connect(self._on_zone_selected)
+        screen.barcode_scanned.connect(self._on_barcode_scanned)
+        screen.exit_requested.connect(self._on_exit)
+        return screen
+
+    def _create_zone_selector(self):
+        from app.ui.screens.zone_selector_screen import ZoneSelectorScreen
+        screen = ZoneSelectorScreen()
+        screen.zone_selected.connect(self._on_zone_selected)
+        screen.back_requested.connect(self._show_dashboard)
+        return screen
+
+    def _create_dirty_zone(self):
+        from app.ui.zones.dirty_zone_screen import DirtyZoneScreen
+        screen = DirtyZoneScreen()
+        screen.back_requested.connect(self._show_dashboard)
+        screen.receive_item.connect(self._on_receive_item)
+        screen.barcode_scanned.connect(self._on_barcode_scanned)
+        return screen
+
+    def _create_clean_zone(self):
+        from app.ui.zones.clean_zone_screen import CleanZoneScreen
+        screen = CleanZoneScreen()
+        screen.back_requested.connect(self._show_dashboard)
+        screen.pass_inspection.connect(self._on_pass_inspection)
+        screen.fail_inspection.connect(self._on_fail_inspection)
+        screen.complete_packaging.connect(self._on_complete_packaging)
+        screen.barcode_scanned.connect(self._on_barcode_scanned)
+        return screen
+
+    def _create_sterile_zone(self):
+        from app.ui.zones.sterile_zone_screen import SterileZoneScreen
+        screen = SterileZoneScreen()
+        screen.back_requested.connect(self._show_dashboard)
+        screen.release_item.connect(self._on_release_item)
+        screen.reject_item.connect(self._on_reject_item)
+        screen.barcode_scanned.connect(self._on_barcode_scanned)
+        return screen
+
+    def _warm_up(self):
+        boot_profiler.mark("interactive")
+        QTimer.singleShot(250, self._preload)
+
+    def _preload(self):
+        with boot_profiler.span("preload"):
+            self.auth_service
+            self._screen('dashboard')
+        if settings.scanner.devices:
+            self.scanner_service.set_handler(lambda event: self.scanner_events.scanned.emit(event.code))
+            self.scanner_service.start()
+
+    def stop_scanners(self):
+        if 'scanner_service' in self.__dict__:
+            self.scanner_service.stop()
+        if 'scan_pipeline' in self.__dict__:
+            self.scan_pipeline.flush()
+            self.scan_pipeline.stop()
+
+    def _dispatch_scan(self, code: str):
+        if self._held_scans or QApplication.activeModalWidget() is not None:
+            self._held_scans.append(code)
+            if len(self._held_scans) == 1:
+                QTimer.singleShot(100, self._release_held_scans)
+            return
+        self._route_scan(code)
+
+    def _release_held_scans(self):
+        if not self._held_scans:
+            return
+        if QApplication.activeModalWidget() is not None:
+            QTimer.singleShot(100, self._release_held_scans)
+            return
+        self._route_scan(self._held_scans.pop(0))
+        if self._held_scans:
+            QTimer.singleShot(0, self._release_held_scans)
+
+    def _route_scan(self, code: str):
+        current = self.stack.currentWidget()
+        if current is self.login_screen:
+            self.login_screen.handle_scan(code)
+        elif hasattr(current, 'barcode_scanned'):
+            current.barcode_scanned.emit(code)
+
+    @traced(action=True)
     def _on_login(self, badge: str, pin: str):
+        started = time.perf_counter()
         success, message, user_data = self.auth_service.authenticate_with_pin(badge, pin)
-        if success:
-            self._show_dashboard()
-        else:
+        if not success:
             self.login_screen.show_error(message)
+            return
+
+        if self._resume_screen is not None:
+            self._resume()
+            self.last_switch_ms = (time.perf_counter() - started) * 1000
+        else:
+            self._show_dashboard()
+
+    def _on_switch_user(self):
+        session = current_session.current_user
+        if session is None:
+            self._on_logout()
+            return
+        self._resume_screen = self.stack.currentWidget()
+        self.stack.setCurrentWidget(self.login_screen)
+        self.login_screen.set_switch_mode(True, session.full_name)
+
+    def _resume(self):
+        screen, self._resume_screen = self._resume_screen, None
+        self.login_screen.set_switch_mode(False)
+        session = current_session.current_user
+        if session is None:
+            self.stack.setCurrentWidget(self.login_screen)
+            return
+
+        zone = next((z for name, z in self.ZONE_SCREENS.items() if self._screens.get(name) is screen), None)
+        if screen is None or (zone and not session.can_access_zone(zone)):
+            self._show_dashboard()
+            return
+        if screen is self._screens.get('dashboard'):
+            self.dashboard_screen.update_user_info()
+        self.stack.setCurrentWidget(screen)
 
     def _on_logout(self):
+        self._resume_screen = None
+        self.login_screen.set_switch_mode(False)
         self.auth_service.logout()
         self.stack.setCurrentWidget(self.login_screen)
 
@@ -90,9 +292,10 @@ class MainWindow(QMainWindow):
             QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            self.auth_service.logout()
+            self.auth_service.logout(SessionEndReasons.SHUTDOWN)
             QApplication.quit()
 
+    @traced(action=True)
     def _show_dashboard(self):
         self.dashboard_screen.update_user_info()
         self._update_dashboard_stats()
@@ -104,7 +307,9 @@ class MainWindow(QMainWindow):
         sterile = 0
         ready = 0
         self.dashboard_screen.update_stats(pending, washing, sterile, ready)
+        self.dashboard_screen.set_maintenance_alerts(self.maintenance_service.get_upcoming())
 
+    @traced(action=True)
     def _on_zone_selected(self, zone: str):
         if zone == "DIRTY":
             self._load_dirty_zone()
@@ -116,6 +321,7 @@ class MainWindow(QMainWindow):
             self._load_sterile_zone()
             self.stack.setCurrentWidget(self.sterile_zone)
 
+    @traced()
     def _load_dirty_zone(self):
         pending = self.dirty_service.get_pending_items()
         washing = self.dirty_service.get_washing_items()
@@ -125,6 +331,7 @@ class MainWindow(QMainWindow):
         self.dirty_zone.set_pending_data(pending)
         self.dirty_zone.set_washing_data(washing)
 
+    @traced()
     def _load_clean_zone(self):
         inspection = self.clean_service.get_pending_inspection()
         packaging = self.clean_service.get_pending_packaging()
@@ -136,6 +343,7 @@ class MainWindow(QMainWindow):
         self.clean_zone.set_inspection_data(inspection)
         self.clean_zone.set_packaging_data(packaging)
 
+    @traced()
     def _load_sterile_zone(self):
         sterilizing = self.sterile_service.get_sterilizing_items()
         pending = self.sterile_service.get_pending_release_items()
@@ -147,12 +355,42 @@ class MainWindow(QMainWindow):
         self.sterile_zone.set_pending_data(pending)
         self.sterile_zone.set_released_data(released)
 
+    @traced(action=True)
+    def _on_database_changed(self, tables: list):
+        if not self.WATCHED_TABLES.intersection(tables):
+            return
+
+        current = self.stack.currentWidget()
+        if current is self._screens.get('dashboard'):
+            self._update_dashboard_stats()
+        elif current is self._screens.get('dirty_zone'):
+            self._load_dirty_zone()
+        elif current is self._screens.get('clean_zone'):
+            self._load_clean_zone()
+        elif current is self._screens.get('sterile_zone'):
+            self._load_sterile_zone()
+
     def _on_barcode_scanned(self, barcode: str):
-        pass
+        current = self.stack.currentWidget()
+        zone = next((zone for name, zone in self.ZONE_SCREENS.items()
+                     if current is self._screens.get(name)), None)
+        self.scan_pipeline.submit(barcode, zone)
+
+    @traced(action=True)
+    def _on_scan_resolved(self, result):
+        if result.action == "DUPLICATE":
+            return
+
+        current = self.stack.currentWidget()
+        if hasattr(current, 'show_scan_result'):
+            current.show_scan_result(result.message, result.ok)
+        if result.order_id is not None or result.action == "RECEIVE":
+            self._on_database_changed(['work_orders'])
 
     def _on_receive_item(self):
         pass
 
+    @traced(action=True)
     def _on_pass_inspection(self, order_id: int):
         success, msg = self.clean_service.pass_inspection(order_id)
         if success:
@@ -160,6 +398,7 @@ class MainWindow(QMainWindow):
         else:
             self._show_error(msg)
 
+    @traced(action=True)
     def _on_fail_inspection(self, order_id: int, reason: str):
         success, msg = self.clean_service.fail_inspection(order_id, reason or "Kontrol basarisiz")
         if success:
@@ -167,6 +406,7 @@ class MainWindow(QMainWindow):
         else:
             self._show_error(msg)
 
+    @traced(action=True)
     def _on_complete_packaging(self, order_id: int, packaging_type: str):
         success, msg = self.clean_service.complete_packaging(order_id, packaging_type)
         if success:
@@ -174,13 +414,17 @@ class MainWindow(QMainWindow):
         else:
             self._show_error(msg)
 
-    def _on_release_item(self, record_id: int):
-        success, msg = self.sterile_service.release_item(record_id)
+    @traced(action=True)
+    def _on_release_item(self, order_id: int):
+        success, msg = self.sterile_service.release_item(order_id)
         if success:
+            if settings.printing.print_on_release:
+                self.label_service.print_order_record(order_id)
             self._load_sterile_zone()
         else:
             self._show_error(msg)
 
+    @traced(action=True)
     def _on_reject_item(self, record_id: int, reason: str):
         success, msg = self.sterile_service.reject_item(record_id, reason or "Reddedildi")
         if success:
@@ -188,6 +432,18 @@ class MainWindow(QMainWindow):
         else:
             self._show_error(msg)
 
+    def _on_print_finished(self, job):
+        if job.status == "FAILED":
+            self._show_error(f"Yazdirma basarisiz: {job.error}")
+
+    def _dump_trace(self):
+        try:
+            path = tracer.dump()
+        except OSError as e:
+            self._show_error(f"Iz kaydedilemedi: {e}")
+            return
+        QMessageBox.information(self, "Iz", f"Iz kaydedildi:\n{path}")
+
     def _show_error(self, message: str):
         QMessageBox.warning(self, "Hata", message)
 
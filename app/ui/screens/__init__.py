@@ -1,5 +1,11 @@
-from .login_screen import LoginScreen
-from .dashboard_screen import DashboardScreen
-from .zone_selector_screen import ZoneSelectorScreen
+from app.utils.lazy import lazy_exports
 
-__all__ = ['LoginScreen', 'DashboardScreen', 'ZoneSelectorScreen']
+_EXPORTS = {
+    'LoginScreen': '.login_screen',
+    'DashboardScreen': '.dashboard_screen',
+    'ZoneSelectorScreen': '.zone_selector_screen'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -3,10 +3,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.widgets.cards import StatCard
 from app.ui.widgets.inputs import BarcodeInput
-from app.ui.widgets.buttons import PrimaryButton
+from app.ui.widgets.buttons import PrimaryButton, SecondaryButton, DangerButton, ZoneButton
 from app.core.session import current_session
 
 
@@ -15,6 +15,7 @@ class DashboardScreen(QWidget):
     barcode_scanned = Signal(str)
     zone_selected = Signal(str)
     logout_requested = Signal()
+    switch_user_requested = Signal()
     exit_requested = Signal()
 
     def __init__(self, parent=None):
@@ -22,7 +23,7 @@ class DashboardScreen(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setStyleSheet(f"background-color: {Colors.BACKGROUND};")
+        set_role(self, "screen")
 
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -37,6 +38,9 @@ class DashboardScreen(QWidget):
         stats = self._create_stats_section()
         layout.addLayout(stats)
 
+        maintenance = self._create_maintenance_section()
+        layout.addWidget(maintenance)
+
         zones = self._create_zones_section()
         layout.addWidget(zones)
 
@@ -46,83 +50,62 @@ class DashboardScreen(QWidget):
         header = QHBoxLayout()
 
         left = QVBoxLayout()
-        self.welcome_label = QLabel("Hos Geldiniz")
-        self.welcome_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: bold;
-        """)
-
-        self.user_label = QLabel("")
-        self.user_label.setStyleSheet(f"""
-            color: {Colors.TEXT_SECONDARY};
-            font-size: 16px;
-        """)
+        self.welcome_label = set_role(QLabel("Hos Geldiniz"), "welcome")
+        self.user_label = set_role(QLabel(""), "subtitle", "large")
 
         left.addWidget(self.welcome_label)
         left.addWidget(self.user_label)
 
+        switch_btn = SecondaryButton("Kullanici Degistir")
+        switch_btn.setFixedWidth(180)
+        switch_btn.clicked.connect(self.switch_user_requested.emit)
+
         logout_btn = PrimaryButton("Cikis")
         logout_btn.setFixedWidth(120)
         logout_btn.clicked.connect(self.logout_requested.emit)
 
-        exit_btn = PrimaryButton("Sistemi Kapat")
+        exit_btn = DangerButton("Sistemi Kapat")
         exit_btn.setFixedWidth(140)
-        exit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.DANGER};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-        """)
         exit_btn.clicked.connect(self.exit_requested.emit)
 
         header.addLayout(left)
         header.addStretch()
+        header.addWidget(switch_btn)
         header.addWidget(logout_btn)
         header.addWidget(exit_btn)
 
         return header
 
     def _create_barcode_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 12px;
-                padding: 20px;
-            }}
-        """)
+        frame = set_role(QFrame(), "panel")
 
         layout = QVBoxLayout(frame)
 
-        label = QLabel("Hizli Barkod Tarama")
-        label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 18px;
-            font-weight: bold;
-        """)
+        label = set_role(QLabel("Hizli Barkod Tarama"), "heading")
 
         self.barcode_input = BarcodeInput("Barkod okutun veya yazin...")
         self.barcode_input.barcode_scanned.connect(self.barcode_scanned.emit)
 
+        self.scan_status = set_role(QLabel(""), "caption")
+
         layout.addWidget(label)
         layout.addWidget(self.barcode_input)
+        layout.addWidget(self.scan_status)
 
         return frame
 
+    def show_scan_result(self, message: str, ok: bool):
+        set_role(self.scan_status, "alert", "success" if ok else "danger")
+        self.scan_status.setText(message)
+
     def _create_stats_section(self):
         stats = QGridLayout()
         stats.setSpacing(16)
 
-        self.stat_pending = StatCard("Bekleyen", "0", "", Colors.WARNING)
-        self.stat_washing = StatCard("Yikamada", "0", "", Colors.INFO)
-        self.stat_sterile = StatCard("Sterilizasyonda", "0", "", Colors.SUCCESS)
-        self.stat_ready = StatCard("Hazir", "0", "", Colors.PRIMARY)
+        self.stat_pending = StatCard("Bekleyen", "0", "", "warning")
+        self.stat_washing = StatCard("Yikamada", "0", "", "info")
+        self.stat_sterile = StatCard("Sterilizasyonda", "0", "", "success")
+        self.stat_ready = StatCard("Hazir", "0", "", "primary")
 
         stats.addWidget(self.stat_pending, 0, 0)
         stats.addWidget(self.stat_washing, 0, 1)
@@ -131,33 +114,37 @@ class DashboardScreen(QWidget):
 
         return stats
 
+    def _create_maintenance_section(self):
+        self.maintenance_frame = set_role(QFrame(), "panel", "compact")
+
+        layout = QVBoxLayout(self.maintenance_frame)
+        layout.setSpacing(6)
+
+        label = set_role(QLabel("Yaklasan Bakimlar"), "heading")
+        layout.addWidget(label)
+
+        self.maintenance_list = QVBoxLayout()
+        self.maintenance_list.setSpacing(4)
+        layout.addLayout(self.maintenance_list)
+
+        self.maintenance_frame.hide()
+        return self.maintenance_frame
+
     def _create_zones_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 12px;
-                padding: 20px;
-            }}
-        """)
+        frame = set_role(QFrame(), "panel")
 
         layout = QVBoxLayout(frame)
         layout.setSpacing(16)
 
-        label = QLabel("Calisma Alani Secin")
-        label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 18px;
-            font-weight: bold;
-        """)
+        label = set_role(QLabel("Calisma Alani Secin"), "heading")
         layout.addWidget(label)
 
         zones_layout = QHBoxLayout()
         zones_layout.setSpacing(16)
 
-        dirty_btn = self._create_zone_button("Kirli Alan", "DIRTY", Colors.DIRTY_ZONE)
-        clean_btn = self._create_zone_button("Temiz Alan", "CLEAN", Colors.CLEAN_ZONE)
-        sterile_btn = self._create_zone_button("Steril Alan", "STERILE", Colors.STERILE_ZONE)
+        dirty_btn = self._create_zone_button("Kirli Alan", "DIRTY")
+        clean_btn = self._create_zone_button("Temiz Alan", "CLEAN")
+        sterile_btn = self._create_zone_button("Steril Alan", "STERILE")
 
         zones_layout.addWidget(dirty_btn)
         zones_layout.addWidget(clean_btn)
@@ -167,22 +154,9 @@ class DashboardScreen(QWidget):
 
         return frame
 
-    def _create_zone_button(self, text: str, zone: str, color: str):
-        btn = PrimaryButton(text)
+    def _create_zone_button(self, text: str, zone: str):
+        btn = ZoneButton(text, zone)
         btn.setMinimumHeight(80)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 18px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                opacity: 0.9;
-            }}
-        """)
         btn.clicked.connect(lambda: self.zone_selected.emit(zone))
         return btn
 
@@ -197,6 +171,30 @@ class DashboardScreen(QWidget):
         self.stat_sterile.set_value(str(sterile))
         self.stat_ready.set_value(str(ready))
 
+    def set_maintenance_alerts(self, items: list):
+        while self.maintenance_list.count():
+            widget = self.maintenance_list.takeAt(0).widget()
+            if widget:
+                widget.deleteLater()
+
+        for item in items[:5]:
+            if item['overdue']:
+                text = f"{item['machine_name']} - {item['maintenance_type_name']}: SURESI GECTI"
+                tone = "danger"
+            else:
+                parts = []
+                if item['days_remaining'] is not None:
+                    parts.append(f"{item['days_remaining']} gun")
+                if item['cycles_remaining'] is not None:
+                    parts.append(f"{item['cycles_remaining']} cevrim")
+                text = f"{item['machine_name']} - {item['maintenance_type_name']}: {' / '.join(parts)} kaldi"
+                tone = "warning"
+
+            row = set_role(QLabel(text), "alert", tone)
+            self.maintenance_list.addWidget(row)
+
+        self.maintenance_frame.setVisible(bool(items))
+
     def showEvent(self, event):
         super().showEvent(event)
         self.update_user_info()
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.widgets.inputs import BarcodeInput, PinInput
 from app.ui.widgets.buttons import PrimaryButton, SecondaryButton
 
@@ -11,6 +11,7 @@ from app.ui.widgets.buttons import PrimaryButton, SecondaryButton
 class LoginScreen(QWidget):
 
     login_requested = Signal(str, str)
+    cancel_requested = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -18,37 +19,22 @@ class LoginScreen(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setStyleSheet(f"background-color: {Colors.BACKGROUND};")
+        set_role(self, "screen")
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
 
         card = QFrame()
         card.setFixedWidth(400)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 16px;
-                padding: 32px;
-            }}
-        """)
+        set_role(card, "login-card")
 
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(24)
 
-        title = QLabel("Sterilizasyon Takip Sistemi")
-        title.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 24px;
-            font-weight: bold;
-        """)
+        title = set_role(QLabel("Sterilizasyon Takip Sistemi"), "title")
         title.setAlignment(Qt.AlignCenter)
 
-        subtitle = QLabel("Giris yapmak icin kartinizi okutun")
-        subtitle.setStyleSheet(f"""
-            color: {Colors.TEXT_SECONDARY};
-            font-size: 14px;
-        """)
+        subtitle = set_role(QLabel("Giris yapmak icin kartinizi okutun"), "subtitle")
         subtitle.setAlignment(Qt.AlignCenter)
 
         self.barcode_input = BarcodeInput("Kart numarasi...")
@@ -59,15 +45,13 @@ class LoginScreen(QWidget):
         pin_layout = QVBoxLayout(self.pin_container)
         pin_layout.setSpacing(16)
 
-        pin_label = QLabel("PIN'inizi girin")
-        pin_label.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 14px;")
+        pin_label = set_role(QLabel("PIN'inizi girin"), "label")
         pin_label.setAlignment(Qt.AlignCenter)
 
         self.pin_input = PinInput(4)
         self.pin_input.pin_entered.connect(self._on_pin_entered)
 
-        self.user_label = QLabel("")
-        self.user_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 12px;")
+        self.user_label = set_role(QLabel(""), "caption")
         self.user_label.setAlignment(Qt.AlignCenter)
 
         login_btn = PrimaryButton("Giris")
@@ -83,19 +67,32 @@ class LoginScreen(QWidget):
         pin_layout.addWidget(login_btn)
         pin_layout.addWidget(back_btn)
 
-        self.error_label = QLabel("")
-        self.error_label.setStyleSheet(f"color: {Colors.DANGER}; font-size: 14px;")
+        self.error_label = set_role(QLabel(""), "error")
         self.error_label.setAlignment(Qt.AlignCenter)
         self.error_label.hide()
 
         card_layout.addWidget(title)
         card_layout.addWidget(subtitle)
         card_layout.addWidget(self.barcode_input)
+
+        self.cancel_btn = SecondaryButton("Vazgec")
+        self.cancel_btn.clicked.connect(self.cancel_requested.emit)
+        self.cancel_btn.hide()
+        card_layout.addWidget(self.cancel_btn)
         card_layout.addWidget(self.pin_container)
         card_layout.addWidget(self.error_label)
 
         layout.addWidget(card)
 
+    def set_switch_mode(self, active: bool, current_user: str = ""):
+        self.cancel_btn.setVisible(active)
+        if active:
+            self.user_label.setText(f"Aktif: {current_user}")
+
+    def handle_scan(self, code: str):
+        self.barcode_input.clear()
+        self._on_badge_scanned(code)
+
     def _on_badge_scanned(self, badge: str):
         self.badge_number = badge
         self.barcode_input.hide()
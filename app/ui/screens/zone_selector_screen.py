@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.widgets.buttons import PrimaryButton, SecondaryButton
 
 
@@ -17,18 +17,13 @@ class ZoneSelectorScreen(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setStyleSheet(f"background-color: {Colors.BACKGROUND};")
+        set_role(self, "screen")
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(32)
 
-        title = QLabel("Calisma Alani Secin")
-        title.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 32px;
-            font-weight: bold;
-        """)
+        title = set_role(QLabel("Calisma Alani Secin"), "display")
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -39,19 +34,19 @@ class ZoneSelectorScreen(QWidget):
             "Kirli Alan",
             "Kabul ve Yikama",
             "DIRTY",
-            Colors.DIRTY_ZONE
+            "dirty"
         )
         clean = self._create_zone_card(
             "Temiz Alan",
             "Kontrol ve Paketleme",
             "CLEAN",
-            Colors.CLEAN_ZONE
+            "clean"
         )
         sterile = self._create_zone_card(
             "Steril Alan",
             "Sterilizasyon ve Depolama",
             "STERILE",
-            Colors.STERILE_ZONE
+            "sterile"
         )
 
         zones_layout.addWidget(dirty)
@@ -65,37 +60,20 @@ class ZoneSelectorScreen(QWidget):
         back_btn.clicked.connect(self.back_requested.emit)
         layout.addWidget(back_btn, alignment=Qt.AlignCenter)
 
-    def _create_zone_card(self, title: str, desc: str, zone: str, color: str):
+    def _create_zone_card(self, title: str, desc: str, zone: str, tone: str):
         card = QFrame()
         card.setFixedSize(280, 320)
         card.setCursor(Qt.PointingHandCursor)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {color};
-                border-radius: 16px;
-            }}
-            QFrame:hover {{
-                border: 4px solid white;
-            }}
-        """)
+        set_role(card, "zone-card", tone)
 
         layout = QVBoxLayout(card)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(16)
 
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-        """)
+        title_label = set_role(QLabel(title), "zone-title", "large")
         title_label.setAlignment(Qt.AlignCenter)
 
-        desc_label = QLabel(desc)
-        desc_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.8);
-            font-size: 14px;
-        """)
+        desc_label = set_role(QLabel(desc), "zone-desc")
         desc_label.setAlignment(Qt.AlignCenter)
 
         layout.addWidget(title_label)
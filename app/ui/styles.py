@@ -1,295 +1,441 @@
-class Colors:
-    PRIMARY = "#2196F3"
-    PRIMARY_DARK = "#1976D2"
-    PRIMARY_LIGHT = "#BBDEFB"
+from string import Template
+from typing import Dict, Optional
 
-    SECONDARY = "#FF9800"
-    SECONDARY_DARK = "#F57C00"
 
-    SUCCESS = "#4CAF50"
-    SUCCESS_DARK = "#388E3C"
+THEMES: Dict[str, Dict[str, str]] = {
+    'dark': {
+        'PRIMARY': "#2196F3",
+        'PRIMARY_DARK': "#1976D2",
+        'PRIMARY_LIGHT': "#BBDEFB",
+        'SECONDARY': "#FF9800",
+        'SECONDARY_DARK': "#F57C00",
+        'SUCCESS': "#4CAF50",
+        'SUCCESS_DARK': "#388E3C",
+        'WARNING': "#FFC107",
+        'WARNING_DARK': "#FFA000",
+        'DANGER': "#F44336",
+        'DANGER_DARK': "#D32F2F",
+        'INFO': "#00BCD4",
+        'INFO_DARK': "#0097A7",
+        'DIRTY_ZONE': "#e74c3c",
+        'CLEAN_ZONE': "#f39c12",
+        'STERILE_ZONE': "#27ae60",
+        'BACKGROUND': "#1a1a2e",
+        'BACKGROUND_LIGHT': "#16213e",
+        'SURFACE': "#0f3460",
+        'SURFACE_LIGHT': "#1f4287",
+        'TEXT_PRIMARY': "#ffffff",
+        'TEXT_SECONDARY': "#b0b0b0",
+        'TEXT_DISABLED': "#666666",
+        'BORDER': "#333333",
+        'BORDER_LIGHT': "#444444",
+    },
+    'light': {
+        'PRIMARY': "#1976D2",
+        'PRIMARY_DARK': "#0D47A1",
+        'PRIMARY_LIGHT': "#BBDEFB",
+        'SECONDARY': "#EF6C00",
+        'SECONDARY_DARK': "#E65100",
+        'SUCCESS': "#2E7D32",
+        'SUCCESS_DARK': "#1B5E20",
+        'WARNING': "#F9A825",
+        'WARNING_DARK': "#F57F17",
+        'DANGER': "#C62828",
+        'DANGER_DARK': "#B71C1C",
+        'INFO': "#00838F",
+        'INFO_DARK': "#006064",
+        'DIRTY_ZONE': "#c0392b",
+        'CLEAN_ZONE': "#d68910",
+        'STERILE_ZONE': "#1e8449",
+        'BACKGROUND': "#eef1f5",
+        'BACKGROUND_LIGHT': "#e1e6ee",
+        'SURFACE': "#ffffff",
+        'SURFACE_LIGHT': "#f5f7fa",
+        'TEXT_PRIMARY': "#1a1a2e",
+        'TEXT_SECONDARY': "#5f6b7a",
+        'TEXT_DISABLED': "#a0a8b3",
+        'BORDER': "#cfd6df",
+        'BORDER_LIGHT': "#b8c2cf",
+    },
+}
 
-    WARNING = "#FFC107"
-    WARNING_DARK = "#FFA000"
+TONES = {
+    'primary': ('PRIMARY', 'PRIMARY_DARK'),
+    'secondary': ('SECONDARY', 'SECONDARY_DARK'),
+    'success': ('SUCCESS', 'SUCCESS_DARK'),
+    'warning': ('WARNING', 'WARNING_DARK'),
+    'danger': ('DANGER', 'DANGER_DARK'),
+    'info': ('INFO', 'INFO_DARK'),
+    'dirty': ('DIRTY_ZONE', 'DIRTY_ZONE'),
+    'clean': ('CLEAN_ZONE', 'CLEAN_ZONE'),
+    'sterile': ('STERILE_ZONE', 'STERILE_ZONE'),
+    'muted': ('TEXT_DISABLED', 'TEXT_DISABLED'),
+}
 
-    DANGER = "#F44336"
-    DANGER_DARK = "#D32F2F"
+ZONE_TONES = {'DIRTY': 'dirty', 'CLEAN': 'clean', 'STERILE': 'sterile'}
 
-    INFO = "#00BCD4"
-    INFO_DARK = "#0097A7"
 
-    DIRTY_ZONE = "#e74c3c"
-    CLEAN_ZONE = "#f39c12"
-    STERILE_ZONE = "#27ae60"
+class Colors:
+    pass
 
-    BACKGROUND = "#1a1a2e"
-    BACKGROUND_LIGHT = "#16213e"
-    SURFACE = "#0f3460"
-    SURFACE_LIGHT = "#1f4287"
 
-    TEXT_PRIMARY = "#ffffff"
-    TEXT_SECONDARY = "#b0b0b0"
-    TEXT_DISABLED = "#666666"
+for _name, _value in THEMES['dark'].items():
+    setattr(Colors, _name, _value)
 
-    BORDER = "#333333"
-    BORDER_LIGHT = "#444444"
 
+BASE_TEMPLATE = Template("""
+QMainWindow, QDialog, QWidget[role="screen"] {
+    background-color: $BACKGROUND;
+}
+QLabel {
+    color: $TEXT_PRIMARY;
+    background-color: transparent;
+}
+QScrollArea {
+    border: none;
+    background-color: transparent;
+}
 
-class Styles:
+QPushButton {
+    background-color: $PRIMARY;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: bold;
+}
+QPushButton:hover, QPushButton:pressed {
+    background-color: $PRIMARY_DARK;
+}
+QPushButton:disabled {
+    background-color: $TEXT_DISABLED;
+    color: $TEXT_SECONDARY;
+}
+QPushButton[tone="outline"] {
+    background-color: transparent;
+    color: $TEXT_PRIMARY;
+    border: 2px solid $BORDER_LIGHT;
+    font-weight: normal;
+}
+QPushButton[tone="outline"]:hover {
+    background-color: $SURFACE;
+    border-color: $PRIMARY;
+}
+QPushButton[role="icon-button"] {
+    background-color: transparent;
+    color: $TEXT_PRIMARY;
+    border-radius: 24px;
+    padding: 0px;
+    font-size: 18px;
+    font-weight: normal;
+}
+QPushButton[role="icon-button"]:hover {
+    background-color: $SURFACE;
+}
+QPushButton[role="header-button"] {
+    background-color: transparent;
+    color: white;
+    border: 2px solid rgba(255, 255, 255, 0.5);
+    padding: 8px 16px;
+    font-weight: normal;
+}
+QPushButton[role="header-button"]:hover {
+    background-color: rgba(255, 255, 255, 0.1);
+}
+QPushButton[role="zone-button"] {
+    color: white;
+    border-radius: 12px;
+    font-size: 18px;
+}
 
-    @staticmethod
-    def main_window() -> str:
-        return f"""
-            QMainWindow {{
-                background-color: {Colors.BACKGROUND};
-            }}
-        """
+QLineEdit {
+    background-color: $SURFACE;
+    color: $TEXT_PRIMARY;
+    border: 2px solid $BORDER;
+    border-radius: 6px;
+    padding: 12px 16px;
+    font-size: 16px;
+}
+QLineEdit:focus {
+    border-color: $PRIMARY;
+}
+QLineEdit:disabled {
+    background-color: $BACKGROUND_LIGHT;
+    color: $TEXT_DISABLED;
+}
+QLineEdit[role="pin-digit"] {
+    border-radius: 8px;
+    padding: 0px;
+    font-size: 24px;
+    font-weight: bold;
+}
+QLineEdit[role="search"] {
+    border-radius: 22px;
+    padding: 8px 20px;
+    font-size: 14px;
+}
 
-    @staticmethod
-    def container() -> str:
-        return f"""
-            QWidget {{
-                background-color: {Colors.BACKGROUND};
-                color: {Colors.TEXT_PRIMARY};
-            }}
-        """
+QComboBox {
+    background-color: $SURFACE;
+    color: $TEXT_PRIMARY;
+    border: 2px solid $BORDER;
+    border-radius: 6px;
+    padding: 12px 16px;
+    font-size: 14px;
+}
+QComboBox:focus {
+    border-color: $PRIMARY;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 30px;
+}
+QComboBox QAbstractItemView {
+    background-color: $SURFACE;
+    color: $TEXT_PRIMARY;
+    selection-background-color: $PRIMARY;
+}
 
-    @staticmethod
-    def card() -> str:
-        return f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """
+QTableWidget {
+    background-color: $SURFACE;
+    alternate-background-color: $SURFACE_LIGHT;
+    color: $TEXT_PRIMARY;
+    border: none;
+    border-radius: 8px;
+    gridline-color: $BORDER;
+}
+QTableWidget::item {
+    padding: 8px;
+}
+QTableWidget::item:selected {
+    background-color: $PRIMARY;
+}
+QHeaderView::section {
+    background-color: $BACKGROUND_LIGHT;
+    color: $TEXT_PRIMARY;
+    padding: 12px;
+    border: none;
+    font-weight: bold;
+}
 
-    @staticmethod
-    def button_primary() -> str:
-        return f"""
-            QPushButton {{
-                background-color: {Colors.PRIMARY};
-                color: {Colors.TEXT_PRIMARY};
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.PRIMARY_DARK};
-            }}
-            QPushButton:pressed {{
-                background-color: {Colors.PRIMARY_DARK};
-            }}
-            QPushButton:disabled {{
-                background-color: {Colors.TEXT_DISABLED};
-                color: {Colors.TEXT_SECONDARY};
-            }}
-        """
+QScrollBar:vertical {
+    background-color: $BACKGROUND;
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical {
+    background-color: $BORDER_LIGHT;
+    border-radius: 6px;
+    min-height: 30px;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
 
-    @staticmethod
-    def button_success() -> str:
-        return f"""
-            QPushButton {{
-                background-color: {Colors.SUCCESS};
-                color: {Colors.TEXT_PRIMARY};
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.SUCCESS_DARK};
-            }}
-        """
+QFrame[role="card"] {
+    background-color: $SURFACE;
+    border-radius: 8px;
+    padding: 16px;
+}
+QFrame[role="panel"] {
+    background-color: $SURFACE;
+    border-radius: 12px;
+    padding: 20px;
+}
+QFrame[role="panel"][tone="compact"] {
+    padding: 12px;
+}
+QFrame[role="login-card"] {
+    background-color: $SURFACE;
+    border-radius: 16px;
+    padding: 32px;
+}
+QFrame[role="plain"] {
+    background-color: transparent;
+}
+QFrame[role="stat-card"] {
+    background-color: $SURFACE;
+    border-radius: 12px;
+}
+QFrame[role="item-card"] {
+    background-color: $SURFACE;
+    border-radius: 8px;
+    border: 2px solid transparent;
+}
+QFrame[role="item-card"]:hover {
+    border-color: $PRIMARY;
+}
+QFrame[role="zone-card"] {
+    border-radius: 16px;
+}
+QFrame[role="zone-card"]:hover {
+    border: 4px solid white;
+}
 
-    @staticmethod
-    def button_danger() -> str:
-        return f"""
-            QPushButton {{
-                background-color: {Colors.DANGER};
-                color: {Colors.TEXT_PRIMARY};
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.DANGER_DARK};
-            }}
-        """
+QLabel[role="display"] {
+    font-size: 32px;
+    font-weight: bold;
+}
+QLabel[role="welcome"] {
+    font-size: 28px;
+    font-weight: bold;
+}
+QLabel[role="title"] {
+    font-size: 24px;
+    font-weight: bold;
+}
+QLabel[role="heading"] {
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel[role="section-title"] {
+    font-size: 16px;
+    font-weight: bold;
+}
+QLabel[role="body"] {
+    font-size: 16px;
+}
+QLabel[role="label"] {
+    font-size: 14px;
+}
+QLabel[role="subtitle"] {
+    color: $TEXT_SECONDARY;
+    font-size: 14px;
+}
+QLabel[role="subtitle"][tone="large"] {
+    font-size: 16px;
+}
+QLabel[role="caption"] {
+    color: $TEXT_SECONDARY;
+    font-size: 12px;
+}
+QLabel[role="value"] {
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel[role="error"] {
+    color: $DANGER;
+    font-size: 14px;
+}
+QLabel[role="alert"] {
+    font-size: 14px;
+    font-weight: bold;
+}
+QLabel[role="stat-value"] {
+    color: white;
+    font-size: 32px;
+    font-weight: bold;
+}
+QLabel[role="stat-title"] {
+    color: rgba(255, 255, 255, 0.8);
+    font-size: 14px;
+}
+QLabel[role="stat-icon"] {
+    color: rgba(255, 255, 255, 0.5);
+    font-size: 40px;
+}
+QLabel[role="zone-title"] {
+    color: white;
+    font-size: 22px;
+    font-weight: bold;
+}
+QLabel[role="zone-title"][tone="large"] {
+    font-size: 24px;
+}
+QLabel[role="zone-desc"] {
+    color: rgba(255, 255, 255, 0.8);
+    font-size: 14px;
+}
+QLabel[role="badge"] {
+    color: white;
+    border-radius: 4px;
+    padding: 4px 12px;
+    font-size: 11px;
+    font-weight: bold;
+}
+QLabel[role="count-badge"] {
+    color: white;
+    border-radius: 10px;
+    padding: 2px 8px;
+    font-size: 12px;
+    font-weight: bold;
+    min-width: 20px;
+}
+QLabel[role="dialog-icon"] {
+    color: white;
+    font-size: 24px;
+    font-weight: bold;
+    padding: 12px;
+    border-radius: 25px;
+}
+""")
 
-    @staticmethod
-    def button_secondary() -> str:
-        return f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.TEXT_PRIMARY};
-                border: 2px solid {Colors.BORDER_LIGHT};
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.SURFACE};
-                border-color: {Colors.PRIMARY};
-            }}
-        """
+TONE_TEMPLATE = Template("""
+QPushButton[tone="$tone"] { background-color: $base; }
+QPushButton[tone="$tone"]:hover { background-color: $dark; }
+QFrame[role="stat-card"][tone="$tone"],
+QFrame[role="zone-card"][tone="$tone"],
+QFrame[role="zone-header"][tone="$tone"],
+QLabel[role="badge"][tone="$tone"],
+QLabel[role="count-badge"][tone="$tone"],
+QLabel[role="dialog-icon"][tone="$tone"] { background-color: $base; }
+QLabel[role="alert"][tone="$tone"] { color: $base; }
+""")
 
-    @staticmethod
-    def input_field() -> str:
-        return f"""
-            QLineEdit {{
-                background-color: {Colors.SURFACE};
-                color: {Colors.TEXT_PRIMARY};
-                border: 2px solid {Colors.BORDER};
-                border-radius: 6px;
-                padding: 12px 16px;
-                font-size: 16px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.PRIMARY};
-            }}
-            QLineEdit:disabled {{
-                background-color: {Colors.BACKGROUND_LIGHT};
-                color: {Colors.TEXT_DISABLED};
-            }}
-        """
 
-    @staticmethod
-    def label() -> str:
-        return f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 14px;
-            }}
-        """
+class Styles:
 
-    @staticmethod
-    def label_title() -> str:
-        return f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 24px;
-                font-weight: bold;
-            }}
-        """
+    _compiled: Dict[str, str] = {}
+    current = 'dark'
 
-    @staticmethod
-    def label_subtitle() -> str:
-        return f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: 16px;
-            }}
-        """
+    @classmethod
+    def compile(cls, name: str) -> str:
+        sheet = cls._compiled.get(name)
+        if sheet is None:
+            palette = THEMES.get(name, THEMES['dark'])
+            parts = [BASE_TEMPLATE.substitute(palette)]
+            for tone, (base, dark) in TONES.items():
+                parts.append(TONE_TEMPLATE.substitute(tone=tone, base=palette[base], dark=palette[dark]))
+            sheet = "\n".join(parts)
+            cls._compiled[name] = sheet
+        return sheet
 
-    @staticmethod
-    def table() -> str:
-        return f"""
-            QTableWidget {{
-                background-color: {Colors.SURFACE};
-                color: {Colors.TEXT_PRIMARY};
-                border: none;
-                border-radius: 8px;
-                gridline-color: {Colors.BORDER};
-            }}
-            QTableWidget::item {{
-                padding: 8px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: {Colors.PRIMARY};
-            }}
-            QHeaderView::section {{
-                background-color: {Colors.BACKGROUND_LIGHT};
-                color: {Colors.TEXT_PRIMARY};
-                padding: 12px;
-                border: none;
-                font-weight: bold;
-            }}
-        """
+    @classmethod
+    def apply(cls, name: str = None, app=None):
+        from PySide6.QtWidgets import QApplication
 
-    @staticmethod
-    def scrollbar() -> str:
-        return f"""
-            QScrollBar:vertical {{
-                background-color: {Colors.BACKGROUND};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {Colors.BORDER_LIGHT};
-                border-radius: 6px;
-                min-height: 30px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """
+        name = name if name in THEMES else 'dark'
+        for key, value in THEMES[name].items():
+            setattr(Colors, key, value)
+        cls.current = name
+        app = app or QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(cls.compile(name))
 
     @staticmethod
-    def combo_box() -> str:
-        return f"""
-            QComboBox {{
-                background-color: {Colors.SURFACE};
-                color: {Colors.TEXT_PRIMARY};
-                border: 2px solid {Colors.BORDER};
-                border-radius: 6px;
-                padding: 12px 16px;
-                font-size: 14px;
-            }}
-            QComboBox:focus {{
-                border-color: {Colors.PRIMARY};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 30px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {Colors.SURFACE};
-                color: {Colors.TEXT_PRIMARY};
-                selection-background-color: {Colors.PRIMARY};
-            }}
-        """
+    def tone_for_status(status: str) -> str:
+        if status in ['RELEASED', 'COMPLETED', 'PASS']:
+            return 'success'
+        if status in ['REJECTED', 'FAIL', 'ERROR']:
+            return 'danger'
+        if status and 'PENDING' in status:
+            return 'warning'
+        return 'info'
 
     @staticmethod
-    def zone_badge(zone: str) -> str:
-        colors = {
-            'DIRTY': Colors.DIRTY_ZONE,
-            'CLEAN': Colors.CLEAN_ZONE,
-            'STERILE': Colors.STERILE_ZONE
-        }
-        bg_color = colors.get(zone, Colors.SURFACE)
-        return f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: white;
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-weight: bold;
-            }}
-        """
+    def tone_for_zone(zone: str) -> str:
+        return ZONE_TONES.get(zone, 'primary')
 
-    @staticmethod
-    def status_badge(status: str) -> str:
-        if status in ['RELEASED', 'COMPLETED', 'PASS']:
-            bg = Colors.SUCCESS
-        elif status in ['REJECTED', 'FAIL', 'ERROR']:
-            bg = Colors.DANGER
-        elif status in ['PENDING', 'PENDING_RELEASE', 'PENDING_CI', 'PENDING_BI']:
-            bg = Colors.WARNING
-        else:
-            bg = Colors.INFO
 
-        return f"""
-            QLabel {{
-                background-color: {bg};
-                color: white;
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-weight: bold;
-            }}
-        """
+def set_role(widget, role: str, tone: Optional[str] = None):
+    from PySide6.QtCore import Qt
+
+    widget.setProperty("role", role)
+    if tone is not None:
+        widget.setProperty("tone", tone)
+    if widget.testAttribute(Qt.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    return widget
@@ -1,15 +1,24 @@
-from .buttons import PrimaryButton, SecondaryButton, DangerButton, IconButton
-from .inputs import BarcodeInput, PinInput, SearchInput
-from .cards import InfoCard, StatCard, ItemCard
-from .dialogs import ConfirmDialog, PinDialog, MessageDialog
-from .tables import DataTable
-from .badges import StatusBadge, ZoneBadge
+from app.utils.lazy import lazy_exports
 
-__all__ = [
-    'PrimaryButton', 'SecondaryButton', 'DangerButton', 'IconButton',
-    'BarcodeInput', 'PinInput', 'SearchInput',
-    'InfoCard', 'StatCard', 'ItemCard',
-    'ConfirmDialog', 'PinDialog', 'MessageDialog',
-    'DataTable',
-    'StatusBadge', 'ZoneBadge'
-]
+_EXPORTS = {
+    'PrimaryButton': '.buttons',
+    'SecondaryButton': '.buttons',
+    'DangerButton': '.buttons',
+    'IconButton': '.buttons',
+    'BarcodeInput': '.inputs',
+    'PinInput': '.inputs',
+    'SearchInput': '.inputs',
+    'InfoCard': '.cards',
+    'StatCard': '.cards',
+    'ItemCard': '.cards',
+    'ConfirmDialog': '.dialogs',
+    'PinDialog': '.dialogs',
+    'MessageDialog': '.dialogs',
+    'DataTable': '.tables',
+    'StatusBadge': '.badges',
+    'ZoneBadge': '.badges'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import QLabel
 from PySide6.QtCore import Qt
 
-from app.ui.styles import Styles, Colors
+from app.ui.styles import Styles, set_role
 from app.utils.formatting import Formatter
 
 
@@ -14,7 +14,7 @@ class StatusBadge(QLabel):
     def set_status(self, status: str):
         self.status = status
         self.setText(Formatter.status_text(status))
-        self.setStyleSheet(Styles.status_badge(status))
+        set_role(self, "badge", Styles.tone_for_status(status))
         self.setAlignment(Qt.AlignCenter)
 
 
@@ -27,7 +27,7 @@ class ZoneBadge(QLabel):
     def set_zone(self, zone: str):
         self.zone = zone
         self.setText(Formatter.zone_text(zone))
-        self.setStyleSheet(Styles.zone_badge(zone))
+        set_role(self, "badge", Styles.tone_for_zone(zone))
         self.setAlignment(Qt.AlignCenter)
 
 
@@ -41,29 +41,20 @@ class PriorityBadge(QLabel):
         self.priority = priority
 
         if priority >= 3:
-            bg = Colors.DANGER
+            tone = "danger"
             text = "ACIL"
         elif priority == 2:
-            bg = Colors.WARNING
+            tone = "warning"
             text = "YUKSEK"
         elif priority == 1:
-            bg = Colors.INFO
+            tone = "info"
             text = "NORMAL"
         else:
-            bg = Colors.TEXT_DISABLED
+            tone = "muted"
             text = "DUSUK"
 
         self.setText(text)
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg};
-                color: white;
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-        """)
+        set_role(self, "badge", tone)
         self.setAlignment(Qt.AlignCenter)
 
 
@@ -79,20 +70,10 @@ class CountBadge(QLabel):
 
         if count > 0:
             self.show()
-            bg = Colors.DANGER if count > 10 else Colors.PRIMARY
+            tone = "danger" if count > 10 else "primary"
         else:
             self.hide()
-            bg = Colors.PRIMARY
-
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg};
-                color: white;
-                border-radius: 10px;
-                padding: 2px 8px;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 20px;
-            }}
-        """)
+            tone = "primary"
+
+        set_role(self, "count-badge", tone)
         self.setAlignment(Qt.AlignCenter)
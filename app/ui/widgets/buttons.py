@@ -1,14 +1,14 @@
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtCore import Qt, QSize
 
-from app.ui.styles import Styles, Colors
+from app.ui.styles import Styles, set_role
 
 
 class PrimaryButton(QPushButton):
 
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(Styles.button_primary())
+        set_role(self, "button", "primary")
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(48)
 
@@ -17,7 +17,7 @@ class SecondaryButton(QPushButton):
 
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(Styles.button_secondary())
+        set_role(self, "button", "outline")
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(48)
 
@@ -26,7 +26,7 @@ class DangerButton(QPushButton):
 
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(Styles.button_danger())
+        set_role(self, "button", "danger")
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(48)
 
@@ -35,7 +35,7 @@ class SuccessButton(QPushButton):
 
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(Styles.button_success())
+        set_role(self, "button", "success")
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(48)
 
@@ -46,18 +46,7 @@ class IconButton(QPushButton):
         super().__init__(icon_text, parent)
         self.setFixedSize(QSize(48, 48))
         self.setCursor(Qt.PointingHandCursor)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.TEXT_PRIMARY};
-                border: none;
-                border-radius: 24px;
-                font-size: 18px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.SURFACE};
-            }}
-        """)
+        set_role(self, "icon-button")
 
 
 class ZoneButton(QPushButton):
@@ -67,26 +56,4 @@ class ZoneButton(QPushButton):
         self.zone = zone
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(60)
-
-        colors = {
-            'DIRTY': Colors.DIRTY_ZONE,
-            'CLEAN': Colors.CLEAN_ZONE,
-            'STERILE': Colors.STERILE_ZONE
-        }
-        bg_color = colors.get(zone, Colors.SURFACE)
-
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 16px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {bg_color};
-                opacity: 0.9;
-            }}
-        """)
+        set_role(self, "zone-button", Styles.tone_for_zone(zone))
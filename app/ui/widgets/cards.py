@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import Styles, set_role
 
 
 class InfoCard(QFrame):
@@ -13,29 +13,13 @@ class InfoCard(QFrame):
         self._setup_ui(title, value)
 
     def _setup_ui(self, title: str, value: str):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        set_role(self, "card")
 
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
 
-        self.title_label = QLabel(title)
-        self.title_label.setStyleSheet(f"""
-            color: {Colors.TEXT_SECONDARY};
-            font-size: 12px;
-        """)
-
-        self.value_label = QLabel(value)
-        self.value_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 18px;
-            font-weight: bold;
-        """)
+        self.title_label = set_role(QLabel(title), "caption")
+        self.value_label = set_role(QLabel(value), "value")
 
         layout.addWidget(self.title_label)
         layout.addWidget(self.value_label)
@@ -47,19 +31,12 @@ class InfoCard(QFrame):
 class StatCard(QFrame):
 
     def __init__(self, title: str, value: str, icon: str = "",
-                color: str = None, parent=None):
+                tone: str = None, parent=None):
         super().__init__(parent)
-        self._setup_ui(title, value, icon, color)
-
-    def _setup_ui(self, title: str, value: str, icon: str, color: str):
-        bg_color = color or Colors.SURFACE
+        self._setup_ui(title, value, icon, tone)
 
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg_color};
-                border-radius: 12px;
-            }}
-        """)
+    def _setup_ui(self, title: str, value: str, icon: str, tone: str):
+        set_role(self, "stat-card", tone or "")
         self.setMinimumHeight(100)
 
         layout = QHBoxLayout(self)
@@ -68,18 +45,8 @@ class StatCard(QFrame):
         left = QVBoxLayout()
         left.setSpacing(4)
 
-        self.value_label = QLabel(value)
-        self.value_label.setStyleSheet(f"""
-            color: white;
-            font-size: 32px;
-            font-weight: bold;
-        """)
-
-        self.title_label = QLabel(title)
-        self.title_label.setStyleSheet(f"""
-            color: rgba(255, 255, 255, 0.8);
-            font-size: 14px;
-        """)
+        self.value_label = set_role(QLabel(value), "stat-value")
+        self.title_label = set_role(QLabel(title), "stat-title")
 
         left.addWidget(self.value_label)
         left.addWidget(self.title_label)
@@ -88,11 +55,7 @@ class StatCard(QFrame):
         layout.addStretch()
 
         if icon:
-            icon_label = QLabel(icon)
-            icon_label.setStyleSheet(f"""
-                color: rgba(255, 255, 255, 0.5);
-                font-size: 40px;
-            """)
+            icon_label = set_role(QLabel(icon), "stat-icon")
             layout.addWidget(icon_label)
 
     def set_value(self, value: str):
@@ -109,16 +72,7 @@ class ItemCard(QFrame):
         self._setup_ui(title, subtitle, status)
 
     def _setup_ui(self, title: str, subtitle: str, status: str):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                border: 2px solid transparent;
-            }}
-            QFrame:hover {{
-                border-color: {Colors.PRIMARY};
-            }}
-        """)
+        set_role(self, "item-card")
         self.setCursor(Qt.PointingHandCursor)
 
         layout = QHBoxLayout(self)
@@ -127,18 +81,8 @@ class ItemCard(QFrame):
         left = QVBoxLayout()
         left.setSpacing(4)
 
-        self.title_label = QLabel(title)
-        self.title_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 16px;
-            font-weight: bold;
-        """)
-
-        self.subtitle_label = QLabel(subtitle)
-        self.subtitle_label.setStyleSheet(f"""
-            color: {Colors.TEXT_SECONDARY};
-            font-size: 12px;
-        """)
+        self.title_label = set_role(QLabel(title), "section-title")
+        self.subtitle_label = set_role(QLabel(subtitle), "caption")
 
         left.addWidget(self.title_label)
         if subtitle:
@@ -153,23 +97,7 @@ class ItemCard(QFrame):
             layout.addWidget(self.status_label)
 
     def _set_status_style(self, status: str):
-        if status in ['RELEASED', 'COMPLETED', 'PASS']:
-            bg = Colors.SUCCESS
-        elif status in ['REJECTED', 'FAIL', 'ERROR']:
-            bg = Colors.DANGER
-        elif 'PENDING' in status:
-            bg = Colors.WARNING
-        else:
-            bg = Colors.INFO
-
-        self.status_label.setStyleSheet(f"""
-            background-color: {bg};
-            color: white;
-            border-radius: 4px;
-            padding: 4px 12px;
-            font-size: 11px;
-            font-weight: bold;
-        """)
+        set_role(self.status_label, "badge", Styles.tone_for_status(status))
 
     def mousePressEvent(self, event):
         self.clicked.emit()
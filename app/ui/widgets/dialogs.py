@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Styles, Colors
+from app.ui.styles import set_role
 from app.ui.widgets.inputs import PinInput
 from app.ui.widgets.buttons import PrimaryButton, SecondaryButton, DangerButton
 
@@ -14,12 +14,6 @@ class BaseDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setModal(True)
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {Colors.BACKGROUND};
-            }}
-        """)
-
         self.setMinimumWidth(400)
 
 
@@ -35,10 +29,7 @@ class ConfirmDialog(BaseDialog):
         layout.setContentsMargins(24, 24, 24, 24)
 
         msg_label = QLabel(message)
-        msg_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 16px;
-        """)
+        set_role(msg_label, "body")
         msg_label.setWordWrap(True)
         layout.addWidget(msg_label)
 
@@ -69,22 +60,12 @@ class DangerConfirmDialog(BaseDialog):
         layout.setContentsMargins(24, 24, 24, 24)
 
         warning = QLabel("!")
-        warning.setStyleSheet(f"""
-            background-color: {Colors.DANGER};
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-            padding: 16px;
-            border-radius: 50%;
-        """)
+        set_role(warning, "dialog-icon", "danger")
         warning.setFixedSize(60, 60)
         warning.setAlignment(Qt.AlignCenter)
 
         msg_label = QLabel(message)
-        msg_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 16px;
-        """)
+        set_role(msg_label, "body")
         msg_label.setWordWrap(True)
         msg_label.setAlignment(Qt.AlignCenter)
 
@@ -119,10 +100,7 @@ class PinDialog(BaseDialog):
         layout.setContentsMargins(24, 24, 24, 24)
 
         msg_label = QLabel("Islemi onaylamak icin PIN'inizi girin")
-        msg_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 16px;
-        """)
+        set_role(msg_label, "body")
         msg_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(msg_label)
 
@@ -131,10 +109,7 @@ class PinDialog(BaseDialog):
         layout.addWidget(self.pin_input)
 
         self.error_label = QLabel("")
-        self.error_label.setStyleSheet(f"""
-            color: {Colors.DANGER};
-            font-size: 14px;
-        """)
+        set_role(self.error_label, "error")
         self.error_label.setAlignment(Qt.AlignCenter)
         self.error_label.hide()
         layout.addWidget(self.error_label)
@@ -171,32 +146,21 @@ class MessageDialog(BaseDialog):
         layout.setContentsMargins(24, 24, 24, 24)
 
         icons = {
-            'success': ('✓', Colors.SUCCESS),
-            'error': ('✗', Colors.DANGER),
-            'warning': ('!', Colors.WARNING),
-            'info': ('i', Colors.INFO)
+            'success': ('✓', 'success'),
+            'error': ('✗', 'danger'),
+            'warning': ('!', 'warning'),
+            'info': ('i', 'info')
         }
 
-        icon_text, icon_color = icons.get(message_type, ('i', Colors.INFO))
-
-        icon_label = QLabel(icon_text)
-        icon_label.setStyleSheet(f"""
-            background-color: {icon_color};
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-            padding: 12px;
-            border-radius: 25px;
-        """)
+        icon_text, icon_tone = icons.get(message_type, ('i', 'info'))
+
+        icon_label = set_role(QLabel(icon_text), "dialog-icon", icon_tone)
         icon_label.setFixedSize(50, 50)
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label, alignment=Qt.AlignCenter)
 
         msg_label = QLabel(message)
-        msg_label.setStyleSheet(f"""
-            color: {Colors.TEXT_PRIMARY};
-            font-size: 16px;
-        """)
+        set_role(msg_label, "body")
         msg_label.setWordWrap(True)
         msg_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(msg_label)
@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import QLineEdit, QHBoxLayout, QWidget, QLabel
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Styles, Colors
+from app.ui.styles import set_role
 
 
 class BarcodeInput(QLineEdit):
@@ -11,7 +11,7 @@ class BarcodeInput(QLineEdit):
     def __init__(self, placeholder: str = "Barkod okutun...", parent=None):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
-        self.setStyleSheet(Styles.input_field())
+        set_role(self, "input")
         self.setMinimumHeight(56)
         self.setAlignment(Qt.AlignCenter)
 
@@ -51,19 +51,7 @@ class PinInput(QWidget):
             digit.setFixedSize(56, 64)
             digit.setAlignment(Qt.AlignCenter)
             digit.setEchoMode(QLineEdit.Password)
-            digit.setStyleSheet(f"""
-                QLineEdit {{
-                    background-color: {Colors.SURFACE};
-                    color: {Colors.TEXT_PRIMARY};
-                    border: 2px solid {Colors.BORDER};
-                    border-radius: 8px;
-                    font-size: 24px;
-                    font-weight: bold;
-                }}
-                QLineEdit:focus {{
-                    border-color: {Colors.PRIMARY};
-                }}
-            """)
+            set_role(digit, "pin-digit")
 
             digit.textChanged.connect(lambda text, idx=i: self._on_digit_changed(idx, text))
             self.digits.append(digit)
@@ -95,19 +83,7 @@ class SearchInput(QLineEdit):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
         self.setMinimumHeight(44)
-        self.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {Colors.SURFACE};
-                color: {Colors.TEXT_PRIMARY};
-                border: 2px solid {Colors.BORDER};
-                border-radius: 22px;
-                padding: 8px 20px;
-                font-size: 14px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.PRIMARY};
-            }}
-        """)
+        set_role(self, "search")
 
 
 class NumericInput(QLineEdit):
@@ -115,7 +91,7 @@ class NumericInput(QLineEdit):
     def __init__(self, placeholder: str = "", parent=None):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
-        self.setStyleSheet(Styles.input_field())
+        set_role(self, "input")
         self.setAlignment(Qt.AlignRight)
 
     def keyPressEvent(self, event):
@@ -4,7 +4,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Styles, Colors
+from app.core.rows import as_dict
+from app.core.tracing import traced
 
 
 class DataTable(QTableWidget):
@@ -19,7 +20,6 @@ class DataTable(QTableWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setStyleSheet(Styles.table())
         self.setColumnCount(len(self.columns))
 
         headers = [col.get('title', '') for col in self.columns]
@@ -42,6 +42,7 @@ class DataTable(QTableWidget):
         self.cellClicked.connect(self._on_cell_clicked)
         self.cellDoubleClicked.connect(self._on_cell_double_clicked)
 
+    @traced("DataTable.set_data")
     def set_data(self, data: List[Dict[str, Any]]):
         self.data = data
         self.setRowCount(len(data))
@@ -67,16 +68,16 @@ class DataTable(QTableWidget):
     def get_selected_data(self) -> Dict[str, Any]:
         row = self.currentRow()
         if 0 <= row < len(self.data):
-            return self.data[row]
+            return as_dict(self.data[row])
         return {}
 
     def _on_cell_clicked(self, row: int, col: int):
         if 0 <= row < len(self.data):
-            self.row_clicked.emit(row, self.data[row])
+            self.row_clicked.emit(row, as_dict(self.data[row]))
 
     def _on_cell_double_clicked(self, row: int, col: int):
         if 0 <= row < len(self.data):
-            self.row_double_clicked.emit(row, self.data[row])
+            self.row_double_clicked.emit(row, as_dict(self.data[row]))
 
     def clear_data(self):
         self.data = []
@@ -104,7 +105,6 @@ class SimpleTable(QTableWidget):
         self._setup_ui(headers)
 
     def _setup_ui(self, headers: List[str]):
-        self.setStyleSheet(Styles.table())
         self.setColumnCount(len(headers))
         self.setHorizontalHeaderLabels(headers)
 
@@ -1,5 +1,11 @@
-from .dirty_zone_screen import DirtyZoneScreen
-from .clean_zone_screen import CleanZoneScreen
-from .sterile_zone_screen import SterileZoneScreen
+from app.utils.lazy import lazy_exports
 
-__all__ = ['DirtyZoneScreen', 'CleanZoneScreen', 'SterileZoneScreen']
+_EXPORTS = {
+    'DirtyZoneScreen': '.dirty_zone_screen',
+    'CleanZoneScreen': '.clean_zone_screen',
+    'SterileZoneScreen': '.sterile_zone_screen'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.widgets.buttons import PrimaryButton, SecondaryButton
 from app.ui.widgets.inputs import BarcodeInput
 
@@ -14,14 +14,14 @@ class BaseZoneScreen(QWidget):
     back_requested = Signal()
     barcode_scanned = Signal(str)
 
-    def __init__(self, zone_name: str, zone_color: str, parent=None):
+    def __init__(self, zone_name: str, zone_tone: str, parent=None):
         super().__init__(parent)
         self.zone_name = zone_name
-        self.zone_color = zone_color
+        self.zone_tone = zone_tone
         self._setup_base_ui()
 
     def _setup_base_ui(self):
-        self.setStyleSheet(f"background-color: {Colors.BACKGROUND};")
+        set_role(self, "screen")
 
         layout = QVBoxLayout(self)
         layout.setSpacing(0)
@@ -46,44 +46,21 @@ class BaseZoneScreen(QWidget):
         scroll = QScrollArea()
         scroll.setWidget(content)
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
 
         layout.addWidget(scroll)
 
     def _create_header(self):
-        header = QFrame()
+        header = set_role(QFrame(), "zone-header", self.zone_tone)
         header.setFixedHeight(70)
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.zone_color};
-            }}
-        """)
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(24, 0, 24, 0)
 
-        back_btn = SecondaryButton("< Geri")
+        back_btn = set_role(SecondaryButton("< Geri"), "header-button")
         back_btn.setFixedWidth(100)
-        back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: white;
-                border: 2px solid rgba(255,255,255,0.5);
-                border-radius: 6px;
-                padding: 8px 16px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255,255,255,0.1);
-            }}
-        """)
         back_btn.clicked.connect(self.back_requested.emit)
 
-        title = QLabel(self.zone_name)
-        title.setStyleSheet("""
-            color: white;
-            font-size: 22px;
-            font-weight: bold;
-        """)
+        title = set_role(QLabel(self.zone_name), "zone-title")
 
         layout.addWidget(back_btn)
         layout.addStretch()
@@ -94,24 +71,24 @@ class BaseZoneScreen(QWidget):
         return header
 
     def _create_barcode_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QHBoxLayout(frame)
 
         self.barcode_input = BarcodeInput("Barkod okutun...")
         self.barcode_input.barcode_scanned.connect(self.barcode_scanned.emit)
 
+        self.scan_status = set_role(QLabel(""), "caption")
+
         layout.addWidget(self.barcode_input)
+        layout.addWidget(self.scan_status)
 
         return frame
 
+    def show_scan_result(self, message: str, ok: bool):
+        set_role(self.scan_status, "alert", "success" if ok else "danger")
+        self.scan_status.setText(message)
+
     def add_section(self, widget: QWidget):
         self.main_layout.addWidget(widget)
 
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.zones.base_zone_screen import BaseZoneScreen
 from app.ui.widgets.cards import StatCard
 from app.ui.widgets.buttons import PrimaryButton, DangerButton
@@ -20,7 +20,7 @@ class CleanZoneScreen(BaseZoneScreen):
     complete_packaging = Signal(int, str)
 
     def __init__(self, parent=None):
-        super().__init__("Temiz Alan", Colors.CLEAN_ZONE, parent)
+        super().__init__("Temiz Alan", "clean", parent)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -34,16 +34,15 @@ class CleanZoneScreen(BaseZoneScreen):
         self.add_section(packaging_section)
 
     def _create_stats(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"background-color: transparent;")
+        frame = set_role(QFrame(), "plain")
 
         layout = QHBoxLayout(frame)
         layout.setSpacing(16)
 
-        self.stat_inspect = StatCard("Kontrol", "0", "", Colors.INFO)
-        self.stat_packaging = StatCard("Paketleme", "0", "", Colors.WARNING)
-        self.stat_ready = StatCard("Hazir", "0", "", Colors.SUCCESS)
-        self.stat_failed = StatCard("Basarisiz", "0", "", Colors.DANGER)
+        self.stat_inspect = StatCard("Kontrol", "0", "", "info")
+        self.stat_packaging = StatCard("Paketleme", "0", "", "warning")
+        self.stat_ready = StatCard("Hazir", "0", "", "success")
+        self.stat_failed = StatCard("Basarisiz", "0", "", "danger")
 
         layout.addWidget(self.stat_inspect)
         layout.addWidget(self.stat_packaging)
@@ -53,20 +52,12 @@ class CleanZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_inspection_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Kontrol Bekleyen")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Kontrol Bekleyen"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
@@ -98,20 +89,12 @@ class CleanZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_packaging_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Paketleme Bekleyen")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Paketleme Bekleyen"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.zones.base_zone_screen import BaseZoneScreen
 from app.ui.widgets.cards import StatCard, ItemCard
 from app.ui.widgets.buttons import PrimaryButton
@@ -18,7 +18,7 @@ class DirtyZoneScreen(BaseZoneScreen):
     complete_washing = Signal(int)
 
     def __init__(self, parent=None):
-        super().__init__("Kirli Alan", Colors.DIRTY_ZONE, parent)
+        super().__init__("Kirli Alan", "dirty", parent)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -35,15 +35,14 @@ class DirtyZoneScreen(BaseZoneScreen):
         self.add_section(washing_section)
 
     def _create_stats(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"background-color: transparent;")
+        frame = set_role(QFrame(), "plain")
 
         layout = QHBoxLayout(frame)
         layout.setSpacing(16)
 
-        self.stat_pending = StatCard("Bekleyen", "0", "", Colors.WARNING)
-        self.stat_washing = StatCard("Yikamada", "0", "", Colors.INFO)
-        self.stat_washed = StatCard("Yikandi", "0", "", Colors.SUCCESS)
+        self.stat_pending = StatCard("Bekleyen", "0", "", "warning")
+        self.stat_washing = StatCard("Yikamada", "0", "", "info")
+        self.stat_washed = StatCard("Yikandi", "0", "", "success")
 
         layout.addWidget(self.stat_pending)
         layout.addWidget(self.stat_washing)
@@ -52,14 +51,7 @@ class DirtyZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_actions(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QHBoxLayout(frame)
 
@@ -72,20 +64,12 @@ class DirtyZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_pending_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Bekleyen Urunler")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Bekleyen Urunler"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
@@ -106,20 +90,12 @@ class DirtyZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_washing_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Yikamada")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Yikamada"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
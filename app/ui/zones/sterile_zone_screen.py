@@ -3,10 +3,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
-from app.ui.styles import Colors
+from app.ui.styles import set_role
 from app.ui.zones.base_zone_screen import BaseZoneScreen
 from app.ui.widgets.cards import StatCard
-from app.ui.widgets.buttons import PrimaryButton, DangerButton
+from app.ui.widgets.buttons import PrimaryButton, DangerButton, SuccessButton
 from app.ui.widgets.tables import DataTable
 from app.utils.formatting import Formatter
 
@@ -21,7 +21,7 @@ class SterileZoneScreen(BaseZoneScreen):
     store_item = Signal(int, str)
 
     def __init__(self, parent=None):
-        super().__init__("Steril Alan", Colors.STERILE_ZONE, parent)
+        super().__init__("Steril Alan", "sterile", parent)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -38,17 +38,16 @@ class SterileZoneScreen(BaseZoneScreen):
         self.add_section(released_section)
 
     def _create_stats(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"background-color: transparent;")
+        frame = set_role(QFrame(), "plain")
 
         layout = QHBoxLayout(frame)
         layout.setSpacing(16)
 
-        self.stat_sterilizing = StatCard("Sterilizasyonda", "0", "", Colors.INFO)
-        self.stat_pending_ci = StatCard("CI Bekliyor", "0", "", Colors.WARNING)
-        self.stat_pending_bi = StatCard("BI Bekliyor", "0", "", Colors.WARNING)
-        self.stat_pending_release = StatCard("Onay Bekliyor", "0", "", Colors.SECONDARY)
-        self.stat_released = StatCard("Onaylandi", "0", "", Colors.SUCCESS)
+        self.stat_sterilizing = StatCard("Sterilizasyonda", "0", "", "info")
+        self.stat_pending_ci = StatCard("CI Bekliyor", "0", "", "warning")
+        self.stat_pending_bi = StatCard("BI Bekliyor", "0", "", "warning")
+        self.stat_pending_release = StatCard("Onay Bekliyor", "0", "", "secondary")
+        self.stat_released = StatCard("Onaylandi", "0", "", "success")
 
         layout.addWidget(self.stat_sterilizing)
         layout.addWidget(self.stat_pending_ci)
@@ -59,20 +58,12 @@ class SterileZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_sterilizing_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Sterilizasyonda")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Sterilizasyonda"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
@@ -92,20 +83,12 @@ class SterileZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_pending_release_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Onay Bekleyen")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Onay Bekleyen"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
@@ -132,20 +115,7 @@ class SterileZoneScreen(BaseZoneScreen):
         bi_btn = PrimaryButton("BI Oku")
         bi_btn.clicked.connect(self._on_check_bi)
 
-        release_btn = PrimaryButton("Onayla")
-        release_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.SUCCESS};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.SUCCESS_DARK};
-            }}
-        """)
+        release_btn = SuccessButton("Onayla")
         release_btn.clicked.connect(self._on_release)
 
         reject_btn = DangerButton("Reddet")
@@ -161,20 +131,12 @@ class SterileZoneScreen(BaseZoneScreen):
         return frame
 
     def _create_released_section(self):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-radius: 8px;
-                padding: 16px;
-            }}
-        """)
+        frame = set_role(QFrame(), "card")
 
         layout = QVBoxLayout(frame)
 
         header = QHBoxLayout()
-        title = QLabel("Onaylananlar")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 16px; font-weight: bold;")
+        title = set_role(QLabel("Onaylananlar"), "section-title")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
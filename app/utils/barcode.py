@@ -1,8 +1,11 @@
 import uuid
 import re
+import hashlib
 from datetime import datetime
 from typing import Optional, Tuple
 
+from app.core.clock import hlc
+
 
 class BarcodeGenerator:
 
@@ -16,6 +19,11 @@ class BarcodeGenerator:
         random_part = uuid.uuid4().hex[:4].upper()
         return f"WO{date_part}{random_part}"
 
+    @staticmethod
+    def work_order_prefix(now: datetime = None) -> str:
+        station = hashlib.sha1(hlc.device_id.encode()).hexdigest()[:6].upper()
+        return f"WO{(now or datetime.now()).strftime('%Y%m%d')}{station}"
+
     @staticmethod
     def generate_sterilization() -> str:
         date_part = datetime.now().strftime("%y%m%d")
@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import signal
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def _configure(workdir: str):
+    settings.database.path = os.path.join(workdir, "primary.db")
+    settings.database.archive_path = os.path.join(workdir, "archive")
+    settings.database.archive_enabled = True
+    settings.database.archive_interval_seconds = 0.2
+
+
+def writer(workdir: str):
+    _configure(workdir)
+    from app.core.database import get_db
+    from app.services.archive_service import ArchiveService
+
+    ArchiveService().start()
+    db = get_db()
+    log = os.open(os.path.join(workdir, "commits.log"), os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    n = 0
+    while True:
+        order_number = f"A{n:07d}"
+        db.execute("""
+            INSERT INTO work_orders (order_number, item_type, item_id, status, current_zone)
+            VALUES (?, 'SET', 1, 'RECEIVED', 'DIRTY')
+        """, (order_number,))
+        order_id = db.get_last_insert_id()
+        db.execute("""
+            INSERT INTO process_records (work_order_id, process_type, zone)
+            VALUES (?, 'RECEIVE', 'DIRTY')
+        """, (order_id,))
+        if n % 5 == 4:
+            db.execute("UPDATE work_orders SET status = 'WASHING' WHERE id = ?", (order_id - 2,))
+        if n % 17 == 16:
+            db.execute("DELETE FROM process_records WHERE work_order_id = ?", (order_id - 10,))
+        db.commit()
+        os.write(log, f"{order_number} {time.time()}\n".encode())
+        n += 1
+
+
+def _table_rows(path: str):
+    import sqlite3
+    connection = sqlite3.connect(path)
+    try:
+        tables = [r[0] for r in connection.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name NOT GLOB 'sqlite_*' AND name != 'archive_log'
+              AND name NOT GLOB 'search_index*'
+            ORDER BY name
+        """)]
+        return {t: connection.execute(f"SELECT rowid, * FROM {t} ORDER BY rowid").fetchall() for t in tables}
+    finally:
+        connection.close()
+
+
+def _search_matches(path: str) -> int:
+    import sqlite3
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM search_index WHERE search_index MATCH 'A*'").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def _orders(path: str):
+    import sqlite3
+    connection = sqlite3.connect(path)
+    try:
+        return {r[0] for r in connection.execute("SELECT order_number FROM work_orders")}
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arşiv çökme ve zamana göre geri yükleme testi")
+    parser.add_argument("--seconds", type=float, default=4.0)
+    parser.add_argument("--writer", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.writer:
+        writer(args.writer)
+        return 0
+
+    workdir = tempfile.mkdtemp()
+    _configure(workdir)
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.services.archive_service import ArchiveService
+
+    init_database()
+    get_db().close()
+    archive = ArchiveService()
+    archive.create_base()
+
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--writer", workdir])
+    time.sleep(args.seconds / 2)
+    ok, message, _ = archive.create_base()
+    print(f"Çalışma sırasında temel yedek: {message}")
+    time.sleep(args.seconds / 2)
+    os.kill(process.pid, signal.SIGKILL)
+    process.wait()
+
+    commits = []
+    with open(os.path.join(workdir, "commits.log")) as f:
+        lines = f.read().splitlines()
+    for line in lines:
+        parts = line.split()
+        if len(parts) == 2:
+            commits.append((parts[0], float(parts[1])))
+    print(f"İşlenen iş emri: {len(commits)} (SIGKILL ile sonlandırıldı)")
+
+    pending = archive.ship()
+    print(f"Yeniden başlatmada gönderilen kayıt: {pending}")
+
+    failures = 0
+    full_path = os.path.join(workdir, "restore-full.db")
+    ok, message, stats = archive.restore_to(full_path)
+    same = ok and _table_rows(full_path) == _table_rows(settings.database.path)
+    print(f"Tam geri yükleme: {message} {stats}  birebir: {same}")
+    failures += 0 if same else 1
+    live, found = _search_matches(settings.database.path), _search_matches(full_path) if ok else 0
+    print(f"Arama dizini: canlı {live}, geri yüklenen {found} eşleşme")
+    failures += 0 if found == live > 0 else 1
+
+    cutoff = commits[len(commits) // 2][1]
+    until = datetime.fromtimestamp(int(cutoff) + 1)
+    point_path = os.path.join(workdir, "restore-point.db")
+    ok, message, stats = archive.restore_to(point_path, until)
+    restored = _orders(point_path) if ok else set()
+    limit = until.timestamp()
+    missing = [o for o, t in commits if t <= limit and o not in restored]
+    extra = [o for o, t in commits if t > limit + 0.25 and o in restored]
+    print(f"{until:%H:%M:%S} anına geri yükleme: {message}  kayıt: {len(restored)}  "
+          f"eksik: {len(missing)}  fazla: {len(extra)}")
+    failures += 0 if ok and not missing and not extra else 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import os
+import sys
+import time
+import zipfile
+import argparse
+import resource
+import tempfile
+import tracemalloc
+from datetime import datetime, date, timedelta
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+SHEET_ROW = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}row"
+
+
+def seed(db, start: date, days: int, cycles_per_day: int, items_per_cycle: int) -> int:
+    db.execute("INSERT INTO machines (name, machine_type, zone) VALUES ('Otoklav 1', 'STEAM', 'STERILE')")
+    machine_id = db.get_last_insert_id()
+    db.execute("INSERT INTO machine_programs (machine_id, name, temperature) VALUES (?, '134C Standart', 134)",
+               (machine_id,))
+    program_id = db.get_last_insert_id()
+
+    records = 0
+    for day in range(days):
+        day_start = datetime.combine(start + timedelta(days=day), datetime.min.time()) + timedelta(hours=7)
+        for n in range(cycles_per_day):
+            started = day_start + timedelta(minutes=50 * n)
+            db.execute("""
+                INSERT INTO machine_cycles (cycle_number, machine_id, program_id, operator_id, start_time,
+                    end_time, status, temperature_achieved, pressure_achieved, ci_result, bi_lot_number, bi_result)
+                VALUES (?, ?, ?, 1, ?, ?, 'COMPLETED', 134.2, 2.1, 'PASS', ?, 'NEGATIVE')
+            """, (f"C{started:%y%m%d%H%M}M01", machine_id, program_id, started, started + timedelta(minutes=45),
+                  f"BI{started:%y%m%d}"))
+            cycle_id = db.get_last_insert_id()
+            rows = []
+            for item in range(items_per_cycle):
+                records += 1
+                rows.append((f"SR{records:08d}", "SET", item + 1, f"Cerrahi Set {item} (Ortopedi)",
+                             f"SET{item:06d}", cycle_id, machine_id, started, started + timedelta(minutes=45),
+                             started + timedelta(hours=1), started + timedelta(hours=4), started + timedelta(hours=5),
+                             started + timedelta(days=180)))
+            db.executemany("""
+                INSERT INTO sterilization_records (record_number, item_type, item_id, item_name, item_barcode,
+                    cycle_id, machine_id, sterilization_method, operator_id, load_time, unload_time,
+                    status, ci_result, ci_checked_by, ci_checked_at, bi_result, bi_read_by, bi_read_at,
+                    released_by, released_at, expiry_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'STEAM', 1, ?, ?, 'RELEASED', 'PASS', 1, ?, 'NEGATIVE', 1, ?,
+                    1, ?, ?)
+            """, rows)
+        db.execute("""
+            INSERT INTO sterilization_release_log (sterilization_id, action, performed_by, notes, created_at)
+            SELECT id, 'RELEASE', 1, 'Serbest bırakıldı', released_at FROM sterilization_records
+            WHERE id > (SELECT COALESCE(MAX(sterilization_id), 0) FROM sterilization_release_log)
+        """)
+        db.commit()
+    return records
+
+
+def count_output(fmt: str, path: str) -> int:
+    if fmt == "csv":
+        with open(path, encoding="utf-8-sig") as f:
+            return sum(1 for _ in f) - 1
+    if fmt == "xlsx":
+        with zipfile.ZipFile(path) as archive, archive.open("xl/worksheets/sheet1.xml") as sheet:
+            rows = 0
+            for _, element in ElementTree.iterparse(sheet):
+                if element.tag == SHEET_ROW:
+                    rows += 1
+                    element.clear()
+            return rows - 1
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data.rstrip().endswith(b"%%EOF")
+    return data.count(b"/Type /Page ")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uyumluluk raporu akışlı dışa aktarma testi")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--cycles", type=int, default=12)
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--memory-budget-mb", type=float, default=16.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "export.db")
+    settings.export.export_path = os.path.join(workdir, "exports")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.writer import background_writer
+    from app.config.constants import ExportJobStatus
+    from app.services.export import ComplianceExportService
+
+    init_database()
+    db = get_db()
+    start = date(2025, 10, 1)
+    started = time.perf_counter()
+    records = seed(db, start, args.days, args.cycles, args.items)
+    end = start + timedelta(days=args.days - 1)
+    print(f"{records} kayıt, {args.days * args.cycles} çevrim hazırlandı ({time.perf_counter() - started:.1f} s), "
+          f"veritabanı {os.path.getsize(settings.database.path) / 1e6:.1f} MB")
+
+    service = ComplianceExportService()
+    failures = 0
+    for fmt in ("csv", "xlsx", "pdf"):
+        updates = []
+        tracemalloc.start()
+        ok, message, job = service.export(start, end, fmt, progress=lambda j: updates.append(j.rows))
+        job.done.wait(600)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        written = count_output(fmt, job.path) if job.status == ExportJobStatus.COMPLETED else -1
+        expected = -(-records // settings.export.pdf_rows_per_page) if fmt == "pdf" else records
+        print(f"{fmt.upper():<4} {job.status}: {job.rows} satır, {job.elapsed_ms / 1000:5.1f} s, "
+              f"{job.rows / (job.elapsed_ms / 1000):8.0f} satır/s, {os.path.getsize(job.path) / 1e6:6.1f} MB, "
+              f"tepe bellek {peak / 1e6:5.2f} MB, {len(updates)} ilerleme bildirimi, dosyada {written}")
+        if (job.status != ExportJobStatus.COMPLETED or job.rows != records or written != expected
+                or peak > args.memory_budget_mb * 1e6 or updates != sorted(updates) or len(updates) < 2):
+            print(f"  hata: {job.error or 'beklenmeyen sonuç'}")
+            failures += 1
+
+    ok, message, job = service.export(start, end, "xlsx", progress=lambda j: j.cancel())
+    job.done.wait(600)
+    leftovers = [name for name in os.listdir(settings.export.export_path) if name.endswith(".tmp")]
+    print(f"İptal: {job.status} {job.rows} satırda, geçici dosya {len(leftovers)}")
+    if job.status != ExportJobStatus.CANCELLED or leftovers or os.path.exists(job.path):
+        failures += 1
+
+    ok, message, _ = service.export(end, start)
+    print(f"Ters aralık: {message}")
+    failures += ok
+
+    background_writer.flush()
+    audits = db.fetchone("SELECT COUNT(*) FROM audit_log WHERE action = 'EXPORT'")[0]
+    print(f"Denetim kaydı: {audits}/3, süreç tepe RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    if audits != 3:
+        failures += 1
+    background_writer.stop()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
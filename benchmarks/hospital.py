@@ -0,0 +1,429 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import sqlite3
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+from benchmarks.workload import PROFILES, generate
+
+GENERATOR_VERSION = 1
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+SEARCH_TERMS = ("kocher", "makas", "ortopedi seti", "portegü", "laparoskopik", "ekartör", "göz", "trokar")
+READS = (("dashboard", 10), ("lookup.barcode", 8), ("search", 6), ("history.released", 3),
+         ("records.expiring", 2), ("audit.recent", 2), ("scan.info", 6))
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              timeout=10).stdout.strip() or "?"
+    except (OSError, subprocess.SubprocessError):
+        return "?"
+
+
+def prepare(path: str, cache: str, profile, seed: int) -> dict:
+    meta = {'profile': profile.name, 'seed': seed, 'generator': GENERATOR_VERSION}
+    sidecar = cache + ".json" if cache else None
+    if cache and os.path.exists(cache) and os.path.exists(sidecar):
+        with open(sidecar, encoding="utf-8") as f:
+            cached = json.load(f)
+        if all(cached.get(key) == value for key, value in meta.items()):
+            shutil.copyfile(cache, path)
+            print(f"Önbellekteki veritabanı kullanıldı: {cache} ({cached['generated_at']})")
+            return cached
+
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    init_database()
+    start = time.perf_counter()
+    counts = generate(get_db(), profile, seed)
+    get_db().execute("ANALYZE")
+    get_db().close()
+    meta.update(counts=counts, generated_at=datetime.now().isoformat(timespec="seconds"),
+                generate_s=round(time.perf_counter() - start, 1))
+    print(f"{profile.name} profili üretildi: {counts.get('work_orders', 0)} iş emri, "
+          f"{counts.get('audit_log', 0)} denetim kaydı, {meta['generate_s']} sn")
+    if cache:
+        os.makedirs(os.path.dirname(os.path.abspath(cache)), exist_ok=True)
+        shutil.copyfile(path, cache)
+        with open(sidecar, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+class Replay:
+
+    def __init__(self, profile, rng: random.Random):
+        from app.core.database import get_db
+        from app.core.metrics import LatencyHistogram
+        from app.config.constants import Zones, IndicatorResults, PackagingTypes
+        from app.services import (DirtyZoneService, CleanZoneService, SterileZoneService, MachineService,
+                                  SterilizationRecordService, IndicatorService, ReleaseService,
+                                  MaintenanceService, AuditService, SearchService, ScanPipeline)
+        from app.services.work_order_service import WorkOrderService
+
+        self.db = get_db()
+        self.profile = profile
+        self.rng = rng
+        self.Histogram = LatencyHistogram
+        self.Zones, self.Results, self.Packaging = Zones, IndicatorResults, PackagingTypes
+        self.dirty, self.clean, self.sterile = DirtyZoneService(), CleanZoneService(), SterileZoneService()
+        self.machines, self.records = MachineService(), SterilizationRecordService()
+        self.indicators, self.releases = IndicatorService(), ReleaseService()
+        self.orders, self.maintenance = WorkOrderService(), MaintenanceService()
+        self.audit, self.search = AuditService(), SearchService()
+        self.pipeline = ScanPipeline()
+        self.pipeline.set_handler(self._on_scan)
+        self._scanned = threading.Event()
+        self._result = None
+
+        self.histograms = {}
+        self.rounds = [{}]
+        self.failures = {}
+        self.queues = {stage: [] for stage in ("received", "washed", "inspecting", "packaging", "packaged",
+                                               "transferred", "pending")}
+        self.cycles = {'wash': [], 'load': []}
+        self.record_of = {}
+        self.items = [(row['item_type'], row['item_id'], row['item_barcode']) for row in self.db.fetchall(
+            "SELECT DISTINCT item_type, item_id, item_barcode FROM work_orders WHERE status = 'COMPLETED' LIMIT 5000"
+        )]
+        self.barcodes = [row['barcode'] for row in self.db.fetchall(
+            "SELECT barcode FROM work_orders WHERE barcode IS NOT NULL ORDER BY RANDOM() LIMIT 500")]
+        self.programs = {row['machine_id']: row['id'] for row in self.db.fetchall(
+            "SELECT machine_id, MIN(id) as id FROM machine_programs GROUP BY machine_id")}
+        self.washers = [row['id'] for row in self.db.fetchall(
+            "SELECT id FROM machines WHERE zone = ? ORDER BY id", (Zones.DIRTY,))]
+        self.sterilizers = [row['id'] for row in self.db.fetchall(
+            "SELECT id FROM machines WHERE zone = ? ORDER BY id", (Zones.STERILE,))]
+
+    def timed(self, name: str, function, *args, check: bool = True):
+        start = time.perf_counter()
+        result = function(*args)
+        self.record(name, (time.perf_counter() - start) * 1000)
+        if check and isinstance(result, tuple) and result and result[0] is False:
+            self.failures[name] = self.failures.get(name, 0) + 1
+        return result
+
+    def record(self, name: str, ms: float):
+        for histograms in (self.histograms, self.rounds[-1]):
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = self.Histogram(name)
+            histogram.record(ms)
+
+    def _on_scan(self, result):
+        self._result = result
+        self._scanned.set()
+
+    def scan(self, code: str, zone: str = None):
+        self._scanned.clear()
+        self.pipeline.submit(code, zone)
+        if not self._scanned.wait(10):
+            self.failures['scan.timeout'] = self.failures.get('scan.timeout', 0) + 1
+            return None
+        result = self._result
+        self.record(f"scan.{result.action.lower()}", result.latency_ms)
+        return result
+
+    def refresh(self, zone: str):
+        if zone == self.Zones.DIRTY:
+            self.timed("zone.dirty", lambda: (self.dirty.get_pending_items(), self.dirty.get_washing_items(),
+                                              self.dirty.get_washed_items()))
+        elif zone == self.Zones.CLEAN:
+            self.timed("zone.clean", lambda: (self.clean.get_pending_inspection(), self.clean.get_pending_packaging(),
+                                              self.clean.get_packaged_items(), self.clean.get_failed_items()))
+        else:
+            self.timed("zone.sterile", lambda: (self.sterile.get_sterilizing_items(),
+                                                self.sterile.get_pending_release_items(),
+                                                self.sterile.get_released_items()))
+
+    def receive(self):
+        item_type, item_id, barcode = self.rng.choice(self.items)
+        result = self.scan(barcode, self.Zones.DIRTY)
+        self.pipeline.flush()
+        if result is not None and result.action == "RECEIVE":
+            row = self.db.fetchone("""
+                SELECT id FROM work_orders WHERE item_type = ? AND item_id = ? AND status = 'RECEIVED'
+                ORDER BY id DESC LIMIT 1
+            """, (item_type, item_id))
+            if row:
+                self.queues['received'].append(row['id'])
+        self.refresh(self.Zones.DIRTY)
+
+    def idle(self, machines: list, kind: str) -> list:
+        busy = {machine for _, machine, _ in self.cycles[kind]}
+        return [machine for machine in machines if machine not in busy]
+
+    def start_wash(self):
+        machine = self.rng.choice(self.idle(self.washers, 'wash'))
+        ok, _, cycle_id = self.timed("machine.start_cycle", self.machines.start_cycle, machine,
+                                     self.programs.get(machine))
+        if not ok:
+            return
+        batch = self.queues['received'][:self.profile.items_per_wash]
+        del self.queues['received'][:len(batch)]
+        for order_id in batch:
+            self.timed("dirty.start_washing", self.dirty.start_washing, order_id, machine, cycle_id)
+        self.cycles['wash'].append((cycle_id, machine, batch))
+        self.refresh(self.Zones.DIRTY)
+
+    def finish_wash(self):
+        cycle_id, _, batch = self.cycles['wash'].pop(0)
+        self.timed("machine.complete_cycle", self.machines.complete_cycle, cycle_id, 93.0)
+        for order_id in batch:
+            self.timed("dirty.complete_washing", self.dirty.complete_washing, order_id)
+        self.queues['washed'].extend(batch)
+        self.refresh(self.Zones.DIRTY)
+
+    def transfer(self, source: str, target: str, zone: str):
+        order_id = self.queues[source].pop(0)
+        row = self.db.fetchone("SELECT order_number FROM work_orders WHERE id = ?", (order_id,))
+        result = self.scan(row['order_number'], zone)
+        self.pipeline.flush()
+        if result is not None and result.ok and result.action.startswith("TRANSFER"):
+            self.queues[target].append(order_id)
+        self.refresh(zone)
+
+    def inspect(self):
+        order_id = self.queues['inspecting'].pop(0)
+        if self.rng.random() < self.profile.inspection_fail_rate:
+            self.timed("clean.fail_inspection", self.clean.fail_inspection, order_id, "Kalıntı tespit edildi")
+        else:
+            self.timed("clean.pass_inspection", self.clean.pass_inspection, order_id)
+            self.queues['packaging'].append(order_id)
+        self.refresh(self.Zones.CLEAN)
+
+    def package(self):
+        order_id = self.queues['packaging'].pop(0)
+        self.timed("clean.complete_packaging", self.clean.complete_packaging, order_id,
+                   self.rng.choice((self.Packaging.CONTAINER, self.Packaging.WRAP_DOUBLE, self.Packaging.POUCH)))
+        self.queues['packaged'].append(order_id)
+        self.refresh(self.Zones.CLEAN)
+
+    def load(self):
+        machine = self.rng.choice(self.idle(self.sterilizers, 'load'))
+        ok, _, cycle_id = self.timed("machine.start_cycle", self.machines.start_cycle, machine,
+                                     self.programs.get(machine))
+        if not ok:
+            return
+        batch = self.queues['transferred'][:self.profile.items_per_load]
+        del self.queues['transferred'][:len(batch)]
+        for order_id in batch:
+            self.timed("sterile.load", self.sterile.load_to_sterilizer, order_id, machine, cycle_id)
+            ok, _, record_id = self.timed("records.create", self.records.create, order_id, cycle_id, "STEAM")
+            self.record_of[order_id] = record_id
+        self.cycles['load'].append((cycle_id, machine, batch))
+        self.refresh(self.Zones.STERILE)
+
+    def unload(self):
+        cycle_id, _, batch = self.cycles['load'].pop(0)
+        self.timed("machine.complete_cycle", self.machines.complete_cycle, cycle_id, 134.2, 2.1,
+                   self.Results.PASS)
+        for order_id in batch:
+            self.timed("sterile.unload", self.sterile.unload_from_sterilizer, order_id)
+            if self.record_of.get(order_id):
+                self.timed("indicators.check_ci", self.indicators.check_ci, self.record_of[order_id],
+                           self.Results.PASS)
+            self.timed("sterile.set_pending_release", self.sterile.set_pending_release, order_id)
+        self.queues['pending'].extend(batch)
+        self.refresh(self.Zones.STERILE)
+
+    def release(self):
+        order_id = self.queues['pending'].pop(0)
+        record_id = self.record_of.pop(order_id, None)
+        if record_id:
+            self.timed("release.can_release", self.releases.can_release, record_id, check=False)
+        self.timed("sterile.release", self.sterile.release_item, order_id)
+        self.refresh(self.Zones.STERILE)
+
+    def read(self, name: str):
+        if name == "dashboard":
+            self.timed(name, lambda: (len(self.dirty.get_pending_items()), len(self.dirty.get_washing_items()),
+                                      self.maintenance.get_upcoming()))
+        elif name == "lookup.barcode":
+            self.timed(name, self.orders.get_work_order_by_barcode, self.rng.choice(self.barcodes))
+        elif name == "search":
+            self.timed(name, self.search.search, self.rng.choice(SEARCH_TERMS))
+        elif name == "history.released":
+            self.timed(name, self.releases.get_released, 50)
+        elif name == "records.expiring":
+            self.timed(name, self.records.get_expiring, 7)
+        elif name == "audit.recent":
+            self.timed(name, self.audit.get_recent_activity, 24)
+        elif name == "scan.info":
+            self.scan(self.rng.choice(self.barcodes))
+
+    def step(self):
+        q, p = self.queues, self.profile
+        writes = [(self.receive, 6)]
+        if len(q['received']) >= p.items_per_wash and self.idle(self.washers, 'wash'):
+            writes.append((self.start_wash, 3))
+        if self.cycles['wash']:
+            writes.append((self.finish_wash, 2))
+        if q['washed']:
+            writes.append((lambda: self.transfer('washed', 'inspecting', self.Zones.CLEAN), 5))
+        if q['inspecting']:
+            writes.append((self.inspect, 5))
+        if q['packaging']:
+            writes.append((self.package, 5))
+        if q['packaged']:
+            writes.append((lambda: self.transfer('packaged', 'transferred', self.Zones.STERILE), 5))
+        if len(q['transferred']) >= p.items_per_load and self.idle(self.sterilizers, 'load'):
+            writes.append((self.load, 3))
+        if self.cycles['load']:
+            writes.append((self.unload, 2))
+        if q['pending']:
+            writes.append((self.release, 5))
+        choices = writes + [((lambda name=name: self.read(name)), weight) for name, weight in READS]
+        action = self.rng.choices([c[0] for c in choices], weights=[c[1] for c in choices])[0]
+        action()
+
+    def close(self):
+        self.pipeline.flush()
+        self.pipeline.stop()
+
+
+def operations(histograms: dict, rounds: list) -> dict:
+    result = {}
+    for name, histogram in sorted(histograms.items()):
+        summary = histogram.summary()
+        summary['ops_per_s'] = round(histogram.count / (histogram.total_ms / 1000), 1) if histogram.total_ms else 0.0
+        best = [r[name].percentile(95) for r in rounds if name in r and r[name].count >= 10]
+        summary['p95_best'] = round(min(best or [histogram.percentile(95)]), 3)
+        result[name] = summary
+    return result
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta: float, min_count: int) -> list:
+    regressions = []
+    print(f"\n{'işlem':<28} {'p95 ms':>9} {'temel':>9} {'fark':>8}  (turların en iyi p95 değeri)")
+    for name, summary in current.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<28} {summary['p95_best']:>9.2f} {'-':>9} {'yeni':>8}")
+            continue
+        if min(summary['count'], base['count']) < min_count:
+            print(f"{name:<28} {summary['p95_best']:>9.2f} {base['p95_best']:>9.2f} {'az örnek':>8}")
+            continue
+        now, then = summary['p95_best'], base['p95_best']
+        change = (now - then) / then * 100 if then else 0.0
+        regressed = now > then * tolerance and now - then > min_delta
+        print(f"{name:<28} {now:>9.2f} {then:>9.2f} {change:>+7.1f}%"
+              f"{'  GERİLEME' if regressed else ''}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik hastane iş yüküyle servis katmanı performans testi")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="smoke")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--actions", type=int, default=1000, help="tur başına eylem sayısı")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--db", help="üretilen veritabanının önbellek yolu (tekrar üretimi atlar)")
+    parser.add_argument("--baseline", help="karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.3)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    parser.add_argument("--min-count", type=int, default=20)
+    args = parser.parse_args()
+
+    profile = PROFILES[args.profile]
+    baseline_path = args.baseline or os.path.join(BASELINES, f"hospital-{profile.name}.json")
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "hospital.db")
+    settings.diagnostics.slow_query_log = os.path.join(workdir, "logs", "slow_queries.log")
+    settings.diagnostics.trace_path = os.path.join(workdir, "traces")
+    settings.diagnostics.slow_query_ms = 1e9
+
+    meta = prepare(settings.database.path, args.db, profile, args.seed)
+
+    from app.core.tracing import tracer
+    from app.core.slow_query import slow_queries
+    from app.services import AuthService
+    tracer.enabled = False
+    ok, message, _ = AuthService().authenticate_by_badge("ADMIN001")
+    if not ok:
+        print(f"Giriş başarısız: {message}")
+        return 1
+
+    replay = Replay(profile, random.Random(args.seed))
+    for _ in range(50):
+        replay.step()
+    replay.histograms.clear()
+    replay.failures.clear()
+
+    settings.diagnostics.slow_query_ms = 50
+    replay.rounds = []
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        replay.rounds.append({})
+        for _ in range(args.actions):
+            replay.step()
+    elapsed = time.perf_counter() - start
+    replay.close()
+
+    actions = args.actions * args.rounds
+    current = operations(replay.histograms, replay.rounds)
+    print(f"\n{args.rounds} x {args.actions} eylem {elapsed:.1f} sn ({actions / elapsed:.1f} eylem/sn), "
+          f"{meta['counts'].get('work_orders', 0)} iş emri")
+    print(f"{'işlem':<28} {'adet':>6} {'işlem/sn':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'maks':>8}")
+    for name, summary in current.items():
+        print(f"{name:<28} {summary['count']:>6} {summary['ops_per_s']:>9.1f} {summary['p50']:>8.2f} "
+              f"{summary['p95']:>8.2f} {summary['p99']:>8.2f} {summary['max']:>8.2f}")
+    if replay.failures:
+        print("Başarısız işlemler: " + ", ".join(f"{name} {count}" for name, count in replay.failures.items()))
+
+    slow = sorted(slow_queries.stats.items(), key=lambda item: item[1]['total_ms'], reverse=True)
+    for statement, stats in slow[:5]:
+        scans = " TAM TARAMA" if stats['full_scans'] else ""
+        print(f"  yavaş {stats['count']:5}x maks {stats['max_ms']:7.1f} ms{scans}  {statement[:90]}")
+    slow_queries.close()
+
+    result = {
+        'meta': {
+            'profile': profile.name, 'seed': args.seed, 'actions': args.actions, 'rounds': args.rounds,
+            'work_orders': meta['counts'].get('work_orders', 0), 'commit': git_commit(),
+            'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(), 'cpus': os.cpu_count(),
+            'recorded_at': datetime.now().isoformat(timespec="seconds"),
+        },
+        'operations': current,
+    }
+    failures = int(bool(replay.failures))
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"\nTemel kaydedildi: {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nTemel: {baseline_path} ({baseline['meta']['commit']}, {baseline['meta']['recorded_at']})")
+        regressions = compare(current, baseline['operations'], args.tolerance, args.min_delta_ms,
+                              args.min_count)
+        if regressions:
+            print(f"Gerileme: {', '.join(regressions)}")
+            failures += 1
+    else:
+        print(f"\nTemel yok: {baseline_path} (--save-baseline ile oluşturun)")
+    shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
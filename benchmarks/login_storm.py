@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import hashlib
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _report(name, latencies):
+    ms = [v * 1000 for v in latencies]
+    print(f"{name:<22} p50 {_percentile(ms, 50):7.1f} ms  p95 {_percentile(ms, 95):7.1f} ms  "
+          f"maks {max(ms):7.1f} ms  toplam {sum(ms) / 1000:6.2f} s")
+
+
+def legacy_login(db, badge: str, pin: str) -> bool:
+    user = db.fetchone("""
+        SELECT o.*, r.code as role_code, r.name as role_name
+        FROM operators o
+        LEFT JOIN roles r ON o.role_id = r.id
+        WHERE o.badge_number = ? AND o.is_active = 1
+    """, (badge,))
+    if not user or user['legacy_hash'] != hashlib.sha256(pin.encode()).hexdigest():
+        return False
+    db.fetchall("""
+        SELECT p.code FROM role_permissions rp
+        JOIN permissions p ON rp.permission_id = p.id
+        WHERE rp.role_id = ?
+    """, (user['role_id'],))
+    for query, params in (
+        ("UPDATE operators SET failed_attempts = 0, locked_until = NULL, updated_at = ? WHERE id = ?",
+         (datetime.now(), user['id'])),
+        ("UPDATE operators SET last_login = ?, updated_at = ? WHERE id = ?",
+         (datetime.now(), datetime.now(), user['id'])),
+        ("INSERT INTO audit_log (operator_id, action, entity_type, details, created_at) "
+         "VALUES (?, 'LOGIN', 'SESSION', 'PIN ile giris', ?)", (user['id'], datetime.now())),
+    ):
+        db.execute(query, params)
+        db.commit()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vardiya değişimi kart okutma yükü")
+    parser.add_argument("--operators", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    settings.database.path = os.path.join(tempfile.mkdtemp(), "login.db")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.session import current_session
+    from app.core.security import measure_ms
+    from app.core.writer import background_writer
+    from app.services.auth_service import AuthService
+    from app.services.user_service import UserService
+
+    init_database()
+    db = get_db()
+    db.execute("ALTER TABLE operators ADD COLUMN legacy_hash TEXT")
+    users = UserService()
+    badges = []
+    for n in range(args.operators):
+        badge, pin = f"STORM{n:04d}", f"{n % 10000:04d}"
+        users.create_user({'badge_number': badge, 'full_name': f"Operatör {n}", 'pin': pin, 'role_id': 3})
+        db.execute("UPDATE operators SET legacy_hash = ? WHERE badge_number = ?",
+                   (hashlib.sha256(pin.encode()).hexdigest(), badge))
+        badges.append((badge, pin))
+    db.commit()
+
+    hash_ms = measure_ms()
+    print(f"PIN özeti: {hash_ms:.1f} ms (bütçe {settings.security.pin_hash_budget_ms} ms)")
+
+    legacy = []
+    for _ in range(args.rounds):
+        for badge, pin in badges:
+            start = time.perf_counter()
+            assert legacy_login(db, badge, pin)
+            legacy.append(time.perf_counter() - start)
+    _report("Eski yol (sha256)", legacy)
+
+    audit_before = db.fetchone("SELECT COUNT(*) FROM audit_log")[0]
+    auth = AuthService()
+    latencies = []
+    for _ in range(args.rounds):
+        for badge, pin in badges:
+            start = time.perf_counter()
+            ok, message, _ = auth.authenticate_with_pin(badge, pin)
+            latencies.append(time.perf_counter() - start)
+            assert ok, message
+            current_session.logout()
+    _report("Yeni yol (scrypt)", latencies)
+
+    badge_only = []
+    for badge, _ in badges:
+        start = time.perf_counter()
+        ok, message, _ = auth.authenticate_by_badge(badge)
+        badge_only.append(time.perf_counter() - start)
+        assert ok, message
+        current_session.logout()
+    _report("Yeni yol (yalnız kart)", badge_only)
+
+    switches = []
+    for badge, pin in badges:
+        start = time.perf_counter()
+        ok, message, _ = auth.authenticate_with_pin(badge, pin)
+        switches.append(time.perf_counter() - start)
+        assert ok, message
+    current_session.logout()
+    _report("Kullanıcı değiştirme", switches)
+
+    start = time.perf_counter()
+    current_session.flush_history()
+    background_writer.flush()
+    print(f"Arka plan yazıcı: {background_writer.written} işlem, {background_writer.errors} hata, "
+          f"boşaltma {(time.perf_counter() - start) * 1000:.1f} ms")
+    logged = db.fetchone("SELECT COUNT(*) FROM audit_log")[0] - audit_before
+    print(f"Denetim kaydı: {logged} / {(args.rounds + 2) * args.operators}")
+    sessions = db.fetchone("SELECT COUNT(*) FROM login_sessions")[0]
+    print(f"Oturum geçmişi: {sessions} / {(args.rounds + 2) * args.operators}")
+    background_writer.stop()
+    switch_ms = _percentile(switches, 95) * 1000
+    within = hash_ms <= settings.security.pin_hash_budget_ms and switch_ms <= settings.security.switch_budget_ms
+    return 0 if within and not background_writer.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
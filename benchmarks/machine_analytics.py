@@ -0,0 +1,122 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def generate_cycles(db, days: int = 365, seed: int = 42):
+    rng = random.Random(seed)
+    machines = db.fetchall("SELECT id, machine_type FROM machines WHERE is_active = 1")
+    end = datetime.now().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=days)
+
+    cycles = []
+    contents = []
+    orders = []
+    records = []
+    cycle_id = 0
+    order_id = 0
+
+    for machine in machines:
+        washer = machine['machine_type'] == 'WASHER_DISINFECTOR'
+        duration = 50 if washer else 75
+        clock = start + timedelta(hours=7)
+        while clock < end:
+            if clock.hour >= 23:
+                clock = (clock + timedelta(days=1)).replace(hour=7, minute=0)
+                continue
+
+            cycle_id += 1
+            length = timedelta(minutes=rng.gauss(duration, 8))
+            failed = rng.random() < 0.02
+            cycles.append((
+                cycle_id, f"B{cycle_id:07d}", machine['id'], clock, clock + length,
+                'ERROR' if failed else 'COMPLETED', clock
+            ))
+
+            for _ in range(rng.randint(4, 18)):
+                order_id += 1
+                arrived = clock - timedelta(minutes=rng.expovariate(1 / 35))
+                orders.append((order_id, f"WO{order_id:09d}", 'SET', 1, arrived, arrived))
+                records.append((order_id, 'RECEIVE', arrived))
+                contents.append((cycle_id, order_id, clock, clock + length))
+
+            clock += length + timedelta(minutes=rng.expovariate(1 / 25))
+
+    db.executemany("""
+        INSERT INTO machine_cycles (id, cycle_number, machine_id, start_time, end_time, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, cycles)
+    db.executemany("""
+        INSERT INTO work_orders (id, order_number, item_type, item_id, received_at, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, orders)
+    db.executemany("""
+        INSERT INTO process_records (work_order_id, process_type, created_at)
+        VALUES (?, ?, ?)
+    """, records)
+    db.executemany("""
+        INSERT INTO cycle_contents (cycle_id, work_order_id, loaded_at, unloaded_at)
+        VALUES (?, ?, ?, ?)
+    """, contents)
+    db.commit()
+    return start, end, len(cycles), len(contents)
+
+
+def timed(label: str, func, repeat: int = 3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<28} {best * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Makine analitiği benchmark")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--db", default=None)
+    args = parser.parse_args()
+
+    settings.database.path = args.db or os.path.join(tempfile.mkdtemp(), "bench.db")
+
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.services.machine_analytics_service import MachineAnalyticsService
+
+    init_database()
+    db = get_db()
+
+    t0 = time.perf_counter()
+    start, end, cycle_count, item_count = generate_cycles(db, args.days)
+    print(f"{cycle_count} çevrim, {item_count} yük üretildi "
+          f"({time.perf_counter() - t0:.1f} s)")
+
+    service = MachineAnalyticsService()
+    timed("1 hafta", lambda: service.analyze(end - timedelta(days=7), end))
+    timed("1 ay", lambda: service.analyze(end - timedelta(days=30), end))
+    report = timed(f"{args.days} gün", lambda: service.analyze(start, end))
+
+    print()
+    for m in report.machines:
+        print(f"{m.machine_name:<12} kullanım %{m.utilization * 100:5.1f}  "
+              f"çevrim {m.cycle_count:5d}  ort. yük {m.average_load:4.1f}  "
+              f"p90 süre {m.durations.p90_minutes:5.1f} dk  "
+              f"boşluk ort. {m.idle_gap_mean_minutes:5.1f} dk  "
+              f"bekleme p90 {m.queue_wait_p90_minutes:5.1f} dk")
+    for b in report.bottlenecks:
+        print(f"Darboğaz: {b.zone}/{b.category} {b.reason} -> önerilen {b.recommended_machines} makine")
+
+
+if __name__ == "__main__":
+    main()
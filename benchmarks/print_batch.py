@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+LP_STAND_IN = '''import os, sys, itertools
+spool = os.environ["LP_SPOOL"]
+os.makedirs(spool, exist_ok=True)
+args = sys.argv[1:]
+printer = args[args.index("-d") + 1] if "-d" in args else "default"
+title = args[args.index("-t") + 1] if "-t" in args else "stdin"
+data = sys.stdin.buffer.read()
+if not data:
+    sys.exit("lp: no data")
+for n in itertools.count(1):
+    path = os.path.join(spool, f"{printer}-{n}")
+    if not os.path.exists(path):
+        break
+with open(path, "wb") as f:
+    f.write(data)
+print(f"request id is {printer}-{n} (1 file(s)) {title}")
+'''
+
+
+def seed(db, items: int) -> int:
+    db.execute("INSERT INTO machines (name, machine_type, zone) VALUES ('Otoklav 1', 'STEAM', 'STERILE')")
+    machine_id = db.get_last_insert_id()
+    db.execute("INSERT INTO machine_programs (machine_id, name, temperature) VALUES (?, '134C Standart', 134)",
+               (machine_id,))
+    program_id = db.get_last_insert_id()
+    db.execute("""
+        INSERT INTO machine_cycles (cycle_number, machine_id, program_id, operator_id, start_time, status)
+        VALUES ('C2610190800M01', ?, ?, 1, ?, 'COMPLETED')
+    """, (machine_id, program_id, datetime.now()))
+    cycle_id = db.get_last_insert_id()
+    for n in range(items):
+        db.execute("INSERT INTO instrument_sets (barcode, name) VALUES (?, ?)", (f"SET{n:06d}", f"Cerrahi Set {n}"))
+        db.execute("""
+            INSERT INTO work_orders (order_number, barcode, item_type, item_id, item_name, item_barcode, status)
+            VALUES (?, ?, 'SET', ?, ?, ?, 'STERILIZING')
+        """, (f"WO20261019{n:04d}", f"WO{n:08X}", n + 1, f"Cerrahi Set {n}", f"SET{n:06d}"))
+        db.execute("""
+            INSERT INTO sterilization_records (record_number, work_order_id, item_type, item_id, item_name,
+                item_barcode, cycle_id, machine_id, sterilization_method, operator_id, load_time, expiry_date)
+            VALUES (?, ?, 'SET', ?, ?, ?, ?, ?, 'STEAM', 1, ?, ?)
+        """, (f"SR261019{n:04d}", db.get_last_insert_id(), n + 1, f"Cerrahi Set {n}", f"SET{n:06d}",
+              cycle_id, machine_id, datetime.now(), datetime.now() + timedelta(days=30)))
+    db.commit()
+    return cycle_id
+
+
+def measure_stall(job) -> float:
+    worst = 0.0
+    while not job.done.is_set():
+        start = time.perf_counter()
+        time.sleep(0.005)
+        worst = max(worst, (time.perf_counter() - start - 0.005) * 1000)
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yük etiketi toplu yazdırma testi")
+    parser.add_argument("--items", type=int, default=60)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "print.db")
+    settings.printing.spool_path = os.path.join(workdir, "spool")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.writer import background_writer
+    from app.services.auth_service import AuthService
+    from app.services.labels import LabelService, print_queue, compile_template
+    from app.config.constants import PrintJobStatus
+
+    init_database()
+    db = get_db()
+    cycle_id = seed(db, args.items)
+    ok, message, _ = AuthService().authenticate_by_badge("ADMIN001")
+    assert ok, message
+
+    service = LabelService()
+    failures = 0
+    for fmt in ("zpl", "pdf", "png"):
+        start = time.perf_counter()
+        ok, message, job = service.print_load(cycle_id, fmt)
+        submit_ms = (time.perf_counter() - start) * 1000
+        stall = measure_stall(job)
+        job.done.wait(30)
+        print(f"{fmt.upper():<4} {message}: gönderim {submit_ms:5.1f} ms, çizim {job.render_ms:6.1f} ms, "
+              f"toplam {job.elapsed_ms:6.1f} ms, {job.size / 1024:7.1f} KB, GUI takılması maks {stall:4.1f} ms, "
+              f"{job.status}")
+        if job.status != PrintJobStatus.PRINTED or job.label_count != args.items + 1:
+            print(f"  hata: {job.error}")
+            failures += 1
+
+    spooled = os.listdir(settings.printing.spool_path)
+    print(f"Kuyruk dosyası: {len(spooled)} (iş başına bir dosya)")
+    if len(spooled) != 3:
+        failures += 1
+
+    script = os.path.join(workdir, "lp_stand_in.py")
+    with open(script, "w") as f:
+        f.write(LP_STAND_IN)
+    os.environ["LP_SPOOL"] = os.path.join(workdir, "cups")
+    settings.printing.backend = "lp"
+    settings.printing.printer = "etiket"
+    settings.printing.lp_command = f"{sys.executable} {script}"
+    ok, message, job = service.print_load(cycle_id, "zpl")
+    job.done.wait(30)
+    print(f"lp yedeği: {job.status} '{job.path}' {job.elapsed_ms:.1f} ms")
+    if job.status != PrintJobStatus.PRINTED or not os.listdir(os.environ["LP_SPOOL"]):
+        failures += 1
+
+    settings.printing.lp_command = "false"
+    ok, message, job = service.print_record(1)
+    job.done.wait(30)
+    print(f"Hatalı yazıcı: {job.status} ({job.error})")
+    if job.status != PrintJobStatus.FAILED:
+        failures += 1
+
+    print_queue.stop()
+    background_writer.flush()
+    audits = db.fetchone("SELECT COUNT(*) FROM audit_log WHERE action = 'PRINT'")[0]
+    cache = compile_template.cache_info()
+    print(f"Denetim kaydı: {audits}/4, şablon önbelleği {cache.hits} isabet / {cache.misses} derleme")
+    if audits != 4:
+        failures += 1
+    background_writer.stop()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import os
+import gc
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+QUERY = """
+    SELECT wo.*, d.name as department_name
+    FROM work_orders wo
+    LEFT JOIN departments d ON wo.department_id = d.id
+    WHERE wo.status = ?
+    ORDER BY wo.created_at DESC
+"""
+COLUMNS = ("order_number", "item_name", "department_name", "priority", "status", "created_at")
+
+
+def seed(db, orders: int, rng) -> None:
+    now = datetime.now()
+    db.executemany("INSERT INTO departments (code, name) VALUES (?, ?)",
+                   ((f"D{n:02d}", f"Ameliyathane {n}") for n in range(12)))
+    db.executemany("""
+        INSERT INTO work_orders (order_number, barcode, item_type, item_id, item_name, item_barcode,
+            department_id, priority, status, current_zone, notes, created_at)
+        VALUES (?, ?, 'SET', ?, ?, ?, ?, ?, 'RELEASED', 'STERILE', '', ?)
+    """, ((f"WO2026{n:07d}", f"WO{n:08X}", n % 800 + 1, f"Cerrahi Set {n % 800}", f"SET{n % 800:06d}",
+           n % 12 + 1, rng.randint(0, 2), now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)))
+          for n in range(orders)))
+    db.commit()
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = build()
+    elapsed = (time.perf_counter() - start) * 1000
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    read = getattr if rows and not hasattr(rows[0], 'get') else (lambda row, key, default: row.get(key, default))
+    start = time.perf_counter()
+    for row in rows:
+        for key in COLUMNS:
+            read(row, key, '')
+    access = (time.perf_counter() - start) * 1000
+    return rows, size, elapsed, access
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İş emri listelerinin bellek kullanımı testi")
+    parser.add_argument("--orders", type=int, default=50000)
+    parser.add_argument("--max-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "rows.db")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.rows import as_dict
+    from app.core.tracing import tracer
+    from app.config.constants import WorkOrderStatus
+    from app.services.zones.sterile_zone_service import SterileZoneService
+    from app.services.work_order_service import WorkOrderService
+
+    init_database()
+    db = get_db()
+    seed(db, args.orders, random.Random(3))
+    tracer.enabled = False
+    sterile = SterileZoneService()
+    orders = WorkOrderService()
+    params = (WorkOrderStatus.RELEASED,)
+
+    results = {}
+    for name, build in (
+            ("dict", lambda: [dict(row) for row in db.fetchall(QUERY, params)]),
+            ("sqlite3.Row", lambda: db.fetchall(QUERY, params)),
+            ("RowView", sterile.get_released_items),
+            ("WorkOrder", lambda: [orders._row_to_work_order(row) for row in db.fetchall(QUERY, params)])):
+        rows, size, elapsed, access = measure(build)
+        results[name] = (len(rows), size, elapsed, access, rows[0] if rows else None)
+        del rows
+
+    print(f"{args.orders} iş emri, {len(COLUMNS)} sütun okuma")
+    print(f"{'gösterim':<14} {'satır':>7} {'bellek KB':>10} {'bayt/satır':>11} {'oluşturma':>10} {'okuma':>9}")
+    for name, (count, size, elapsed, access, _) in results.items():
+        print(f"{name:<14} {count:>7} {size // 1024:>10} {size / max(count, 1):>11.0f} "
+              f"{elapsed:>8.1f}ms {access:>7.1f}ms")
+
+    failures = 0
+    ratio = results["RowView"][1] / max(results["dict"][1], 1)
+    print(f"RowView / dict bellek oranı: {ratio:.2f} (sınır {args.max_ratio:.2f})")
+    if ratio > args.max_ratio:
+        failures += 1
+    if as_dict(results["RowView"][4]) != results["dict"][4]:
+        print("  hata: RowView içeriği dict ile aynı değil")
+        failures += 1
+    if hasattr(results["WorkOrder"][4], "__dict__"):
+        print("  hata: WorkOrder örneklerinde __dict__ var")
+        failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
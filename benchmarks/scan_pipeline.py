@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def stream(pipeline, codes, zone, rate: float, double_read: float, rng) -> int:
+    interval = 1.0 / rate
+    doubles = 0
+    start = time.perf_counter()
+    for n, code in enumerate(codes):
+        due = start + n * interval
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        pipeline.submit(code, zone, captured_at=due)
+        if rng.random() < double_read:
+            pipeline.submit(code, zone)
+            doubles += 1
+    pipeline.flush()
+    return doubles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Barkod tarama hattı gecikme ve çift okuma testi")
+    parser.add_argument("--sets", type=int, default=150)
+    parser.add_argument("--rate", type=float, default=10.0)
+    parser.add_argument("--double-read", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    settings.database.path = os.path.join(tempfile.mkdtemp(), "scan.db")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.writer import background_writer
+    from app.services.auth_service import AuthService
+    from app.services.scanner import ScanPipeline, ScanActions
+
+    init_database()
+    db = get_db()
+    rng = random.Random(args.seed)
+    codes = [f"SET{n:06d}" for n in range(args.sets)]
+    db.executemany("INSERT INTO instrument_sets (barcode, name) VALUES (?, ?)",
+                   [(code, f"Set {n}") for n, code in enumerate(codes)])
+    db.commit()
+
+    ok, message, _ = AuthService().authenticate_by_badge("ADMIN001")
+    assert ok, message
+
+    pipeline = ScanPipeline()
+    results = []
+    lock = threading.Lock()
+
+    def on_result(result):
+        with lock:
+            results.append(result)
+
+    pipeline.set_handler(on_result)
+
+    failures = 0
+    phases = (
+        ("DIRTY", None, ScanActions.RECEIVE),
+        ("CLEAN", "WASHED", ScanActions.TRANSFER_CLEAN),
+        ("STERILE", "PACKAGED", ScanActions.TRANSFER_STERILE),
+    )
+    for zone, prepare, action in phases:
+        if prepare:
+            db.execute("UPDATE work_orders SET status = ?", (prepare,))
+            db.commit()
+        del results[:]
+        order = codes[:]
+        rng.shuffle(order)
+        started = time.perf_counter()
+        doubles = stream(pipeline, order, zone, args.rate, args.double_read, rng)
+        elapsed = time.perf_counter() - started
+
+        done = sum(1 for r in results if r.action == action and r.ok)
+        duplicates = sum(1 for r in results if r.action == ScanActions.DUPLICATE)
+        rejected = [r for r in results if not r.ok]
+        print(f"{zone:<8} {done}/{args.sets} {action}, çift okuma {duplicates}/{doubles}, "
+              f"red {len(rejected)}, {args.sets / elapsed:.1f} tarama/s")
+        for r in rejected[:3]:
+            print(f"  red: {r.code} {r.message}")
+        if done != args.sets or duplicates != doubles or rejected:
+            failures += 1
+
+    time.sleep(settings.scanner.dedupe_window_ms / 1000 + 0.1)
+    del results[:]
+    stream(pipeline, codes[:20], "DIRTY", args.rate * 4, 0.0, rng)
+    rescans = sum(1 for r in results if r.order_id is not None and r.action != ScanActions.RECEIVE)
+    print(f"Pencere sonrası tekrar: {rescans}/20 mevcut iş emrine bağlandı, "
+          f"{sum(1 for r in results if r.action == ScanActions.RECEIVE)} yeni kabul")
+
+    del results[:]
+    burst_start = time.perf_counter()
+    for code in codes:
+        pipeline.submit(code, None)
+    pipeline.flush()
+    burst = time.perf_counter() - burst_start
+    print(f"Yığın sorgu: {len(results)} tarama {burst * 1000:.0f} ms, {len(results) / burst:.0f} tarama/s")
+
+    orders = db.fetchone("SELECT COUNT(*) FROM work_orders")[0]
+    records = db.fetchone("SELECT COUNT(*) FROM process_records")[0]
+    sterile = db.fetchone("SELECT COUNT(*) FROM work_orders WHERE status = 'STERILIZING'")[0]
+    print(f"İş emri {orders}/{args.sets}, süreç kaydı {records}/{args.sets * 3}, steril {sterile}/{args.sets}")
+    if orders != args.sets or records != args.sets * 3 or sterile != args.sets or rescans != 20:
+        failures += 1
+
+    time.sleep(settings.scanner.dedupe_window_ms / 1000 + 0.1)
+    del results[:]
+    db.execute("UPDATE work_orders SET status = 'WASHED' WHERE item_id = 1")
+    db.commit()
+    db.execute("BEGIN IMMEDIATE")
+    pipeline.submit(codes[0], "CLEAN")
+    while pipeline.pending:
+        time.sleep(0.005)
+    db.execute("UPDATE work_orders SET status = 'INSPECTION_FAILED' WHERE item_id = 1")
+    db.commit()
+    pipeline.flush()
+    stale = results[0] if results else None
+    after = db.fetchone("SELECT COUNT(*) FROM process_records")[0]
+    print(f"Yarış kaybı: {stale.action if stale else '-'} '{stale.message if stale else '-'}', "
+          f"süreç kaydı {after - records} yeni")
+    if not stale or stale.ok or stale.action != ScanActions.REJECTED or after != records:
+        failures += 1
+
+    print(pipeline.report())
+    print(f"Hata: hat {pipeline.stats['errors']}, yazıcı {background_writer.errors}")
+    pipeline.stop()
+    background_writer.stop()
+    over = pipeline.over_budget()
+    print(f"p99 {pipeline.metrics['total'].percentile(99):.1f} ms (bütçe {settings.scanner.latency_budget_ms:.0f} ms)"
+          f"{' AŞILDI' if over else ''}")
+    return 1 if failures or over or pipeline.stats['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.scanner import ScannerService, SimulatedScanner, SerialScanner
+
+
+def run_evdev(scans: int, key_ms: float, gap_ms: float, seed: int) -> int:
+    rng = random.Random(seed)
+    simulator = SimulatedScanner(key_ms=key_ms, gap_ms=gap_ms, seed=seed)
+    service = ScannerService([simulator.device()])
+    received = []
+    done = threading.Event()
+
+    def on_scan(event):
+        received.append((event, time.perf_counter()))
+        if len(received) == scans:
+            done.set()
+
+    service.set_handler(on_scan)
+    service.start()
+
+    typed = 0
+    started = time.perf_counter()
+    for n in range(scans):
+        simulator.scan(f"WO{rng.randint(0, 999999):06d}{rng.choice('ABCDEF')}{n:04d}")
+        if n % 25 == 24:
+            simulator.type_text(rng.choice(["steril", "Kontrol 12", "abc"]) + "\n")
+            typed += 1
+    done.wait(30)
+    elapsed = time.perf_counter() - started
+    service.stop()
+
+    codes = [event.code for event, _ in received]
+    ordered = [event.sequence for event, _ in received] == sorted(event.sequence for event, _ in received)
+    lost = len(simulator.sent) - len(codes)
+    leaked = [code for code in codes if code not in simulator.sent]
+    print(f"evdev: {len(codes)}/{scans} tarama, {elapsed * 1000:.0f} ms, kayıp {lost}, "
+          f"sıra {'doğru' if codes == simulator.sent and ordered else 'HATALI'}, "
+          f"klavye parçası {service.stats['typing']} (yazılan {typed} satır), sızan {len(leaked)}")
+    return 0 if codes == simulator.sent and not leaked else 1
+
+
+def run_serial(scans: int) -> int:
+    master, slave = os.openpty()
+    device = SerialScanner(os.ttyname(slave))
+    service = ScannerService([device])
+    service.start()
+    while device.fd is None:
+        time.sleep(0.01)
+    sent = [f"SR{n:06d}ABCD" for n in range(scans)]
+    for code in sent:
+        os.write(master, (code + "\r\n").encode())
+    received = []
+    deadline = time.time() + 10
+    while len(received) < scans and time.time() < deadline:
+        event = service.get(timeout=0.5)
+        if event:
+            received.append(event.code)
+    service.stop()
+    os.close(master)
+    print(f"seri: {len(received)}/{scans} tarama, sıra {'doğru' if received == sent else 'HATALI'}")
+    return 0 if received == sent else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Barkod tarayıcı ardışık okuma testi")
+    parser.add_argument("--scans", type=int, default=500)
+    parser.add_argument("--key-ms", type=float, default=1.0)
+    parser.add_argument("--gap-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    failures = run_evdev(args.scans, args.key_ms, args.gap_ms, args.seed)
+    failures += run_serial(min(args.scans, 200))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
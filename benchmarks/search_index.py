@@ -0,0 +1,183 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+NAMES = ("Kocher Pensi", "Metzenbaum Makası", "Mayo Makası", "Portegü", "İğne Tutucu", "Ekartör",
+         "Işıklı Retraktör", "Bisturi Sapı", "Doku Forsepsi", "Aspiratör Ucu", "Küret", "Şırınga Adaptörü",
+         "Çift Uçlu Disektör", "Ölçüm Probu", "Trokar", "Laparoskopik Grasper", "Kemik Rongeur", "Osteotom")
+CATEGORIES = ("Genel Cerrahi", "Ortopedi", "Kadın Doğum", "Göz", "KBB", "Üroloji", "Beyin Cerrahisi")
+MAKERS = ("Aesculap", "KLS Martin", "Medicon", "Stille", "Karl Storz")
+
+QUERIES = ("koc", "kocher", "kocher pen", "makas", "MAKASI", "igne", "İĞNE", "ığne tut", "isikli",
+           "IŞIKLI ret", "siringa", "cift uclu", "olcum", "INS0012", "INS00500", "SET001", "WO2026",
+           "ortopedi kuret", "storz trokar", "xyz")
+
+
+def seed(db, instruments: int, sets: int, orders: int, rng) -> None:
+    db.executemany("""
+        INSERT INTO instruments (barcode, name, description, category, manufacturer, serial_number)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, ((f"INS{n:07d}", f"{rng.choice(NAMES)} {rng.randint(10, 30)} cm", f"{rng.choice(CATEGORIES)} aleti",
+           rng.choice(CATEGORIES), rng.choice(MAKERS), f"SN{rng.randrange(10 ** 8):08d}")
+          for n in range(instruments)))
+    db.executemany("""
+        INSERT INTO instrument_sets (barcode, name, description, category) VALUES (?, ?, ?, ?)
+    """, ((f"SET{n:06d}", f"{rng.choice(CATEGORIES)} Seti {n}", "Standart set", rng.choice(CATEGORIES))
+          for n in range(sets)))
+    db.executemany("""
+        INSERT INTO work_orders (order_number, barcode, item_type, item_id, item_name, item_barcode, status)
+        VALUES (?, ?, 'SET', ?, ?, ?, 'COMPLETED')
+    """, ((f"WO2026{n:07d}", f"WO{n:08X}", n % sets + 1, f"{CATEGORIES[n % len(CATEGORIES)]} Seti {n % sets}",
+           f"SET{n % sets:06d}") for n in range(orders)))
+    db.commit()
+
+
+def timed(histogram, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    histogram.record((time.perf_counter() - start) * 1000)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tam metin arama indeksi gecikme testi")
+    parser.add_argument("--instruments", type=int, default=100000)
+    parser.add_argument("--sets", type=int, default=5000)
+    parser.add_argument("--orders", type=int, default=200000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings.database.path = os.path.join(tempfile.mkdtemp(), "search.db")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.metrics import LatencyHistogram
+    from app.config.constants import SearchKinds
+    from app.services.instrument_service import InstrumentService
+    from app.services.search_service import SearchService, LiveSearch
+
+    init_database()
+    db = get_db()
+    started = time.perf_counter()
+    seed(db, args.instruments, args.sets, args.orders, random.Random(args.seed))
+    print(f"{args.instruments} alet, {args.sets} set, {args.orders} iş emri yüklendi "
+          f"(tetikleyicilerle {time.perf_counter() - started:.1f} s)")
+
+    failures = 0
+    instruments = InstrumentService()
+    search = SearchService()
+    fts_hist, global_hist, like_hist = (LatencyHistogram("fts"), LatencyHistogram("global"),
+                                        LatencyHistogram("like"))
+    for _ in range(args.rounds):
+        for query in QUERIES:
+            timed(fts_hist, instruments.search_instruments, query)
+            timed(global_hist, search.search, query)
+    for query in QUERIES[:5]:
+        like = f"%{query}%"
+        timed(like_hist, db.fetchall, """
+            SELECT * FROM instruments WHERE name LIKE ? OR barcode LIKE ? OR description LIKE ?
+            ORDER BY name LIMIT 50
+        """, (like, like, like))
+
+    print(f"search_instruments (FTS5) : {fts_hist}")
+    print(f"genel arama (3 tür)       : {global_hist}")
+    print(f"eski LIKE taraması        : {like_hist}")
+    if fts_hist.percentile(99) > args.budget_ms or global_hist.percentile(99) > args.budget_ms:
+        print(f"  hata: p99 {args.budget_ms:.0f} ms bütçesini aşıyor")
+        failures += 1
+
+    checks = {
+        "igne": "İğne Tutucu", "İĞNE": "İğne Tutucu", "ığne": "İğne Tutucu",
+        "isikli": "Işıklı Retraktör", "IŞIKLI": "Işıklı Retraktör", "sırınga": "Şırınga Adaptörü",
+    }
+    for query, expected in checks.items():
+        found = instruments.search_instruments(query, 5)
+        ok = bool(found) and all(expected in item.name for item in found)
+        print(f"  '{query}' -> {found[0].name if found else '-'} {'tamam' if ok else 'HATA'}")
+        failures += not ok
+
+    for query, kind, prefix in (("ins00500", SearchKinds.INSTRUMENT, "INS00500"),
+                                ("SET0012 ortopedi", SearchKinds.SET, "SET0012"),
+                                ("wo20260001", SearchKinds.WORK_ORDER, "WO20260001")):
+        hits = search.search(query, (kind,))
+        ok = bool(hits) and all(hit.code.startswith(prefix) for hit in hits)
+        if kind == SearchKinds.SET:
+            unfiltered = search.search(prefix, (kind,))
+            ok = ok and len(hits) < len(unfiltered) and set(hits) <= set(unfiltered)
+        print(f"  kod '{query}' -> {len(hits)} sonuç, ilk {hits[0].code if hits else '-'} "
+              f"{'tamam' if ok else 'HATA'}")
+        failures += not ok
+
+    db.execute("""
+        INSERT INTO instruments (barcode, name, category, model_number)
+        VALUES ('INS9900001', 'Mayo Makası 20cm', 'Genel Cerrahi', 'MZ200')
+    """)
+    db.commit()
+    for query in ("Makas 20cm", "20cm", "MZ200", "mz20 makas"):
+        hits = search.search(query, (SearchKinds.INSTRUMENT,))
+        ok = any(hit.code == "INS9900001" for hit in hits)
+        print(f"  karışık '{query}' -> {len(hits)} sonuç {'tamam' if ok else 'HATA'}")
+        failures += not ok
+
+    target = instruments.search_instruments("INS0000042", 1)
+    first = target[0].id if target else None
+    db.execute("UPDATE instruments SET name = 'Zımba Özel' WHERE id = ?", (first,))
+    db.commit()
+    renamed = [i.id for i in instruments.search_instruments("zimba ozel")]
+    db.execute("DELETE FROM instruments WHERE id = ?", (first,))
+    db.commit()
+    removed = instruments.search_instruments("zimba ozel")
+    print(f"Tetikleyici senkronu: güncelleme {'tamam' if renamed == [first] else 'HATA'}, "
+          f"silme {'tamam' if not removed else 'HATA'}")
+    failures += renamed != [first] or bool(removed)
+
+    results = []
+    done = threading.Event()
+
+    def deliver(result):
+        results.append(result)
+        if result.query == "kocher pensi 20":
+            done.set()
+
+    live = LiveSearch(deliver, kinds=(SearchKinds.INSTRUMENT,))
+    for n in range(1, len("kocher pensi 20") + 1):
+        live.submit("kocher pensi 20"[:n])
+        time.sleep(0.025)
+    done.wait(5)
+    live.stop()
+    final = results[-1] if results else None
+    print(f"Yazarken arama: 15 tuş, {len(results)} sonuç teslim, {live.cancelled} iptal/eski, "
+          f"son sorgu '{final.query if final else '-'}' {len(final.hits) if final else 0} sonuç "
+          f"{final.elapsed_ms if final else 0:.1f} ms (gecikme dahil)")
+    if not final or final.query != "kocher pensi 20" or not final.hits or len(results) > 8:
+        failures += 1
+
+    settings.search.debounce_ms = 0
+    results.clear()
+    done.clear()
+    live = LiveSearch(deliver)
+    for n in range(1, len("kocher pensi 20") + 1):
+        live.submit("kocher pensi 20"[:n])
+        time.sleep(0.0005)
+    done.wait(5)
+    time.sleep(0.05)
+    live.stop()
+    print(f"Gecikmesiz: {len(results)} sonuç teslim, {live.cancelled} kesildi/eski, "
+          f"son '{results[-1].query if results else '-'}'")
+    if not results or results[-1].query != "kocher pensi 20" or live.completed + live.cancelled > 15:
+        failures += 1
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def _use_server(address: str):
+    settings.database.mode = "remote"
+    settings.database.server_address = address
+
+
+def kiosk(address: str, kiosk_id: int, orders: int, results):
+    _use_server(address)
+    from app.core.database import get_db
+
+    db = get_db()
+    latencies = []
+    errors = 0
+    for n in range(orders):
+        t0 = time.perf_counter()
+        try:
+            db.execute("""
+                INSERT INTO work_orders (order_number, item_type, item_id, status, current_zone)
+                VALUES (?, 'SET', 1, 'RECEIVED', 'DIRTY')
+            """, (f"K{kiosk_id:02d}-{n:06d}",))
+            order_id = db.get_last_insert_id()
+            db.execute("""
+                INSERT INTO process_records (work_order_id, process_type, zone)
+                VALUES (?, 'RECEIVE', 'DIRTY')
+            """, (order_id,))
+            db.commit()
+        except Exception:
+            db.rollback()
+            errors += 1
+        latencies.append(time.perf_counter() - t0)
+    results.put((kiosk_id, latencies, errors))
+    db.close()
+
+
+def watcher(address: str, expected: int, ready, results):
+    _use_server(address)
+    from app.core.database import get_db
+
+    db = get_db()
+    received = multiprocessing.Value("i", 0)
+    first = []
+
+    def on_change(tables):
+        if "work_orders" in tables:
+            if not first:
+                first.append(time.perf_counter())
+            with received.get_lock():
+                received.value += 1
+
+    db.add_change_listener(on_change)
+    db.fetchone("SELECT 1")
+    ready.set()
+
+    deadline = time.time() + 60
+    while received.value < expected and time.time() < deadline:
+        time.sleep(0.01)
+    results.put(("watcher", received.value, 0))
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paylaşımlı veritabanı çoklu kiosk testi")
+    parser.add_argument("--kiosks", type=int, default=4)
+    parser.add_argument("--orders", type=int, default=250)
+    parser.add_argument("--tcp", action="store_true")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "shared.db")
+    address = "127.0.0.1:0" if args.tcp else os.path.join(workdir, "db.sock")
+
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.db_server import DatabaseServer
+
+    init_database()
+    get_db().close()
+
+    server = DatabaseServer(settings.database.path, address).start()
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    ready = ctx.Event()
+    total = args.kiosks * args.orders
+
+    watch = ctx.Process(target=watcher, args=(server.address, total, ready, results))
+    watch.start()
+    ready.wait(30)
+
+    t0 = time.perf_counter()
+    workers = [
+        ctx.Process(target=kiosk, args=(server.address, i, args.orders, results))
+        for i in range(args.kiosks)
+    ]
+    for worker in workers:
+        worker.start()
+
+    latencies = []
+    errors = 0
+    notified = 0
+    for _ in range(args.kiosks + 1):
+        name, data, failed = results.get(timeout=120)
+        if name == "watcher":
+            notified = data
+        else:
+            latencies.extend(data)
+            errors += failed
+    elapsed = time.perf_counter() - t0
+
+    for process in workers + [watch]:
+        process.join()
+
+    _use_server(server.address)
+    db = get_db()
+    db.close()
+    count = db.fetchone("SELECT COUNT(*) FROM work_orders")[0]
+    db.close()
+    server.shutdown()
+
+    latencies.sort()
+    print(f"{args.kiosks} kiosk x {args.orders} iş emri, {elapsed:.2f} s "
+          f"({total / elapsed:.0f} işlem/s)")
+    print(f"Gecikme p50 {latencies[len(latencies) // 2] * 1000:.2f} ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+    print(f"Kayıt: {count}/{total}  hata: {errors}  bildirim: {notified}/{total}")
+    return 0 if count == total and not errors and notified == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def seed(db, orders: int, rng) -> None:
+    now = datetime.now()
+    db.executemany("""
+        INSERT INTO work_orders (order_number, barcode, item_type, item_id, item_name, item_barcode,
+            status, current_zone, completed_at)
+        VALUES (?, ?, 'SET', ?, ?, ?, 'COMPLETED', 'STERILE', ?)
+    """, ((f"WO2026{n:07d}", f"WO{n:08X}", n % 500 + 1, f"Cerrahi Set {n % 500}", f"SET{n % 500:06d}",
+           now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))) for n in range(orders)))
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yavaş sorgu günlüğü ve EXPLAIN yakalama testi")
+    parser.add_argument("--orders", type=int, default=200000)
+    parser.add_argument("--threshold-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "slow.db")
+    settings.diagnostics.slow_query_log = os.path.join(workdir, "logs", "slow_queries.log")
+    settings.diagnostics.slow_query_ms = 1e9
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.slow_query import slow_queries, read_log
+    from app.core.tracing import tracer
+    from app.services.work_order_service import WorkOrderService
+
+    init_database()
+    db = get_db()
+    seed(db, args.orders, random.Random(5))
+    print(f"{args.orders} iş emri yüklendi")
+
+    tracer.enabled = False
+    calls = 20000
+    connection = db.connection
+    raw, checked = [], []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(calls):
+            connection.execute("SELECT 1").fetchone()
+        raw.append((time.perf_counter() - start) / calls * 1e6)
+        start = time.perf_counter()
+        for _ in range(calls):
+            db.fetchone("SELECT 1")
+        checked.append((time.perf_counter() - start) / calls * 1e6)
+    print(f"Hızlı sorgu: ham {min(raw):.2f} µs, Database.fetchone {min(checked):.2f} µs "
+          f"(eşik denetimi dahil, izleme kapalı)")
+
+    settings.diagnostics.slow_query_ms = args.threshold_ms
+    orders = WorkOrderService()
+    failures = 0
+    for n in range(5):
+        orders.get_work_order_by_barcode(f"INS{n:07d}")
+    db.fetchone("SELECT COUNT(*) FROM work_orders WHERE DATE(completed_at) = DATE('now')")
+    db.fetchone("SELECT COUNT(*) FROM work_orders WHERE barcode = ?", ("WO00000010",))
+
+    records = read_log(settings.diagnostics.slow_query_log)
+    by_query = {record['query']: record for record in records}
+    print(f"Günlükte {len(records)} kayıt, {len(slow_queries.stats)} farklı yavaş sorgu")
+    for record in records:
+        scans = ", ".join(f"{scan['table']}:{scan['rows']}" for scan in record['full_scans']) or "-"
+        print(f"  {record['ms']:7.1f} ms  tarama {scans:<18} {record['params']:<18} {record['query'][:70]}")
+        for line in record['plan']:
+            print(f"             {line}")
+        print(f"             @ {record['stack'][0] if record['stack'] else '?'}")
+
+    barcode = next((r for q, r in by_query.items() if "barcode = ? OR item_barcode = ?" in q), None)
+    today = next((r for q, r in by_query.items() if "DATE(completed_at)" in q), None)
+    for label, record, caller in (("OR barkod", barcode, "work_order_service.py"),
+                                  ("DATE(completed_at)", today, "slow_query.py")):
+        ok = (record is not None and record['full_scans'] and record['full_scans'][0]['table'] == "work_orders"
+              and record['stack'] and caller in record['stack'][0])
+        print(f"{label}: {'tam tarama işaretlendi' if ok else 'HATA'}")
+        failures += not ok
+    if any("barcode = ?" == q.split("WHERE ")[-1] for q in by_query):
+        print("  hata: indeksli sorgu yavaş olarak kaydedildi")
+        failures += 1
+
+    stats = next((v for q, v in slow_queries.stats.items() if "OR item_barcode" in q), {'count': 0})
+    print(f"Tekrar bastırma: {stats['count']} yavaş çağrı, {1 if barcode else 0} günlük kaydı")
+    if stats['count'] != 5 or sum("OR item_barcode" in r['query'] for r in records) != 1:
+        failures += 1
+
+    slow_queries.close()
+    settings.diagnostics.slow_query_log_bytes = 4096
+    settings.diagnostics.slow_query_log_backups = 2
+    settings.diagnostics.slow_query_ms = 0
+    for n in range(200):
+        db.fetchone(f"SELECT {n} FROM work_orders WHERE id = ?", (n,))
+    slow_queries.close()
+    logs = sorted(name for name in os.listdir(os.path.dirname(settings.diagnostics.slow_query_log)))
+    sizes = [os.path.getsize(os.path.join(os.path.dirname(settings.diagnostics.slow_query_log), name))
+             for name in logs]
+    print(f"Döndürme: {logs}, en büyük {max(sizes)} bayt")
+    if len(logs) != 3 or max(sizes) > 4096 + 2048:
+        failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import os
+import sys
+import sqlite3
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+
+def kiosk(workdir: str, name: str, action: str, order_number: str, status: str):
+    settings.database.path = os.path.join(workdir, f"{name}.db")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.services.auth_service import AuthService
+    from app.services.sync.server import SyncServer
+    from app.services.sync.transport import LocalTransport
+    from app.services.sync.sync_service import SyncService
+    from app.services.work_order_service import WorkOrderService
+    from app.services.zones.clean_zone_service import CleanZoneService
+
+    init_database()
+    db = get_db()
+    AuthService().authenticate_by_badge("ADMIN001")
+    sync = SyncService(LocalTransport(SyncServer(os.path.join(workdir, "server.db"))))
+
+    row = db.fetchone("SELECT id FROM work_orders WHERE order_number = ?", (order_number,))
+    if action == "create":
+        db.execute("""
+            INSERT INTO work_orders (order_number, item_type, item_id, status, current_zone)
+            VALUES (?, 'SET', 1, ?, 'CLEAN')
+        """, (order_number, status))
+        db.commit()
+    elif action == "set":
+        db.execute("UPDATE work_orders SET status = ? WHERE id = ?", (status, row['id']))
+        db.commit()
+    elif action == "reprocess":
+        ok, message = WorkOrderService().send_to_reprocessing(row['id'], "senkron testi")
+        print(f"  {name}: tekrar işleme -> {ok} {message}")
+    elif action == "reprocess-clean":
+        ok, message = CleanZoneService().send_to_reprocess(row['id'], "senkron testi")
+        print(f"  {name}: temiz alan tekrar işleme -> {ok} {message}")
+
+    result = sync.sync_now()
+    if result.error:
+        print(f"  {name}: senkron hatası {result.error}")
+    db.close()
+
+
+def _state(workdir: str, name: str, order_number: str):
+    connection = sqlite3.connect(os.path.join(workdir, f"{name}.db"))
+    try:
+        row = connection.execute(
+            "SELECT status, status_epoch FROM work_orders WHERE order_number = ?", (order_number,)
+        ).fetchone()
+    finally:
+        connection.close()
+    return tuple(row) if row else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İki kiosk arasında durum birleştirme testi")
+    parser.add_argument("--kiosk", nargs=5, metavar=("WORKDIR", "NAME", "ACTION", "ORDER", "STATUS"))
+    args = parser.parse_args()
+    if args.kiosk:
+        kiosk(*args.kiosk)
+        return 0
+
+    workdir = tempfile.mkdtemp()
+
+    def step(name: str, action: str, order_number: str, status: str = "-"):
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--kiosk",
+                        workdir, name, action, order_number, status], check=True)
+
+    failures = 0
+
+    def expect(title: str, order_number: str, status: str):
+        nonlocal failures
+        a, b = _state(workdir, "kiosk-a", order_number), _state(workdir, "kiosk-b", order_number)
+        ok = a == b and a is not None and a[0] == status
+        print(f"{title}: A {a}  B {b}  beklenen {status}  {'tamam' if ok else 'HATA'}")
+        failures += 0 if ok else 1
+
+    step("kiosk-a", "create", "M0000001", "INSPECTION_FAILED")
+    step("kiosk-b", "sync", "M0000001")
+    step("kiosk-a", "set", "M0000001", "RELEASED")
+    step("kiosk-b", "reprocess", "M0000001")
+    step("kiosk-a", "sync", "M0000001")
+    step("kiosk-b", "sync", "M0000001")
+    expect("Serbest bırakma / eski tekrar işleme", "M0000001", "RELEASED")
+
+    step("kiosk-b", "reprocess", "M0000001")
+    step("kiosk-b", "reprocess-clean", "M0000001")
+    step("kiosk-a", "sync", "M0000001")
+    expect("Serbest bırakılmış iş emri reddi", "M0000001", "RELEASED")
+
+    step("kiosk-a", "create", "M0000002", "RELEASED")
+    step("kiosk-b", "sync", "M0000002")
+    step("kiosk-a", "set", "M0000002", "RECALLED")
+    step("kiosk-b", "sync", "M0000002")
+    step("kiosk-b", "reprocess", "M0000002")
+    step("kiosk-a", "sync", "M0000002")
+    expect("Geri çağırma / tekrar işleme", "M0000002", "REPROCESSING")
+
+    step("kiosk-a", "create", "M0000003", "RELEASED")
+    step("kiosk-b", "sync", "M0000003")
+    step("kiosk-a", "set", "M0000003", "RECALLED")
+    step("kiosk-b", "set", "M0000003", "STORED")
+    step("kiosk-a", "sync", "M0000003")
+    step("kiosk-b", "sync", "M0000003")
+    step("kiosk-a", "sync", "M0000003")
+    expect("Geri çağırma / eşzamanlı depolama", "M0000003", "RECALLED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+
+ACTIVE = ("RECEIVED", "WASHING", "WASHED", "INSPECTING", "INSPECTION_FAILED", "PACKAGING", "PACKAGED",
+          "STERILIZING", "PENDING_RELEASE", "RELEASED")
+ZONES = {"RECEIVED": "DIRTY", "WASHING": "DIRTY", "WASHED": "DIRTY", "INSPECTING": "CLEAN",
+         "INSPECTION_FAILED": "CLEAN", "PACKAGING": "CLEAN", "PACKAGED": "CLEAN"}
+
+
+def seed(db, orders: int, active: int, rng) -> None:
+    db.execute("INSERT INTO departments (name, code) VALUES ('Ameliyathane', 'AMH')")
+    rows = []
+    for n in range(orders):
+        status = ACTIVE[n % len(ACTIVE)] if n >= orders - active * len(ACTIVE) else "COMPLETED"
+        rows.append((f"WO2026{n:07d}", f"WO{n:08X}", rng.randint(1, 500), f"Cerrahi Set {n % 500}",
+                     f"SET{n % 500:06d}", status, ZONES.get(status, "STERILE"), rng.randint(0, 2)))
+    db.executemany("""
+        INSERT INTO work_orders (order_number, barcode, item_type, item_id, item_name, item_barcode,
+            department_id, status, current_zone, priority)
+        VALUES (?, ?, 'SET', ?, ?, ?, 1, ?, ?, ?)
+    """, rows)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İzleme katmanının kullanıcı eylemlerine maliyeti")
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--active", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--budget-pct", type=float, default=1.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "tracing.db")
+    settings.diagnostics.trace_path = os.path.join(workdir, "traces")
+    from app.core.schema import init_database
+    from app.core.database import get_db
+    from app.core.tracing import tracer, traced, load_folded, top_frames
+    from app.services.work_order_service import WorkOrderService
+    from app.services.zones import DirtyZoneService, CleanZoneService, SterileZoneService
+    from app.services.maintenance_service import MaintenanceService
+
+    init_database()
+    db = get_db()
+    rng = random.Random(3)
+    seed(db, args.orders, args.active, rng)
+
+    dirty, clean, sterile = DirtyZoneService(), CleanZoneService(), SterileZoneService()
+    orders, maintenance = WorkOrderService(), MaintenanceService()
+    barcodes = [f"WO{n:08X}" for n in rng.sample(range(args.orders), 20)]
+
+    def session():
+        with tracer.action("dashboard"):
+            len(dirty.get_pending_items()), len(dirty.get_washing_items())
+            maintenance.get_upcoming()
+        with tracer.action("zone.dirty"):
+            dirty.get_pending_items(), dirty.get_washing_items(), dirty.get_washed_items()
+        with tracer.action("zone.clean"):
+            clean.get_pending_inspection(), clean.get_pending_packaging()
+            clean.get_packaged_items(), clean.get_failed_items()
+        with tracer.action("zone.sterile"):
+            sterile.get_sterilizing_items(), sterile.get_pending_release_items(), sterile.get_released_items()
+        for barcode in barcodes:
+            with tracer.action("scan"):
+                orders.get_work_order_by_barcode(barcode)
+
+    def timed(enabled: bool) -> float:
+        tracer.enabled = enabled
+        start = time.perf_counter()
+        session()
+        return time.perf_counter() - start
+
+    session()
+
+    def noop():
+        pass
+
+    wrapped = traced("bos")(noop)
+    calls = 20000
+    span_cost = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(calls):
+            wrapped()
+        span_cost.append((time.perf_counter() - start) / calls)
+    tracer.enabled = False
+    start = time.perf_counter()
+    for _ in range(calls):
+        wrapped()
+    disabled_cost = (time.perf_counter() - start) / calls
+    tracer.enabled = True
+
+    tracer.reset()
+    off, on = [], []
+    for n in range(args.rounds):
+        for enabled in ((False, True) if n % 2 else (True, False)):
+            (on if enabled else off).append(timed(enabled))
+
+    base, measured = min(off), min(on)
+    spans = sum(h.count for h in tracer.histograms().values()) / args.rounds
+    overhead = spans * min(span_cost) / base * 100
+    print(f"Oturum (24 eylem): izsiz {base * 1000:.2f} ms, izli {measured * 1000:.2f} ms "
+          f"(doğrudan fark %{(measured - base) / base * 100:+.2f}, tek çekirdekte gürültülü)")
+    print(f"Aralık maliyeti {min(span_cost) * 1e6:.2f} µs (kapalıyken {disabled_cost * 1e6:.2f} µs) x "
+          f"{spans:.0f} aralık/oturum = %{overhead:.2f} ek maliyet (bütçe %{args.budget_pct:.1f})")
+
+    failures = int(overhead > args.budget_pct)
+    scans = [record for record in tracer.recent_actions() if record.name == "scan"]
+    zones = [record for record in tracer.recent_actions() if record.name == "zone.clean"]
+    print(f"Eylem halkası: {len(tracer.actions)}/{tracer.actions.maxlen}, tarama başına "
+          f"{scans[-1].queries if scans else 0} sorgu, temiz alan {zones[-1].queries if zones else 0} sorgu "
+          f"{zones[-1].query_ms if zones else 0:.2f} ms")
+    if not scans or scans[-1].queries < 2 or not zones or zones[-1].queries != 4:
+        failures += 1
+
+    path = tracer.dump()
+    stacks = load_folded(path)
+    print(f"İz: {path} ({len(stacks)} yığın)")
+    for frame, own, total in top_frames(stacks, 5):
+        print(f"  {own / 1000:8.1f} ms {total / 1000:8.1f} ms  {frame}")
+    expected = "MainThread;zone.clean;CleanZoneService.get_pending_inspection;db.fetchall"
+    if expected not in stacks or not os.path.exists(path[:-len(".folded")] + ".txt"):
+        print(f"  hata: '{expected}' yığını yok")
+        failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
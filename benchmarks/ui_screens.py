@@ -0,0 +1,341 @@
+import os
+import gc
+import sys
+import json
+import time
+import random
+import shutil
+import sqlite3
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import settings
+from benchmarks.workload import PROFILES
+from benchmarks.hospital import BASELINES, prepare, operations, compare, git_commit
+
+SCREENS = {
+    'dashboard': ("app.ui.screens.dashboard_screen", "DashboardScreen", None, ()),
+    'dirty': ("app.ui.zones.dirty_zone_screen", "DirtyZoneScreen", "DIRTY",
+              (("set_pending_data", "dirty_service", "get_pending_items"),
+               ("set_washing_data", "dirty_service", "get_washing_items"))),
+    'clean': ("app.ui.zones.clean_zone_screen", "CleanZoneScreen", "CLEAN",
+              (("set_inspection_data", "clean_service", "get_pending_inspection"),
+               ("set_packaging_data", "clean_service", "get_pending_packaging"))),
+    'sterile': ("app.ui.zones.sterile_zone_screen", "SterileZoneScreen", "STERILE",
+                (("set_sterilizing_data", "sterile_service", "get_sterilizing_items"),
+                 ("set_pending_data", "sterile_service", "get_pending_release_items"),
+                 ("set_released_data", "sterile_service", "get_released_items"))),
+}
+TEMPLATE_QUERY = """
+    SELECT wo.*, sr.record_number, sr.ci_result, sr.bi_result, sr.released_at, sr.expiry_date,
+        sr.storage_location, mc.cycle_number, mc.start_time, m.name as machine_name,
+        d.name as department_name
+    FROM work_orders wo
+    JOIN sterilization_records sr ON sr.work_order_id = wo.id
+    JOIN machine_cycles mc ON mc.id = sr.cycle_id
+    JOIN machines m ON m.id = mc.machine_id
+    LEFT JOIN departments d ON d.id = wo.department_id
+    ORDER BY wo.id DESC LIMIT 20
+"""
+SIZE = (1280, 800)
+
+
+def rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def expand(rows: list, templates: list, count: int) -> list:
+    source = [dict(row) for row in rows] or templates
+    expanded = []
+    for n in range(count):
+        row = dict(source[n % len(source)])
+        row['id'] = n + 1
+        if row.get('order_number'):
+            row['order_number'] = f"{row['order_number'][:10]}{n:04d}"
+        expanded.append(row)
+    return expanded
+
+
+class Recorder:
+
+    def __init__(self):
+        from app.core.metrics import LatencyHistogram
+        self.Histogram = LatencyHistogram
+        self.histograms = {}
+        self.rounds = [{}]
+
+    def record(self, name: str, ms: float):
+        for histograms in (self.histograms, self.rounds[-1]):
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = self.Histogram(name)
+            histogram.record(ms)
+
+    def timed(self, name: str, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        self.record(name, (time.perf_counter() - start) * 1000)
+        return result
+
+
+class Heartbeat:
+
+    def __init__(self, recorder: Recorder, interval_ms: int):
+        from PySide6.QtCore import QTimer
+        self.recorder = recorder
+        self.interval_ms = interval_ms
+        self.gaps = []
+        self._last = None
+        self.timer = QTimer()
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self._beat)
+
+    def _beat(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            gap = (now - self._last) * 1000
+            self.gaps.append(gap)
+            self.recorder.record("loop.gap", gap)
+        self._last = now
+
+    def start(self):
+        self._last = None
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ekran dışı (offscreen) Qt ile alan ekranlarının performans testi")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="smoke")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--db", help="üretilen veritabanının önbellek yolu")
+    parser.add_argument("--rows", type=int, default=500, help="her tabloya yüklenecek satır sayısı")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--scans", type=int, default=20, help="alan başına simüle edilen okuma")
+    parser.add_argument("--stall-ms", type=float, default=100.0)
+    parser.add_argument("--baseline", help="karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.3)
+    parser.add_argument("--min-delta-ms", type=float, default=2.0)
+    parser.add_argument("--min-count", type=int, default=5)
+    parser.add_argument("--min-memory-kb", type=int, default=4096)
+    args = parser.parse_args()
+
+    try:
+        import PySide6
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QEventLoop, qVersion
+    except ImportError:
+        print("PySide6 kurulu değil, arayüz testi atlandı")
+        return 0
+
+    profile = PROFILES[args.profile]
+    baseline_path = args.baseline or os.path.join(BASELINES, f"ui-{profile.name}-{args.rows}.json")
+    workdir = tempfile.mkdtemp()
+    settings.database.path = os.path.join(workdir, "ui.db")
+    settings.diagnostics.slow_query_log = os.path.join(workdir, "logs", "slow_queries.log")
+    settings.diagnostics.trace_path = os.path.join(workdir, "traces")
+    settings.scanner.devices = []
+    settings.printing.print_on_release = False
+    meta = prepare(settings.database.path, args.db, profile, args.seed)
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    app.setStyle('Fusion')
+    from app.ui.styles import Styles
+    Styles.apply(settings.ui.theme, app)
+
+    import importlib
+    from app.core.database import get_db
+    from app.core.writer import background_writer
+    from app.ui.main_window import MainWindow
+    from app.ui.widgets.tables import DataTable
+
+    classes = {name: getattr(importlib.import_module(module), cls) for name, (module, cls, _, _) in SCREENS.items()}
+    recorder = Recorder()
+
+    def settle():
+        for _ in range(3):
+            app.processEvents(QEventLoop.AllEvents, 50)
+
+    window = MainWindow()
+    ok, message, _ = window.auth_service.authenticate_by_badge("ADMIN001")
+    if not ok:
+        print(f"Giriş başarısız: {message}")
+        return 1
+    settle()
+
+    db = get_db()
+    templates = [dict(row) for row in db.fetchall(TEMPLATE_QUERY)]
+    data = {}
+    for name, (_, _, _, tables) in SCREENS.items():
+        for setter, service, method in tables:
+            data[(name, setter)] = expand(getattr(getattr(window, service), method)(), templates, args.rows)
+    upcoming = window.maintenance_service.get_upcoming()
+
+    cold = {}
+    for name, cls in classes.items():
+        start = time.perf_counter()
+        screen = cls()
+        screen.resize(*SIZE)
+        screen.show()
+        settle()
+        cold[name] = round((time.perf_counter() - start) * 1000, 2)
+        screen.close()
+        screen.deleteLater()
+    settle()
+
+    recorder.rounds = []
+    for _ in range(args.rounds):
+        recorder.rounds.append({})
+        for name, cls in classes.items():
+            start = time.perf_counter()
+            screen = cls()
+            screen.resize(*SIZE)
+            screen.show()
+            settle()
+            recorder.record(f"construct.{name}", (time.perf_counter() - start) * 1000)
+
+            for setter, _, _ in SCREENS[name][3]:
+                recorder.timed(f"set_data.{name}.{setter[4:-5]}", getattr(screen, setter), data[(name, setter)])
+            if name == 'dashboard':
+                recorder.timed("update.dashboard", lambda: (screen.update_stats(12, 8, 40, 25),
+                                                           screen.set_maintenance_alerts(upcoming)))
+            recorder.timed(f"render.{name}", screen.grab)
+            screen.close()
+            screen.deleteLater()
+            settle()
+
+    memory = {}
+    for name, cls in classes.items():
+        gc.collect()
+        settle()
+        before = rss_kb()
+        tracemalloc.start()
+        screen = cls()
+        screen.resize(*SIZE)
+        screen.show()
+        for setter, _, _ in SCREENS[name][3]:
+            getattr(screen, setter)(data[(name, setter)])
+        screen.grab()
+        settle()
+        python_kb = tracemalloc.get_traced_memory()[0] // 1024
+        tracemalloc.stop()
+        rows = sum(table.rowCount() for table in screen.findChildren(DataTable))
+        memory[name] = {'rss_kb': rss_kb() - before, 'python_kb': python_kb, 'rows': rows}
+        screen.close()
+        screen.deleteLater()
+        settle()
+
+    resolved = []
+    window.scanner_events.resolved.connect(resolved.append)
+    heartbeat = Heartbeat(recorder, 5)
+    rng = random.Random(args.seed)
+    items = [row['barcode'] for row in db.fetchall("SELECT barcode FROM instrument_sets ORDER BY id LIMIT 500")]
+    active = {zone: [row['order_number'] for row in db.fetchall(
+        "SELECT order_number FROM work_orders WHERE current_zone = ? ORDER BY id DESC LIMIT 200", (zone,))]
+        for zone in ("CLEAN", "STERILE")}
+
+    recorder.rounds = []
+    heartbeat.start()
+    for _ in range(args.rounds):
+        recorder.rounds.append({})
+        recorder.timed("refresh.dashboard", window._show_dashboard)
+        settle()
+        for name, (_, _, zone, _) in SCREENS.items():
+            if zone is None:
+                continue
+            recorder.timed(f"refresh.{name}", window._on_zone_selected, zone)
+            settle()
+
+            codes = items if zone == "DIRTY" else active[zone] or items
+            for code in rng.sample(codes, min(len(codes), max(1, args.scans // args.rounds))):
+                count = len(resolved)
+                start = time.perf_counter()
+                window._route_scan(code)
+                while len(resolved) == count and time.perf_counter() - start < 10:
+                    app.processEvents(QEventLoop.AllEvents, 5)
+                recorder.record(f"scan.{name}", (time.perf_counter() - start) * 1000)
+                background_writer.flush()
+                settle()
+    heartbeat.stop()
+    window.stop_scanners()
+
+    current = operations(recorder.histograms, recorder.rounds)
+    stalls = [gap for gap in heartbeat.gaps if gap >= args.stall_ms]
+    print(f"\n{args.rows} satır, {args.rounds} tur, {meta['counts'].get('work_orders', 0)} iş emri, "
+          f"Qt {qVersion()}, platform {app.platformName()}")
+    print("İlk oluşturma: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in cold.items()))
+    print(f"{'işlem':<32} {'adet':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'maks':>8}")
+    for name, summary in current.items():
+        print(f"{name:<32} {summary['count']:>6} {summary['p50']:>8.2f} {summary['p95']:>8.2f} "
+              f"{summary['p99']:>8.2f} {summary['max']:>8.2f}")
+    print(f"Olay döngüsü: {len(heartbeat.gaps)} vuruş, {len(stalls)} takılma >= {args.stall_ms:.0f} ms, "
+          f"en uzun {max(heartbeat.gaps, default=0):.1f} ms")
+    print(f"{'ekran':<12} {'satır':>6} {'RSS KB':>9} {'Python KB':>10}")
+    for name, usage in memory.items():
+        print(f"{name:<12} {usage['rows']:>6} {usage['rss_kb']:>9} {usage['python_kb']:>10}")
+
+    result = {
+        'meta': {
+            'profile': profile.name, 'seed': args.seed, 'rows': args.rows, 'rounds': args.rounds,
+            'commit': git_commit(), 'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version,
+            'pyside': PySide6.__version__, 'qt': qVersion(), 'qpa': app.platformName(),
+            'platform': platform.platform(), 'cpus': os.cpu_count(),
+            'recorded_at': datetime.now().isoformat(timespec="seconds"),
+        },
+        'cold': cold,
+        'stalls': {'count': len(stalls), 'threshold_ms': args.stall_ms,
+                   'max_ms': round(max(heartbeat.gaps, default=0), 2)},
+        'memory': memory,
+        'operations': current,
+    }
+    failures = 0
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"\nTemel kaydedildi: {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nTemel: {baseline_path} ({baseline['meta']['commit']}, Qt {baseline['meta']['qt']}, "
+              f"{baseline['meta']['recorded_at']})")
+        regressions = compare(current, baseline['operations'], args.tolerance, args.min_delta_ms,
+                              args.min_count)
+        for name, usage in memory.items():
+            then = baseline['memory'].get(name, {}).get('rss_kb')
+            if then is not None and usage['rss_kb'] > then * args.tolerance \
+                    and usage['rss_kb'] - then > args.min_memory_kb:
+                print(f"{name:<28} RSS {usage['rss_kb']} KB, temel {then} KB  GERİLEME")
+                regressions.append(f"memory.{name}")
+        if len(stalls) > baseline['stalls']['count'] * args.tolerance + 2:
+            print(f"Takılma sayısı {len(stalls)}, temel {baseline['stalls']['count']}  GERİLEME")
+            regressions.append("loop.stalls")
+        if regressions:
+            print(f"Gerileme: {', '.join(regressions)}")
+            failures += 1
+    else:
+        print(f"\nTemel yok: {baseline_path} (--save-baseline ile oluşturun)")
+
+    window.close()
+    background_writer.flush()
+    shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,401 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+from typing import Dict, List, Tuple
+
+from app.config.constants import (
+    WorkOrderStatus, SterilizationStatus, IndicatorResults, AuditActions, MachineTypes, Zones, PackagingTypes
+)
+
+INSTRUMENT_NAMES = ("Kocher Pensi", "Metzenbaum Makası", "Mayo Makası", "Portegü", "İğne Tutucu", "Ekartör",
+                    "Işıklı Retraktör", "Bisturi Sapı", "Doku Forsepsi", "Aspiratör Ucu", "Küret",
+                    "Çift Uçlu Disektör", "Ölçüm Probu", "Trokar", "Laparoskopik Grasper", "Kemik Rongeur",
+                    "Osteotom", "Babcock Pensi", "Allis Pensi", "Deaver Ekartörü")
+CATEGORIES = ("Genel Cerrahi", "Ortopedi", "Kadın Doğum", "Göz", "KBB", "Üroloji", "Beyin Cerrahisi",
+              "Kalp Damar", "Plastik Cerrahi")
+MAKERS = ("Aesculap", "KLS Martin", "Medicon", "Stille", "Karl Storz")
+DEPARTMENTS = ("Ameliyathane 1", "Ameliyathane 2", "Acil Servis", "Yoğun Bakım", "Doğumhane", "Endoskopi",
+               "Göz Polikliniği", "Diş Kliniği", "KBB Polikliniği", "Ortopedi Servisi", "Üroloji Servisi",
+               "Kardiyoloji Kateter Lab")
+PACKAGING = (PackagingTypes.CONTAINER, PackagingTypes.WRAP_DOUBLE, PackagingTypes.POUCH, PackagingTypes.PEEL_PACK)
+
+WASH_STAGES = (("WASH_START", Zones.DIRTY, 0, WorkOrderStatus.WASHING),
+               ("WASH_COMPLETE", Zones.DIRTY, 55, WorkOrderStatus.WASHED),
+               ("TRANSFER_CLEAN", Zones.CLEAN, 65, WorkOrderStatus.INSPECTING),
+               ("INSPECT_PASS", Zones.CLEAN, 80, WorkOrderStatus.PACKAGING),
+               ("PACKAGE_COMPLETE", Zones.CLEAN, 100, WorkOrderStatus.PACKAGED),
+               ("TRANSFER_STERILE", Zones.STERILE, 110, WorkOrderStatus.STERILIZING))
+LOAD_STAGES = (("STERILIZE_LOAD", Zones.STERILE, 0, WorkOrderStatus.STERILIZING),
+               ("STERILIZE_UNLOAD", Zones.STERILE, 60, WorkOrderStatus.STERILIZED),
+               ("PENDING_RELEASE", Zones.STERILE, 65, WorkOrderStatus.PENDING_RELEASE),
+               ("RELEASE", Zones.STERILE, 75, WorkOrderStatus.RELEASED),
+               ("STORE", Zones.STERILE, 85, WorkOrderStatus.STORED),
+               ("DISTRIBUTE", Zones.STERILE, 60 * 20, WorkOrderStatus.DISTRIBUTED))
+CLOSE_AFTER_DAYS = 7
+BATCH_DAYS = 30
+
+
+@dataclass
+class HospitalProfile:
+    name: str
+    days: int
+    orders_per_day: int
+    instruments: int
+    sets: int
+    operators: int = 40
+    washers: int = 4
+    sterilizers: int = 4
+    items_per_wash: int = 12
+    items_per_load: int = 10
+    set_share: float = 0.8
+    inspection_fail_rate: float = 0.02
+    ci_fail_rate: float = 0.003
+    recall_rate: float = 0.0005
+    validity_days: int = 30
+
+
+PROFILES = {
+    "smoke": HospitalProfile("smoke", days=14, orders_per_day=80, instruments=2000, sets=150),
+    "1y": HospitalProfile("1y", days=365, orders_per_day=200, instruments=6000, sets=450),
+    "5y": HospitalProfile("5y", days=5 * 365, orders_per_day=250, instruments=12000, sets=800),
+}
+
+
+class HospitalGenerator:
+
+    def __init__(self, db, profile: HospitalProfile, seed: int = 1, today: date = None):
+        self.db = db
+        self.profile = profile
+        self.rng = random.Random(seed)
+        self.today = today or date.today()
+        self.counts: Dict[str, int] = {}
+        self._rows: Dict[str, List[tuple]] = {}
+        self._next: Dict[str, int] = {}
+        self._cycle_seq: Dict[Tuple[date, int], int] = {}
+
+    def generate(self) -> Dict[str, int]:
+        self.db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('applying', 'benchmark')")
+        try:
+            self._catalog()
+            first = self.today - timedelta(days=self.profile.days - 1)
+            for offset in range(self.profile.days):
+                self._day(first + timedelta(days=offset), offset == self.profile.days - 1)
+                if offset % BATCH_DAYS == BATCH_DAYS - 1:
+                    self._flush()
+            self._flush()
+            self.db.execute("""
+                UPDATE machines SET total_cycles = (
+                    SELECT COUNT(*) FROM machine_cycles WHERE machine_cycles.machine_id = machines.id)
+            """)
+        finally:
+            self.db.execute("DELETE FROM sync_state WHERE key = 'applying'")
+            self.db.commit()
+        return dict(self.counts)
+
+    def _id(self, table: str) -> int:
+        if table not in self._next:
+            row = self.db.fetchone(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            self._next[table] = row[0]
+        self._next[table] += 1
+        return self._next[table]
+
+    def _add(self, table: str, row: tuple):
+        self._rows.setdefault(table, []).append(row)
+
+    def _catalog(self):
+        p, rng = self.profile, self.rng
+        self.departments = {}
+        for name in DEPARTMENTS:
+            self.db.execute("INSERT INTO departments (name, code) VALUES (?, ?)", (name, name[:3].upper()))
+            self.departments[self.db.get_last_insert_id()] = name
+
+        self.db.executemany("""
+            INSERT INTO operators (badge_number, full_name, role_id, default_zone, can_release_load)
+            VALUES (?, ?, 3, ?, ?)
+        """, [(f"OP{n:04d}", f"Operatör {n}", (Zones.DIRTY, Zones.CLEAN, Zones.STERILE)[n % 3], int(n % 5 == 0))
+              for n in range(1, p.operators + 1)])
+        self.operators = [row[0] for row in self.db.fetchall("SELECT id FROM operators WHERE badge_number LIKE 'OP%'")]
+
+        self.washers, self.sterilizers, self.programs = [], [], {}
+        for kind, count, zone, target in ((MachineTypes.WASHER_DISINFECTOR, p.washers, Zones.DIRTY, self.washers),
+                                          (MachineTypes.STEAM, p.sterilizers, Zones.STERILE, self.sterilizers)):
+            for n in range(1, count + 1):
+                self.db.execute("INSERT INTO machines (name, machine_type, zone, manufacturer) VALUES (?, ?, ?, ?)",
+                                (f"{'Yıkayıcı' if zone == Zones.DIRTY else 'Otoklav'} {n}", kind, zone,
+                                 rng.choice(MAKERS)))
+                machine_id = self.db.get_last_insert_id()
+                self.db.execute("""
+                    INSERT INTO machine_programs (machine_id, name, temperature, pressure, duration_minutes)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (machine_id, "93C Termal" if zone == Zones.DIRTY else "134C Standart",
+                      93 if zone == Zones.DIRTY else 134, 0 if zone == Zones.DIRTY else 2.1, 55 if zone == Zones.DIRTY else 45))
+                self.programs[machine_id] = self.db.get_last_insert_id()
+                target.append(machine_id)
+
+        self.db.executemany("""
+            INSERT INTO instruments (barcode, name, description, category, manufacturer, serial_number, max_cycles)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, ((f"INS{n:07d}", f"{rng.choice(INSTRUMENT_NAMES)} {rng.randint(10, 30)} cm",
+               f"{rng.choice(CATEGORIES)} aleti", rng.choice(CATEGORIES), rng.choice(MAKERS),
+               f"SN{rng.randrange(10 ** 8):08d}", rng.choice((0, 500, 1000))) for n in range(p.instruments)))
+        self.db.executemany("""
+            INSERT INTO instrument_sets (barcode, name, description, category, department_id, container_type,
+                validity_days)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, ((f"SET{n:06d}", f"{CATEGORIES[n % len(CATEGORIES)]} Seti {n}", "Standart set",
+               CATEGORIES[n % len(CATEGORIES)], rng.choice(list(self.departments)), rng.choice(PACKAGING),
+               p.validity_days) for n in range(p.sets)))
+        self.instruments = [(row[0], row[1], row[2]) for row in
+                            self.db.fetchall("SELECT id, name, barcode FROM instruments WHERE barcode LIKE 'INS%'")]
+        self.sets = [(row[0], row[1], row[2]) for row in
+                     self.db.fetchall("SELECT id, name, barcode FROM instrument_sets WHERE barcode LIKE 'SET%'")]
+
+        contents = []
+        per_set = max(1, min(25, len(self.instruments) // max(1, len(self.sets))))
+        for set_id, _, _ in self.sets:
+            for instrument_id, _, _ in rng.sample(self.instruments, per_set):
+                contents.append((set_id, instrument_id, rng.randint(1, 3)))
+        self.db.executemany("INSERT INTO set_contents (set_id, instrument_id, quantity) VALUES (?, ?, ?)", contents)
+        self.db.execute("""
+            UPDATE instrument_sets SET total_instruments = (
+                SELECT COALESCE(SUM(quantity), 0) FROM set_contents WHERE set_contents.set_id = instrument_sets.id)
+        """)
+        self.db.commit()
+        self.counts.update(instruments=len(self.instruments), sets=len(self.sets), set_contents=len(contents))
+
+    def _day(self, day: date, live: bool):
+        p, rng = self.profile, self.rng
+        start = datetime.combine(day, datetime.min.time()) + timedelta(hours=7)
+        total = max(1, int(p.orders_per_day * rng.uniform(0.85, 1.15)))
+        arrivals = sorted(start + timedelta(minutes=rng.uniform(0, 14 * 60)) for _ in range(total))
+        shift = rng.sample(self.operators, min(len(self.operators), 9))
+        for n, operator_id in enumerate(shift):
+            login = start + timedelta(hours=8 * (n % 3) - 1)
+            self._add("audit_log", (operator_id, AuditActions.LOGIN, "OPERATOR", operator_id, "Giriş", login))
+            self._add("audit_log", (operator_id, AuditActions.LOGOUT, "OPERATOR", operator_id, "Çıkış",
+                                    login + timedelta(hours=8)))
+
+        orders = []
+        for seq, received in enumerate(arrivals, 1):
+            if rng.random() < p.set_share:
+                item_type, item = "SET", rng.choice(self.sets)
+            else:
+                item_type, item = "INSTRUMENT", rng.choice(self.instruments)
+            orders.append({
+                'id': self._id("work_orders"), 'number': f"WO{day:%Y%m%d}{seq:04d}", 'type': item_type,
+                'item': item, 'received': received, 'operator': rng.choice(shift),
+                'department': rng.choice(list(self.departments)), 'priority': int(rng.random() < 0.1),
+                'stop': rng.randrange(0, len(WASH_STAGES) + len(LOAD_STAGES) + 1) if live else None,
+            })
+
+        wash_cycles = self._cycles(orders, p.items_per_wash, self.washers, 20, False)
+        for order in orders:
+            self._order_until_load(order, wash_cycles[order['id']])
+        loadable = [order for order in orders if order.get('ready')]
+        load_cycles = self._cycles(loadable, p.items_per_load, self.sterilizers, 0, True, key='ready')
+        for order in loadable:
+            self._order_from_load(order, load_cycles[order['id']], day)
+        for order in orders:
+            self._finish(order, day)
+
+    def _cycles(self, orders: List[dict], size: int, machines: List[int], delay: int, sterilizer: bool,
+                key: str = 'received') -> Dict[int, Tuple[int, int, datetime]]:
+        assigned = {}
+        ordered = sorted(orders, key=lambda o: o[key])
+        for n in range(0, len(ordered), size):
+            chunk = ordered[n:n + size]
+            begin = max(order[key] for order in chunk) + timedelta(minutes=delay)
+            machine_id = machines[(n // size) % len(machines)]
+            cycle_id = self._id("machine_cycles")
+            slot = (begin.date(), machine_id)
+            self._cycle_seq[slot] = self._cycle_seq.get(slot, 0) + 1
+            first_of_day = n < size * len(machines)
+            self._add("machine_cycles", (
+                cycle_id, f"C{begin:%Y%m%d}M{machine_id:02d}{self._cycle_seq[slot]:03d}", machine_id, self.programs[machine_id],
+                chunk[0]['operator'], begin, begin + timedelta(minutes=45 if sterilizer else 55), "COMPLETED",
+                round(self.rng.gauss(134.3, 0.4), 1) if sterilizer else round(self.rng.gauss(93.0, 0.5), 1),
+                round(self.rng.gauss(2.1, 0.05), 2) if sterilizer else None,
+                IndicatorResults.PASS if sterilizer else IndicatorResults.NOT_APPLICABLE,
+                f"BI{begin:%y%m%d}{machine_id:02d}" if sterilizer and first_of_day else None,
+                IndicatorResults.PASS if sterilizer and first_of_day else IndicatorResults.NOT_APPLICABLE,
+                begin + timedelta(hours=24) if sterilizer and first_of_day else None, begin))
+            for order in chunk:
+                assigned[order['id']] = (cycle_id, machine_id, begin, first_of_day)
+        return assigned
+
+    def _stage(self, order: dict, process: str, zone: str, at: datetime, status: str,
+               machine_id: int = None, cycle_id: int = None, notes: str = None) -> bool:
+        if order['stop'] is not None and order.setdefault('stages', 0) >= order['stop']:
+            return False
+        order['stages'] = order.get('stages', 0) + 1
+        order['status'], order['zone'], order['updated'] = status, zone, at
+        self._add("process_records", (order['id'], process, zone, order['operator'], machine_id, cycle_id,
+                                      at, at + timedelta(minutes=5), "COMPLETED", notes, at))
+        return True
+
+    def _order_until_load(self, order: dict, wash: tuple):
+        cycle_id, machine_id, begin, _ = wash
+        order['status'], order['zone'], order['updated'] = WorkOrderStatus.RECEIVED, Zones.DIRTY, order['received']
+        self._add("process_records", (order['id'], "RECEIVE", Zones.DIRTY, order['operator'], None, None,
+                                      order['received'], order['received'], "COMPLETED", None, order['received']))
+        self._add("audit_log", (order['operator'], AuditActions.SCAN, "WORK_ORDER", order['id'],
+                                order['item'][2], order['received']))
+        self._add("audit_log", (order['operator'], AuditActions.CREATE, "WORK_ORDER", order['id'],
+                                order['number'], order['received']))
+
+        failed = self.rng.random() < self.profile.inspection_fail_rate
+        shift = timedelta()
+        for process, zone, minutes, status in WASH_STAGES:
+            at = begin + timedelta(minutes=minutes) + shift
+            if process == "INSPECT_PASS" and failed:
+                if not self._stage(order, "INSPECT_FAIL", zone, at, WorkOrderStatus.INSPECTION_FAILED,
+                                   notes="Kalıntı tespit edildi"):
+                    return
+                self._add("reprocessing_records", (order['id'], "Kalıntı tespit edildi", order['operator'], at))
+                if not self._stage(order, "REPROCESS", Zones.DIRTY, at + timedelta(minutes=5),
+                                   WorkOrderStatus.REPROCESSING):
+                    return
+                shift = timedelta(minutes=90)
+                failed = False
+                for retry, retry_zone, retry_minutes, retry_status in WASH_STAGES[:3]:
+                    if not self._stage(order, retry, retry_zone, at + timedelta(minutes=10 + retry_minutes),
+                                       retry_status, machine_id if retry.startswith("WASH") else None,
+                                       cycle_id if retry.startswith("WASH") else None):
+                        return
+                at = begin + timedelta(minutes=minutes) + shift
+            wash_stage = process.startswith("WASH")
+            if not self._stage(order, process, zone, at, status, machine_id if wash_stage else None,
+                               cycle_id if wash_stage else None,
+                               self.rng.choice(PACKAGING) if process == "PACKAGE_COMPLETE" else None):
+                return
+            if process in ("TRANSFER_CLEAN", "TRANSFER_STERILE"):
+                self._add("audit_log", (order['operator'], AuditActions.SCAN, "WORK_ORDER", order['id'],
+                                        order['item'][2], at))
+            if process == "WASH_START":
+                self._add("cycle_contents", (cycle_id, order['id'], at, at + timedelta(minutes=55)))
+        order['ready'] = order['updated']
+
+    def _order_from_load(self, order: dict, load: tuple, day: date):
+        cycle_id, machine_id, begin, has_bi = load
+        order['cycle'], order['machine'] = cycle_id, machine_id
+        ci_failed = self.rng.random() < self.profile.ci_fail_rate
+        record_id = None
+        for process, zone, minutes, status in LOAD_STAGES:
+            at = begin + timedelta(minutes=minutes)
+            if process == "RELEASE" and ci_failed:
+                if not self._stage(order, "REJECT", zone, at, WorkOrderStatus.REJECTED, notes="CI başarısız"):
+                    break
+                self._record(order, record_id, SterilizationStatus.REJECTED, begin, at, has_bi,
+                             ci=IndicatorResults.FAIL)
+                self._add("sterilization_release_log", (record_id, "REJECT", order['operator'], "CI başarısız", at))
+                self._add("audit_log", (order['operator'], AuditActions.REJECT, "STERILIZATION_RECORD", record_id,
+                                        "CI başarısız", at))
+                return
+            machine_stage = process.startswith("STERILIZE")
+            if not self._stage(order, process, zone, at, status, machine_id if machine_stage else None,
+                               cycle_id if machine_stage else None):
+                break
+            if process == "STERILIZE_LOAD":
+                record_id = self._id("sterilization_records")
+                self._add("cycle_contents", (cycle_id, order['id'], at, at + timedelta(minutes=60)))
+            elif process == "RELEASE":
+                order['released'] = at
+                self._add("sterilization_release_log", (record_id, "RELEASE", order['operator'],
+                                                        "Serbest bırakıldı", at))
+                self._add("audit_log", (order['operator'], AuditActions.RELEASE, "STERILIZATION_RECORD", record_id,
+                                        order['number'], at))
+            elif process == "DISTRIBUTE":
+                order['completed'] = at
+
+        if record_id is None:
+            return
+        if order['status'] == WorkOrderStatus.STERILIZING:
+            status = SterilizationStatus.PENDING_CI
+        elif order['status'] == WorkOrderStatus.STERILIZED:
+            status = SterilizationStatus.PENDING_BI if has_bi else SterilizationStatus.PENDING_RELEASE
+        elif order['status'] == WorkOrderStatus.PENDING_RELEASE:
+            status = SterilizationStatus.PENDING_RELEASE
+        elif order.get('completed'):
+            status = SterilizationStatus.USED
+            self._add("sterilization_release_log", (record_id, "USED", order['operator'], "", order['completed']))
+        else:
+            status = SterilizationStatus.RELEASED
+
+        if order.get('completed') and order['stop'] is None and self.rng.random() < self.profile.recall_rate:
+            at = order['completed'] + timedelta(days=1)
+            self._stage(order, "RECALL", Zones.STERILE, at, WorkOrderStatus.RECALLED, notes="Geri çağırma")
+            self._add("sterilization_release_log", (record_id, "RECALL", order['operator'], "Geri çağırma", at))
+            self._add("audit_log", (order['operator'], AuditActions.RECALL, "STERILIZATION_RECORD", record_id,
+                                    order['number'], at))
+            status = SterilizationStatus.RECALLED
+        self._record(order, record_id, status, begin, order['updated'], has_bi)
+
+    def _record(self, order: dict, record_id: int, status: str, loaded: datetime, at: datetime, has_bi: bool,
+                ci: str = IndicatorResults.PASS):
+        released = order.get('released')
+        checked = status not in (SterilizationStatus.PENDING_CI,)
+        unloaded = loaded + timedelta(minutes=60)
+        item_id, name, barcode = order['item']
+        self._add("sterilization_records", (
+            record_id, f"SR{loaded:%Y%m%d}{record_id:07d}", order['id'], order['type'], item_id, name, barcode,
+            order['cycle'], order['machine'], "STEAM", order['operator'], loaded,
+            unloaded if checked else None, status, ci if checked else IndicatorResults.PENDING,
+            order['operator'] if checked else None, unloaded if checked else None,
+            f"BI{loaded:%y%m%d}{order['machine']:02d}" if has_bi else None,
+            (IndicatorResults.PASS if status in (SterilizationStatus.RELEASED, SterilizationStatus.RECALLED)
+             else IndicatorResults.PENDING) if has_bi else IndicatorResults.NOT_APPLICABLE,
+            order['operator'] if released else None, released,
+            order['operator'] if status == SterilizationStatus.REJECTED else None,
+            at if status == SterilizationStatus.REJECTED else None,
+            "CI başarısız" if status == SterilizationStatus.REJECTED else None,
+            loaded + timedelta(days=self.profile.validity_days), loaded, at))
+
+    def _finish(self, order: dict, day: date):
+        status = order['status']
+        if status == WorkOrderStatus.DISTRIBUTED and (self.today - day).days > CLOSE_AFTER_DAYS:
+            status = WorkOrderStatus.COMPLETED
+        item_id, name, barcode = order['item']
+        self._add("work_orders", (
+            order['id'], order['number'], f"WO{order['id']:08X}", order['type'], item_id, name, barcode,
+            order['department'], order['priority'], status, WorkOrderStatus.get_zone(status) or order['zone'],
+            self.departments[order['department']], order['operator'], order['received'],
+            order.get('completed'), order['received'], order['updated']))
+
+    def _flush(self):
+        statements = {
+            "work_orders": """INSERT INTO work_orders (id, order_number, barcode, item_type, item_id, item_name,
+                item_barcode, department_id, priority, status, current_zone, source_department, received_by,
+                received_at, completed_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            "machine_cycles": """INSERT INTO machine_cycles (id, cycle_number, machine_id, program_id, operator_id,
+                start_time, end_time, status, temperature_achieved, pressure_achieved, ci_result, bi_lot_number,
+                bi_result, bi_read_time, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            "cycle_contents": """INSERT INTO cycle_contents (cycle_id, work_order_id, loaded_at, unloaded_at)
+                VALUES (?, ?, ?, ?)""",
+            "process_records": """INSERT INTO process_records (work_order_id, process_type, zone, operator_id,
+                machine_id, cycle_id, start_time, end_time, status, notes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            "sterilization_records": """INSERT INTO sterilization_records (id, record_number, work_order_id,
+                item_type, item_id, item_name, item_barcode, cycle_id, machine_id, sterilization_method,
+                operator_id, load_time, unload_time, status, ci_result, ci_checked_by, ci_checked_at,
+                bi_lot_number, bi_result, released_by, released_at, rejected_by, rejected_at, rejection_reason,
+                expiry_date, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            "sterilization_release_log": """INSERT INTO sterilization_release_log (sterilization_id, action,
+                performed_by, notes, created_at) VALUES (?, ?, ?, ?, ?)""",
+            "reprocessing_records": """INSERT INTO reprocessing_records (work_order_id, reason, initiated_by,
+                created_at) VALUES (?, ?, ?, ?)""",
+            "audit_log": """INSERT INTO audit_log (operator_id, action, entity_type, entity_id, details, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+        }
+        for table, query in statements.items():
+            rows = self._rows.pop(table, [])
+            if rows:
+                self.db.executemany(query, rows)
+                self.counts[table] = self.counts.get(table, 0) + len(rows)
+        self.db.commit()
+
+
+def generate(db, profile: HospitalProfile, seed: int = 1, today: date = None) -> Dict[str, int]:
+    return HospitalGenerator(db, profile, seed, today).generate()